@@ -6,6 +6,7 @@ from typing import Any
 from typing import NamedTuple
 from typing import Sequence
 from typing import TypeVar
+from typing import Union
 
 if sys.version_info >= (3, 8):  # pragma: >=3.8 cover
     from typing import Protocol
@@ -14,7 +15,17 @@ else:  # pragma: <3.8 cover
     from typing_extensions import Protocol
     from typing_extensions import runtime_checkable
 
+from proxystore.serialize import BytesLike
+
 KeyT = TypeVar('KeyT', bound=NamedTuple)
+PayloadT = Union[BytesLike, Sequence[BytesLike]]
+"""Serialized object type accepted by [`Connector.put()`][proxystore.connectors.connector.Connector.put].
+
+A serialized object is any bytes-like object (i.e., supports the buffer
+protocol) or a sequence of bytes-like objects whose concatenation is the
+serialized object. Multi-part objects allow connectors to write the parts
+with scatter/gather I/O rather than materializing one contiguous buffer.
+"""  # noqa: E501
 
 
 @runtime_checkable
@@ -23,6 +34,14 @@ class Connector(Protocol[KeyT]):
 
     The Connector protocol defines the interface for interacting with a
     byte-level object store.
+
+    Objects passed to [`put()`][proxystore.connectors.connector.Connector.put]
+    and [`put_batch()`][proxystore.connectors.connector.Connector.put_batch]
+    can be any [`PayloadT`][proxystore.connectors.connector.PayloadT]
+    (e.g., [`bytes`][bytes], [`memoryview`][memoryview], or a list of
+    buffers). The utilities in [`proxystore.utils`][proxystore.utils] (e.g.,
+    [`as_buffers()`][proxystore.utils.as_buffers]) can be used to normalize
+    these inputs.
     """
 
     def close(self) -> None:
@@ -71,7 +90,100 @@ class Connector(Protocol[KeyT]):
         """
         ...
 
-    def get(self, key: KeyT) -> bytes | None:
+    def get(self, key: KeyT) -> BytesLike | None:
+        """Get the serialized object associated with the key.
+
+        Args:
+            key: Key associated with the object to retrieve.
+
+        Returns:
+            Serialized object or `None` if the object does not exist. \
+            Connectors may return any bytes-like object (e.g., a \
+            read-only [`memoryview`][memoryview] over a memory-mapped file) \
+            to avoid copying the data.
+        """
+        ...
+
+    def get_batch(
+        self,
+        keys: Sequence[KeyT],
+    ) -> Sequence[BytesLike | None]:
+        """Get a batch of serialized objects associated with the keys.
+
+        Args:
+            keys: Sequence of keys associated with objects to retrieve.
+
+        Returns:
+            Sequence with same order as `keys` with the serialized objects or
+            `None` if the corresponding key does not have an associated object.
+        """
+        ...
+
+    def put(self, obj: PayloadT) -> KeyT:
+        """Put a serialized object in the store.
+
+        Args:
+            obj: Serialized object to put in the store. May be a single
+                bytes-like object or a sequence of bytes-like objects.
+
+        Returns:
+            Key which can be used to retrieve the object.
+        """
+        ...
+
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[KeyT]:
+        """Put a batch of serialized objects in the store.
+
+        Args:
+            objs: Sequence of serialized objects to put in the store.
+
+        Returns:
+            List of keys with the same order as `objs` which can be used to
+            retrieve the objects.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncConnector(Protocol[KeyT]):
+    """Protocol for connectors which support asynchronous operations.
+
+    An [`AsyncConnector`][proxystore.connectors.connector.AsyncConnector]
+    provides coroutine equivalents of the
+    [`Connector`][proxystore.connectors.connector.Connector] operations.
+    Connectors implement this protocol in addition to
+    [`Connector`][proxystore.connectors.connector.Connector], and the async
+    methods of the [`Store`][proxystore.store.base.Store] (e.g.,
+    [`Store.aget()`][proxystore.store.base.Store.aget]) will use these
+    methods when available rather than running the synchronous methods in
+    a thread.
+
+    Note:
+        Async methods should be awaited from a single event loop for the
+        lifetime of the connector because some connectors bind network
+        resources to the event loop on first use.
+    """
+
+    async def aevict(self, key: KeyT) -> None:
+        """Evict the object associated with the key.
+
+        Args:
+            key: Key associated with object to evict.
+        """
+        ...
+
+    async def aexists(self, key: KeyT) -> bool:
+        """Check if an object associated with the key exists.
+
+        Args:
+            key: Key potentially associated with stored object.
+
+        Returns:
+            If an object associated with the key exists.
+        """
+        ...
+
+    async def aget(self, key: KeyT) -> BytesLike | None:
         """Get the serialized object associated with the key.
 
         Args:
@@ -82,7 +194,10 @@ class Connector(Protocol[KeyT]):
         """
         ...
 
-    def get_batch(self, keys: Sequence[KeyT]) -> list[bytes | None]:
+    async def aget_batch(
+        self,
+        keys: Sequence[KeyT],
+    ) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
         Args:
@@ -94,7 +209,7 @@ class Connector(Protocol[KeyT]):
         """
         ...
 
-    def put(self, obj: bytes) -> KeyT:
+    async def aput(self, obj: PayloadT) -> KeyT:
         """Put a serialized object in the store.
 
         Args:
@@ -105,7 +220,7 @@ class Connector(Protocol[KeyT]):
         """
         ...
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[KeyT]:
+    async def aput_batch(self, objs: Sequence[PayloadT]) -> list[KeyT]:
         """Put a batch of serialized objects in the store.
 
         Args:
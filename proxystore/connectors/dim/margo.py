@@ -1,6 +1,7 @@
 """Margo RPC-based distributed in-memory connector implementation."""
 from __future__ import annotations
 
+import itertools
 import logging
 import sys
 import uuid
@@ -32,10 +33,17 @@ except ImportError as e:  # pragma: no cover
     pymargo_import_error = e
 
 
+from proxystore.connectors.connector import PayloadT
 from proxystore.connectors.dim.utils import get_ip_address
+from proxystore.connectors.dim.utils import size_class
 from proxystore.connectors.dim.utils import Status
+from proxystore.serialize import BytesLike
 from proxystore.serialize import deserialize
 from proxystore.serialize import serialize
+from proxystore.utils import as_buffers
+from proxystore.utils import join_buffers
+from proxystore.utils import map_concurrent
+from proxystore.utils import nbytes
 
 server_process: Process | None = None
 client_pids: set[int] = set()
@@ -43,6 +51,8 @@ logger = logging.getLogger(__name__)
 engine: Engine | None = None
 _rpcs: dict[str, RemoteFunction]
 
+_RPC_NAMES = ('set', 'get', 'exists', 'evict', 'set_batch', 'get_batch')
+
 
 class Protocol(Enum):
     """Available Mercury plugins and transports."""
@@ -74,6 +84,11 @@ class MargoKey(NamedTuple):
     """Peer where object is located."""
 
 
+def _offsets(sizes: Sequence[int]) -> list[int]:
+    """Get the offset of each object packed contiguously in a region."""
+    return [0, *itertools.accumulate(sizes)][:-1]
+
+
 class MargoConnector:
     """Margo RPC-based distributed in-memory connector.
 
@@ -83,10 +98,17 @@ class MargoConnector:
         that will store data. Hence, this connector just acts as an interface
         to that server.
 
+    Batch operations transfer all objects to or from a peer with a single
+    RPC. The objects are packed contiguously in a single bulk region so
+    only one region is registered per batch.
+
     Args:
         interface: The network interface to use.
         port: The desired port for the spawned server.
         protocol: The communication protocol to use.
+        batch_concurrency: Maximum number of concurrent RPCs issued by
+            [`get_batch()`][proxystore.connectors.dim.margo.MargoConnector.get_batch]
+            when the keys are located on multiple peers.
     """
 
     host: str
@@ -103,6 +125,7 @@ class MargoConnector:
         interface: str,
         port: int,
         protocol: Protocol = Protocol.OFI_VERBS,
+        batch_concurrency: int = 8,
     ) -> None:
         global server_process
         global client_pids
@@ -114,6 +137,7 @@ class MargoConnector:
             raise pymargo_import_error
 
         self.protocol = protocol
+        self.batch_concurrency = batch_concurrency
 
         self.interface = interface
         self.host = get_ip_address(interface)
@@ -133,12 +157,7 @@ class MargoConnector:
                 use_progress_thread=True,
             )
 
-            _rpcs = {
-                'set': engine.register('set'),
-                'get': engine.register('get'),
-                'exists': engine.register('exists'),
-                'evict': engine.register('evict'),
-            }
+            _rpcs = {name: engine.register(name) for name in _RPC_NAMES}
 
         self.engine = engine
         self._rpcs = _rpcs
@@ -171,10 +190,8 @@ class MargoConnector:
 
         # create server
         receiver = MargoServer(server_engine)
-        server_engine.register('get', receiver.get)
-        server_engine.register('set', receiver.set)
-        server_engine.register('exists', receiver.exists)
-        server_engine.register('evict', receiver.evict)
+        for name in _RPC_NAMES:
+            server_engine.register(name, getattr(receiver, name))
         server_engine.wait_for_finalize()
 
     def server_started(self) -> None:  # pragma: no cover
@@ -250,6 +267,7 @@ class MargoConnector:
             'interface': self.interface,
             'port': self.port,
             'protocol': self.protocol,
+            'batch_concurrency': self.batch_concurrency,
         }
 
     @classmethod
@@ -329,19 +347,67 @@ class MargoConnector:
             return None
         return bytes(buff)
 
-    def get_batch(self, keys: Sequence[MargoKey]) -> list[bytes | None]:
+    def get_batch(self, keys: Sequence[MargoKey]) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Keys are grouped by peer and the objects on each peer are pushed
+        by the peer into a single bulk region with one RPC. RPCs to
+        different peers are issued concurrently from a thread pool.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
         Returns:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
+            The objects are views of the region they were received into.
         """
-        return [self.get(key) for key in keys]
+        groups: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(key.peer, []).append(i)
+
+        def _get_group(indices: list[int]) -> list[BytesLike | None]:
+            return self._get_batch_from([keys[i] for i in indices])
+
+        results: list[BytesLike | None] = [None] * len(keys)
+        group_indices = list(groups.values())
+        group_results = map_concurrent(
+            _get_group,
+            group_indices,
+            self.batch_concurrency,
+        )
+        for indices, objs in zip(group_indices, group_results):
+            for i, obj in zip(indices, objs):
+                results[i] = obj
+        return results
+
+    def _get_batch_from(
+        self,
+        keys: Sequence[MargoKey],
+    ) -> list[BytesLike | None]:
+        logger.debug(
+            f'Client issuing get batch request on {len(keys)} keys '
+            f'to {keys[0].peer}',
+        )
+        sizes = [key.obj_size for key in keys]
+        buff = bytearray(sum(sizes))
+        blk = self.engine.create_bulk(buff, bulk.write_only)
+        server_addr = self.engine.lookup(keys[0].peer)
+        found = deserialize(
+            self._rpcs['get_batch'].on(server_addr)(
+                blk,
+                len(buff),
+                [(key.margo_key, key.obj_size) for key in keys],
+            ),
+        )
 
-    def put(self, obj: bytes) -> MargoKey:
+        view = memoryview(buff)
+        return [
+            view[offset : offset + size] if exists else None
+            for offset, size, exists in zip(_offsets(sizes), sizes, found)
+        ]
+
+    def put(self, obj: PayloadT) -> MargoKey:
         """Put a serialized object in the store.
 
         Args:
@@ -350,6 +416,7 @@ class MargoConnector:
         Returns:
             Key which can be used to retrieve the object.
         """
+        obj = join_buffers(obj)
         key = MargoKey(
             margo_key=str(uuid.uuid4()),
             obj_size=len(obj),
@@ -367,9 +434,12 @@ class MargoConnector:
         )
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[MargoKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[MargoKey]:
         """Put a batch of serialized objects in the store.
 
+        The objects are packed into a single bulk region which the server
+        pulls from with one RPC.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
 
@@ -377,26 +447,178 @@ class MargoConnector:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        if len(objs) == 0:
+            return []
+
+        keys = [
+            MargoKey(
+                margo_key=str(uuid.uuid4()),
+                obj_size=nbytes(obj),
+                peer=self.addr,
+            )
+            for obj in objs
+        ]
+        logger.debug(
+            f'Client {self.addr} issuing set batch request on '
+            f'{len(keys)} keys',
+        )
+
+        buff = bytearray(sum(key.obj_size for key in keys))
+        offset = 0
+        for obj in objs:
+            for part in as_buffers(obj):
+                buff[offset : offset + part.nbytes] = part
+                offset += part.nbytes
+
+        blk = self.engine.create_bulk(buff, bulk.read_only)
+        server_addr = self.engine.lookup(self.addr)
+        self._rpcs['set_batch'].on(server_addr)(
+            blk,
+            len(buff),
+            [(key.margo_key, key.obj_size) for key in keys],
+        )
+        return keys
+
+
+class BufferPool:
+    """Pool of buffers registered for bulk transfers.
+
+    Buffers are allocated in size classes (see
+    [`size_class()`][proxystore.connectors.dim.utils.size_class]) and
+    registered with the engine once when allocated. Each power of two is
+    divided into several size classes so objects larger than the smallest
+    size class leave less than a quarter of their buffer unused. Released
+    buffers are kept and reused by later requests for a buffer of the same
+    size class so objects do not pay for allocating and registering a new
+    region.
+
+    Args:
+        engine: Engine used to register buffers.
+        max_idle_bytes: Maximum total size in bytes of released buffers
+            kept for reuse. Buffers released beyond this limit are freed.
+        min_buffer_size: Size in bytes of the smallest size class.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        max_idle_bytes: int = 256 * 1000 * 1000,
+        min_buffer_size: int = 64,
+    ) -> None:
+        self.engine = engine
+        self.max_idle_bytes = max_idle_bytes
+        self.min_buffer_size = min_buffer_size
+        self.idle_bytes = 0
+        self._idle: dict[int, list[tuple[bytearray, Bulk]]] = {}
+
+    def acquire(self, size: int) -> tuple[bytearray, Bulk]:
+        """Get a registered buffer with at least `size` bytes.
+
+        Args:
+            size: Minimum size of the buffer in bytes.
+
+        Returns:
+            Tuple of the buffer and its bulk handle.
+
+        Raises:
+            ValueError: If `size` is negative.
+        """
+        buffer_size = size_class(size, self.min_buffer_size)
+        idle = self._idle.get(buffer_size)
+        if idle:
+            self.idle_bytes -= buffer_size
+            return idle.pop()
+        buffer = bytearray(buffer_size)
+        return buffer, self.engine.create_bulk(buffer, bulk.read_write)
+
+    def release(self, buffer: bytearray, handle: Bulk) -> None:
+        """Return a buffer acquired from this pool for reuse.
+
+        Args:
+            buffer: Buffer returned by
+                [`acquire()`][proxystore.connectors.dim.margo.BufferPool.acquire].
+            handle: Bulk handle of the buffer.
+        """
+        if self.idle_bytes + len(buffer) <= self.max_idle_bytes:
+            self._idle.setdefault(len(buffer), []).append((buffer, handle))
+            self.idle_bytes += len(buffer)
 
 
 class MargoServer:
     """MargoServer implementation.
 
+    Objects are stored in registered buffers from a
+    [`BufferPool`][proxystore.connectors.dim.margo.BufferPool] so objects
+    can be pushed to clients without registering a new bulk region and
+    buffers of evicted objects are reused.
+
     Args:
         engine: The server engine created at the specified network address.
     """
 
-    data: dict[str, bytes]
+    data: dict[str, memoryview]
     engine: Engine
 
     def __init__(self, engine: Engine) -> None:
         self.data = {}
+        self._buffers: dict[str, tuple[bytearray, Bulk]] = {}
 
         self.engine = engine
+        self.pool = BufferPool(engine)
 
         logger.debug('Server initialized')
 
+    def _store(
+        self,
+        key: str,
+        addr: Address,
+        bulk_str: Bulk,
+        offset: int,
+        size: int,
+    ) -> None:
+        buffer, local_bulk = self.pool.acquire(size)
+        try:
+            self.engine.transfer(
+                bulk.pull,
+                addr,
+                bulk_str,
+                offset,
+                local_bulk,
+                0,
+                size,
+            )
+        except Exception:
+            self.pool.release(buffer, local_bulk)
+            raise
+        self._remove(key)
+        self.data[key] = memoryview(buffer)[:size]
+        self._buffers[key] = (buffer, local_bulk)
+
+    def _remove(self, key: str) -> bool:
+        if self.data.pop(key, None) is None:
+            return False
+        self.pool.release(*self._buffers.pop(key))
+        return True
+
+    def _push(
+        self,
+        key: str,
+        addr: Address,
+        bulk_str: Bulk,
+        offset: int,
+        size: int,
+    ) -> None:
+        _, local_bulk = self._buffers[key]
+        self.engine.transfer(
+            bulk.push,
+            addr,
+            bulk_str,
+            offset,
+            local_bulk,
+            0,
+            size,
+        )
+
     def set(
         self,
         handle: Handle,
@@ -415,20 +637,31 @@ class MargoServer:
         logger.debug(f'Received set RPC for key {key}.')
 
         s = Status(True, None)
+        self._store(key, handle.get_addr(), bulk_str, 0, bulk_size)
+        handle.respond(serialize(s))
 
-        local_buffer = bytearray(bulk_size)
-        local_bulk = self.engine.create_bulk(local_buffer, bulk.write_only)
-        self.engine.transfer(
-            bulk.pull,
-            handle.get_addr(),
-            bulk_str,
-            0,
-            local_bulk,
-            0,
-            bulk_size,
-        )
-        self.data[key] = local_buffer
+    def set_batch(
+        self,
+        handle: Handle,
+        bulk_str: Bulk,
+        bulk_size: int,
+        keys: list[tuple[str, int]],
+    ) -> None:
+        """Obtain a batch of objects from the client and store them.
 
+        Args:
+            handle: The client handle.
+            bulk_str: The buffer containing the objects packed contiguously.
+            bulk_size: The size of the buffer.
+            keys: List of the key and size of each object in the buffer.
+        """
+        logger.debug(f'Received set batch RPC for {len(keys)} keys.')
+
+        s = Status(True, None)
+        addr = handle.get_addr()
+        sizes = [size for _, size in keys]
+        for (key, size), offset in zip(keys, _offsets(sizes)):
+            self._store(key, addr, bulk_str, offset, size)
         handle.respond(serialize(s))
 
     def get(
@@ -451,23 +684,45 @@ class MargoServer:
         s = Status(True, None)
 
         try:
-            local_array = self.data[key]
-            local_bulk = self.engine.create_bulk(local_array, bulk.read_only)
-            self.engine.transfer(
-                bulk.push,
-                handle.get_addr(),
-                bulk_str,
-                0,
-                local_bulk,
-                0,
-                bulk_size,
-            )
+            self._push(key, handle.get_addr(), bulk_str, 0, bulk_size)
         except KeyError as error:
             logger.error(f'key {error} not found.')
             s = Status(False, error)
 
         handle.respond(serialize(s))
 
+    def get_batch(
+        self,
+        handle: Handle,
+        bulk_str: Bulk,
+        bulk_size: int,
+        keys: list[tuple[str, int]],
+    ) -> None:
+        """Return a batch of objects back to the client.
+
+        The objects are pushed into the client's buffer packed
+        contiguously in the order of `keys`. The response is a list of
+        booleans indicating which objects were found.
+
+        Args:
+            handle: The client handle.
+            bulk_str: The buffer that will store the objects.
+            bulk_size: The size of the buffer.
+            keys: List of the key and size of each object.
+        """
+        logger.debug(f'Received get batch RPC for {len(keys)} keys.')
+
+        addr = handle.get_addr()
+        sizes = [size for _, size in keys]
+        found: list[bool] = []
+        for (key, size), offset in zip(keys, _offsets(sizes)):
+            exists = key in self.data
+            if exists:
+                self._push(key, addr, bulk_str, offset, size)
+            found.append(exists)
+
+        handle.respond(serialize(found))
+
     def evict(
         self,
         handle: Handle,
@@ -485,7 +740,7 @@ class MargoServer:
         """
         logger.debug(f'Received exists RPC for key {key}')
 
-        self.data.pop(key, None)
+        self._remove(key)
         s = Status(True, None)
 
         handle.respond(serialize(s))
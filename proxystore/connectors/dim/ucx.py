@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import enum
+import itertools
 import logging
 import signal
+import struct
 import sys
 import uuid
 from multiprocessing import Process
@@ -25,11 +28,13 @@ try:
 except ImportError as e:  # pragma: no cover
     ucx_import_error = e
 
+from proxystore.connectors.connector import PayloadT
+from proxystore.connectors.dim.utils import BufferPool
 from proxystore.connectors.dim.utils import get_ip_address
 from proxystore.connectors.dim.utils import Status
-from proxystore.serialize import deserialize
-from proxystore.serialize import SerializationError
-from proxystore.serialize import serialize
+from proxystore.serialize import BytesLike
+from proxystore.utils import gather_concurrent
+from proxystore.utils import join_buffers
 
 ENCODING = 'UTF-8'
 
@@ -48,6 +53,99 @@ class UCXKey(NamedTuple):
     """Peer where object is located."""
 
 
+# Request header: (request ID, operation, key length, data length).
+_REQUEST = struct.Struct('!QBQQ')
+# Response header: (request ID, status, data length).
+_RESPONSE = struct.Struct('!QBQ')
+
+
+class _Op(enum.IntEnum):
+    PING = 0
+    EVICT = 1
+    EXISTS = 2
+    GET = 3
+    SET = 4
+
+
+class _Status(enum.IntEnum):
+    OK = 0
+    MISSING = 1
+    ERROR = 2
+
+
+class _PeerEndpoint:
+    """Persistent endpoint to a peer shared by concurrent requests.
+
+    Requests are sent in order on the endpoint's default tag, and the
+    response to each request is sent with the request ID as the tag so
+    many requests can be in flight at once and responses can be received
+    in any order.
+    """
+
+    def __init__(self, endpoint: ucp.Endpoint) -> None:
+        self.endpoint = endpoint
+        self._send_lock = asyncio.Lock()
+        # Response headers are received into reusable buffers.
+        self._headers: list[bytearray] = []
+
+    async def _send(
+        self,
+        header: bytes,
+        key: bytes,
+        data: BytesLike | None,
+    ) -> None:
+        async with self._send_lock:
+            await self.endpoint.send(header)
+            if len(key) > 0:
+                await self.endpoint.send(key)
+            if data is not None and len(data) > 0:
+                await self.endpoint.send(data)
+
+    async def request(
+        self,
+        request_id: int,
+        op: _Op,
+        key: bytes = b'',
+        data: BytesLike | None = None,
+        size_hint: int = 0,
+    ) -> tuple[int, bytearray]:
+        data_length = 0 if data is None else len(data)
+        header = _REQUEST.pack(request_id, op, len(key), data_length)
+        # The response is received directly into a buffer of the expected
+        # size. The buffer is returned to and owned by the caller so it is
+        # allocated per request rather than taken from a pool.
+        response = bytearray(size_hint)
+        # Shield the sends so a cancelled request does not leave a
+        # partially sent request on the endpoint.
+        await asyncio.shield(self._send(header, key, data))
+
+        buffer = self._headers.pop() if self._headers else None
+        if buffer is None:
+            buffer = bytearray(_RESPONSE.size)
+        try:
+            await self.endpoint.recv(buffer, tag=request_id)
+            _, status, length = _RESPONSE.unpack(buffer)
+        finally:
+            self._headers.append(buffer)
+
+        if length != len(response):
+            response = bytearray(length)
+        if length > 0:
+            await self.endpoint.recv(response, tag=request_id)
+        return status, response
+
+    async def close(self) -> None:
+        if not self.endpoint.closed():
+            await self.endpoint.close()
+
+
+async def _close_endpoints(endpoints: Sequence[_PeerEndpoint]) -> None:
+    await asyncio.gather(
+        *(peer.close() for peer in endpoints),
+        return_exceptions=True,
+    )
+
+
 class UCXConnector:
     """UCX-based distributed in-memory connector.
 
@@ -57,9 +155,24 @@ class UCXConnector:
         that will store data. Hence, this connector just acts as an interface
         to that server.
 
+    Endpoints to each peer are created on first use and reused by all
+    subsequent requests. Each request is a small binary header followed by
+    the raw key and object data, and responses are tagged with the request
+    ID so requests to the same peer are pipelined. Objects are received
+    directly into buffers sized using
+    [`UCXKey.obj_size`][proxystore.connectors.dim.ucx.UCXKey.obj_size].
+
+    Note:
+        Endpoints are created per event loop. The synchronous methods use
+        an event loop owned by the connector.
+
     Args:
         interface: The network interface to use.
         port: The desired port for the spawned server.
+        batch_concurrency: Maximum number of concurrent requests issued by
+            [`get_batch()`][proxystore.connectors.dim.ucx.UCXConnector.get_batch]
+            and
+            [`put_batch()`][proxystore.connectors.dim.ucx.UCXConnector.put_batch].
     """
 
     addr: str
@@ -69,7 +182,12 @@ class UCXConnector:
     _loop: asyncio.events.AbstractEventLoop
 
     # TODO : make host optional and try to get infiniband path automatically
-    def __init__(self, interface: str, port: int) -> None:
+    def __init__(
+        self,
+        interface: str,
+        port: int,
+        batch_concurrency: int = 8,
+    ) -> None:
         global server_process
 
         if ucx_import_error is not None:  # pragma: no cover
@@ -80,6 +198,7 @@ class UCXConnector:
         self.interface = interface
         self.host = get_ip_address(interface)
         self.port = port
+        self.batch_concurrency = batch_concurrency
 
         self.addr = f'{self.host}:{self.port}'
 
@@ -98,8 +217,11 @@ class UCXConnector:
                 wait_for_server(self.host, self.port),
             )
 
-        # TODO: Verify if create_endpoint error handling will successfully
-        # connect to endpoint or if error handling needs to be done here
+        self._endpoints: dict[
+            tuple[asyncio.AbstractEventLoop, str],
+            _PeerEndpoint,
+        ] = {}
+        self._request_ids = itertools.count(1)
 
     def __enter__(self) -> Self:
         return self
@@ -112,27 +234,47 @@ class UCXConnector:
     ) -> None:
         self.close()
 
-    async def handler(self, event: bytes, addr: str) -> bytes:
-        """Handler that issues requests to the server."""
-        host = addr.split(':')[0]  # quick fix
-        port = int(addr.split(':')[1])
-
-        ep = await ucp.create_endpoint(host, port)
-
-        await ep.send_obj(event)
-
-        res = await ep.recv_obj()
-
-        await ep.close()
+    async def _get_endpoint(self, addr: str) -> _PeerEndpoint:
+        loop = asyncio.get_running_loop()
+        peer = self._endpoints.get((loop, addr))
+        if peer is None:
+            host, port = addr.rsplit(':', 1)
+            endpoint = await ucp.create_endpoint(host, int(port))
+            # Another request may have created an endpoint to the same
+            # peer while this one was being created.
+            peer = self._endpoints.setdefault(
+                (loop, addr),
+                _PeerEndpoint(endpoint),
+            )
+            if peer.endpoint is not endpoint:
+                await endpoint.close()
+        return peer
 
-        return bytes(res)  # returns bytearray by default
+    async def _rpc(
+        self,
+        addr: str,
+        op: _Op,
+        key: str,
+        data: BytesLike | None = None,
+        size_hint: int = 0,
+    ) -> tuple[int, bytearray]:
+        peer = await self._get_endpoint(addr)
+        status, response = await peer.request(
+            next(self._request_ids),
+            op,
+            key.encode(ENCODING),
+            data,
+            size_hint,
+        )
+        if status == _Status.ERROR:
+            raise RuntimeError(
+                f'Request {op.name} to {addr} failed: '
+                f'{response.decode(ENCODING)}',
+            )
+        return status, response
 
     def close(self) -> None:
-        """Get the connector configuration.
-
-        The configuration contains all the information needed to reconstruct
-        the connector object.
-        """
+        """Close the connector and the server process if one was spawned."""
         global server_process
 
         logger.info('Clean up requested')
@@ -142,6 +284,19 @@ class UCXConnector:
             server_process.join()
             server_process = None
 
+        endpoints = [
+            peer
+            for (loop, _), peer in self._endpoints.items()
+            if loop is self._loop
+        ]
+        self._endpoints.clear()
+        if (
+            len(endpoints) > 0
+            and not self._loop.is_running()
+            and not self._loop.is_closed()
+        ):
+            self._loop.run_until_complete(_close_endpoints(endpoints))
+
         logger.debug('Clean up completed')
 
     def config(self) -> dict[str, Any]:
@@ -150,7 +305,11 @@ class UCXConnector:
         The configuration contains all the information needed to reconstruct
         the connector object.
         """
-        return {'interface': self.interface, 'port': self.port}
+        return {
+            'interface': self.interface,
+            'port': self.port,
+            'batch_concurrency': self.batch_concurrency,
+        }
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> UCXConnector:
@@ -168,9 +327,9 @@ class UCXConnector:
             key: Key associated with object to evict.
         """
         logger.debug(f'Client issuing an evict request on key {key}.')
-
-        event = serialize({'key': key.ucx_key, 'data': None, 'op': 'evict'})
-        self._loop.run_until_complete(self.handler(event, key.peer))
+        self._loop.run_until_complete(
+            self._rpc(key.peer, _Op.EVICT, key.ucx_key),
+        )
 
     def exists(self, key: UCXKey) -> bool:
         """Check if an object associated with the key exists.
@@ -182,15 +341,12 @@ class UCXConnector:
             If an object associated with the key exists.
         """
         logger.debug(f'Client issuing an exists request on key {key}.')
-
-        event = serialize(
-            {'key': key.ucx_key, 'data': None, 'op': 'exists'},
-        )
-        return deserialize(
-            self._loop.run_until_complete(self.handler(event, key.peer)),
+        status, _ = self._loop.run_until_complete(
+            self._rpc(key.peer, _Op.EXISTS, key.ucx_key),
         )
+        return status == _Status.OK
 
-    def get(self, key: UCXKey) -> bytes | None:
+    def get(self, key: UCXKey) -> bytearray | None:
         """Get the serialized object associated with the key.
 
         Args:
@@ -199,24 +355,23 @@ class UCXConnector:
         Returns:
             Serialized object or `None` if the object does not exist.
         """
-        res: bytes | None
-        logger.debug(f'Client issuing get request on key {key}.')
+        return self._loop.run_until_complete(self._get(key))
 
-        event = serialize({'key': key.ucx_key, 'data': '', 'op': 'get'})
-        res = self._loop.run_until_complete(self.handler(event, key.peer))
-
-        try:
-            s = deserialize(res)
-
-            assert isinstance(s, Status)
-            assert not s.success
-            return None
-        except SerializationError:
-            return res
+    async def _get(self, key: UCXKey) -> bytearray | None:
+        logger.debug(f'Client issuing get request on key {key}.')
+        status, data = await self._rpc(
+            key.peer,
+            _Op.GET,
+            key.ucx_key,
+            size_hint=key.obj_size,
+        )
+        return data if status == _Status.OK else None
 
-    def get_batch(self, keys: Sequence[UCXKey]) -> list[bytes | None]:
+    def get_batch(self, keys: Sequence[UCXKey]) -> list[bytearray | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Requests are pipelined on the endpoint to each peer.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -224,9 +379,11 @@ class UCXConnector:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        return self._loop.run_until_complete(
+            gather_concurrent(self._get, keys, self.batch_concurrency),
+        )
 
-    def put(self, obj: bytes) -> UCXKey:
+    def put(self, obj: PayloadT) -> UCXKey:
         """Put a serialized object in the store.
 
         Args:
@@ -235,6 +392,10 @@ class UCXConnector:
         Returns:
             Key which can be used to retrieve the object.
         """
+        return self._loop.run_until_complete(self._put(obj))
+
+    async def _put(self, obj: PayloadT) -> UCXKey:
+        obj = join_buffers(obj)
         key = UCXKey(
             ucx_key=str(uuid.uuid4()),
             obj_size=len(obj),
@@ -243,15 +404,14 @@ class UCXConnector:
         logger.debug(
             f'Client issuing set request on key {key} with addr {self.addr}',
         )
-
-        event = serialize({'key': key.ucx_key, 'data': obj, 'op': 'set'})
-
-        self._loop.run_until_complete(self.handler(event, self.addr))
+        await self._rpc(self.addr, _Op.SET, key.ucx_key, obj)
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[UCXKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[UCXKey]:
         """Put a batch of serialized objects in the store.
 
+        Requests are pipelined on the endpoint to the local server.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
 
@@ -259,12 +419,21 @@ class UCXConnector:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        return self._loop.run_until_complete(
+            gather_concurrent(self._put, objs, self.batch_concurrency),
+        )
 
 
 class UCXServer:
     """UCXServer implementation.
 
+    Each client endpoint is served by a long-lived handler which receives
+    requests until the client closes the endpoint. Keys are received into
+    buffers reused from a
+    [`BufferPool`][proxystore.connectors.dim.utils.BufferPool]. Object
+    data is received into a buffer of exactly the object size which is
+    then stored, so stored objects do not occupy larger pooled buffers.
+
     Args:
         host: The server host.
         port: The server port.
@@ -273,15 +442,16 @@ class UCXServer:
     host: str
     port: int
     ucp_listener: ucp.core.Listener | None
-    data: dict[str, bytes]
+    data: dict[str, BytesLike]
 
     def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
         self.data = {}
         self.ucp_listener = None
+        self._pool = BufferPool()
 
-    def set(self, key: str, data: bytes) -> Status:
+    def set(self, key: str, data: BytesLike) -> Status:
         """Obtain data from the client and store it in local dictionary.
 
         Args:
@@ -294,7 +464,7 @@ class UCXServer:
         self.data[key] = data
         return Status(success=True, error=None)
 
-    def get(self, key: str) -> bytes | Status:
+    def get(self, key: str) -> BytesLike | Status:
         """Return data at a given key back to the client.
 
         Args:
@@ -331,43 +501,76 @@ class UCXServer:
         """
         return key in self.data
 
+    def process(
+        self,
+        op: int,
+        key: str,
+        data: BytesLike,
+    ) -> tuple[_Status, BytesLike]:
+        """Process a request.
+
+        Args:
+            op: Operation to perform.
+            key: Object key of the request.
+            data: Object data of a set request.
+
+        Returns:
+            Tuple of the response status and data.
+        """
+        if op == _Op.PING:
+            return _Status.OK, b''
+        elif op == _Op.SET:
+            self.set(key, data)
+            return _Status.OK, b''
+        elif op == _Op.GET:
+            result = self.get(key)
+            if isinstance(result, Status):
+                return _Status.MISSING, b''
+            return _Status.OK, result
+        elif op == _Op.EXISTS:
+            return _Status.OK if self.exists(key) else _Status.MISSING, b''
+        elif op == _Op.EVICT:
+            self.evict(key)
+            return _Status.OK, b''
+        else:
+            return _Status.ERROR, f'Unknown operation {op}.'.encode(ENCODING)
+
     async def handler(self, ep: ucp.Endpoint) -> None:
         """Handle endpoint requests.
 
         Args:
             ep: The endpoint to communicate with.
         """
-        json_kv = await ep.recv_obj()
-
-        if json_kv == bytes(1):
-            await ep.send_obj(bytes(1))
-            return
-
-        kv = deserialize(bytes(json_kv))
-
-        key = kv['key']
-        data = kv['data']
-        func = kv['op']
-
-        if func == 'set':
-            res = self.set(key, data)
-        else:
-            if func == 'get':
-                func = self.get
-            elif func == 'exists':
-                func = self.exists
-            elif func == 'evict':
-                func = self.evict
-            else:
-                raise AssertionError('Unreachable.')
-            res = func(key)
-
-        if isinstance(res, Status) or isinstance(res, bool):
-            serialized_res = serialize(res)
-        else:
-            serialized_res = res
-
-        await ep.send_obj(serialized_res)
+        header = bytearray(_REQUEST.size)
+        while not ep.closed():
+            try:
+                await ep.recv(header)
+                request_id, op, key_length, data_length = _REQUEST.unpack(
+                    header,
+                )
+                key_buffer = self._pool.acquire(key_length)
+                try:
+                    key = memoryview(key_buffer)[:key_length]
+                    if key_length > 0:
+                        await ep.recv(key)
+                    key_str = str(key, ENCODING)
+                finally:
+                    self._pool.release(key_buffer)
+                data = bytearray(data_length)
+                if data_length > 0:
+                    await ep.recv(data)
+
+                status, response = self.process(op, key_str, data)
+
+                await ep.send(
+                    _RESPONSE.pack(request_id, status, len(response)),
+                    tag=request_id,
+                )
+                if len(response) > 0:
+                    await ep.send(response, tag=request_id)
+            except ucp.exceptions.UCXError:
+                # The client closed the endpoint.
+                break
 
     async def run(self) -> None:
         """Run this UCXServer forever.
@@ -516,7 +719,7 @@ async def wait_for_server(host: str, port: int, timeout: float = 5.0) -> None:
         else:
             break  # pragma: no cover
 
-    await ep.send_obj(bytes(1))
-    _ = await ep.recv_obj()
+    await ep.send(_REQUEST.pack(0, _Op.PING, 0, 0))
+    await ep.recv(bytearray(_RESPONSE.size), tag=0)
     await ep.close()
     assert ep.closed()
@@ -37,6 +37,76 @@ def get_ip_address(ifname: str) -> str:
         return ifname
 
 
+def size_class(size: int, min_size: int = 64, steps: int = 4) -> int:
+    """Round a buffer size up to its size class.
+
+    Each power of two is divided into `steps` evenly spaced size classes so
+    at most `1 / steps` of a buffer of a given size class is unused.
+
+    Args:
+        size: Minimum size of the buffer in bytes.
+        min_size: Size in bytes of the smallest size class.
+        steps: Number of size classes per power of two.
+
+    Returns:
+        Size in bytes of the size class.
+
+    Raises:
+        ValueError: If `size` is negative.
+    """
+    if size < 0:
+        raise ValueError(f'Buffer size must be non-negative. Got {size}.')
+    if size <= min_size:
+        return min_size
+    base = 1 << ((size - 1).bit_length() - 1)
+    step = max(1, base // steps)
+    return -(-size // step) * step
+
+
+class BufferPool:
+    """Pool of reusable buffers for transient receives.
+
+    Buffers are allocated in size classes (see
+    [`size_class()`][proxystore.connectors.dim.utils.size_class]) and
+    released buffers are reused by later requests for a buffer of the same
+    size class.
+
+    Args:
+        max_idle_bytes: Maximum total size in bytes of released buffers
+            kept for reuse. Buffers released beyond this limit are freed.
+        min_buffer_size: Size in bytes of the smallest size class.
+    """
+
+    def __init__(
+        self,
+        max_idle_bytes: int = 64 * 1000 * 1000,
+        min_buffer_size: int = 64,
+    ) -> None:
+        self.max_idle_bytes = max_idle_bytes
+        self.min_buffer_size = min_buffer_size
+        self.idle_bytes = 0
+        self._idle: dict[int, list[bytearray]] = {}
+
+    def acquire(self, size: int) -> bytearray:
+        """Get a buffer with at least `size` bytes.
+
+        Raises:
+            ValueError: If `size` is negative.
+        """
+        buffer_size = size_class(size, self.min_buffer_size)
+        idle = self._idle.get(buffer_size)
+        if idle:
+            self.idle_bytes -= buffer_size
+            return idle.pop()
+        return bytearray(buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer acquired from this pool for reuse."""
+        if self.idle_bytes + len(buffer) <= self.max_idle_bytes:
+            self._idle.setdefault(len(buffer), []).append(buffer)
+            self.idle_bytes += len(buffer)
+
+
 class Status(NamedTuple):
     """Task status response."""
 
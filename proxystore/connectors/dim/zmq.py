@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import enum
+import itertools
 import logging
 import signal
+import struct
 import sys
 import time
 import uuid
-import atexit
 from multiprocessing import Process
 from types import TracebackType
 from typing import Any
@@ -28,16 +31,53 @@ except ImportError as e:  # pragma: no cover
     zmq_import_error = e
 
 import proxystore.utils as utils
+from proxystore.connectors.connector import PayloadT
 from proxystore.connectors.dim.utils import get_ip_address
 from proxystore.connectors.dim.utils import Status
-from proxystore.serialize import deserialize
-from proxystore.serialize import SerializationError
-from proxystore.serialize import serialize
+from proxystore.serialize import BytesLike
+from proxystore.utils import gather_concurrent
 
 MAX_CHUNK_LENGTH = 64 * 1024
 
 logger = logging.getLogger(__name__)
-server_process = None
+server_process: Process | None = None
+
+# Header frame of requests (request ID and operation) and responses
+# (request ID and status).
+_HEADER = struct.Struct('!QB')
+# Number of frames of each object in a batch or -1 if the object is missing.
+_COUNT = struct.Struct('!q')
+
+
+class _Op(enum.IntEnum):
+    EVICT = 1
+    EXISTS = 2
+    GET = 3
+    SET = 4
+    GET_BATCH = 5
+    SET_BATCH = 6
+
+
+class _Status(enum.IntEnum):
+    OK = 0
+    MISSING = 1
+    ERROR = 2
+
+
+def _pack_counts(counts: Sequence[int]) -> bytes:
+    return struct.pack(f'!{len(counts)}q', *counts)
+
+
+def _unpack_counts(frame: BytesLike) -> tuple[int, ...]:
+    count = len(frame) // _COUNT.size
+    return struct.unpack(f'!{count}q', frame)
+
+
+def _join_frames(frames: Sequence[zmq.Frame]) -> BytesLike:
+    if len(frames) == 1:
+        # Single-frame objects are returned without copying the frame.
+        return frames[0].buffer
+    return b''.join(frame.buffer for frame in frames)
 
 
 class ZeroMQKey(NamedTuple):
@@ -51,6 +91,77 @@ class ZeroMQKey(NamedTuple):
     """Peer where object is located."""
 
 
+class _PeerSocket:
+    """DEALER socket connected to a peer server.
+
+    Many requests can be in flight on the socket at once. Responses are
+    matched to requests by the request ID in the header frame by a reader
+    task running on the event loop the socket was created in. The reader
+    task exits once no requests are outstanding so an idle socket does not
+    leave a pending task on the event loop.
+    """
+
+    def __init__(self, context: zmq.asyncio.Context, addr: str) -> None:
+        self.addr = addr
+        self.socket = context.socket(zmq.DEALER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(addr)
+        self._pending: dict[
+            int,
+            asyncio.Future[tuple[int, list[zmq.Frame]]],
+        ] = {}
+        self._reader: asyncio.Task[None] | None = None
+
+    async def request(
+        self,
+        request_id: int,
+        op: _Op,
+        frames: Sequence[BytesLike],
+    ) -> tuple[int, list[zmq.Frame]]:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._read())
+
+        future: asyncio.Future[
+            tuple[int, list[zmq.Frame]]
+        ] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # The empty delimiter frame makes the message compatible with
+            # REP and ROUTER sockets.
+            await self.socket.send_multipart(
+                [b'', _HEADER.pack(request_id, op), *frames],
+                copy=False,
+            )
+            return await future
+        finally:
+            # If the request was cancelled, the response will be dropped.
+            self._pending.pop(request_id, None)
+
+    async def _read(self) -> None:
+        try:
+            while len(self._pending) > 0:
+                _, header, *frames = await self.socket.recv_multipart(
+                    copy=False,
+                )
+                request_id, status = _HEADER.unpack(header.buffer)
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((status, frames))
+        except zmq.ZMQError as e:  # pragma: no cover
+            logger.exception(f'Error receiving from {self.addr}: {e}')
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            self._pending.clear()
+
+    def close(self) -> asyncio.Task[None] | None:
+        reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.cancel()
+        self.socket.close()
+        return reader
+
+
 class ZeroMQConnector:
     """ZeroMQ-based distributed in-memory connector.
 
@@ -60,19 +171,49 @@ class ZeroMQConnector:
         that will store data. Hence, this connector just acts as an interface
         to that server.
 
+    Requests are sent over a persistent DEALER socket to each peer. Each
+    message starts with a small binary header frame containing a request ID
+    and the operation, followed by the key and the raw object data frames
+    which are sent and received without copying. Multi-part objects passed
+    to [`put()`][proxystore.connectors.dim.zmq.ZeroMQConnector.put] are
+    sent as separate frames without being joined. Responses are matched to
+    requests by ID so many requests to a peer can be in flight at once.
+
+    Batch operations are sent as a single request to each peer.
+
+    Note:
+        Sockets are created per event loop. The synchronous methods use an
+        event loop owned by the connector and the async methods use the
+        running event loop.
+
     Args:
         interface: The network interface to use.
         port: The desired port for the spawned server.
+        timeout: Timeout in seconds to wait for the server to start.
+        batch_concurrency: Maximum number of concurrent batch requests
+            issued by
+            [`get_batch()`][proxystore.connectors.dim.zmq.ZeroMQConnector.get_batch]
+            when the keys are located on multiple peers.
+        max_inflight: Maximum number of requests handled concurrently by
+            the spawned server.
+        max_inflight_bytes: Optional maximum size in bytes of the requests
+            and responses handled concurrently by the spawned server.
     """
 
     addr: str
-    provider_id: int
     context: zmq.asyncio.Context
-    socket: zmq.asyncio.Socket
-    chunk_size: int
     _loop: asyncio.events.AbstractEventLoop
 
-    async def __init__(self, interface: str, port: int) -> None:
+    def __init__(
+        self,
+        interface: str,
+        port: int,
+        timeout: float = 5,
+        batch_concurrency: int = 8,
+        max_inflight: int = 64,
+        max_inflight_bytes: int | None = None,
+    ) -> None:
+        global server_process
 
         # ZMQ is not a default dependency so we don't want to raise
         # an error unless the user actually tries to use this code
@@ -81,27 +222,45 @@ class ZeroMQConnector:
 
         logger.debug('Instantiating client and server')
 
-        self.chunk_size = MAX_CHUNK_LENGTH
-
         self.interface = interface
         self.host = get_ip_address(interface)
         self.port = port
+        self.timeout = timeout
+        self.batch_concurrency = batch_concurrency
+        self.max_inflight = max_inflight
+        self.max_inflight_bytes = max_inflight_bytes
 
         self.addr = f'tcp://{self.host}:{self.port}'
 
         try:
-            wait_for_server(self.host, self.port)
+            self._loop = asyncio.get_running_loop()
         except RuntimeError:
-            self.server = spawn_server(self.host, self.port)
-
+            self._loop = asyncio.new_event_loop()
 
-        self.context = zmq.asyncio.Context()
-        self.socket = self.context.socket(zmq.REQ)
+        try:
+            self._loop.run_until_complete(
+                wait_for_server(self.host, self.port),
+            )
+        except RuntimeError:
+            server_process = spawn_server(
+                self.host,
+                self.port,
+                max_inflight=self.max_inflight,
+                max_inflight_bytes=self.max_inflight_bytes,
+            )
+            self._loop.run_until_complete(
+                wait_for_server(self.host, self.port, timeout=self.timeout),
+            )
 
-    def __del__(self) -> None:
-        # https://github.com/zeromq/pyzmq/issues/1512
-        self.socket.close()
-        self.context.term()
+        # The process-wide context is shared by all connectors so a connector
+        # which is not closed cannot block garbage collection by terminating
+        # a context with open sockets.
+        self.context = zmq.asyncio.Context.instance()
+        self._peers: dict[
+            tuple[asyncio.AbstractEventLoop, str],
+            _PeerSocket,
+        ] = {}
+        self._request_ids = itertools.count()
 
     def __enter__(self) -> Self:
         return self
@@ -114,72 +273,70 @@ class ZeroMQConnector:
     ) -> None:
         self.close()
 
-    # def _start_server(self) -> None:
-    #     """Launch the local ZeroMQ server process."""
-    #     logger.info(
-    #         f'starting server on host {self.host} with port {self.port}',
-    #     )
-
-    #     ps = ZeroMQServer(self.host, self.port)
-    #     asyncio.run(ps.launch())
-
-    def _send_rpc(self, rpc: Sequence[RPC]) -> list[RPCResponse]:
-        """Send an RPC request to the server.
-
-        Args:
-            rpc: List of RPC requests.
-
-        Returns:
-            List of RPC responses.
-        """
-
-        event = serialize(rpc)
-        res = self._loop.run_until_complete(self.handler(event, self.addr))
-
-        assert isinstance(res, bytes)
-
-        try:
-            res = deserialize(res)
-        except SerializationError:
-            logger.exception('Deserialization error')
-            raise
-
-        return res
-
-    async def handler(self, event: bytes, addr: str) -> bytes:
-        """ZeroMQ handler function implementation.
-
-        Args:
-            event: A pickled dictionary consisting of the data,
-                its key, and the operation to perform on the data.
-            addr: The address of the server to connect to.
-
-        Returns:
-            The serialized result of the operation on the data.
-        """
-        with self.socket.connect(addr):
-            await self.socket.send_multipart(
-                list(utils.chunk_bytes(event, self.chunk_size)),
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(address={self.addr})'
+
+    def _get_peer(self, addr: str) -> _PeerSocket:
+        loop = asyncio.get_running_loop()
+        peer = self._peers.get((loop, addr))
+        if peer is None:
+            # Drop sockets of event loops which have since been closed.
+            for peer_key in list(self._peers):
+                if peer_key[0].is_closed():
+                    self._peers.pop(peer_key).close()
+            peer = _PeerSocket(self.context, addr)
+            self._peers[(loop, addr)] = peer
+        return peer
+
+    async def _rpc(
+        self,
+        addr: str,
+        op: _Op,
+        frames: Sequence[BytesLike],
+    ) -> tuple[int, list[zmq.Frame]]:
+        peer = self._get_peer(addr)
+        status, response = await peer.request(
+            next(self._request_ids),
+            op,
+            frames,
+        )
+        if status == _Status.ERROR:
+            message = response[0].bytes.decode() if response else ''
+            raise RuntimeError(
+                f'Request {op.name} to {addr} failed: {message}',
             )
-            res = b''.join(await self.socket.recv_multipart())
-
-        assert isinstance(res, bytes)
+        return status, response
 
-        return res
-
-    def close(self, kill_server : bool = True) -> None:
+    def close(self, kill_server: bool = True) -> None:
         """Close the connector.
 
         Args:
             kill_server: Whether to kill the server process.
         """
-        if kill_server and self.server is not None:
-            self.server.terminate()
-            self.server.join()
-            self.server = None
+        global server_process
 
-        self.socket.close()
-        self.context.term()
+        if kill_server and server_process is not None:
+            server_process.terminate()
+            server_process.join()
+            server_process = None
+
+        readers = [peer.close() for peer in self._peers.values()]
+        self._peers.clear()
+        # Let the cancelled reader tasks of the connector's event loop
+        # finish so they are not destroyed while pending.
+        pending = [
+            reader
+            for reader in readers
+            if reader is not None and reader.get_loop() is self._loop
+        ]
+        if (
+            len(pending) > 0
+            and not self._loop.is_running()
+            and not self._loop.is_closed()
+        ):
+            self._loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True),
+            )
 
     def config(self) -> dict[str, Any]:
         """Get the connector configuration.
@@ -187,7 +344,14 @@ class ZeroMQConnector:
         The configuration contains all the information needed to reconstruct
         the connector object.
         """
-        return {'interface': self.interface, 'port': self.port}
+        return {
+            'interface': self.interface,
+            'port': self.port,
+            'timeout': self.timeout,
+            'batch_concurrency': self.batch_concurrency,
+            'max_inflight': self.max_inflight,
+            'max_inflight_bytes': self.max_inflight_bytes,
+        }
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> ZeroMQConnector:
@@ -204,12 +368,7 @@ class ZeroMQConnector:
         Args:
             key: Key associated with object to evict.
         """
-        logger.debug(f'Client issuing an evict request on key {key}.')
-
-        event = serialize(
-            {'key': key.zmq_key, 'data': None, 'op': 'evict'},
-        )
-        self._loop.run_until_complete(self.handler(event, key.peer))
+        self._loop.run_until_complete(self.aevict(key))
 
     def exists(self, key: ZeroMQKey) -> bool:
         """Check if an object associated with the key exists.
@@ -220,43 +379,27 @@ class ZeroMQConnector:
         Returns:
             If an object associated with the key exists.
         """
-        logger.debug(f'Client issuing an exists request on key {key}.')
+        return self._loop.run_until_complete(self.aexists(key))
 
-        event = serialize(
-            {'key': key.zmq_key, 'data': None, 'op': 'exists'},
-        )
-        return deserialize(
-            self._loop.run_until_complete(self.handler(event, key.peer)),
-        )
-
-    def get(self, key: ZeroMQKey) -> bytes | None:
+    def get(self, key: ZeroMQKey) -> BytesLike | None:
         """Get the serialized object associated with the key.
 
         Args:
             key: Key associated with the object to retrieve.
 
         Returns:
-            Serialized object or `None` if the object does not exist.
+            Serialized object or `None` if the object does not exist. \
+            Objects stored as a single frame are returned as a zero-copy \
+            [`memoryview`][memoryview] of the received frame.
         """
-        logger.debug(f'Client issuing get request on key {key}')
+        return self._loop.run_until_complete(self.aget(key))
 
-        event = serialize(
-            {'key': key.zmq_key, 'data': None, 'op': 'get'},
-        )
-        res = self._loop.run_until_complete(self.handler(event, key.peer))
-
-        try:
-            s = deserialize(res)
-
-            assert isinstance(s, Status)
-            assert not s.success
-            return None
-        except SerializationError:
-            return res
-
-    def get_batch(self, keys: Sequence[ZeroMQKey]) -> list[bytes | None]:
+    def get_batch(self, keys: Sequence[ZeroMQKey]) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Keys are grouped by peer and each group is retrieved with a single
+        request.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -264,9 +407,9 @@ class ZeroMQConnector:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        return self._loop.run_until_complete(self.aget_batch(keys))
 
-    def put(self, obj: bytes) -> ZeroMQKey:
+    def put(self, obj: PayloadT) -> ZeroMQKey:
         """Put a serialized object in the store.
 
         Args:
@@ -275,24 +418,13 @@ class ZeroMQConnector:
         Returns:
             Key which can be used to retrieve the object.
         """
-        key = ZeroMQKey(
-            zmq_key=str(uuid.uuid4()),
-            obj_size=len(obj),
-            peer=self.addr,
-        )
-        logger.debug(
-            f'Client issuing set request on key {key} with addr {self.addr}',
-        )
-
-        event = serialize(
-            {'key': key.zmq_key, 'data': obj, 'op': 'set'},
-        )
-        self._loop.run_until_complete(self.handler(event, self.addr))
-        return key
+        return self._loop.run_until_complete(self.aput(obj))
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[ZeroMQKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[ZeroMQKey]:
         """Put a batch of serialized objects in the store.
 
+        The batch is sent as a single request.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
 
@@ -300,58 +432,226 @@ class ZeroMQConnector:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        return self._loop.run_until_complete(self.aput_batch(objs))
+
+    async def aevict(self, key: ZeroMQKey) -> None:
+        """Evict the object associated with the key asynchronously."""
+        logger.debug(f'Client issuing an evict request on key {key}')
+        await self._rpc(key.peer, _Op.EVICT, [key.zmq_key.encode()])
+
+    async def aexists(self, key: ZeroMQKey) -> bool:
+        """Check if an object associated with the key exists asynchronously."""
+        logger.debug(f'Client issuing an exists request on key {key}')
+        status, _ = await self._rpc(
+            key.peer,
+            _Op.EXISTS,
+            [key.zmq_key.encode()],
+        )
+        return status == _Status.OK
+
+    async def aget(self, key: ZeroMQKey) -> BytesLike | None:
+        """Get the serialized object associated with the key asynchronously."""
+        logger.debug(f'Client issuing a get request on key {key}')
+        status, frames = await self._rpc(
+            key.peer,
+            _Op.GET,
+            [key.zmq_key.encode()],
+        )
+        if status == _Status.MISSING:
+            return None
+        return _join_frames(frames)
+
+    async def aget_batch(
+        self,
+        keys: Sequence[ZeroMQKey],
+    ) -> list[BytesLike | None]:
+        """Get a batch of serialized objects asynchronously.
+
+        See [`get_batch()`][proxystore.connectors.dim.zmq.ZeroMQConnector.get_batch]
+        for details.
+        """
+        groups: dict[str, list[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key.peer, []).append(index)
+
+        async def _get_group(
+            group: tuple[str, list[int]],
+        ) -> list[BytesLike | None]:
+            peer, indices = group
+            _, frames = await self._rpc(
+                peer,
+                _Op.GET_BATCH,
+                [keys[i].zmq_key.encode() for i in indices],
+            )
+            counts = _unpack_counts(frames[0].buffer)
+            objs: list[BytesLike | None] = []
+            offset = 1
+            for count in counts:
+                if count < 0:
+                    objs.append(None)
+                else:
+                    objs.append(_join_frames(frames[offset : offset + count]))
+                    offset += count
+            return objs
+
+        logger.debug(
+            f'Client issuing a batch get request on {len(keys)} keys '
+            f'across {len(groups)} peers',
+        )
+        results = await gather_concurrent(
+            _get_group,
+            list(groups.items()),
+            self.batch_concurrency,
+        )
+
+        ordered: list[BytesLike | None] = [None] * len(keys)
+        for indices, objs in zip(groups.values(), results):
+            for index, obj in zip(indices, objs):
+                ordered[index] = obj
+        return ordered
+
+    async def aput(self, obj: PayloadT) -> ZeroMQKey:
+        """Put a serialized object in the store asynchronously."""
+        key = ZeroMQKey(
+            zmq_key=str(uuid.uuid4()),
+            obj_size=utils.nbytes(obj),
+            peer=self.addr,
+        )
+        logger.debug(f'Client issuing a set request on key {key}')
+        await self._rpc(
+            self.addr,
+            _Op.SET,
+            [key.zmq_key.encode(), *utils.as_buffers(obj)],
+        )
+        return key
+
+    async def aput_batch(self, objs: Sequence[PayloadT]) -> list[ZeroMQKey]:
+        """Put a batch of serialized objects in the store asynchronously.
+
+        See [`put_batch()`][proxystore.connectors.dim.zmq.ZeroMQConnector.put_batch]
+        for details.
+        """
+        keys = [
+            ZeroMQKey(
+                zmq_key=str(uuid.uuid4()),
+                obj_size=utils.nbytes(obj),
+                peer=self.addr,
+            )
+            for obj in objs
+        ]
+        if len(keys) == 0:
+            return keys
+
+        buffers = [utils.as_buffers(obj) for obj in objs]
+        logger.debug(
+            f'Client issuing a batch set request on {len(keys)} keys',
+        )
+        await self._rpc(
+            self.addr,
+            _Op.SET_BATCH,
+            [
+                _pack_counts([len(parts) for parts in buffers]),
+                *(key.zmq_key.encode() for key in keys),
+                *itertools.chain.from_iterable(buffers),
+            ],
+        )
+        return keys
 
 
 class ZeroMQServer:
     """ZeroMQServer implementation.
 
+    Objects are stored as the list of frames they were received as so
+    that they can be sent back to clients without being joined or copied.
+
+    The server listens on a ROUTER socket and each request is handled in
+    its own task so requests from many clients are served concurrently
+    (e.g., sending a large object to one client does not block requests
+    from other clients). Requests are admitted while fewer than
+    `max_inflight` requests are in flight and the in-flight requests and
+    responses total at most `max_inflight_bytes`. Otherwise, the server
+    stops receiving until a request completes, and new requests queue in
+    ZeroMQ.
+
+    Attributes:
+        inflight_requests: Number of requests currently being handled.
+        inflight_bytes: Size in bytes of the requests and responses
+            currently being handled.
+        nbytes: Total size in bytes of the stored objects.
+
     Args:
         host: IP address of the location to start the server.
         port: The port to initiate communication on.
+        max_inflight: Maximum number of requests handled concurrently.
+        max_inflight_bytes: Optional maximum size in bytes of the requests
+            and responses being handled concurrently. A single request
+            larger than this limit is still handled once no other requests
+            are in flight.
+
+    Raises:
+        ValueError: If `max_inflight` is less than one.
     """
 
     host: str
     port: int
     chunk_size: int
-    data: dict[str, bytes]
+    data: dict[str, list[BytesLike]]
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_inflight: int = 64,
+        max_inflight_bytes: int | None = None,
+    ) -> None:
+        if max_inflight < 1:
+            raise ValueError(
+                f'Max inflight must be at least one. Got {max_inflight}.',
+            )
 
-    def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
+        self.max_inflight = max_inflight
+        self.max_inflight_bytes = max_inflight_bytes
         self.chunk_size = MAX_CHUNK_LENGTH
         self.data = {}
 
+        self.inflight_requests = 0
+        self.inflight_bytes = 0
+        self.nbytes = 0
+
         self.context = zmq.asyncio.Context()
-        self.socket = self.context.socket(zmq.REP)
+        self.socket = self.context.socket(zmq.ROUTER)
         self.socket.bind(f'tcp://{self.host}:{self.port}')
-    
+
     def close(self) -> None:
         """Close the server socket."""
         self.socket.close()
         self.context.term()
 
-    def set(self, key: str, data: bytes) -> Status:
+    def set(self, key: str, data: list[BytesLike]) -> Status:
         """Obtain and store locally data from client.
 
         Args:
             key: Object key to use.
-            data: Data to store.
+            data: Data frames to store.
 
         Returns:
             Operation status.
         """
+        self.evict(key)
         self.data[key] = data
+        self.nbytes += sum(len(frame) for frame in data)
         return Status(success=True, error=None)
 
-    def get(self, key: str) -> bytes | Status:
+    def get(self, key: str) -> list[BytesLike] | Status:
         """Return data at a given key back to the client.
 
         Args:
             key: The object key.
 
         Returns:
-            Operation status.
+            Data frames or the operation status if the key is missing.
         """
         try:
             return self.data[key]
@@ -367,7 +667,9 @@ class ZeroMQServer:
         Returns:
             Operation status.
         """
-        self.data.pop(key, None)
+        data = self.data.pop(key, None)
+        if data is not None:
+            self.nbytes -= sum(len(frame) for frame in data)
         return Status(success=True, error=None)
 
     def exists(self, key: str) -> bool:
@@ -381,60 +683,198 @@ class ZeroMQServer:
         """
         return key in self.data
 
-    async def handler(self) -> None:
-        """Handle zmq connection requests."""
-        while not self.socket.closed:  # pragma: no branch
-            try:
-                pkv = await self.socket.recv_multipart()
-                kvb = b''.join(pkv)
-
-                if kvb == b'ping':
-                    self.socket.send(b'pong')
-                    continue
+    def process(self, frames: Sequence[BytesLike]) -> list[BytesLike]:
+        """Process a request message.
 
-                kv = deserialize(kvb)
+        Args:
+            frames: Request frames where the first frame is the binary
+                header (request ID and operation) and the remaining frames
+                are the operation arguments (e.g., the key and object data).
 
-                key = kv['key']
-                data = kv['data']
-                func = kv['op']
+        Returns:
+            Response frames where the first frame is the binary header \
+            (request ID and status) and the remaining frames are the \
+            result (e.g., the object data for get requests).
+        """
+        if len(frames) == 1 and bytes(frames[0]) == b'ping':
+            return [b'pong']
 
-                if func == 'set':
-                    res = self.set(key, data)
-                else:
-                    if func == 'get':
-                        func = self.get
-                    elif func == 'exists':
-                        func = self.exists
-                    elif func == 'evict':
-                        func = self.evict
-                    else:
-                        raise AssertionError('Unreachable.')
-                    res = func(key)
-
-                if isinstance(res, Status) or isinstance(res, bool):
-                    serialized_res = serialize(res)
+        request_id, op = _HEADER.unpack(frames[0])
+        args = frames[1:]
+        try:
+            status, result = self._dispatch(op, args)
+        except Exception as e:
+            logger.exception(f'Error processing request {request_id}: {e}')
+            return [
+                _HEADER.pack(request_id, _Status.ERROR),
+                f'{type(e).__name__}: {e}'.encode(),
+            ]
+        return [_HEADER.pack(request_id, status), *result]
+
+    def _dispatch(
+        self,
+        op: int,
+        args: Sequence[BytesLike],
+    ) -> tuple[_Status, list[BytesLike]]:
+        if op in (_Op.EVICT, _Op.EXISTS, _Op.GET, _Op.SET):
+            key = bytes(args[0]).decode()
+
+        if op == _Op.EVICT:
+            self.evict(key)
+            return _Status.OK, []
+        elif op == _Op.EXISTS:
+            exists = self.exists(key)
+            return _Status.OK if exists else _Status.MISSING, []
+        elif op == _Op.GET:
+            data = self.get(key)
+            if isinstance(data, Status):
+                return _Status.MISSING, []
+            return _Status.OK, data
+        elif op == _Op.SET:
+            self.set(key, list(args[1:]))
+            return _Status.OK, []
+        elif op == _Op.GET_BATCH:
+            counts: list[int] = []
+            frames: list[BytesLike] = []
+            for key_frame in args:
+                data = self.get(bytes(key_frame).decode())
+                if isinstance(data, Status):
+                    counts.append(-1)
                 else:
-                    serialized_res = res
+                    counts.append(len(data))
+                    frames.extend(data)
+            return _Status.OK, [_pack_counts(counts), *frames]
+        elif op == _Op.SET_BATCH:
+            counts_ = _unpack_counts(args[0])
+            keys = args[1 : len(counts_) + 1]
+            offset = len(counts_) + 1
+            if len(keys) != len(counts_) or offset + sum(counts_) != len(
+                args,
+            ):
+                raise ValueError('Batch frame counts do not match message.')
+            for key_frame, count in zip(keys, counts_):
+                self.set(
+                    bytes(key_frame).decode(),
+                    list(args[offset : offset + count]),
+                )
+                offset += count
+            return _Status.OK, []
+        else:
+            raise ValueError(f'Unknown operation {op}.')
+
+    def _can_admit(self, nbytes: int) -> bool:
+        if self.inflight_requests >= self.max_inflight:
+            return False
+        return (
+            self.max_inflight_bytes is None
+            or self.inflight_requests == 0
+            or self.inflight_bytes + nbytes <= self.max_inflight_bytes
+        )
 
-                await self.socket.send_multipart(
-                    list(
-                        utils.chunk_bytes(serialized_res, self.chunk_size),
-                    ),
+    async def _handle(
+        self,
+        envelope: list[zmq.Frame],
+        request: list[zmq.Frame],
+        request_bytes: int,
+        condition: asyncio.Condition,
+    ) -> None:
+        response_bytes = 0
+        try:
+            response = self.process([frame.buffer for frame in request])
+            response_bytes = sum(len(frame) for frame in response)
+            self.inflight_bytes += response_bytes
+            await self.socket.send_multipart(
+                [*envelope, *response],
+                copy=False,
+            )
+        except zmq.ZMQError as e:  # pragma: no cover
+            logger.exception(e)
+        finally:
+            async with condition:
+                self.inflight_requests -= 1
+                self.inflight_bytes -= request_bytes + response_bytes
+                condition.notify_all()
+
+    async def handler(self) -> None:
+        """Handle zmq connection requests."""
+        condition = asyncio.Condition()
+        tasks: set[asyncio.Task[None]] = set()
+        while not self.socket.closed:  # pragma: no branch
+            try:
+                frames = await self.socket.recv_multipart(copy=False)
+                # The envelope is the routing identity frames up to and
+                # including the empty delimiter frame.
+                delimiter = next(
+                    i for i, frame in enumerate(frames) if len(frame) == 0
+                )
+                envelope = frames[: delimiter + 1]
+                request = frames[delimiter + 1 :]
+                request_bytes = sum(len(frame) for frame in request)
+
+                async with condition:
+                    await condition.wait_for(
+                        lambda: self._can_admit(request_bytes),  # noqa: B023
+                    )
+                    self.inflight_requests += 1
+                    self.inflight_bytes += request_bytes
+
+                task = asyncio.ensure_future(
+                    self._handle(envelope, request, request_bytes, condition),
                 )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
             except zmq.ZMQError as e:  # pragma: no cover
                 logger.exception(e)
                 await asyncio.sleep(0.01)
+            except StopIteration:  # pragma: no cover
+                logger.error('Dropping request without an envelope')
             except asyncio.exceptions.CancelledError:  # pragma: no cover
                 logger.debug('loop terminated')
-
-
-def start_server(host, port) -> None:
-    """Start a ZeroMQServer."""
-    server = ZeroMQServer(host, port)
+                break
+
+        for task in tasks:  # pragma: no cover
+            task.cancel()
+
+
+async def _serve(
+    host: str,
+    port: int,
+    max_inflight: int = 64,
+    max_inflight_bytes: int | None = None,
+) -> None:
+    server = ZeroMQServer(
+        host,
+        port,
+        max_inflight=max_inflight,
+        max_inflight_bytes=max_inflight_bytes,
+    )
     loop = asyncio.get_running_loop()
-    loop.add_signal_handler(signal.SIGINT, server.close)
-    loop.add_signal_handler(signal.SIGTERM, server.close)
-    loop.run_until_complete(server.handler())
+    task = asyncio.ensure_future(server.handler())
+    loop.add_signal_handler(signal.SIGINT, task.cancel)
+    loop.add_signal_handler(signal.SIGTERM, task.cancel)
+    try:
+        await task
+    finally:
+        server.close()
+
+
+def start_server(
+    host: str,
+    port: int,
+    max_inflight: int = 64,
+    max_inflight_bytes: int | None = None,
+) -> None:
+    """Start a ZeroMQServer and serve requests until SIGINT or SIGTERM.
+
+    Args:
+        host: The host for the server to listen on.
+        port: The port for the server to listen on.
+        max_inflight: Maximum number of requests handled concurrently.
+        max_inflight_bytes: Optional maximum size in bytes of the requests
+            and responses being handled concurrently.
+    """
+    logger.info(f'starting server on host {host} with port {port}')
+    asyncio.run(_serve(host, port, max_inflight, max_inflight_bytes))
 
 
 async def wait_for_server(host: str, port: int, timeout: float = 0.1) -> None:
@@ -453,40 +893,60 @@ async def wait_for_server(host: str, port: int, timeout: float = 0.1) -> None:
     socket = context.socket(zmq.REQ)
     socket.setsockopt(zmq.LINGER, 0)
 
-    with socket.connect(f'tcp://{host}:{port}'):
+    try:
+        socket.connect(f'tcp://{host}:{port}')
         await socket.send(b'ping')
 
-        poller = zmq.asyncio.Poller()
-        poller.register(socket, zmq.POLLIN)
-
         while time.time() - start < timeout:
-            event = await poller.poll(timeout)
-            if len(event) != 0:
+            if await socket.poll(timeout=10) != 0:
                 response = await socket.recv()
                 assert response == b'pong'
-                socket.close()
                 return
-
-    socket.close()
+    finally:
+        socket.close()
+        context.term()
 
     raise RuntimeError(
-        'Failed to connect to server within timeout ({timeout} seconds).',
+        f'Failed to connect to server within timeout ({timeout} seconds).',
     )
 
 
-def spawn_server(host: str, port: int, timeout: float) -> Process:
-    server_process = Process(target=start_server, args=(host, port))
+def spawn_server(
+    host: str,
+    port: int,
+    timeout: float = 1,
+    max_inflight: int = 64,
+    max_inflight_bytes: int | None = None,
+) -> Process:
+    """Spawn a ZeroMQServer in a separate process.
+
+    The server process is killed when the calling process exits.
+
+    Args:
+        host: The host for the server to listen on.
+        port: The port for the server to listen on.
+        timeout: Max time in seconds to wait for the server to exit when
+            killing it on exit.
+        max_inflight: Maximum number of requests handled concurrently.
+        max_inflight_bytes: Optional maximum size in bytes of the requests
+            and responses being handled concurrently.
+
+    Returns:
+        The server process.
+    """
+    server_process = Process(
+        target=start_server,
+        args=(host, port, max_inflight, max_inflight_bytes),
+    )
     server_process.start()
 
     def _kill_on_exit() -> None:
         server_process.terminate()
         server_process.join(timeout=timeout)
-        if server_process.is_alive():
+        if server_process.is_alive():  # pragma: no cover
             server_process.kill()
             server_process.join()
-        
-    atexit.register(_kill_on_exit)
 
-    wait_for_server(host, port, timeout=timeout)
+    atexit.register(_kill_on_exit)
 
     return server_process
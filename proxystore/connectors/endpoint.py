@@ -1,11 +1,13 @@
 """Endpoint connector implementation."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 import uuid
 from types import TracebackType
 from typing import Any
+from typing import Iterable
 from typing import NamedTuple
 from typing import Sequence
 from uuid import UUID
@@ -15,12 +17,17 @@ if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
 else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
+import aiohttp
 import requests
 
+from proxystore.connectors.connector import PayloadT
 from proxystore.endpoint import client
 from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.config import get_configs
+from proxystore.serialize import BytesLike
+from proxystore.utils import gather_concurrent
 from proxystore.utils import home_dir
+from proxystore.utils import map_concurrent
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +57,29 @@ class EndpointConnector:
         the `proxystore_dir` unspecified so the correct default directory
         will be used.
 
+    Note:
+        The async methods use an `aiohttp.ClientSession` which is created
+        on first use and bound to the running event loop. Using the async
+        methods from a different event loop will replace the session.
+
     Args:
         endpoints: Sequence of valid and running endpoint
             UUIDs to use. At least one of these endpoints must be
             accessible by this process.
         proxystore_dir: Optionally specify the proxystore home
             directory. Defaults to [`home_dir()`][proxystore.utils.home_dir].
+        batch_concurrency: Maximum number of concurrent batch requests made
+            to the endpoint by
+            [`get_batch()`][proxystore.connectors.endpoint.EndpointConnector.get_batch]
+            when the keys are located on multiple endpoints.
+        pool_size: Maximum number of keep-alive connections to the endpoint
+            kept open by the session shared by all synchronous operations.
+            This should be at least `batch_concurrency` to avoid opening
+            new connections in batch operations.
 
     Raises:
         ValueError: If endpoints is an empty list.
+        ValueError: If `pool_size` is less than one.
         EndpointConnectorError: If unable to connect to one of the endpoints
             provided.
     """
@@ -67,6 +88,8 @@ class EndpointConnector:
         self,
         endpoints: Sequence[str | UUID],
         proxystore_dir: str | None = None,
+        batch_concurrency: int = 8,
+        pool_size: int = 10,
     ) -> None:
         if len(endpoints) == 0:
             raise ValueError('At least one endpoint must be specified.')
@@ -74,6 +97,9 @@ class EndpointConnector:
             e if isinstance(e, UUID) else UUID(e, version=4) for e in endpoints
         ]
         self.proxystore_dir = proxystore_dir
+        self.batch_concurrency = batch_concurrency
+        self.pool_size = pool_size
+        self._requests_session = client.create_session(pool_size)
 
         # Find the first locally accessible endpoint to use as our
         # home endpoint
@@ -84,7 +110,7 @@ class EndpointConnector:
         for endpoint in available_endpoints:
             if endpoint.uuid in self.endpoints:
                 logger.debug(f'Attempting connection to {endpoint.uuid}')
-                response = requests.get(
+                response = self._requests_session.get(
                     f'http://{endpoint.host}:{endpoint.port}/endpoint',
                 )
                 if response.status_code == 200:
@@ -105,6 +131,7 @@ class EndpointConnector:
                     logger.debug(f'Connection to {endpoint.uuid} failed')
 
         if found_endpoint is None:
+            self._requests_session.close()
             raise EndpointConnectorError(
                 'Failed to find endpoint configuration matching one of the '
                 'provided endpoint UUIDs.',
@@ -115,6 +142,9 @@ class EndpointConnector:
 
         self.address = f'http://{self.endpoint_host}:{self.endpoint_port}'
 
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
     def __enter__(self) -> Self:
         return self
 
@@ -132,9 +162,32 @@ class EndpointConnector:
             f'@ {self.address})'
         )
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session_loop is not loop:
+            self._close_session()
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    def _close_session(self) -> None:
+        session, loop = self._session, self._session_loop
+        self._session, self._session_loop = None, None
+        if session is None or loop is None or session.closed:
+            return
+        if loop.is_running():
+            loop.create_task(session.close())
+        elif not loop.is_closed():
+            loop.run_until_complete(session.close())
+        else:
+            # The session cannot be closed gracefully once its event loop
+            # is closed so release the connection pool without awaiting.
+            session.detach()
+
     def close(self) -> None:
         """Close the connector and clean up."""
-        pass
+        self._requests_session.close()
+        self._close_session()
 
     def config(self) -> dict[str, Any]:
         """Get the connector configuration.
@@ -145,6 +198,8 @@ class EndpointConnector:
         return {
             'endpoints': [str(ep) for ep in self.endpoints],
             'proxystore_dir': self.proxystore_dir,
+            'batch_concurrency': self.batch_concurrency,
+            'pool_size': self.pool_size,
         }
 
     @classmethod
@@ -156,6 +211,14 @@ class EndpointConnector:
         """
         return cls(**config)
 
+    def pool_stats(self) -> client.PoolStats:
+        """Get the connection pool statistics of the synchronous operations.
+
+        Useful for verifying that connections are being reused (i.e., the
+        number of requests is much larger than the number of connections).
+        """
+        return client.pool_stats(self._requests_session)
+
     def evict(self, key: EndpointKey) -> None:
         """Evict the object associated with the key.
 
@@ -163,7 +226,12 @@ class EndpointConnector:
             key: Key associated with object to evict.
         """
         try:
-            client.evict(self.address, key.object_id, key.endpoint_id)
+            client.evict(
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+                session=self._requests_session,
+            )
         except requests.exceptions.RequestException as e:
             raise EndpointConnectorError(
                 f'Evict failed with error code {e.response.status_code}.',
@@ -179,7 +247,12 @@ class EndpointConnector:
             If an object associated with the key exists.
         """
         try:
-            return client.exists(self.address, key.object_id, key.endpoint_id)
+            return client.exists(
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+                session=self._requests_session,
+            )
         except requests.exceptions.RequestException as e:
             raise EndpointConnectorError(
                 f'Exists failed with error code {e.response.status_code}.',
@@ -195,15 +268,27 @@ class EndpointConnector:
             Serialized object or `None` if the object does not exist.
         """
         try:
-            return client.get(self.address, key.object_id, key.endpoint_id)
+            return client.get(
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+                session=self._requests_session,
+            )
         except requests.exceptions.RequestException as e:
             raise EndpointConnectorError(
                 f'Get failed with error code {e.response.status_code}.',
             ) from e
 
-    def get_batch(self, keys: Sequence[EndpointKey]) -> list[bytes | None]:
+    def get_batch(
+        self,
+        keys: Sequence[EndpointKey],
+    ) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Keys are grouped by the endpoint where the objects are located and
+        each group is retrieved with a single batch request. Requests for
+        different groups are made concurrently from a thread pool.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -211,9 +296,37 @@ class EndpointConnector:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
 
-    def put(self, obj: bytes) -> EndpointKey:
+        def _get_group(
+            group: tuple[str | None, list[int]],
+        ) -> list[BytesLike | None]:
+            endpoint_id, indices = group
+            return client.get_batch(
+                self.address,
+                [keys[i].object_id for i in indices],
+                endpoint_id,
+                session=self._requests_session,
+            )
+
+        groups = _group_by_endpoint(keys)
+        try:
+            results = map_concurrent(
+                _get_group,
+                list(groups.items()),
+                self.batch_concurrency,
+            )
+        except requests.exceptions.RequestException as e:
+            raise EndpointConnectorError(
+                _request_error_message('Get batch', e),
+            ) from e
+        except ValueError as e:
+            raise EndpointConnectorError(
+                f'Get batch returned an invalid response: {e}',
+            ) from e
+
+        return _ungroup(len(keys), groups.values(), results)
+
+    def put(self, obj: PayloadT) -> EndpointKey:
         """Put a serialized object in the store.
 
         Args:
@@ -227,7 +340,13 @@ class EndpointConnector:
             endpoint_id=str(self.endpoint_uuid),
         )
         try:
-            client.put(self.address, key.object_id, obj, key.endpoint_id)
+            client.put(
+                self.address,
+                key.object_id,
+                obj,
+                key.endpoint_id,
+                session=self._requests_session,
+            )
         except requests.exceptions.RequestException as e:
             raise EndpointConnectorError(
                 f'Put failed with error code {e.response.status_code}.',
@@ -235,9 +354,11 @@ class EndpointConnector:
 
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[EndpointKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[EndpointKey]:
         """Put a batch of serialized objects in the store.
 
+        The objects are streamed to the endpoint in a single batch request.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
 
@@ -245,4 +366,193 @@ class EndpointConnector:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        keys = [
+            EndpointKey(
+                object_id=str(uuid.uuid4()),
+                endpoint_id=str(self.endpoint_uuid),
+            )
+            for _ in objs
+        ]
+        if len(keys) == 0:
+            return keys
+
+        try:
+            client.put_batch(
+                self.address,
+                [key.object_id for key in keys],
+                objs,
+                str(self.endpoint_uuid),
+                session=self._requests_session,
+            )
+        except requests.exceptions.RequestException as e:
+            raise EndpointConnectorError(
+                _request_error_message('Put batch', e),
+            ) from e
+
+        return keys
+
+    async def aevict(self, key: EndpointKey) -> None:
+        """Evict the object associated with the key asynchronously."""
+        try:
+            await client.aevict(
+                self._get_session(),
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Evict failed with error code {e.status}.',
+            ) from e
+
+    async def aexists(self, key: EndpointKey) -> bool:
+        """Check if an object associated with the key exists asynchronously."""
+        try:
+            return await client.aexists(
+                self._get_session(),
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Exists failed with error code {e.status}.',
+            ) from e
+
+    async def aget(self, key: EndpointKey) -> bytes | None:
+        """Get the serialized object associated with the key asynchronously."""
+        try:
+            return await client.aget(
+                self._get_session(),
+                self.address,
+                key.object_id,
+                key.endpoint_id,
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Get failed with error code {e.status}.',
+            ) from e
+
+    async def aget_batch(
+        self,
+        keys: Sequence[EndpointKey],
+    ) -> list[BytesLike | None]:
+        """Get a batch of serialized objects asynchronously.
+
+        See [`get_batch()`][proxystore.connectors.endpoint.EndpointConnector.get_batch]
+        for details.
+        """
+
+        async def _get_group(
+            group: tuple[str | None, list[int]],
+        ) -> list[BytesLike | None]:
+            endpoint_id, indices = group
+            return await client.aget_batch(
+                self._get_session(),
+                self.address,
+                [keys[i].object_id for i in indices],
+                endpoint_id,
+            )
+
+        groups = _group_by_endpoint(keys)
+        try:
+            results = await gather_concurrent(
+                _get_group,
+                list(groups.items()),
+                self.batch_concurrency,
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Get batch failed with error code {e.status}.',
+            ) from e
+        except ValueError as e:
+            raise EndpointConnectorError(
+                f'Get batch returned an invalid response: {e}',
+            ) from e
+
+        return _ungroup(len(keys), groups.values(), results)
+
+    async def aput(self, obj: PayloadT) -> EndpointKey:
+        """Put a serialized object in the store asynchronously."""
+        key = EndpointKey(
+            object_id=str(uuid.uuid4()),
+            endpoint_id=str(self.endpoint_uuid),
+        )
+        try:
+            await client.aput(
+                self._get_session(),
+                self.address,
+                key.object_id,
+                obj,
+                key.endpoint_id,
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Put failed with error code {e.status}.',
+            ) from e
+
+        return key
+
+    async def aput_batch(self, objs: Sequence[PayloadT]) -> list[EndpointKey]:
+        """Put a batch of serialized objects in the store asynchronously.
+
+        See [`put_batch()`][proxystore.connectors.endpoint.EndpointConnector.put_batch]
+        for details.
+        """
+        keys = [
+            EndpointKey(
+                object_id=str(uuid.uuid4()),
+                endpoint_id=str(self.endpoint_uuid),
+            )
+            for _ in objs
+        ]
+        if len(keys) == 0:
+            return keys
+
+        try:
+            await client.aput_batch(
+                self._get_session(),
+                self.address,
+                [key.object_id for key in keys],
+                objs,
+                str(self.endpoint_uuid),
+            )
+        except aiohttp.ClientResponseError as e:
+            raise EndpointConnectorError(
+                f'Put batch failed with error code {e.status}.',
+            ) from e
+
+        return keys
+
+
+def _request_error_message(
+    operation: str,
+    error: requests.exceptions.RequestException,
+) -> str:
+    # Connection errors and timeouts do not have a response.
+    if error.response is None:
+        return f'{operation} failed: {error}'
+    return f'{operation} failed with error code {error.response.status_code}.'
+
+
+def _group_by_endpoint(
+    keys: Sequence[EndpointKey],
+) -> dict[str | None, list[int]]:
+    """Group the indices of keys by the endpoint the object is located on."""
+    groups: dict[str | None, list[int]] = {}
+    for index, key in enumerate(keys):
+        groups.setdefault(key.endpoint_id, []).append(index)
+    return groups
+
+
+def _ungroup(
+    size: int,
+    groups: Iterable[list[int]],
+    results: Iterable[list[BytesLike | None]],
+) -> list[BytesLike | None]:
+    """Reorder results of each group to the order of the original keys."""
+    ordered: list[BytesLike | None] = [None] * size
+    for indices, group_results in zip(groups, results):
+        for index, result in zip(indices, group_results):
+            ordered[index] = result
+    return ordered
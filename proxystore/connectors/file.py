@@ -1,22 +1,41 @@
 """File system connector implementation."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import mmap
 import os
 import shutil
 import sys
 import uuid
 from types import TracebackType
 from typing import Any
+from typing import Callable
 from typing import NamedTuple
 from typing import Sequence
+from typing import TypeVar
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
     from typing import Self
 else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
+from proxystore.connectors.connector import PayloadT
+from proxystore.serialize import BytesLike
+from proxystore.utils import as_buffers
+from proxystore.utils import gather_concurrent
+from proxystore.utils import map_concurrent
+
 logger = logging.getLogger(__name__)
+T = TypeVar('T')
+
+# Max number of buffers passed to a single writev call. POSIX only
+# guarantees IOV_MAX >= 16 if it cannot be queried.
+try:
+    _IOV_MAX = max(16, os.sysconf('SC_IOV_MAX'))
+except (AttributeError, ValueError, OSError):  # pragma: no cover
+    _IOV_MAX = 16
 
 
 class FileKey(NamedTuple):
@@ -26,16 +45,82 @@ class FileKey(NamedTuple):
     """Unique object filename."""
 
 
+def _write_buffers(fd: int, obj: PayloadT) -> None:
+    """Write all buffers to a file descriptor without joining them.
+
+    Uses [`os.writev()`][os.writev] (gather write) when available and
+    handles partial writes.
+    """
+    buffers = [b for b in as_buffers(obj) if b.nbytes > 0]
+    writev = getattr(os, 'writev', None)
+    while len(buffers) > 0:
+        if writev is not None:
+            written = writev(fd, buffers[:_IOV_MAX])
+        else:  # pragma: no cover
+            written = os.write(fd, buffers[0])
+        # Drop fully written buffers and slice a partially written buffer
+        while written > 0:
+            if written >= buffers[0].nbytes:
+                written -= buffers[0].nbytes
+                buffers.pop(0)
+            else:
+                buffers[0] = buffers[0][written:]
+                written = 0
+
+
+async def _run_in_executor(function: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(function, *args))
+
+
+def _mmap_file(fd: int) -> BytesLike:
+    """Memory-map a file as a read-only view.
+
+    The mapping remains valid after `fd` is closed and after the file is
+    removed.
+    """
+    if os.fstat(fd).st_size == 0:
+        # Empty files cannot be memory-mapped.
+        return b''
+    return memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+
+
 class FileConnector:
     """Connector to shared file system.
 
+    Tip:
+        Set `mmap=True` to avoid copying objects into memory on every
+        [`get()`][proxystore.connectors.file.FileConnector.get]. Objects
+        are instead returned as read-only [`memoryview`][memoryview]
+        instances over memory-mapped files so repeated reads of the same
+        object on a node share the pages in the OS page cache. Combined with
+        [`serialize_buffers()`][proxystore.serialize.serialize_buffers],
+        [`deserialize()`][proxystore.serialize.deserialize] with
+        `copy=False` will construct large buffers (e.g., NumPy arrays)
+        directly on top of the mapped memory. Note that such arrays are
+        read-only.
+
     Args:
         store_dir: Path to directory to store data in. Note this
             directory will be deleted upon closing the store.
+        mmap: Return memory-mapped views of objects rather than reading
+            the objects into [`bytes`][bytes].
+        batch_concurrency: Maximum number of files read or written
+            concurrently by
+            [`get_batch()`][proxystore.connectors.file.FileConnector.get_batch]
+            and
+            [`put_batch()`][proxystore.connectors.file.FileConnector.put_batch].
     """
 
-    def __init__(self, store_dir: str) -> None:
+    def __init__(
+        self,
+        store_dir: str,
+        mmap: bool = False,
+        batch_concurrency: int = 8,
+    ) -> None:
         self.store_dir = os.path.abspath(store_dir)
+        self.mmap = mmap
+        self.batch_concurrency = batch_concurrency
 
         if not os.path.exists(self.store_dir):
             os.makedirs(self.store_dir, exist_ok=True)
@@ -52,7 +137,10 @@ class FileConnector:
         self.close()
 
     def __repr__(self) -> str:
-        return f'{self.__class__.__name__}(directory={self.store_dir})'
+        return (
+            f'{self.__class__.__name__}(directory={self.store_dir}, '
+            f'mmap={self.mmap})'
+        )
 
     def close(self) -> None:
         """Close the connector and clean up.
@@ -73,7 +161,11 @@ class FileConnector:
         The configuration contains all the information needed to reconstruct
         the connector object.
         """
-        return {'store_dir': self.store_dir}
+        return {
+            'store_dir': self.store_dir,
+            'mmap': self.mmap,
+            'batch_concurrency': self.batch_concurrency,
+        }
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> FileConnector:
@@ -106,25 +198,31 @@ class FileConnector:
         path = os.path.join(self.store_dir, key.filename)
         return os.path.exists(path)
 
-    def get(self, key: FileKey) -> bytes | None:
+    def get(self, key: FileKey) -> BytesLike | None:
         """Get the serialized object associated with the key.
 
         Args:
             key: Key associated with the object to retrieve.
 
         Returns:
-            Serialized object or `None` if the object does not exist.
+            Serialized object or `None` if the object does not exist. \
+            If `mmap=True`, the object is a read-only \
+            [`memoryview`][memoryview] of the memory-mapped file.
         """
         path = os.path.join(self.store_dir, key.filename)
-        if os.path.exists(path):
+        try:
             with open(path, 'rb') as f:
-                data = f.read()
-                return data
-        return None
+                if self.mmap:
+                    return _mmap_file(f.fileno())
+                return f.read()
+        except FileNotFoundError:
+            return None
 
-    def get_batch(self, keys: Sequence[FileKey]) -> list[bytes | None]:
+    def get_batch(self, keys: Sequence[FileKey]) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Files are read concurrently in a thread pool.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -132,11 +230,14 @@ class FileConnector:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        return map_concurrent(self.get, keys, self.batch_concurrency)
 
-    def put(self, obj: bytes) -> FileKey:
+    def put(self, obj: PayloadT) -> FileKey:
         """Put a serialized object in the store.
 
+        Multi-part objects are written with a single gather write and are
+        not joined in memory.
+
         Args:
             obj: Serialized object to put in the store.
 
@@ -147,13 +248,15 @@ class FileConnector:
 
         path = os.path.join(self.store_dir, key.filename)
         with open(path, 'wb', buffering=0) as f:
-            f.write(obj)
+            _write_buffers(f.fileno(), obj)
 
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[FileKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[FileKey]:
         """Put a batch of serialized objects in the store.
 
+        Files are written concurrently in a thread pool.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
 
@@ -161,4 +264,59 @@ class FileConnector:
             List of keys with the same order as `objs` which can be used to
             retrieve the objects.
         """
-        return [self.put(obj) for obj in objs]
+        return map_concurrent(self.put, objs, self.batch_concurrency)
+
+    async def aevict(self, key: FileKey) -> None:
+        """Evict the object associated with the key asynchronously.
+
+        File operations are run in the default executor of the event loop.
+        """
+        await _run_in_executor(self.evict, key)
+
+    async def aexists(self, key: FileKey) -> bool:
+        """Check if an object associated with the key exists asynchronously.
+
+        File operations are run in the default executor of the event loop.
+        """
+        return await _run_in_executor(self.exists, key)
+
+    async def aget(self, key: FileKey) -> BytesLike | None:
+        """Get the serialized object associated with the key asynchronously.
+
+        File operations are run in the default executor of the event loop.
+        """
+        return await _run_in_executor(self.get, key)
+
+    async def aget_batch(
+        self,
+        keys: Sequence[FileKey],
+    ) -> list[BytesLike | None]:
+        """Get a batch of serialized objects asynchronously.
+
+        Up to `batch_concurrency` files are read concurrently in the default
+        executor of the event loop.
+        """
+        return await gather_concurrent(
+            self.aget,
+            keys,
+            self.batch_concurrency,
+        )
+
+    async def aput(self, obj: PayloadT) -> FileKey:
+        """Put a serialized object in the store asynchronously.
+
+        File operations are run in the default executor of the event loop.
+        """
+        return await _run_in_executor(self.put, obj)
+
+    async def aput_batch(self, objs: Sequence[PayloadT]) -> list[FileKey]:
+        """Put a batch of serialized objects in the store asynchronously.
+
+        Up to `batch_concurrency` files are written concurrently in the
+        default executor of the event loop.
+        """
+        return await gather_concurrent(
+            self.aput,
+            objs,
+            self.batch_concurrency,
+        )
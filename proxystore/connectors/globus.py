@@ -29,8 +29,10 @@ else:  # pragma: <3.9 cover
 
 import globus_sdk
 
+from proxystore.connectors.connector import PayloadT
 from proxystore.globus import get_proxystore_authorizer
 from proxystore.globus import GlobusAuthFileError
+from proxystore.utils import as_buffers
 from proxystore.utils import hostname
 
 logger = logging.getLogger(__name__)
@@ -570,7 +572,7 @@ class GlobusConnector:
         """
         return [self.get(key) for key in keys]
 
-    def put(self, obj: bytes) -> GlobusKey:
+    def put(self, obj: PayloadT) -> GlobusKey:
         """Put a serialized object in the store.
 
         Args:
@@ -584,14 +586,14 @@ class GlobusConnector:
         path = self._get_filepath(filename)
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
-        with open(path, 'wb', buffering=0) as f:
-            f.write(obj)
+        with open(path, 'wb') as f:
+            f.writelines(as_buffers(obj))
 
         task_id = self._transfer_files(filename)
 
         return GlobusKey(filename=filename, task_id=task_id)
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[GlobusKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[GlobusKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
@@ -607,8 +609,8 @@ class GlobusConnector:
             path = self._get_filepath(filename)
             os.makedirs(os.path.dirname(path), exist_ok=True)
 
-            with open(path, 'wb', buffering=0) as f:
-                f.write(obj)
+            with open(path, 'wb') as f:
+                f.writelines(as_buffers(obj))
 
         task_id = self._transfer_files(filenames)
 
@@ -14,6 +14,9 @@ if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
 else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
+from proxystore.connectors.connector import PayloadT
+from proxystore.utils import join_buffers
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,7 +124,7 @@ class LocalConnector:
         """
         return [self.get(key) for key in keys]
 
-    def put(self, obj: bytes) -> LocalKey:
+    def put(self, obj: PayloadT) -> LocalKey:
         """Put a serialized object in the store.
 
         Args:
@@ -131,10 +134,10 @@ class LocalConnector:
             Key which can be used to retrieve the object.
         """
         key = LocalKey(str(uuid.uuid4()))
-        self._store[key] = obj
+        self._store[key] = join_buffers(obj)
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[LocalKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[LocalKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
@@ -23,8 +23,11 @@ else:  # pragma: <3.8 cover
     from typing_extensions import TypedDict
 
 from proxystore.connectors.connector import Connector
+from proxystore.connectors.connector import PayloadT
+from proxystore.serialize import BytesLike
 from proxystore.utils import get_class_path
 from proxystore.utils import import_class
+from proxystore.utils import nbytes
 from proxystore.warnings import ExperimentalWarning
 
 warnings.warn(
@@ -131,6 +134,14 @@ class MultiKey(NamedTuple):
     """Key associated with the object."""
 
 
+def _group_by_connector(names: Sequence[str]) -> dict[str, list[int]]:
+    """Group indices of a sequence by connector name."""
+    groups: dict[str, list[int]] = {}
+    for index, name in enumerate(names):
+        groups.setdefault(name, []).append(index)
+    return groups
+
+
 class MultiConnector:
     """Policy based manager for a [`Connector`][proxystore.connectors.connector.Connector] collection.
 
@@ -230,7 +241,7 @@ class MultiConnector:
         connector = self.connectors[key.connector_name].connector
         return connector.exists(key.connector_key)
 
-    def get(self, key: MultiKey) -> bytes | None:
+    def get(self, key: MultiKey) -> BytesLike | None:
         """Get the serialized object associated with the key.
 
         Args:
@@ -242,9 +253,12 @@ class MultiConnector:
         connector = self.connectors[key.connector_name].connector
         return connector.get(key.connector_key)
 
-    def get_batch(self, keys: Sequence[MultiKey]) -> list[bytes | None]:
+    def get_batch(self, keys: Sequence[MultiKey]) -> list[BytesLike | None]:
         """Get a batch of serialized objects associated with the keys.
 
+        Keys are grouped by connector and each group is retrieved with a
+        single call to the `get_batch()` method of the connector.
+
         Args:
             keys: Sequence of keys associated with objects to retrieve.
 
@@ -252,11 +266,21 @@ class MultiConnector:
             List with same order as `keys` with the serialized objects or
             `None` if the corresponding key does not have an associated object.
         """
-        return [self.get(key) for key in keys]
+        results: list[BytesLike | None] = [None] * len(keys)
+        for name, indices in _group_by_connector(
+            [key.connector_name for key in keys],
+        ).items():
+            connector = self.connectors[name].connector
+            values = connector.get_batch(
+                [keys[i].connector_key for i in indices],
+            )
+            for index, value in zip(indices, values):
+                results[index] = value
+        return results
 
     def put(
         self,
-        obj: bytes,
+        obj: PayloadT,
         subset_tags: Iterable[str] = (),
         superset_tags: Iterable[str] = (),
     ) -> MultiKey:
@@ -275,32 +299,26 @@ class MultiConnector:
         Raises:
             RuntimeError: If no connector policy matches the arguments.
         """
-        for connector_name in self.connectors_by_priority:
-            connector, policy = self.connectors[connector_name]
-            if policy.is_valid(
-                size=len(obj),
-                subset_tags=subset_tags,
-                superset_tags=superset_tags,
-            ):
-                key = connector.put(obj)
-                return MultiKey(
-                    connector_name=connector_name,
-                    connector_key=key,
-                )
-        else:
-            raise RuntimeError(
-                'No connector policy was suitable for the constraints: '
-                f'subset_tags={subset_tags}, superset_tags={superset_tags}.',
-            )
+        connector_name = self._select_connector(
+            nbytes(obj),
+            subset_tags,
+            superset_tags,
+        )
+        key = self.connectors[connector_name].connector.put(obj)
+        return MultiKey(connector_name=connector_name, connector_key=key)
 
     def put_batch(
         self,
-        objs: Sequence[bytes],
+        objs: Sequence[PayloadT],
         subset_tags: Iterable[str] = (),
         superset_tags: Iterable[str] = (),
     ) -> list[MultiKey]:
         """Put a batch of serialized objects in the store.
 
+        Objects are grouped by the connector selected by the policies and
+        each group is stored with a single call to the `put_batch()` method
+        of the connector.
+
         Args:
             objs: Sequence of serialized objects to put in the store.
             subset_tags: Iterable of tags that must be a subset
@@ -316,7 +334,36 @@ class MultiConnector:
         Raises:
             RuntimeError: If no connector policy matches the arguments.
         """
-        return [
-            self.put(obj, subset_tags=subset_tags, superset_tags=superset_tags)
+        names = [
+            self._select_connector(nbytes(obj), subset_tags, superset_tags)
             for obj in objs
         ]
+        keys: list[MultiKey | None] = [None] * len(objs)
+        for name, indices in _group_by_connector(names).items():
+            connector = self.connectors[name].connector
+            connector_keys = connector.put_batch([objs[i] for i in indices])
+            for index, connector_key in zip(indices, connector_keys):
+                keys[index] = MultiKey(
+                    connector_name=name,
+                    connector_key=connector_key,
+                )
+        return [key for key in keys if key is not None]
+
+    def _select_connector(
+        self,
+        size: int,
+        subset_tags: Iterable[str],
+        superset_tags: Iterable[str],
+    ) -> str:
+        for connector_name in self.connectors_by_priority:
+            policy = self.connectors[connector_name].policy
+            if policy.is_valid(
+                size=size,
+                subset_tags=subset_tags,
+                superset_tags=superset_tags,
+            ):
+                return connector_name
+        raise RuntimeError(
+            'No connector policy was suitable for the constraints: '
+            f'subset_tags={subset_tags}, superset_tags={superset_tags}.',
+        )
@@ -1,6 +1,7 @@
 """Redis connector implementation."""
 from __future__ import annotations
 
+import asyncio
 import sys
 import uuid
 from types import TracebackType
@@ -14,6 +15,10 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 import redis
+import redis.asyncio
+
+from proxystore.connectors.connector import PayloadT
+from proxystore.utils import as_buffers
 
 
 class RedisKey(NamedTuple):
@@ -23,9 +28,42 @@ class RedisKey(NamedTuple):
     """Unique object ID."""
 
 
+def _set_buffers(
+    client: (
+        redis.StrictRedis[Any]
+        | redis.client.Pipeline[Any]
+        | redis.asyncio.client.Pipeline[Any]
+    ),
+    name: str,
+    buffers: Sequence[memoryview],
+) -> None:
+    """Set a multi-part value without joining the parts in memory.
+
+    The first part is set with `SET` and the remaining parts are appended
+    with `APPEND`. The caller is responsible for executing the commands in
+    a pipeline if `client` is a pipeline.
+    """
+    first = buffers[0] if len(buffers) > 0 else b''
+    # redis-py accepts memoryviews but the type stubs only allow bytes.
+    client.set(name, first)  # type: ignore[arg-type]
+    for buffer in buffers[1:]:
+        client.append(name, buffer)
+
+
+async def _close_async_client(client: redis.asyncio.StrictRedis[Any]) -> None:
+    # redis-py 5 renamed close() to aclose() but the type stubs predate it.
+    await client.aclose()  # type: ignore[attr-defined]
+
+
 class RedisConnector:
     """Redis server connector.
 
+    Note:
+        The async methods use a `redis.asyncio` client which is created on
+        first use and bound to the running event loop. Call
+        [`aclose()`][proxystore.connectors.redis.RedisConnector.aclose]
+        from that event loop to close the client before the loop is closed.
+
     Args:
         hostname: Redis server hostname.
         port: Redis server port.
@@ -35,6 +73,19 @@ class RedisConnector:
         self.hostname = hostname
         self.port = port
         self._redis_client = redis.StrictRedis(host=hostname, port=port)
+        self._async_redis_client: redis.asyncio.StrictRedis[Any] | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._close_task: asyncio.Task[None] | None = None
+
+    @property
+    def _aclient(self) -> redis.asyncio.StrictRedis[Any]:
+        if self._async_redis_client is None:
+            self._async_redis_client = redis.asyncio.StrictRedis(
+                host=self.hostname,
+                port=self.port,
+            )
+            self._async_loop = asyncio.get_running_loop()
+        return self._async_redis_client
 
     def __enter__(self) -> Self:
         return self
@@ -54,8 +105,46 @@ class RedisConnector:
         )
 
     def close(self) -> None:
-        """Close the connector and clean up."""
-        pass
+        """Close the connector and clean up.
+
+        Closes the connection pool of the client and of the async client,
+        if one was created. The async client is closed on the event loop it
+        was created in unless that loop is already closed.
+        """
+        self._redis_client.close()
+
+        client, self._async_redis_client = self._async_redis_client, None
+        loop, self._async_loop = self._async_loop, None
+        if client is None or loop is None or loop.is_closed():
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if loop is running_loop:
+            # Cannot block the running loop so close in a new task.
+            self._close_task = loop.create_task(_close_async_client(client))
+        elif loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(
+                _close_async_client(client),
+                loop,
+            )
+            future.result()
+        else:
+            loop.run_until_complete(_close_async_client(client))
+
+    async def aclose(self) -> None:
+        """Close the connector and clean up asynchronously.
+
+        Must be called from the event loop the async client was created in.
+        """
+        self._redis_client.close()
+        client, self._async_redis_client = self._async_redis_client, None
+        self._async_loop = None
+        if client is not None:
+            await _close_async_client(client)
 
     def config(self) -> dict[str, Any]:
         """Get the connector configuration.
@@ -116,9 +205,12 @@ class RedisConnector:
         """
         return self._redis_client.mget([key.redis_key for key in keys])
 
-    def put(self, obj: bytes) -> RedisKey:
+    def put(self, obj: PayloadT) -> RedisKey:
         """Put a serialized object in the store.
 
+        Multi-part objects are written with a transactional `SET` and
+        `APPEND` pipeline so the parts are not joined in memory.
+
         Args:
             obj: Serialized object to put in the store.
 
@@ -126,10 +218,19 @@ class RedisConnector:
             Key which can be used to retrieve the object.
         """
         key = RedisKey(redis_key=str(uuid.uuid4()))
-        self._redis_client.set(key.redis_key, obj)
+        buffers = as_buffers(obj)
+        if len(buffers) == 1:
+            self._redis_client.set(
+                key.redis_key,
+                buffers[0],  # type: ignore[arg-type]
+            )
+        else:
+            pipeline = self._redis_client.pipeline(transaction=True)
+            _set_buffers(pipeline, key.redis_key, buffers)
+            pipeline.execute()
         return key
 
-    def put_batch(self, objs: Sequence[bytes]) -> list[RedisKey]:
+    def put_batch(self, objs: Sequence[PayloadT]) -> list[RedisKey]:
         """Put a batch of serialized objects in the store.
 
         Args:
@@ -140,7 +241,74 @@ class RedisConnector:
             retrieve the objects.
         """
         keys = [RedisKey(redis_key=str(uuid.uuid4())) for _ in objs]
-        self._redis_client.mset(
-            {key.redis_key: obj for key, obj in zip(keys, objs)},
-        )
+        buffers = [as_buffers(obj) for obj in objs]
+        if all(len(parts) == 1 for parts in buffers):
+            self._redis_client.mset(
+                {
+                    key.redis_key: parts[0]  # type: ignore[misc]
+                    for key, parts in zip(keys, buffers)
+                },
+            )
+        else:
+            pipeline = self._redis_client.pipeline(transaction=True)
+            for key, parts in zip(keys, buffers):
+                _set_buffers(pipeline, key.redis_key, parts)
+            pipeline.execute()
+        return keys
+
+    async def aevict(self, key: RedisKey) -> None:
+        """Evict the object associated with the key asynchronously."""
+        await self._aclient.delete(key.redis_key)
+
+    async def aexists(self, key: RedisKey) -> bool:
+        """Check if an object associated with the key exists asynchronously."""
+        return bool(await self._aclient.exists(key.redis_key))
+
+    async def aget(self, key: RedisKey) -> bytes | None:
+        """Get the serialized object associated with the key asynchronously."""
+        return await self._aclient.get(key.redis_key)
+
+    async def aget_batch(self, keys: Sequence[RedisKey]) -> list[bytes | None]:
+        """Get a batch of serialized objects asynchronously with `MGET`."""
+        return await self._aclient.mget([key.redis_key for key in keys])
+
+    async def aput(self, obj: PayloadT) -> RedisKey:
+        """Put a serialized object in the store asynchronously.
+
+        See [`put()`][proxystore.connectors.redis.RedisConnector.put] for
+        details.
+        """
+        key = RedisKey(redis_key=str(uuid.uuid4()))
+        buffers = as_buffers(obj)
+        if len(buffers) == 1:
+            await self._aclient.set(
+                key.redis_key,
+                buffers[0],  # type: ignore[arg-type]
+            )
+        else:
+            pipeline = self._aclient.pipeline(transaction=True)
+            _set_buffers(pipeline, key.redis_key, buffers)
+            await pipeline.execute()
+        return key
+
+    async def aput_batch(self, objs: Sequence[PayloadT]) -> list[RedisKey]:
+        """Put a batch of serialized objects in the store asynchronously.
+
+        See [`put_batch()`][proxystore.connectors.redis.RedisConnector.put_batch]
+        for details.
+        """
+        keys = [RedisKey(redis_key=str(uuid.uuid4())) for _ in objs]
+        buffers = [as_buffers(obj) for obj in objs]
+        if all(len(parts) == 1 for parts in buffers):
+            await self._aclient.mset(
+                {
+                    key.redis_key: parts[0]  # type: ignore[misc]
+                    for key, parts in zip(keys, buffers)
+                },
+            )
+        else:
+            pipeline = self._aclient.pipeline(transaction=True)
+            for key, parts in zip(keys, buffers):
+                _set_buffers(pipeline, key.redis_key, parts)
+            await pipeline.execute()
         return keys
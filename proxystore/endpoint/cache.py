@@ -0,0 +1,301 @@
+"""Read cache for objects retrieved from peer endpoints.
+
+An [`Endpoint`][proxystore.endpoint.endpoint.Endpoint] configured with a
+peer cache keeps the objects it retrieves from peer endpoints in a
+[`PeerCache`][proxystore.endpoint.cache.PeerCache] so repeated requests for
+the same object are served locally rather than transferred from the peer
+again. Concurrent requests for an object which is not cached share a single
+request to the peer.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from uuid import UUID
+
+from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
+from proxystore.endpoint.policies import DemotionPolicy
+from proxystore.endpoint.policies import get_demotion_policy
+from proxystore.endpoint.storage import EndpointStorage
+from proxystore.serialize import BytesLike
+from proxystore.utils import achunk_bytes
+
+# Result of an in-flight request which did not complete so waiters should
+# make their own request.
+_ABANDONED = object()
+
+
+class PeerCache:
+    """Read-through cache of objects retrieved from peer endpoints.
+
+    Cached objects are stored in an
+    [`EndpointStorage`][proxystore.endpoint.storage.EndpointStorage]
+    separate from the objects owned by the endpoint. Objects selected by
+    the demotion policy are evicted when the cache exceeds `max_size`, and
+    objects expire `ttl` seconds after being cached. Missing keys are not
+    cached.
+
+    Args:
+        max_size: Maximum size in bytes of the cached objects. Objects
+            larger than this are not cached.
+        ttl: Optional time in seconds after which a cached object expires.
+        demotion_policy: Policy, or name of a policy in
+            [`DEMOTION_POLICIES`][proxystore.endpoint.policies.DEMOTION_POLICIES],
+            used to select objects to evict.
+
+    Raises:
+        ValueError: If `max_size` or `ttl` are not greater than zero.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float | None = None,
+        demotion_policy: DemotionPolicy | str = 'lru',
+    ) -> None:
+        if max_size < 1:
+            raise ValueError('Max size must be greater than zero.')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('TTL must be None or greater than zero.')
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._storage = EndpointStorage()
+        self._policy = (
+            get_demotion_policy(demotion_policy)
+            if isinstance(demotion_policy, str)
+            else demotion_policy
+        )
+        self._size = 0
+        self._expires: dict[str, float] = {}
+        # Futures of in-flight peer requests. A request is removed if its
+        # key is invalidated so the stale result is not cached.
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached objects."""
+        return self._size
+
+    @staticmethod
+    def _cache_key(endpoint: UUID, key: str) -> str:
+        return f'{endpoint}/{key}'
+
+    def lookup(self, endpoint: UUID, key: str) -> bytes | None:
+        """Get a cached object.
+
+        Args:
+            endpoint: UUID of the peer endpoint which owns the object.
+            key: Key of the object.
+
+        Returns:
+            The object or `None` if the object is not cached or has expired.
+        """
+        cache_key = self._cache_key(endpoint, key)
+        expires = self._expires.get(cache_key)
+        if expires is None:
+            return None
+        if time.monotonic() >= expires:
+            self._remove(cache_key)
+            return None
+        self._policy.access(cache_key)
+        return self._storage[cache_key]
+
+    def insert(self, endpoint: UUID, key: str, value: bytes) -> None:
+        """Cache an object.
+
+        Args:
+            endpoint: UUID of the peer endpoint which owns the object.
+            key: Key of the object.
+            value: The object.
+        """
+        self._insert(self._cache_key(endpoint, key), value)
+
+    def invalidate(self, endpoint: UUID, key: str) -> None:
+        """Remove an object from the cache.
+
+        An in-flight request for the object will not cache its result.
+
+        Args:
+            endpoint: UUID of the peer endpoint which owns the object.
+            key: Key of the object.
+        """
+        cache_key = self._cache_key(endpoint, key)
+        self._inflight.pop(cache_key, None)
+        if cache_key in self._expires:
+            self._remove(cache_key)
+
+    def clear(self) -> None:
+        """Remove all objects from the cache."""
+        for cache_key in list(self._expires):
+            self._remove(cache_key)
+        self._inflight.clear()
+
+    async def get(
+        self,
+        endpoint: UUID,
+        key: str,
+        fetch: Callable[[], Awaitable[bytes | None]],
+    ) -> bytes | None:
+        """Get an object from the cache or the peer endpoint.
+
+        Args:
+            endpoint: UUID of the peer endpoint which owns the object.
+            key: Key of the object.
+            fetch: Coroutine function which requests the object from the
+                peer endpoint. Only called if the object is not cached and
+                no request for the object is in-flight.
+
+        Returns:
+            The object or `None` if the object does not exist.
+        """
+        found, value = await self._cached(endpoint, key)
+        if found:
+            return value
+
+        cache_key, future = self._start(endpoint, key)
+        try:
+            value = await fetch()
+        except BaseException:
+            self._finish(cache_key, future, _ABANDONED)
+            raise
+        self._finish(cache_key, future, value)
+        return value
+
+    async def stream(
+        self,
+        endpoint: UUID,
+        key: str,
+        fetch: Callable[[], Awaitable[AsyncIterator[BytesLike] | None]],
+    ) -> AsyncIterator[BytesLike] | None:
+        """Get an object as a stream of chunks from the cache or the peer.
+
+        If the object is not cached, the stream from the peer endpoint is
+        returned and the object is cached once the stream has been
+        consumed.
+
+        Args:
+            endpoint: UUID of the peer endpoint which owns the object.
+            key: Key of the object.
+            fetch: Coroutine function which requests the object from the
+                peer endpoint as a stream. Only called if the object is not
+                cached and no request for the object is in-flight.
+
+        Returns:
+            Async iterator of chunks of the object or `None` if the object \
+            does not exist.
+        """
+        found, value = await self._cached(endpoint, key)
+        if found:
+            return None if value is None else achunk_bytes(
+                value,
+                MAX_CHUNK_LENGTH,
+            )
+
+        cache_key, future = self._start(endpoint, key)
+        try:
+            chunks = await fetch()
+        except BaseException:
+            self._finish(cache_key, future, _ABANDONED)
+            raise
+        if chunks is None:
+            self._finish(cache_key, future, None)
+            return None
+        return self._tee(cache_key, future, chunks)
+
+    async def _cached(
+        self,
+        endpoint: UUID,
+        key: str,
+    ) -> tuple[bool, bytes | None]:
+        cache_key = self._cache_key(endpoint, key)
+        while True:
+            value = self.lookup(endpoint, key)
+            if value is not None:
+                self.hits += 1
+                return True, value
+            future = self._inflight.get(cache_key)
+            if future is None:
+                return False, None
+            result = await asyncio.shield(future)
+            if result is not _ABANDONED:
+                self.hits += 1
+                return True, result
+
+    def _start(
+        self,
+        endpoint: UUID,
+        key: str,
+    ) -> tuple[str, asyncio.Future[Any]]:
+        self.misses += 1
+        cache_key = self._cache_key(endpoint, key)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        return cache_key, future
+
+    def _finish(
+        self,
+        cache_key: str,
+        future: asyncio.Future[Any],
+        result: Any,
+    ) -> None:
+        if self._inflight.get(cache_key) is future:
+            del self._inflight[cache_key]
+            if isinstance(result, bytes):
+                self._insert(cache_key, result)
+        future.set_result(result)
+
+    async def _tee(
+        self,
+        cache_key: str,
+        future: asyncio.Future[Any],
+        chunks: AsyncIterator[BytesLike],
+    ) -> AsyncIterator[BytesLike]:
+        buffer: bytearray | None = bytearray()
+        result: Any = _ABANDONED
+        try:
+            async for chunk in chunks:
+                if buffer is not None:
+                    buffer += chunk
+                    if len(buffer) > self.max_size:
+                        # The object is too large to cache so stop
+                        # buffering and let waiters make their own request.
+                        buffer = None
+                        self._finish(cache_key, future, _ABANDONED)
+                yield chunk
+            if buffer is not None:
+                result = bytes(buffer)
+        finally:
+            if buffer is not None:
+                self._finish(cache_key, future, result)
+
+    def _insert(self, cache_key: str, value: bytes) -> None:
+        if cache_key in self._expires:
+            self._remove(cache_key)
+        if len(value) > self.max_size:
+            return
+        while self._size + len(value) > self.max_size:
+            self._remove(self._policy.pop(), tracked=False)
+        self._storage[cache_key] = value
+        self._size += len(value)
+        self._policy.add(cache_key, len(value))
+        self._expires[cache_key] = (
+            math.inf if self.ttl is None else time.monotonic() + self.ttl
+        )
+
+    def _remove(self, cache_key: str, tracked: bool = True) -> None:
+        if tracked:
+            self._policy.remove(cache_key)
+        del self._expires[cache_key]
+        self._size -= len(self._storage[cache_key])
+        del self._storage[cache_key]
@@ -20,7 +20,9 @@ from proxystore.endpoint.commands import list_endpoints
 from proxystore.endpoint.commands import remove_endpoint
 from proxystore.endpoint.commands import start_endpoint
 from proxystore.endpoint.commands import stop_endpoint
+from proxystore.endpoint.compression import CODECS
 from proxystore.endpoint.config import read_config
+from proxystore.endpoint.policies import DEMOTION_POLICIES
 from proxystore.serialize import deserialize
 from proxystore.serialize import serialize
 from proxystore.utils import home_dir
@@ -119,6 +121,58 @@ def version() -> None:
     metavar='PATH',
     help='Directory to dump object to if max-memory exceeded.',
 )
+@click.option(
+    '--demotion-policy',
+    default='lru',
+    type=click.Choice(list(DEMOTION_POLICIES)),
+    help='Policy for selecting objects to dump if max-memory exceeded.',
+)
+@click.option(
+    '--compression',
+    default=None,
+    type=click.Choice(list(CODECS)),
+    help='Codec for compressing objects if max-memory exceeded.',
+)
+@click.option(
+    '--max-compressed-memory',
+    default=None,
+    type=int,
+    metavar='BYTES',
+    help='Optional maximum memory to use for compressed objects.',
+)
+@click.option(
+    '--persist',
+    is_flag=True,
+    default=False,
+    help='Keep objects in dump-dir across endpoint restarts.',
+)
+@click.option(
+    '--snapshot-on-shutdown',
+    is_flag=True,
+    default=False,
+    help='Write objects in memory to dump-dir when stopped.',
+)
+@click.option(
+    '--large-object-threshold',
+    default=None,
+    type=int,
+    metavar='BYTES',
+    help='Stream objects of at least this size to and from dump-dir.',
+)
+@click.option(
+    '--peer-cache-size',
+    default=None,
+    type=int,
+    metavar='BYTES',
+    help='Optional maximum memory to use for caching objects from peers.',
+)
+@click.option(
+    '--peer-cache-ttl',
+    default=None,
+    type=float,
+    metavar='SECONDS',
+    help='Optional time after which objects cached from peers expire.',
+)
 @click.option(
     '--peer-channels',
     default=1,
@@ -126,13 +180,44 @@ def version() -> None:
     metavar='COUNT',
     help='Datachannels to use per peer connection.',
 )
+@click.option(
+    '--max-peer-channels',
+    default=None,
+    type=int,
+    metavar='COUNT',
+    help='Optional maximum datachannels to open per peer connection.',
+)
+@click.option(
+    '--peer-direct-host',
+    default=None,
+    metavar='HOST',
+    help='Optional host to accept direct TCP connections from peers on.',
+)
+@click.option(
+    '--peer-direct-port',
+    default=0,
+    type=int,
+    metavar='PORT',
+    help='Port to accept direct TCP connections from peers on.',
+)
 def configure(
     name: str,
     port: int,
     relay_server: str,
     max_memory: int | None,
     dump_dir: str | None,
+    demotion_policy: str,
+    compression: str | None,
+    max_compressed_memory: int | None,
+    persist: bool,
+    snapshot_on_shutdown: bool,
+    large_object_threshold: int | None,
+    peer_cache_size: int | None,
+    peer_cache_ttl: float | None,
     peer_channels: int,
+    max_peer_channels: int | None,
+    peer_direct_host: str | None,
+    peer_direct_port: int,
 ) -> None:
     """Configure a new endpoint."""
     raise SystemExit(
@@ -142,7 +227,18 @@ def configure(
             relay_server=relay_server,
             max_memory=max_memory,
             dump_dir=dump_dir,
+            demotion_policy=demotion_policy,
+            compression=compression,
+            max_compressed_memory=max_compressed_memory,
+            persist=persist,
+            snapshot_on_shutdown=snapshot_on_shutdown,
+            large_object_threshold=large_object_threshold,
+            peer_cache_size=peer_cache_size,
+            peer_cache_ttl=peer_cache_ttl,
             peer_channels=peer_channels,
+            max_peer_channels=max_peer_channels,
+            peer_direct_host=peer_direct_host,
+            peer_direct_port=peer_direct_port,
         ),
     )
 
@@ -1,19 +1,169 @@
-"""Utilities for client interactions with endpoints."""
+"""Utilities for client interactions with endpoints.
+
+The synchronous functions accept an optional
+[`requests.Session`][requests.Session] which should be created with
+[`create_session()`][proxystore.endpoint.client.create_session] to reuse
+keep-alive connections across requests. Otherwise, a new connection is
+opened for every request.
+"""
 from __future__ import annotations
 
+import dataclasses
 import uuid
+from typing import Any
+from typing import AsyncGenerator
+from typing import Generator
+from typing import Sequence
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException  # noqa: F401
 
 from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
+from proxystore.endpoint.framing import decode_frames
+from proxystore.endpoint.framing import encode_frames
+from proxystore.endpoint.framing import FrameT
+from proxystore.endpoint.framing import FramingError
+from proxystore.serialize import BytesLike
 from proxystore.utils import chunk_bytes
 
 
+@dataclasses.dataclass
+class PoolStats:
+    """Snapshot of the connection pool statistics of a session."""
+
+    pool_size: int
+    """Maximum number of idle connections kept per host."""
+    connections: int
+    """Number of connections opened by the session."""
+    requests: int
+    """Number of requests made by the session."""
+    idle_connections: int
+    """Number of idle connections available for reuse."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the dataclass to a [`dict`][dict]."""
+        return dataclasses.asdict(self)
+
+
+class _PoolAdapter(HTTPAdapter):
+    """HTTP adapter which records the size of its connection pools."""
+
+    __attrs__ = (*HTTPAdapter.__attrs__, 'pool_size')
+
+    def __init__(self, pool_size: int) -> None:
+        super().__init__(pool_connections=1, pool_maxsize=pool_size)
+        self.pool_size = pool_size
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Create a session with a pool of keep-alive connections.
+
+    Requests made through the session from multiple threads draw
+    connections from the same pool. Note that requests does not guarantee
+    that a [`Session`][requests.Session] is thread-safe so the session
+    should not be modified (e.g., headers or cookies) while in use.
+
+    Args:
+        pool_size: Maximum number of connections to keep open per host.
+            If more than `pool_size` threads make requests concurrently,
+            additional connections are opened and discarded after use.
+
+    Returns:
+        Session to pass to the client functions.
+
+    Raises:
+        ValueError: If `pool_size` is less than one.
+    """
+    if pool_size < 1:
+        raise ValueError(f'Pool size must be at least one. Got {pool_size}.')
+
+    session = requests.Session()
+    adapter = _PoolAdapter(pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def pool_stats(session: requests.Session) -> PoolStats:
+    """Get the connection pool statistics of a session.
+
+    Args:
+        session: Session created by
+            [`create_session()`][proxystore.endpoint.client.create_session].
+
+    Returns:
+        Statistics summed over the connection pools of each host.
+
+    Raises:
+        ValueError: If `session` was not created by
+            [`create_session()`][proxystore.endpoint.client.create_session].
+    """
+    adapter = session.get_adapter('http://')
+    if not isinstance(adapter, _PoolAdapter):
+        raise ValueError('Session was not created by create_session().')
+    pools = adapter.poolmanager.pools
+    stats = PoolStats(
+        pool_size=adapter.pool_size,
+        connections=0,
+        requests=0,
+        idle_connections=0,
+    )
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:  # pragma: no cover
+            # Pool was removed by another thread.
+            continue
+        stats.connections += pool.num_connections
+        stats.requests += pool.num_requests
+        if pool.pool is not None:
+            stats.idle_connections += pool.pool.qsize()
+    return stats
+
+
+def _params(key: str, endpoint: uuid.UUID | str | None) -> dict[str, str]:
+    # Unlike requests, aiohttp does not drop parameters with None values.
+    params = {'key': key}
+    if endpoint is not None:
+        params['endpoint'] = str(endpoint)
+    return params
+
+
+def _batch_params(endpoint: uuid.UUID | str | None) -> dict[str, str]:
+    return {} if endpoint is None else {'endpoint': str(endpoint)}
+
+
+def _decode_batch(body: BytesLike, count: int) -> list[BytesLike | None]:
+    try:
+        frames = decode_frames(body)
+    except FramingError as e:
+        raise ValueError(f'Received malformed batch response: {e}') from e
+    if len(frames) != count:
+        raise ValueError(
+            f'Expected {count} objects in the batch response but got '
+            f'{len(frames)}.',
+        )
+    return list(frames)
+
+
+def _encode_batch(
+    keys: Sequence[str],
+    data: Sequence[BytesLike | Sequence[BytesLike]],
+) -> Generator[BytesLike, None, None]:
+    if len(keys) != len(data):
+        raise ValueError(f'Got {len(keys)} keys but {len(data)} objects.')
+    frames: list[FrameT] = []
+    for key, obj in zip(keys, data):
+        frames.extend((key.encode(), obj))
+    return encode_frames(frames, MAX_CHUNK_LENGTH)
+
+
 def evict(
     address: str,
     key: str,
     endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
 ) -> None:
     """Evict the object associated with the key.
 
@@ -21,6 +171,7 @@ def evict(
         address: Address of endpoint.
         key: Key associated with object to evict.
         endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
 
     Raises:
         RequestException: If the endpoint request results in an unexpected
@@ -29,7 +180,7 @@ def evict(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    response = requests.post(
+    response = (requests if session is None else session).post(
         f'{address}/evict',
         params={'key': key, 'endpoint': endpoint_str},
     )
@@ -40,6 +191,7 @@ def exists(
     address: str,
     key: str,
     endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
 ) -> bool:
     """Check if an object associated with the key exists.
 
@@ -47,6 +199,7 @@ def exists(
         address: Address of endpoint.
         key: Key potentially associated with stored object.
         endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
 
     Returns:
         If an object associated with the key exists.
@@ -58,7 +211,7 @@ def exists(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    response = requests.get(
+    response = (requests if session is None else session).get(
         f'{address}/exists',
         params={'key': key, 'endpoint': endpoint_str},
     )
@@ -70,6 +223,7 @@ def get(
     address: str,
     key: str,
     endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
 ) -> bytes | None:
     """Get the serialized object associated with the key.
 
@@ -77,6 +231,7 @@ def get(
         address: Address of endpoint.
         key: Key associated with object to retrieve.
         endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
 
     Returns:
         Serialized object or `None` if the object does not exist.
@@ -88,13 +243,15 @@ def get(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    response = requests.get(
+    response = (requests if session is None else session).get(
         f'{address}/get',
         params={'key': key, 'endpoint': endpoint_str},
         stream=True,
     )
 
     if response.status_code == 400:
+        # Consume the body so the connection is returned to the pool.
+        response.content  # noqa: B018
         return None
 
     response.raise_for_status()
@@ -108,16 +265,19 @@ def get(
 def put(
     address: str,
     key: str,
-    data: bytes,
+    data: BytesLike | Sequence[BytesLike],
     endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
 ) -> None:
     """Put a serialized object in the store.
 
     Args:
         address: Address of endpoint.
         key: Key associated with object to retrieve.
-        data: Serialized data to put in the store.
+        data: Serialized data to put in the store. Multi-part data is
+            streamed one part at a time without being joined.
         endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
 
     Raises:
         RequestException: If the endpoint request results in an unexpected
@@ -126,11 +286,301 @@ def put(
     endpoint_str = (
         str(endpoint) if isinstance(endpoint, uuid.UUID) else endpoint
     )
-    response = requests.post(
+    response = (requests if session is None else session).post(
         f'{address}/set',
         headers={'Content-Type': 'application/octet-stream'},
         params={'key': key, 'endpoint': endpoint_str},
-        data=chunk_bytes(data, MAX_CHUNK_LENGTH),
+        data=chunk_bytes(data, MAX_CHUNK_LENGTH),  # type: ignore[arg-type]
+    )
+    response.raise_for_status()
+
+
+def exists_batch(
+    address: str,
+    keys: Sequence[str],
+    endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
+) -> list[bool]:
+    """Check if objects associated with a batch of keys exist.
+
+    The batch is sent in a single request.
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys potentially associated with stored objects.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
+
+    Returns:
+        If an object associated with each key exists.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+    """
+    response = (requests if session is None else session).post(
+        f'{address}/exists_batch',
+        params=_batch_params(endpoint),
+        json={'keys': list(keys)},
+    )
+    response.raise_for_status()
+    return response.json()['exists']
+
+
+def get_batch(
+    address: str,
+    keys: Sequence[str],
+    endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
+) -> list[BytesLike | None]:
+    """Get the serialized objects associated with a batch of keys.
+
+    The batch is sent in a single request and the objects are returned
+    in a single framed response (see
+    [`proxystore.endpoint.framing`][proxystore.endpoint.framing]).
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys associated with objects to retrieve.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
+
+    Returns:
+        List with the same order as `keys` with the serialized objects, \
+        as views of the response body, or `None` if the object does not \
+        exist.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+        ValueError: If the response is not a valid batch of objects.
+    """
+    response = (requests if session is None else session).post(
+        f'{address}/get_batch',
+        params=_batch_params(endpoint),
+        json={'keys': list(keys)},
         stream=True,
     )
     response.raise_for_status()
+
+    data = bytearray()
+    for chunk in response.iter_content(chunk_size=None):
+        data += chunk
+    return _decode_batch(data, len(keys))
+
+
+def put_batch(
+    address: str,
+    keys: Sequence[str],
+    data: Sequence[BytesLike | Sequence[BytesLike]],
+    endpoint: uuid.UUID | str | None = None,
+    session: requests.Session | None = None,
+) -> None:
+    """Put a batch of serialized objects in the store.
+
+    The objects are streamed in a single framed request (see
+    [`proxystore.endpoint.framing`][proxystore.endpoint.framing]).
+
+    Args:
+        address: Address of endpoint.
+        keys: Keys to associate with each object.
+        data: Serialized objects to put in the store.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+        session: Optional session to make the request with.
+
+    Raises:
+        RequestException: If the endpoint request results in an unexpected
+            error code.
+    """
+    response = (requests if session is None else session).post(
+        f'{address}/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        params=_batch_params(endpoint),
+        data=_encode_batch(keys, data),  # type: ignore[arg-type]
+    )
+    response.raise_for_status()
+
+
+async def aevict(
+    session: aiohttp.ClientSession,
+    address: str,
+    key: str,
+    endpoint: uuid.UUID | str | None = None,
+) -> None:
+    """Evict the object associated with the key asynchronously.
+
+    Args:
+        session: Client session used to make the request.
+        address: Address of endpoint.
+        key: Key associated with object to evict.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+
+    Raises:
+        ClientResponseError: If the endpoint request results in an unexpected
+            error code.
+    """
+    async with session.post(
+        f'{address}/evict',
+        params=_params(key, endpoint),
+    ) as response:
+        response.raise_for_status()
+
+
+async def aexists(
+    session: aiohttp.ClientSession,
+    address: str,
+    key: str,
+    endpoint: uuid.UUID | str | None = None,
+) -> bool:
+    """Check if an object associated with the key exists asynchronously.
+
+    Args:
+        session: Client session used to make the request.
+        address: Address of endpoint.
+        key: Key potentially associated with stored object.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+
+    Returns:
+        If an object associated with the key exists.
+
+    Raises:
+        ClientResponseError: If the endpoint request results in an unexpected
+            error code.
+    """
+    async with session.get(
+        f'{address}/exists',
+        params=_params(key, endpoint),
+    ) as response:
+        response.raise_for_status()
+        return (await response.json())['exists']
+
+
+async def aget(
+    session: aiohttp.ClientSession,
+    address: str,
+    key: str,
+    endpoint: uuid.UUID | str | None = None,
+) -> bytes | None:
+    """Get the serialized object associated with the key asynchronously.
+
+    Args:
+        session: Client session used to make the request.
+        address: Address of endpoint.
+        key: Key associated with object to retrieve.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+
+    Returns:
+        Serialized object or `None` if the object does not exist.
+
+    Raises:
+        ClientResponseError: If the endpoint request results in an unexpected
+            error code.
+    """
+    async with session.get(
+        f'{address}/get',
+        params=_params(key, endpoint),
+    ) as response:
+        if response.status == 400:
+            return None
+
+        response.raise_for_status()
+        return await response.read()
+
+
+async def aput(
+    session: aiohttp.ClientSession,
+    address: str,
+    key: str,
+    data: BytesLike | Sequence[BytesLike],
+    endpoint: uuid.UUID | str | None = None,
+) -> None:
+    """Put a serialized object in the store asynchronously.
+
+    Args:
+        session: Client session used to make the request.
+        address: Address of endpoint.
+        key: Key associated with object to retrieve.
+        data: Serialized data to put in the store. Multi-part data is
+            streamed one part at a time without being joined.
+        endpoint: Optional UUID of remote endpoint to forward operation to.
+
+    Raises:
+        ClientResponseError: If the endpoint request results in an unexpected
+            error code.
+    """
+
+    async def _chunks() -> AsyncGenerator[BytesLike, None]:
+        for chunk in chunk_bytes(data, MAX_CHUNK_LENGTH):
+            yield chunk
+
+    async with session.post(
+        f'{address}/set',
+        headers={'Content-Type': 'application/octet-stream'},
+        params=_params(key, endpoint),
+        data=_chunks(),
+    ) as response:
+        response.raise_for_status()
+
+
+async def aexists_batch(
+    session: aiohttp.ClientSession,
+    address: str,
+    keys: Sequence[str],
+    endpoint: uuid.UUID | str | None = None,
+) -> list[bool]:
+    """Check if objects associated with a batch of keys exist asynchronously.
+
+    See [`exists_batch()`][proxystore.endpoint.client.exists_batch] for
+    details.
+    """
+    async with session.post(
+        f'{address}/exists_batch',
+        params=_batch_params(endpoint),
+        json={'keys': list(keys)},
+    ) as response:
+        response.raise_for_status()
+        return (await response.json())['exists']
+
+
+async def aget_batch(
+    session: aiohttp.ClientSession,
+    address: str,
+    keys: Sequence[str],
+    endpoint: uuid.UUID | str | None = None,
+) -> list[BytesLike | None]:
+    """Get the serialized objects of a batch of keys asynchronously.
+
+    See [`get_batch()`][proxystore.endpoint.client.get_batch] for details.
+    """
+    async with session.post(
+        f'{address}/get_batch',
+        params=_batch_params(endpoint),
+        json={'keys': list(keys)},
+    ) as response:
+        response.raise_for_status()
+        return _decode_batch(await response.read(), len(keys))
+
+
+async def aput_batch(
+    session: aiohttp.ClientSession,
+    address: str,
+    keys: Sequence[str],
+    data: Sequence[BytesLike | Sequence[BytesLike]],
+    endpoint: uuid.UUID | str | None = None,
+) -> None:
+    """Put a batch of serialized objects in the store asynchronously.
+
+    See [`put_batch()`][proxystore.endpoint.client.put_batch] for details.
+    """
+
+    async def _chunks() -> AsyncGenerator[BytesLike, None]:
+        for chunk in _encode_batch(keys, data):
+            yield chunk
+
+    async with session.post(
+        f'{address}/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        params=_batch_params(endpoint),
+        data=_chunks(),
+    ) as response:
+        response.raise_for_status()
@@ -103,7 +103,18 @@ def configure_endpoint(
     proxystore_dir: str | None = None,
     max_memory: int | None = None,
     dump_dir: str | None = None,
+    demotion_policy: str = 'lru',
+    compression: str | None = None,
+    max_compressed_memory: int | None = None,
+    persist: bool = False,
+    snapshot_on_shutdown: bool = False,
+    large_object_threshold: int | None = None,
+    peer_cache_size: int | None = None,
+    peer_cache_ttl: float | None = None,
     peer_channels: int = 1,
+    max_peer_channels: int | None = None,
+    peer_direct_host: str | None = None,
+    peer_direct_port: int = 0,
 ) -> int:
     """Configure a new endpoint.
 
@@ -117,8 +128,30 @@ def configure_endpoint(
             objects. If exceeded, LRU objects will be dumped to `dump_dir`.
         dump_dir: Optional directory to dump objects to if the
             memory limit is exceeded.
+        demotion_policy: Name of the policy used to select objects to dump
+            when the memory limit is exceeded.
+        compression: Optional name of the codec used to compress objects
+            when the memory limit is exceeded.
+        max_compressed_memory: Optional max memory in bytes to use for
+            storing compressed objects before dumping them to `dump_dir`.
+        persist: Keep objects in `dump_dir` when the endpoint is stopped
+            so they are available when the endpoint is restarted.
+        snapshot_on_shutdown: Write objects in memory to `dump_dir` when
+            the endpoint is stopped.
+        large_object_threshold: Optional size in bytes at which objects
+            are streamed to and from `dump_dir` rather than held in memory.
+        peer_cache_size: Optional max memory in bytes to use for caching
+            objects retrieved from peer endpoints.
+        peer_cache_ttl: Optional time in seconds after which objects
+            cached from peer endpoints expire.
         peer_channels: Number of datachannels per peer connection
             to another endpoint to communicate over.
+        max_peer_channels: Optional maximum number of datachannels per
+            peer connection to open as throughput is measured.
+        peer_direct_host: Optional host to accept direct TCP connections
+            from peer endpoints on.
+        peer_direct_port: Port to accept direct TCP connections from peer
+            endpoints on.
 
     Returns:
         Exit code where 0 is success and 1 is failure. Failure messages \
@@ -133,7 +166,18 @@ def configure_endpoint(
             relay_server=relay_server,
             max_memory=max_memory,
             dump_dir=dump_dir,
+            demotion_policy=demotion_policy,
+            compression=compression,
+            max_compressed_memory=max_compressed_memory,
+            persist=persist,
+            snapshot_on_shutdown=snapshot_on_shutdown,
+            large_object_threshold=large_object_threshold,
+            peer_cache_size=peer_cache_size,
+            peer_cache_ttl=peer_cache_ttl,
             peer_channels=peer_channels,
+            max_peer_channels=max_peer_channels,
+            peer_direct_host=peer_direct_host,
+            peer_direct_port=peer_direct_port,
         )
     except ValueError as e:
         logger.error(str(e))
@@ -0,0 +1,159 @@
+"""Compression codecs for endpoint storage.
+
+Blobs demoted by an
+[`EndpointStorage`][proxystore.endpoint.storage.EndpointStorage] can be
+compressed before being kept in the compressed in-memory tier or spilled
+to disk. Whether a blob is compressed is decided per blob by
+[`probe()`][proxystore.endpoint.compression.probe] which compresses a
+small sample of the blob with a fast codec to estimate its
+compressibility.
+
+| Name | Codec |
+| :--- | :---- |
+| `zlib` | [`zlib`][zlib] (stdlib). |
+| `lzma` | [`lzma`][lzma] (stdlib). Slower but higher compression ratio. |
+| `lz4` | [`lz4.frame`](https://python-lz4.readthedocs.io){target=_blank}. Only available if `lz4` is installed. |
+"""  # noqa: E501
+from __future__ import annotations
+
+import dataclasses
+import lzma
+import sys
+import zlib
+from typing import Callable
+
+if sys.version_info >= (3, 8):  # pragma: >=3.8 cover
+    from typing import Protocol
+else:  # pragma: <3.8 cover
+    from typing_extensions import Protocol
+
+try:
+    import lz4.frame
+
+    lz4_import_error = None
+except ImportError as e:  # pragma: no cover
+    lz4_import_error = e
+
+PROBE_SAMPLE_SIZE = 64 * 1024
+"""Number of bytes sampled from a blob by the compressibility probe."""
+MIN_COMPRESS_SIZE = 512
+"""Blobs smaller than this are never compressed."""
+
+
+class Decompressor(Protocol):
+    """Incremental decompressor."""
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the next chunk of compressed data."""
+        ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Codec:
+    """Compression codec.
+
+    Attributes:
+        name: Name of the codec.
+        compress: Function which compresses bytes.
+        decompress: Function which decompresses bytes.
+        decompressor: Factory for incremental decompressors used to
+            decompress data in chunks.
+    """
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+    decompressor: Callable[[], Decompressor]
+
+
+CODECS: dict[str, Codec] = {
+    'zlib': Codec(
+        'zlib',
+        lambda data: zlib.compress(data, 1),
+        zlib.decompress,
+        zlib.decompressobj,
+    ),
+    'lzma': Codec(
+        'lzma',
+        lambda data: lzma.compress(data, preset=1),
+        lzma.decompress,
+        lzma.LZMADecompressor,
+    ),
+}
+"""Mapping of codec names to available codecs."""
+
+if lz4_import_error is None:  # pragma: no cover
+    CODECS['lz4'] = Codec(
+        'lz4',
+        lz4.frame.compress,
+        lz4.frame.decompress,
+        lz4.frame.LZ4FrameDecompressor,
+    )
+
+
+def get_codec(name: str) -> Codec:
+    """Get a codec by name.
+
+    Args:
+        name: Name of the codec in
+            [`CODECS`][proxystore.endpoint.compression.CODECS].
+
+    Returns:
+        The codec.
+
+    Raises:
+        ValueError: If no codec named `name` is available.
+    """
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f'Unknown compression codec {name}. Expected one of '
+            f'{", ".join(CODECS)}.',
+        ) from None
+
+
+def probe(data: bytes, sample_size: int = PROBE_SAMPLE_SIZE) -> float:
+    """Estimate the compression ratio of data.
+
+    Compresses a sample from the middle of `data` with a fast codec.
+
+    Args:
+        data: Data to probe.
+        sample_size: Maximum number of bytes to sample.
+
+    Returns:
+        Ratio of the compressed size to the original size of the sample. \
+        Smaller values indicate more compressible data.
+    """
+    if len(data) == 0:
+        return 1.0
+    start = max(0, (len(data) - sample_size) // 2)
+    sample = memoryview(data)[start : start + sample_size]
+    return len(zlib.compress(sample, 1)) / len(sample)
+
+
+def maybe_compress(
+    data: bytes,
+    codec: Codec,
+    threshold: float,
+) -> tuple[bytes, Codec | None]:
+    """Compress data if it is compressible enough.
+
+    Args:
+        data: Data to compress.
+        codec: Codec to compress with.
+        threshold: Data is compressed only if the estimated ratio from
+            [`probe()`][proxystore.endpoint.compression.probe] and the
+            actual compression ratio are below this value.
+
+    Returns:
+        Tuple of the compressed data and codec used or the original data \
+        and `None` if the data was not compressed.
+    """
+    if len(data) < MIN_COMPRESS_SIZE or probe(data) >= threshold:
+        return data, None
+    compressed = codec.compress(data)
+    if len(compressed) >= threshold * len(data):
+        return data, None
+    return compressed, codec
@@ -7,7 +7,9 @@ import os
 import re
 import uuid
 
+from proxystore.endpoint.compression import CODECS
 from proxystore.endpoint.constants import MAX_OBJECT_SIZE_DEFAULT
+from proxystore.endpoint.policies import DEMOTION_POLICIES
 
 _ENDPOINT_CONFIG_FILE = 'endpoint.json'
 _ENDPOINT_LOG_FILE = 'endpoint.log'
@@ -28,15 +30,51 @@ class EndpointConfig:
         max_object_size: Optional maximum object size.
         dump_dir: Optional directory to put objects in when `max_memory` is
             exceeded.
+        demotion_policy: Name of the policy used to select objects to put
+            in `dump_dir` (see
+            [`DEMOTION_POLICIES`][proxystore.endpoint.policies.DEMOTION_POLICIES]).
+        compression: Optional name of the codec used to compress demoted
+            objects (see
+            [`CODECS`][proxystore.endpoint.compression.CODECS]).
+        max_compressed_memory: Optional memory limit for compressed objects
+            before demoting them to disk. Requires `compression`.
+        persist: Keep objects in `dump_dir` when the endpoint is stopped
+            so they are available when the endpoint is restarted. Requires
+            `dump_dir`.
+        snapshot_on_shutdown: Write objects in memory to `dump_dir` when
+            the endpoint is stopped. Requires `persist`.
+        large_object_threshold: Optional size at which objects are streamed
+            to and from `dump_dir` rather than held in memory. Requires
+            `dump_dir`.
+        peer_cache_size: Optional memory limit for caching objects
+            retrieved from peer endpoints. Objects from peers are not
+            cached if `None`.
+        peer_cache_ttl: Optional time in seconds after which objects
+            cached from peer endpoints expire. Requires `peer_cache_size`.
         peer_channels: Number of peer channels to multiplex communications
             over.
+        max_peer_channels: Optional maximum number of peer channels to
+            open as throughput is measured. Must be at least
+            `peer_channels`.
+        peer_direct_host: Optional host to accept direct TCP connections
+            from peer endpoints on.
+        peer_direct_port: Port to accept direct TCP connections from peer
+            endpoints on. If `0`, a free port is chosen.
         verify_certificates: Validate the SSL certificates of the `relay`
             server.
 
     Raises:
         ValueError: If the name does not contain only alphanumeric, dash, or
-            underscore characters, if the UUID cannot be parsed, or if the
-            port is not in the range [1, 65535].
+            underscore characters, if the UUID cannot be parsed, if the
+            port is not in the range [1, 65535], if the demotion policy
+            or compression codec is unknown, if `max_compressed_memory`
+            is set without `compression`, if `persist` is set without
+            `dump_dir`, if `snapshot_on_shutdown` is set without
+            `persist`, if `large_object_threshold` is set without
+            `dump_dir`, if `peer_cache_ttl` is set without
+            `peer_cache_size`, if `max_peer_channels` is less than
+            `peer_channels`, or if `peer_direct_port` is not in the range
+            [0, 65535].
     """
 
     name: str
@@ -47,7 +85,18 @@ class EndpointConfig:
     max_memory: int | None = None
     max_object_size: int | None = MAX_OBJECT_SIZE_DEFAULT
     dump_dir: str | None = None
+    demotion_policy: str = 'lru'
+    compression: str | None = None
+    max_compressed_memory: int | None = None
+    persist: bool = False
+    snapshot_on_shutdown: bool = False
+    large_object_threshold: int | None = None
+    peer_cache_size: int | None = None
+    peer_cache_ttl: float | None = None
     peer_channels: int = 1
+    max_peer_channels: int | None = None
+    peer_direct_host: str | None = None
+    peer_direct_port: int = 0
     verify_certificate: bool = True
 
     def __post_init__(self) -> None:
@@ -78,8 +127,69 @@ class EndpointConfig:
             raise ValueError(
                 'Max object size must be None or greater than zero.',
             )
+        if self.demotion_policy not in DEMOTION_POLICIES:
+            raise ValueError(
+                f'Unknown demotion policy {self.demotion_policy}. Expected '
+                f'one of {", ".join(DEMOTION_POLICIES)}.',
+            )
+        if self.compression is not None and self.compression not in CODECS:
+            raise ValueError(
+                f'Unknown compression codec {self.compression}. Expected '
+                f'one of {", ".join(CODECS)}.',
+            )
+        if self.max_compressed_memory is not None:
+            if self.max_compressed_memory < 1:
+                raise ValueError(
+                    'Max compressed memory must be None or greater than '
+                    'zero.',
+                )
+            if self.compression is None:
+                raise ValueError(
+                    'Compression must be set if max compressed memory is '
+                    'set.',
+                )
+        if self.persist and self.dump_dir is None:
+            raise ValueError('Dump directory must be set if persist is set.')
+        if self.snapshot_on_shutdown and not self.persist:
+            raise ValueError(
+                'Persist must be set if snapshot on shutdown is set.',
+            )
+        if self.large_object_threshold is not None:
+            if self.large_object_threshold < 1:
+                raise ValueError(
+                    'Large object threshold must be None or greater than '
+                    'zero.',
+                )
+            if self.dump_dir is None:
+                raise ValueError(
+                    'Dump directory must be set if large object threshold '
+                    'is set.',
+                )
+        if self.peer_cache_size is not None and self.peer_cache_size < 1:
+            raise ValueError(
+                'Peer cache size must be None or greater than zero.',
+            )
+        if self.peer_cache_ttl is not None:
+            if self.peer_cache_ttl <= 0:
+                raise ValueError(
+                    'Peer cache TTL must be None or greater than zero.',
+                )
+            if self.peer_cache_size is None:
+                raise ValueError(
+                    'Peer cache size must be set if peer cache TTL is set.',
+                )
         if self.peer_channels < 1:
             raise ValueError('Peer channels must be >= 1.')
+        if (
+            self.max_peer_channels is not None
+            and self.max_peer_channels < self.peer_channels
+        ):
+            raise ValueError('Max peer channels must be >= peer channels.')
+        if not 0 <= self.peer_direct_port <= 65535:
+            raise ValueError(
+                'Peer direct port must be in range [0, 65535]. '
+                f'Got {self.peer_direct_port}.',
+            )
 
 
 def get_configs(proxystore_dir: str) -> list[EndpointConfig]:
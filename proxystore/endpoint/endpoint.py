@@ -3,24 +3,38 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
 import logging
 from types import TracebackType
 from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import cast
 from typing import Generator
+from typing import List
+from typing import Sequence
 from uuid import UUID
 from uuid import uuid4
 
+from proxystore.endpoint import messages
+from proxystore.endpoint.cache import PeerCache
+from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
 from proxystore.endpoint.constants import MAX_OBJECT_SIZE_DEFAULT
 from proxystore.endpoint.exceptions import PeeringNotAvailableError
 from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.messages import EndpointBatchRequest
+from proxystore.endpoint.messages import EndpointMessage
 from proxystore.endpoint.messages import EndpointRequest
 from proxystore.endpoint.storage import EndpointStorage
+from proxystore.endpoint.storage import StorageStats
+from proxystore.p2p.chunks import ChunkStream
 from proxystore.p2p.connection import log_name
+from proxystore.p2p.connection import PeerStats
+from proxystore.p2p.connection import StreamedMessage
 from proxystore.p2p.manager import PeerManager
 from proxystore.p2p.task import spawn_guarded_background_task
-from proxystore.serialize import deserialize
-from proxystore.serialize import SerializationError
-from proxystore.serialize import serialize
+from proxystore.serialize import BytesLike
+from proxystore.utils import achunk_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +68,10 @@ class Endpoint:
         Requests made to remote endpoints will only invoke the request on
         the remote and return the result. I.e., invoking GET on a remote
         will return the value but will not store it on the local endpoint.
+        If `peer_cache_size` is set, values retrieved from remote endpoints
+        are kept in a separate read cache (see
+        [`PeerCache`][proxystore.endpoint.cache.PeerCache]) which is
+        invalidated when the remote evicts or overwrites the key.
 
     Example:
         Solo Mode Usage
@@ -115,13 +133,49 @@ class Endpoint:
         peer_timeout: Timeout for establishing p2p connection with
             another endpoint.
         max_memory: Optional max memory in bytes to use for storing
-            objects. If exceeded, LRU objects will be dumped to `dump_dir`.
+            objects. If exceeded, objects selected by the demotion policy
+            will be dumped to `dump_dir`.
         max_object_size: Optional max size in bytes for any single
             object stored by the endpoint. If exceeded, an error is raised.
         dump_dir: Optional directory to dump objects to if the
             memory limit is exceeded.
+        demotion_policy: Name of the policy used to select objects to dump
+            when the memory limit is exceeded (see
+            [`DEMOTION_POLICIES`][proxystore.endpoint.policies.DEMOTION_POLICIES]).
+        compression: Optional name of the codec used to compress objects
+            when the memory limit is exceeded (see
+            [`CODECS`][proxystore.endpoint.compression.CODECS]).
+        max_compressed_memory: Optional max memory in bytes to use for
+            storing compressed objects before dumping them to `dump_dir`.
+            Requires `compression`.
+        persist: Keep objects in `dump_dir` when the endpoint is closed
+            and restore objects from `dump_dir` kept by a previous
+            endpoint. Requires `dump_dir`.
+        snapshot_on_shutdown: Write objects in memory to `dump_dir` when
+            the endpoint is closed. Requires `persist`.
+        large_object_threshold: Optional size in bytes at which objects
+            are streamed to and from `dump_dir` by
+            [`get_stream()`][proxystore.endpoint.endpoint.Endpoint.get_stream]
+            and
+            [`set_stream()`][proxystore.endpoint.endpoint.Endpoint.set_stream]
+            rather than held in memory. Requires `dump_dir`.
+        peer_cache_size: Optional max memory in bytes to use for caching
+            objects retrieved from peer endpoints. If `None`, objects
+            retrieved from peers are not cached.
+        peer_cache_ttl: Optional time in seconds after which an object
+            cached from a peer endpoint expires. Requires
+            `peer_cache_size`.
         peer_channels: Number of datachannels per peer connection
             to another endpoint to communicate over.
+        max_peer_channels: Maximum number of datachannels per peer
+            connection to open as throughput is measured. Defaults to
+            `peer_channels`.
+        peer_direct_host: Optional host to accept direct TCP connections
+            from peer endpoints on. Peer endpoints which both accept direct
+            connections and can reach each other communicate over TCP
+            rather than WebRTC.
+        peer_direct_port: Port to accept direct TCP connections from peer
+            endpoints on. If `0`, a free port is chosen.
         verify_certificate: Verify the relay server's SSL
             certificate. This should almost never be disabled except for
             testing with self-signed certificates.
@@ -136,7 +190,18 @@ class Endpoint:
         max_memory: int | None = None,
         max_object_size: int | None = MAX_OBJECT_SIZE_DEFAULT,
         dump_dir: str | None = None,
+        demotion_policy: str = 'lru',
+        compression: str | None = None,
+        max_compressed_memory: int | None = None,
+        persist: bool = False,
+        snapshot_on_shutdown: bool = False,
+        large_object_threshold: int | None = None,
+        peer_cache_size: int | None = None,
+        peer_cache_ttl: float | None = None,
         peer_channels: int = 1,
+        max_peer_channels: int | None = None,
+        peer_direct_host: str | None = None,
+        peer_direct_port: int = 0,
         verify_certificate: bool = True,
     ) -> None:
         # TODO(gpauloski): need to consider semantics of operations
@@ -147,7 +212,11 @@ class Endpoint:
         self._relay_server = relay_server
         self._peer_timeout = peer_timeout
         self._peer_channels = peer_channels
+        self._max_peer_channels = max_peer_channels
+        self._peer_direct_host = peer_direct_host
+        self._peer_direct_port = peer_direct_port
         self._verify_certificate = verify_certificate
+        self._snapshot_on_shutdown = snapshot_on_shutdown
 
         self._mode = (
             EndpointMode.SOLO if relay_server is None else EndpointMode.PEERING
@@ -159,11 +228,28 @@ class Endpoint:
             max_size=max_memory,
             max_object_size=max_object_size,
             dump_dir=dump_dir,
+            demotion_policy=demotion_policy,
+            compression=compression,
+            max_compressed_size=max_compressed_memory,
+            persist=persist,
+            large_object_threshold=large_object_threshold,
         )
-        self._pending_requests: dict[
-            str,
-            asyncio.Future[EndpointRequest],
-        ] = {}
+        self._pending_requests: dict[str, asyncio.Future[Any]] = {}
+        # Streams attached to responses to pending get_stream requests.
+        self._response_streams: dict[str, ChunkStream] = {}
+
+        if peer_cache_ttl is not None and peer_cache_size is None:
+            raise ValueError(
+                'A peer_cache_size must be specified if peer_cache_ttl is '
+                'set.',
+            )
+        self._peer_cache = (
+            None
+            if peer_cache_size is None
+            else PeerCache(peer_cache_size, peer_cache_ttl)
+        )
+        # Peer endpoints which cache each key owned by this endpoint.
+        self._peer_readers: dict[str, set[UUID]] = {}
 
         self._async_init_done = False
         self._peer_handler_task: asyncio.Task[None] | None = None
@@ -187,6 +273,16 @@ class Endpoint:
         """Name of this endpoint."""
         return self._name
 
+    def stats(self) -> StorageStats:
+        """Get a snapshot of the storage statistics of this endpoint."""
+        return self._data.stats()
+
+    def peer_stats(self) -> dict[UUID, PeerStats]:
+        """Get a snapshot of the statistics of each peer connection."""
+        if self._peer_manager is None:
+            return {}
+        return self._peer_manager.stats()
+
     async def __aenter__(self) -> Endpoint:
         await self.async_init()
         return self
@@ -211,6 +307,9 @@ class Endpoint:
                 name=self.name,
                 timeout=self._peer_timeout,
                 peer_channels=self._peer_channels,
+                max_peer_channels=self._max_peer_channels,
+                direct_host=self._peer_direct_host,
+                direct_port=self._peer_direct_port,
                 verify_certificate=self._verify_certificate,
             )
             self._peer_handler_task = spawn_guarded_background_task(
@@ -226,10 +325,14 @@ class Endpoint:
 
         while True:
             source_endpoint, message_ = await self._peer_manager.recv()
-            assert isinstance(message_, bytes)
+            stream: ChunkStream | None = None
+            if isinstance(message_, StreamedMessage):
+                stream = message_.stream
+                message_ = message_.message
+            assert isinstance(message_, (bytes, bytearray))
             try:
-                message: EndpointRequest = deserialize(message_)
-            except SerializationError as e:
+                message = messages.decode(message_)
+            except ValueError as e:
                 logger.error(
                     f'{self._log_prefix}: unable to decode message from peer '
                     f'endpoint {source_endpoint}: {e}',
@@ -246,6 +349,8 @@ class Endpoint:
                 else:
                     fut = self._pending_requests.pop(message.uuid)
                     if message.error is None:
+                        if stream is not None:
+                            self._response_streams[message.uuid] = stream
                         fut.set_result(message)
                     else:
                         fut.set_exception(message.error)
@@ -253,17 +358,31 @@ class Endpoint:
 
             logger.debug(
                 f'{self._log_prefix}: received {type(message).__name__}'
-                f'(id={message.uuid}, key={message.key}) from '
+                f'(id={message.uuid}, op={message.op}) from '
                 f'{source_endpoint}',
             )
 
+            if isinstance(message, EndpointRequest) and (
+                message.op == 'invalidate'
+            ):
+                if self._peer_cache is not None:
+                    self._peer_cache.invalidate(source_endpoint, message.key)
+                continue
+
             try:
-                if message.op == 'evict':
+                if isinstance(message, EndpointBatchRequest):
+                    await self._handle_batch_request(message)
+                elif message.op == 'evict':
                     await self.evict(message.key)
                 elif message.op == 'exists':
                     message.exists = await self.exists(message.key)
                 elif message.op == 'get':
                     message.data = await self.get(message.key)
+                    if message.cache and message.data is not None:
+                        self._peer_readers.setdefault(
+                            message.key,
+                            set(),
+                        ).add(source_endpoint)
                 elif message.op == 'set':
                     assert message.data is not None
                     await self.set(message.key, message.data)
@@ -276,18 +395,49 @@ class Endpoint:
                 message.error = e
 
             message.kind = 'response'
+            response_stream: bytes | None = None
+            if isinstance(message, EndpointRequest) and message.stream:
+                if message.data:
+                    response_stream, message.data = message.data, None
+                else:
+                    message.stream = False
             logger.debug(
                 f'{self._log_prefix}: sending {message.op} response with '
-                f'id={message.uuid} and key={message.key} to '
-                f'{source_endpoint}',
+                f'id={message.uuid} to {source_endpoint}',
+            )
+            await self._peer_manager.send(
+                source_endpoint,
+                messages.encode(message),
+                stream=response_stream,
+            )
+
+    async def _handle_batch_request(
+        self,
+        message: EndpointBatchRequest,
+    ) -> None:
+        """Perform a batch request from a peer on the local endpoint."""
+        if message.op == 'exists':
+            message.exists = await self.exists_batch(message.keys)
+        elif message.op == 'get':
+            message.data = await self.get_batch(message.keys)
+        elif message.op == 'set':
+            assert message.data is not None
+            assert all(value is not None for value in message.data)
+            await self.set_batch(
+                message.keys,
+                cast(List[bytes], message.data),
+            )
+            message.data = None
+        else:
+            raise AssertionError(
+                f'unsupported request type {type(message).__name__}',
             )
-            await self._peer_manager.send(source_endpoint, serialize(message))
 
     async def _request_from_peer(
         self,
         endpoint: UUID,
-        request: EndpointRequest,
-    ) -> asyncio.Future[EndpointRequest]:
+        request: EndpointMessage,
+    ) -> asyncio.Future[Any]:
         """Send request to peer endpoint.
 
         Any exceptions will be set on the returned future.
@@ -301,10 +451,10 @@ class Endpoint:
         ] = asyncio.get_running_loop().create_future()
         logger.debug(
             f'{self._log_prefix}: sending {request.op} request with '
-            f'id={request.uuid} and key={request.key}) to {endpoint}',
+            f'id={request.uuid} to {endpoint}',
         )
         try:
-            await self._peer_manager.send(endpoint, serialize(request))
+            await self._peer_manager.send(endpoint, messages.encode(request))
         except Exception as e:
             self._pending_requests[request.uuid].set_exception(
                 PeerRequestError(
@@ -313,6 +463,62 @@ class Endpoint:
             )
         return self._pending_requests[request.uuid]
 
+    async def _peer_get(self, endpoint: UUID, key: str) -> bytes | None:
+        request = EndpointRequest(
+            kind='request',
+            op='get',
+            uuid=str(uuid4()),
+            key=key,
+            cache=self._peer_cache is not None,
+        )
+        request_future = await self._request_from_peer(endpoint, request)
+        response = await request_future
+        return response.data
+
+    async def _peer_get_stream(
+        self,
+        endpoint: UUID,
+        key: str,
+    ) -> AsyncIterator[BytesLike] | None:
+        request = EndpointRequest(
+            kind='request',
+            op='get',
+            uuid=str(uuid4()),
+            key=key,
+            stream=True,
+            cache=self._peer_cache is not None,
+        )
+        request_future = await self._request_from_peer(endpoint, request)
+        response = await request_future
+        if response.stream:
+            return self._response_streams.pop(response.uuid)
+        elif response.data is None:
+            return None
+        return achunk_bytes(response.data, MAX_CHUNK_LENGTH)
+
+    async def _invalidate_peer_caches(self, key: str) -> None:
+        """Notify peers caching a key that the key has changed."""
+        readers = self._peer_readers.pop(key, None)
+        if readers is None or self._peer_manager is None:
+            return
+        for reader in readers:
+            message = EndpointRequest(
+                kind='request',
+                op='invalidate',
+                uuid=str(uuid4()),
+                key=key,
+            )
+            try:
+                await self._peer_manager.send(
+                    reader,
+                    messages.encode(message),
+                )
+            except Exception as e:
+                logger.warning(
+                    f'{self._log_prefix}: failed to invalidate key={key} '
+                    f'cached by {reader}: {e}',
+                )
+
     def _is_peer_request(self, endpoint: UUID | None) -> bool:
         """Check if this request should be forwarded to peer endpoint."""
         if self._mode == EndpointMode.SOLO:
@@ -345,6 +551,8 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
+            if self._peer_cache is not None:
+                self._peer_cache.invalidate(endpoint, key)
             request = EndpointRequest(
                 kind='request',
                 op='evict',
@@ -356,6 +564,7 @@ class Endpoint:
         else:
             if key in self._data:
                 del self._data[key]
+            await self._invalidate_peer_caches(key)
 
     async def exists(self, key: str, endpoint: UUID | None = None) -> bool:
         """Check if key exists on endpoint.
@@ -414,20 +623,15 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
-            request = EndpointRequest(
-                kind='request',
-                op='get',
-                uuid=str(uuid4()),
-                key=key,
-            )
-            request_future = await self._request_from_peer(endpoint, request)
-            response = await request_future
-            return response.data
+            if self._peer_cache is not None:
+                return await self._peer_cache.get(
+                    endpoint,
+                    key,
+                    functools.partial(self._peer_get, endpoint, key),
+                )
+            return await self._peer_get(endpoint, key)
         else:
-            if key in self._data:
-                return self._data[key]
-            else:
-                return None
+            return await self._data.aget(key)
 
     async def set(
         self,
@@ -454,6 +658,8 @@ class Endpoint:
         )
         if self._is_peer_request(endpoint):
             assert endpoint is not None
+            if self._peer_cache is not None:
+                self._peer_cache.invalidate(endpoint, key)
             request = EndpointRequest(
                 kind='request',
                 op='set',
@@ -464,7 +670,220 @@ class Endpoint:
             request_future = await self._request_from_peer(endpoint, request)
             await request_future
         else:
-            self._data[key] = data
+            await self._data.aset(key, data)
+            await self._invalidate_peer_caches(key)
+
+    async def get_stream(
+        self,
+        key: str,
+        endpoint: UUID | None = None,
+    ) -> AsyncIterator[BytesLike] | None:
+        """Get value associated with key on endpoint as a stream of chunks.
+
+        Large objects on the local endpoint's disk are streamed from disk
+        without being loaded into memory (see
+        [`EndpointStorage.astream()`][proxystore.endpoint.storage.EndpointStorage.astream]).
+        Values on a peer endpoint are streamed from the peer so chunks are
+        yielded as they are received rather than once the whole value has
+        been received.
+
+        Args:
+            key: Key to get value for.
+            endpoint: Endpoint to perform operation on. If
+                unspecified or if the endpoint is on solo mode, the operation
+                will be performed on the local endpoint.
+
+        Returns:
+            Async iterator of chunks of the value associated with key or \
+            `None` if the key does not exist.
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+        """
+        if self._is_peer_request(endpoint):
+            assert endpoint is not None
+            logger.debug(
+                f'{self._log_prefix}: GET key={key} on endpoint={endpoint}',
+            )
+            if self._peer_cache is not None:
+                return await self._peer_cache.stream(
+                    endpoint,
+                    key,
+                    functools.partial(self._peer_get_stream, endpoint, key),
+                )
+            return await self._peer_get_stream(endpoint, key)
+        else:
+            return await self._data.astream(key)
+
+    async def set_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[BytesLike],
+        endpoint: UUID | None = None,
+    ) -> int:
+        """Set key with data from a stream of chunks on endpoint.
+
+        Large objects set on the local endpoint are written directly to
+        disk (see
+        [`EndpointStorage.aset_stream()`][proxystore.endpoint.storage.EndpointStorage.aset_stream]).
+
+        Args:
+            key: Key to associate with value.
+            chunks: Async iterable of chunks of the value.
+            endpoint: Endpoint to perform operation on. If
+                unspecified or if the endpoint is on solo mode, the operation
+                will be performed on the local endpoint.
+
+        Returns:
+            Size of the value in bytes. If zero, the key is not set.
+
+        Raises:
+            ObjectSizeExceededError: If the max object size is configured and
+                the data exceeds that size.
+            PeerRequestError: If request to a peer endpoint fails.
+        """
+        if self._is_peer_request(endpoint):
+            data = bytearray()
+            async for chunk in chunks:
+                data += chunk
+            if len(data) > 0:
+                await self.set(key, bytes(data), endpoint)
+            return len(data)
+        else:
+            logger.debug(
+                f'{self._log_prefix}: SET key={key} on endpoint={endpoint}',
+            )
+            size = await self._data.aset_stream(key, chunks)
+            await self._invalidate_peer_caches(key)
+            return size
+
+    async def exists_batch(
+        self,
+        keys: Sequence[str],
+        endpoint: UUID | None = None,
+    ) -> list[bool]:
+        """Check if each of a batch of keys exists on endpoint.
+
+        Args:
+            keys: Keys to check.
+            endpoint: Endpoint to perform operation on. If
+                unspecified or if the endpoint is on solo mode, the operation
+                will be performed on the local endpoint. Batches are
+                forwarded to a peer endpoint as a single message.
+
+        Returns:
+            If each key exists.
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+        """
+        logger.debug(
+            f'{self._log_prefix}: EXISTS_BATCH keys={len(keys)} on '
+            f'endpoint={endpoint}',
+        )
+        if self._is_peer_request(endpoint):
+            assert endpoint is not None
+            request = EndpointBatchRequest(
+                kind='request',
+                op='exists',
+                uuid=str(uuid4()),
+                keys=list(keys),
+            )
+            request_future = await self._request_from_peer(endpoint, request)
+            response = await request_future
+            assert isinstance(response.exists, list)
+            return response.exists
+        else:
+            return [key in self._data for key in keys]
+
+    async def get_batch(
+        self,
+        keys: Sequence[str],
+        endpoint: UUID | None = None,
+    ) -> list[bytes | None]:
+        """Get values associated with a batch of keys on endpoint.
+
+        Args:
+            keys: Keys to get values for.
+            endpoint: Endpoint to perform operation on. If
+                unspecified or if the endpoint is on solo mode, the operation
+                will be performed on the local endpoint. Batches are
+                forwarded to a peer endpoint as a single message.
+
+        Returns:
+            Values associated with each key or `None` if a key does not \
+            exist.
+
+        Raises:
+            PeerRequestError: If request to a peer endpoint fails.
+        """
+        logger.debug(
+            f'{self._log_prefix}: GET_BATCH keys={len(keys)} on '
+            f'endpoint={endpoint}',
+        )
+        if self._is_peer_request(endpoint):
+            assert endpoint is not None
+            request = EndpointBatchRequest(
+                kind='request',
+                op='get',
+                uuid=str(uuid4()),
+                keys=list(keys),
+            )
+            request_future = await self._request_from_peer(endpoint, request)
+            response = await request_future
+            assert isinstance(response.data, list)
+            return response.data
+        else:
+            return [await self._data.aget(key) for key in keys]
+
+    async def set_batch(
+        self,
+        keys: Sequence[str],
+        data: Sequence[bytes],
+        endpoint: UUID | None = None,
+    ) -> None:
+        """Set a batch of keys with data on endpoint.
+
+        Args:
+            keys: Keys to associate with values.
+            data: Value to associate with each key.
+            endpoint: Endpoint to perform operation on. If
+                unspecified or if the endpoint is on solo mode, the operation
+                will be performed on the local endpoint. Batches are
+                forwarded to a peer endpoint as a single message.
+
+        Raises:
+            ValueError: If `keys` and `data` have different lengths.
+            ObjectSizeExceededError: If the max object size is configured and
+                the data exceeds that size.
+            PeerRequestError: If request to a peer endpoint fails.
+        """
+        if len(keys) != len(data):
+            raise ValueError(
+                f'Got {len(keys)} keys but {len(data)} values.',
+            )
+        logger.debug(
+            f'{self._log_prefix}: SET_BATCH keys={len(keys)} on '
+            f'endpoint={endpoint}',
+        )
+        if self._is_peer_request(endpoint):
+            assert endpoint is not None
+            if self._peer_cache is not None:
+                for key in keys:
+                    self._peer_cache.invalidate(endpoint, key)
+            request = EndpointBatchRequest(
+                kind='request',
+                op='set',
+                uuid=str(uuid4()),
+                keys=list(keys),
+                data=list(data),
+            )
+            request_future = await self._request_from_peer(endpoint, request)
+            await request_future
+        else:
+            for key, value in zip(keys, data):
+                await self._data.aset(key, value)
+                await self._invalidate_peer_caches(key)
 
     async def close(self) -> None:
         """Close the endpoint and any open connections safely."""
@@ -476,5 +895,10 @@ class Endpoint:
                 pass
         if self._peer_manager is not None:
             await self._peer_manager.close()
-        self._data.cleanup()
+        await self._data.wait_pending()
+        if self._snapshot_on_shutdown:
+            await self._data.asnapshot()
+        self._data.close()
+        if self._peer_cache is not None:
+            self._peer_cache.clear()
         logger.info(f'{self._log_prefix}: endpoint closed')
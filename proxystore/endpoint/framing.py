@@ -0,0 +1,193 @@
+"""Length-prefixed framing of multiple objects in a single message.
+
+A framed message is a sequence of frames where each frame is an 8-byte
+big-endian unsigned length followed by that many bytes of data. The
+maximum length value is reserved to encode a missing object (`None`)
+with no data following it.
+
+Framing is used by the batch routes of the endpoint (e.g., `/get_batch` and
+`/set_batch`) to transfer many objects in one HTTP request or response.
+"""
+from __future__ import annotations
+
+import struct
+from typing import Generator
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
+from proxystore.serialize import BytesLike
+from proxystore.utils import as_buffers
+from proxystore.utils import chunk_bytes
+from proxystore.utils import nbytes
+
+FrameT = Optional[Union[BytesLike, Sequence[BytesLike]]]
+"""Frame types accepted by [`encode_frames()`][proxystore.endpoint.framing.encode_frames].
+
+A frame can be a bytes-like object, a sequence of bytes-like objects which
+are concatenated, or `None` to indicate a missing object.
+"""  # noqa: E501
+
+_LENGTH = struct.Struct('!Q')
+_MISSING_LENGTH = 2**64 - 1
+# Frames smaller than this are copied into a shared buffer so small
+# objects are not sent as many tiny chunks. Larger frames are yielded
+# as zero-copy chunks.
+_COALESCE_LENGTH = 64 * 1024
+
+
+class FramingError(Exception):
+    """Exception raised when a framed message is malformed."""
+
+    pass
+
+
+def encode_frames(
+    frames: Iterable[FrameT],
+    chunk_size: int = MAX_CHUNK_LENGTH,
+) -> Generator[BytesLike, None, None]:
+    """Encode frames into chunks of a framed message.
+
+    Args:
+        frames: Iterable of frames to encode.
+        chunk_size: Maximum size in bytes of chunks of large frames.
+
+    Returns:
+        Generator that yields chunks of the framed message. The
+        concatenation of the chunks is the framed message.
+    """
+    buffer = bytearray()
+    for frame in frames:
+        if frame is None:
+            buffer += _LENGTH.pack(_MISSING_LENGTH)
+            continue
+
+        size = nbytes(frame)
+        buffer += _LENGTH.pack(size)
+        if size <= _COALESCE_LENGTH:
+            for part in as_buffers(frame):
+                buffer += part
+        else:
+            yield bytes(buffer)
+            buffer.clear()
+            yield from chunk_bytes(frame, chunk_size)
+
+        if len(buffer) >= _COALESCE_LENGTH:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+def decode_frames(data: BytesLike) -> list[memoryview | None]:
+    """Decode a framed message.
+
+    Args:
+        data: Framed message produced by
+            [`encode_frames()`][proxystore.endpoint.framing.encode_frames].
+
+    Returns:
+        List of zero-copy views of `data` for each frame or `None` if the
+        frame encoded a missing object.
+
+    Raises:
+        FramingError: If `data` is not a valid framed message.
+    """
+    view = memoryview(data).cast('B')
+    frames: list[memoryview | None] = []
+    offset = 0
+    while offset < view.nbytes:
+        if offset + _LENGTH.size > view.nbytes:
+            raise FramingError('Framed message ends with a partial header.')
+        (length,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        if length == _MISSING_LENGTH:
+            frames.append(None)
+            continue
+        if offset + length > view.nbytes:
+            raise FramingError(
+                f'Frame length {length} exceeds the remaining '
+                f'{view.nbytes - offset} bytes of the message.',
+            )
+        frames.append(view[offset : offset + length])
+        offset += length
+    return frames
+
+
+class FrameDecoder:
+    """Incremental decoder of a framed message received in chunks.
+
+    Unlike [`decode_frames()`][proxystore.endpoint.framing.decode_frames],
+    the chunks of the message do not need to be concatenated first. Each
+    frame is joined directly from the chunks it spans so the data of the
+    message is copied only once.
+
+    Example:
+        ```python
+        decoder = FrameDecoder()
+        async for chunk in stream:
+            decoder.feed(chunk)
+        frames = decoder.finish()
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._frames: list[bytes | None] = []
+        self._parts: list[memoryview] = []
+        self._header = bytearray()
+        self._remaining: int | None = None
+
+    def feed(self, data: BytesLike) -> None:
+        """Decode the next chunk of the framed message.
+
+        Args:
+            data: Chunk of the framed message.
+        """
+        view = memoryview(data).cast('B')
+        offset = 0
+        while offset < view.nbytes:
+            if self._remaining is None:
+                needed = _LENGTH.size - len(self._header)
+                self._header += view[offset : offset + needed]
+                offset += min(needed, view.nbytes - offset)
+                if len(self._header) < _LENGTH.size:
+                    break
+                (length,) = _LENGTH.unpack(self._header)
+                self._header.clear()
+                if length == _MISSING_LENGTH:
+                    self._frames.append(None)
+                    continue
+                if length == 0:
+                    self._frames.append(b'')
+                    continue
+                self._remaining = length
+            size = min(self._remaining, view.nbytes - offset)
+            self._parts.append(view[offset : offset + size])
+            offset += size
+            self._remaining -= size
+            if self._remaining == 0:
+                self._frames.append(b''.join(self._parts))
+                self._parts.clear()
+                self._remaining = None
+
+    def finish(self) -> list[bytes | None]:
+        """Get the decoded frames after the last chunk has been fed.
+
+        Returns:
+            List of the data of each frame or `None` if the frame encoded a
+            missing object.
+
+        Raises:
+            FramingError: If the message ends with a partial frame.
+        """
+        if len(self._header) > 0:
+            raise FramingError('Framed message ends with a partial header.')
+        if self._remaining is not None:
+            raise FramingError(
+                f'Framed message ends {self._remaining} bytes before the '
+                'end of the last frame.',
+            )
+        return self._frames
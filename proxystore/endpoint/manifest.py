@@ -0,0 +1,129 @@
+"""Persistent index of blobs spilled to disk by endpoint storage.
+
+A persistent [`EndpointStorage`][proxystore.endpoint.storage.EndpointStorage]
+records every blob written to its dump directory in a
+[`SpillManifest`][proxystore.endpoint.manifest.SpillManifest] so the blobs
+can be served after the endpoint is restarted.
+
+The manifest is an append-only log with one JSON record per line. An `add`
+record maps a key to the file containing the blob, and a `remove` record
+indicates the file of a key was deleted. The log is replayed when the
+manifest is opened and compacted once it contains many more records than
+live entries.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = 'manifest.jsonl'
+"""Name of the manifest file in the dump directory."""
+_COMPACT_MIN_RECORDS = 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestEntry:
+    """Blob stored on disk.
+
+    Attributes:
+        key: Key of the blob.
+        filename: Name of the file in the dump directory containing the blob.
+        size: Size of the blob in bytes.
+        stored_size: Size of the file in bytes.
+        codec: Name of the codec the file is compressed with, if any.
+    """
+
+    key: str
+    filename: str
+    size: int
+    stored_size: int
+    codec: str | None = None
+
+
+class SpillManifest:
+    """Append-only log of blobs stored on disk.
+
+    Records are flushed to the operating system when written but are not
+    synced to disk. A partially written record at the end of the log, such
+    as after a crash, is ignored when the log is replayed.
+
+    Args:
+        path: Path to the manifest file. Existing records are replayed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = {}
+        self._records = 0
+        if os.path.exists(self.path):
+            self._replay()
+        self._file = open(self.path, 'a')
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _replay(self) -> None:
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    op = record.pop('op')
+                    if op == 'add':
+                        entry = ManifestEntry(**record)
+                        self.entries[entry.key] = entry
+                    elif op == 'remove':
+                        self.entries.pop(record['key'], None)
+                    else:
+                        raise ValueError(f'Unknown operation {op}.')
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(
+                        f'Skipping invalid record in {self.path}: {e}',
+                    )
+                    continue
+                self._records += 1
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        self._records += 1
+        if self._records > max(2 * len(self.entries), _COMPACT_MIN_RECORDS):
+            self.compact()
+
+    def add(self, entry: ManifestEntry) -> None:
+        """Record that a blob was written to disk."""
+        self.entries[entry.key] = entry
+        self._append({'op': 'add', **dataclasses.asdict(entry)})
+
+    def remove(self, key: str) -> None:
+        """Record that the file of a blob was deleted.
+
+        Does nothing if the key is not in the manifest.
+        """
+        if self.entries.pop(key, None) is not None:
+            self._append({'op': 'remove', 'key': key})
+
+    def compact(self) -> None:
+        """Rewrite the log to contain only the live entries."""
+        self._file.close()
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            for entry in self.entries.values():
+                f.write(
+                    json.dumps({'op': 'add', **dataclasses.asdict(entry)})
+                    + '\n',
+                )
+        os.replace(tmp_path, self.path)
+        self._records = len(self.entries)
+        self._file = open(self.path, 'a')
+
+    def close(self) -> None:
+        """Close the manifest file."""
+        self._file.close()
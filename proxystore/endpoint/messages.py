@@ -1,14 +1,61 @@
-"""Endpoint to endpoint messages."""
+"""Endpoint to endpoint messages.
+
+Messages are sent between peer endpoints in a compact binary format
+rather than being pickled so that object payloads are neither pickled nor
+copied into a larger buffer when sending. A message is encoded by
+[`encode()`][proxystore.endpoint.messages.encode] as a list of buffers:
+a fixed size header and the metadata followed by each payload and,
+optionally, the pickled exception raised by the operation. The buffers
+are sent as a single peer message and decoded by
+[`decode()`][proxystore.endpoint.messages.decode].
+
+The header contains, in network byte order, the magic bytes `PE`, the
+format version, the message kind, the operation, flags, the length of
+the request ID, and the number of keys. The metadata contains the request
+ID, the length of each key, the keys, the results of an `exists`
+operation, and the length of each payload.
+"""
 from __future__ import annotations
 
+import struct
 import sys
 from dataclasses import dataclass
+from typing import Union
 
 if sys.version_info >= (3, 8):  # pragma: >=3.8 cover
     from typing import Literal
 else:  # pragma: <3.8 cover
     from typing_extensions import Literal
 
+from proxystore.serialize import BytesLike
+from proxystore.serialize import deserialize
+from proxystore.serialize import SerializationError
+from proxystore.serialize import serialize
+
+_MAGIC = b'PE'
+_VERSION = 1
+# Magic, version, kind, op, flags, request ID length, and number of keys.
+_HEADER = struct.Struct('!2sBBBBHI')
+_KINDS: tuple[Literal['request', 'response'], ...] = ('request', 'response')
+_OPS: tuple[
+    Literal['evict', 'exists', 'get', 'set', 'invalidate'],
+    ...,
+] = (
+    'evict',
+    'exists',
+    'get',
+    'set',
+    'invalidate',
+)
+_FLAG_BATCH = 1
+_FLAG_EXISTS = 2
+_FLAG_DATA = 4
+_FLAG_ERROR = 8
+_FLAG_STREAM = 16
+_FLAG_CACHE = 32
+# Payload length used to indicate the payload is None.
+_NONE_LENGTH = 2**64 - 1
+
 
 @dataclass
 class EndpointRequest:
@@ -17,18 +64,210 @@ class EndpointRequest:
     Attributes:
         kind: One of `#!python 'request'` or `#!python 'response'`.
         op: One of `#!python 'evict'`, `#!python 'exists'`, `#!python 'get'`,
-            or `#!python 'set'`.
+            `#!python 'set'`, or `#!python 'invalidate'`. An `invalidate`
+            request tells a peer that its cached copy of the key is stale
+            and is not responded to.
         uuid: UUID of sender.
         key: Key to operate on.
         data: Optional data to operate on.
         exists: Result of `exists` operation.
         error: Error raised by operation.
+        stream: In a `get` request, the value should be sent as a stream
+            following the response if the value is not empty. In a `get`
+            response, the value follows the response as a stream.
+        cache: In a `get` request, the sender caches the value and should
+            be sent an `invalidate` request if the key is evicted or
+            overwritten.
     """
 
     kind: Literal['request', 'response']
-    op: Literal['evict', 'exists', 'get', 'set']
+    op: Literal['evict', 'exists', 'get', 'set', 'invalidate']
     uuid: str
     key: str
     data: bytes | None = None
     exists: bool | None = None
     error: Exception | None = None
+    stream: bool = False
+    cache: bool = False
+
+
+@dataclass
+class EndpointBatchRequest:
+    """Message type for batch requests between endpoints.
+
+    A batch of operations of the same type is sent to a peer as a single
+    message rather than one
+    [`EndpointRequest`][proxystore.endpoint.messages.EndpointRequest]
+    per key.
+
+    Attributes:
+        kind: One of `#!python 'request'` or `#!python 'response'`.
+        op: One of `#!python 'exists'`, `#!python 'get'`, or
+            `#!python 'set'`.
+        uuid: UUID of sender.
+        keys: Keys to operate on.
+        data: Data associated with each key for `set` requests and `get`
+            responses.
+        exists: Result of `exists` operation for each key.
+        error: Error raised by operation.
+    """
+
+    kind: Literal['request', 'response']
+    op: Literal['exists', 'get', 'set']
+    uuid: str
+    keys: list[str]
+    data: list[bytes | None] | None = None
+    exists: list[bool] | None = None
+    error: Exception | None = None
+
+
+EndpointMessage = Union[EndpointRequest, EndpointBatchRequest]
+
+
+def encode(message: EndpointMessage) -> list[bytes | memoryview]:
+    """Encode a message in the binary peer message format.
+
+    Args:
+        message: Message to encode.
+
+    Returns:
+        List of buffers which form the encoded message when joined. The \
+        payloads of the message are included as is rather than copied.
+    """
+    flags = 0
+    keys: list[str]
+    exists: list[bool] | None
+    data: list[bytes | None] | None
+    if isinstance(message, EndpointBatchRequest):
+        flags |= _FLAG_BATCH
+        keys, exists, data = message.keys, message.exists, message.data
+    else:
+        if message.stream:
+            flags |= _FLAG_STREAM
+        if message.cache:
+            flags |= _FLAG_CACHE
+        keys = [message.key]
+        exists = None if message.exists is None else [message.exists]
+        data = None if message.data is None else [message.data]
+
+    request_id = message.uuid.encode('utf8')
+    encoded_keys = [key.encode('utf8') for key in keys]
+    metadata = [
+        request_id,
+        struct.pack(f'!{len(keys)}I', *(len(key) for key in encoded_keys)),
+        *encoded_keys,
+    ]
+    payloads: list[bytes | memoryview] = []
+    if exists is not None:
+        flags |= _FLAG_EXISTS
+        metadata.append(bytes(exists))
+    if data is not None:
+        flags |= _FLAG_DATA
+        metadata.append(
+            struct.pack(
+                f'!{len(data)}Q',
+                *(_NONE_LENGTH if d is None else len(d) for d in data),
+            ),
+        )
+        payloads.extend(d for d in data if d is not None)
+    if message.error is not None:
+        flags |= _FLAG_ERROR
+        payloads.append(serialize(message.error))
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        _KINDS.index(message.kind),
+        _OPS.index(message.op),
+        flags,
+        len(request_id),
+        len(keys),
+    )
+    return [b''.join([header, *metadata]), *payloads]
+
+
+class _Reader:
+    def __init__(self, data: BytesLike) -> None:
+        self.view = memoryview(data).cast('B')
+        self.offset = 0
+
+    def read(self, size: int) -> memoryview:
+        if self.offset + size > len(self.view):
+            raise ValueError('Message is truncated.')
+        data = self.view[self.offset : self.offset + size]
+        self.offset += size
+        return data
+
+    def unpack(self, fmt: str) -> tuple[int, ...]:
+        return struct.unpack(fmt, self.read(struct.calcsize(fmt)))
+
+
+def decode(data: BytesLike) -> EndpointMessage:
+    """Decode a message in the binary peer message format.
+
+    Args:
+        data: Encoded message.
+
+    Returns:
+        The decoded message.
+
+    Raises:
+        ValueError: If `data` is not a valid encoded message.
+    """
+    reader = _Reader(data)
+    magic, version, kind, op, flags, id_length, count = struct.unpack(
+        _HEADER.format,
+        reader.read(_HEADER.size),
+    )
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError('Data is not an endpoint message.')
+    if kind >= len(_KINDS) or op >= len(_OPS):
+        raise ValueError(f'Unknown message kind {kind} or op {op}.')
+
+    request_id = str(reader.read(id_length), 'utf8')
+    key_lengths = reader.unpack(f'!{count}I')
+    keys = [str(reader.read(length), 'utf8') for length in key_lengths]
+    exists: list[bool] | None = None
+    if flags & _FLAG_EXISTS:
+        exists = [bool(x) for x in reader.read(count)]
+    values: list[bytes | None] | None = None
+    if flags & _FLAG_DATA:
+        lengths = reader.unpack(f'!{count}Q')
+        values = [
+            None if length == _NONE_LENGTH else bytes(reader.read(length))
+            for length in lengths
+        ]
+    error: Exception | None = None
+    if flags & _FLAG_ERROR:
+        try:
+            error = deserialize(reader.read(len(reader.view) - reader.offset))
+        except SerializationError as e:
+            raise ValueError(f'Unable to decode message error: {e}') from e
+    if reader.offset != len(reader.view):
+        raise ValueError('Message contains unexpected trailing data.')
+
+    if flags & _FLAG_BATCH:
+        if _OPS[op] in ('evict', 'invalidate'):
+            raise ValueError(f'Batch messages do not support {_OPS[op]}.')
+        return EndpointBatchRequest(
+            kind=_KINDS[kind],
+            op=_OPS[op],
+            uuid=request_id,
+            keys=keys,
+            data=values,
+            exists=exists,
+            error=error,
+        )
+    if count != 1:
+        raise ValueError(f'Expected one key but got {count}.')
+    return EndpointRequest(
+        kind=_KINDS[kind],
+        op=_OPS[op],
+        uuid=request_id,
+        key=keys[0],
+        data=None if values is None else values[0],
+        exists=None if exists is None else exists[0],
+        error=error,
+        stream=bool(flags & _FLAG_STREAM),
+        cache=bool(flags & _FLAG_CACHE),
+    )
@@ -0,0 +1,181 @@
+"""Demotion policies for endpoint storage.
+
+A demotion policy tracks the blobs held in memory by an
+[`EndpointStorage`][proxystore.endpoint.storage.EndpointStorage] and
+selects which blob to demote to disk when the memory limit is exceeded.
+
+| Name | Policy | Victim |
+| :--- | :----- | :----- |
+| `lru` | [`LRUPolicy`][proxystore.eviction.LRUPolicy] | Least recently used. |
+| `lfu` | [`LFUPolicy`][proxystore.eviction.LFUPolicy] | Least frequently used. |
+| `greedy-dual` | [`GreedyDualPolicy`][proxystore.endpoint.policies.GreedyDualPolicy] | Large and not recently used. |
+"""  # noqa: E501
+from __future__ import annotations
+
+import heapq
+import itertools
+import sys
+
+if sys.version_info >= (3, 8):  # pragma: >=3.8 cover
+    from typing import Protocol
+    from typing import runtime_checkable
+else:  # pragma: <3.8 cover
+    from typing_extensions import Protocol
+    from typing_extensions import runtime_checkable
+
+from proxystore.eviction import LFUPolicy
+from proxystore.eviction import LRUPolicy
+
+
+@runtime_checkable
+class DemotionPolicy(Protocol):
+    """Protocol for demotion policies.
+
+    A policy tracks a set of keys. Keys are added when a blob is stored in
+    or reloaded into memory, accessed when the blob is read, and removed
+    when the blob is deleted. When space is needed,
+    [`pop()`][proxystore.endpoint.policies.DemotionPolicy.pop] selects and
+    removes the next key to demote.
+    """
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the policy tracks a key."""
+        ...
+
+    def __len__(self) -> int:
+        """Get the number of keys tracked by the policy."""
+        ...
+
+    def add(self, key: str, size: int) -> None:
+        """Start tracking a key.
+
+        Args:
+            key: Key of the blob.
+            size: Size of the blob in bytes.
+        """
+        ...
+
+    def access(self, key: str) -> None:
+        """Record an access to a tracked key.
+
+        Args:
+            key: Key of the blob.
+        """
+        ...
+
+    def remove(self, key: str) -> None:
+        """Stop tracking a key.
+
+        Args:
+            key: Key of the blob.
+
+        Raises:
+            KeyError: If the key is not tracked.
+        """
+        ...
+
+    def pop(self) -> str:
+        """Select and stop tracking the next key to demote.
+
+        Returns:
+            Key of the blob to demote.
+
+        Raises:
+            KeyError: If no keys are tracked.
+        """
+        ...
+
+
+class GreedyDualPolicy:
+    """Size-aware GreedyDual demotion policy.
+
+    Implements GreedyDual-Size with a uniform cost. Each key has a
+    priority of `L + 1 / size` which is reset when the key is accessed
+    where `L` is an inflation value set to the priority of the last
+    demoted key. Large blobs and blobs which have not been accessed
+    recently are demoted first so more small blobs stay in memory.
+
+    Adding, accessing, and popping keys takes logarithmic time. Stale heap
+    entries are discarded lazily.
+    """
+
+    def __init__(self) -> None:
+        self._inflation = 0.0
+        self._counter = itertools.count()
+        # Current (priority, sequence number) and size of each key.
+        self._entries: dict[str, tuple[float, int, int]] = {}
+        self._heap: list[tuple[float, int, str]] = []
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _push(self, key: str, size: int) -> None:
+        priority = self._inflation + 1 / max(size, 1)
+        sequence = next(self._counter)
+        self._entries[key] = (priority, sequence, size)
+        heapq.heappush(self._heap, (priority, sequence, key))
+        # Bound the number of stale entries so the heap does not grow
+        # without limit when keys are accessed frequently.
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (priority, sequence, key)
+                for key, (priority, sequence, _) in self._entries.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def add(self, key: str, size: int) -> None:
+        """Start tracking a key."""
+        self._push(key, size)
+
+    def access(self, key: str) -> None:
+        """Reset the priority of a key."""
+        _, _, size = self._entries[key]
+        self._push(key, size)
+
+    def remove(self, key: str) -> None:
+        """Stop tracking a key."""
+        del self._entries[key]
+
+    def pop(self) -> str:
+        """Select and stop tracking the key with the lowest priority."""
+        while len(self._heap) > 0:
+            priority, sequence, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == sequence:
+                del self._entries[key]
+                self._inflation = priority
+                return key
+        raise KeyError('pop from an empty policy')
+
+
+DEMOTION_POLICIES: dict[str, type[DemotionPolicy]] = {
+    'lru': LRUPolicy,
+    'lfu': LFUPolicy,
+    'greedy-dual': GreedyDualPolicy,
+}
+"""Mapping of demotion policy names to policy types."""
+
+
+def get_demotion_policy(name: str) -> DemotionPolicy:
+    """Create a demotion policy by name.
+
+    Args:
+        name: Name of the policy in
+            [`DEMOTION_POLICIES`][proxystore.endpoint.policies.DEMOTION_POLICIES].
+
+    Returns:
+        New instance of the demotion policy.
+
+    Raises:
+        ValueError: If no policy named `name` exists.
+    """
+    try:
+        return DEMOTION_POLICIES[name]()
+    except KeyError:
+        raise ValueError(
+            f'Unknown demotion policy {name}. Expected one of '
+            f'{", ".join(DEMOTION_POLICIES)}.',
+        ) from None
@@ -26,7 +26,9 @@ from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
 from proxystore.endpoint.endpoint import Endpoint
 from proxystore.endpoint.exceptions import PeerRequestError
-from proxystore.utils import chunk_bytes
+from proxystore.endpoint.framing import encode_frames
+from proxystore.endpoint.framing import FrameDecoder
+from proxystore.endpoint.framing import FramingError
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +158,21 @@ async def _endpoint_() -> Response:
     )
 
 
+@routes_blueprint.route('/stats', methods=['GET'])
+async def _stats() -> Response:
+    endpoint = quart.current_app.config['endpoint']
+    stats = endpoint.stats().as_dict()
+    stats['peers'] = {
+        str(peer): peer_stats.as_dict()
+        for peer, peer_stats in endpoint.peer_stats().items()
+    }
+    return Response(
+        json.dumps(stats),
+        200,
+        content_type='application/json',
+    )
+
+
 @routes_blueprint.route('/evict', methods=['POST'])
 async def _evict() -> Response:
     key = request.args.get('key', None)
@@ -226,13 +243,13 @@ async def _get() -> Response:
             return Response(f'{endpoint_uuid} is not a valid UUID4', 400)
 
     try:
-        data = await endpoint.get(key=key, endpoint=endpoint_uuid)
+        chunks = await endpoint.get_stream(key=key, endpoint=endpoint_uuid)
     except PeerRequestError as e:
         return Response(str(e), 400)
 
-    if data is not None:
+    if chunks is not None:
         return Response(
-            response=chunk_bytes(data, MAX_CHUNK_LENGTH),
+            response=chunks,
             content_type='application/octet-stream',
         )
     else:
@@ -256,18 +273,127 @@ async def _set() -> Response:
         except ValueError:
             return Response(f'{endpoint_uuid} is not a valid UUID4', 400)
 
-    data = bytearray()
-    # Note: tests/endpoint/serve_test.py::test_empty_chunked_data handles
-    # the branching case for where the code in the for loop is not executed
-    # but coverage is not detecting that hence the pragma here
-    async for chunk in request.body:  # pragma: no branch
-        data += chunk
+    try:
+        size = await endpoint.set_stream(
+            key=key,
+            chunks=request.body,
+            endpoint=endpoint_uuid,
+        )
+    except PeerRequestError as e:
+        return Response(str(e), 400)
 
-    if len(data) == 0:
+    if size == 0:
         return Response('Received empty payload', 400)
+    else:
+        return Response('', 200)
+
+
+def _get_endpoint_uuid() -> uuid.UUID | None:
+    """Parse the optional endpoint UUID query parameter.
 
+    Raises:
+        ValueError: If the endpoint UUID is not a valid UUID4.
+    """
+    endpoint_uuid = request.args.get('endpoint', None)
+    if endpoint_uuid is None:
+        return None
+    try:
+        return uuid.UUID(endpoint_uuid, version=4)
+    except ValueError:
+        raise ValueError(f'{endpoint_uuid} is not a valid UUID4') from None
+
+
+async def _get_keys() -> list[str]:
+    """Parse the list of keys from the JSON body of a batch request.
+
+    Raises:
+        ValueError: If the body does not contain a list of keys.
+    """
+    body = await request.get_json(force=True, silent=True)
+    keys = body.get('keys', None) if isinstance(body, dict) else None
+    if not isinstance(keys, list) or not all(
+        isinstance(key, str) for key in keys
+    ):
+        raise ValueError('request missing list of keys')
+    return keys
+
+
+@routes_blueprint.route('/exists_batch', methods=['POST'])
+async def _exists_batch() -> Response:
+    try:
+        endpoint_uuid = _get_endpoint_uuid()
+        keys = await _get_keys()
+    except ValueError as e:
+        return Response(str(e), 400)
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        exists = await endpoint.exists_batch(keys=keys, endpoint=endpoint_uuid)
+    except PeerRequestError as e:
+        return Response(str(e), 400)
+
+    return Response(
+        json.dumps({'exists': exists}),
+        200,
+        content_type='application/json',
+    )
+
+
+@routes_blueprint.route('/get_batch', methods=['POST'])
+async def _get_batch() -> Response:
+    try:
+        endpoint_uuid = _get_endpoint_uuid()
+        keys = await _get_keys()
+    except ValueError as e:
+        return Response(str(e), 400)
+
+    endpoint = quart.current_app.config['endpoint']
+    try:
+        data = await endpoint.get_batch(keys=keys, endpoint=endpoint_uuid)
+    except PeerRequestError as e:
+        return Response(str(e), 400)
+
+    # Missing objects are encoded as missing frames rather than failing
+    # the whole request.
+    return Response(
+        response=encode_frames(data, MAX_CHUNK_LENGTH),
+        content_type='application/octet-stream',
+    )
+
+
+@routes_blueprint.route('/set_batch', methods=['POST'])
+async def _set_batch() -> Response:
+    try:
+        endpoint_uuid = _get_endpoint_uuid()
+    except ValueError as e:
+        return Response(str(e), 400)
+
+    # Frames are decoded as the body is streamed so each value is copied
+    # out of the received chunks once rather than first being accumulated
+    # into a buffer of the whole body.
+    decoder = FrameDecoder()
+    try:
+        async for chunk in request.body:  # pragma: no branch
+            decoder.feed(chunk)
+        frames = decoder.finish()
+    except FramingError as e:
+        return Response(str(e), 400)
+
+    # The body alternates key frames and data frames.
+    if len(frames) == 0 or len(frames) % 2 != 0:
+        return Response('Received malformed batch payload', 400)
+    values = [
+        frame for frame in frames if frame is not None and len(frame) > 0
+    ]
+    if len(values) != len(frames):
+        return Response('Received empty payload', 400)
+
+    keys = [str(value, 'utf-8') for value in values[::2]]
+    data = values[1::2]
+
+    endpoint = quart.current_app.config['endpoint']
     try:
-        await endpoint.set(key=key, data=bytes(data), endpoint=endpoint_uuid)
+        await endpoint.set_batch(keys=keys, data=data, endpoint=endpoint_uuid)
     except PeerRequestError as e:
         return Response(str(e), 400)
     else:
@@ -1,12 +1,20 @@
 """Storage interface for blobs."""
 from __future__ import annotations
 
+import asyncio
 import collections
+import dataclasses
 import enum
+import logging
 import os
 import shutil
 import sys
-from typing import Deque
+import time
+import uuid
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import BinaryIO
 from typing import Iterator
 
 if sys.version_info >= (3, 9):  # pragma: >=3.9 cover
@@ -14,10 +22,24 @@ if sys.version_info >= (3, 9):  # pragma: >=3.9 cover
 else:  # pragma: <3.9 cover
     from typing import MutableMapping
 
+from proxystore.endpoint.compression import Codec
+from proxystore.endpoint.compression import get_codec
+from proxystore.endpoint.compression import maybe_compress
+from proxystore.endpoint.constants import MAX_CHUNK_LENGTH
 from proxystore.endpoint.exceptions import FileDumpNotAvailableError
 from proxystore.endpoint.exceptions import ObjectSizeExceededError
+from proxystore.endpoint.manifest import MANIFEST_FILENAME
+from proxystore.endpoint.manifest import ManifestEntry
+from proxystore.endpoint.manifest import SpillManifest
+from proxystore.endpoint.policies import DemotionPolicy
+from proxystore.endpoint.policies import get_demotion_policy
+from proxystore.serialize import BytesLike
+from proxystore.store.metrics import TimeStats
+from proxystore.utils import achunk_bytes
 from proxystore.utils import bytes_to_readable
 
+logger = logging.getLogger(__name__)
+
 
 class BlobLocation(enum.Enum):
     """Location of Blob."""
@@ -26,6 +48,8 @@ class BlobLocation(enum.Enum):
     """Blob is loaded in memory."""
     FILE = 2
     """Blob is stored on disk."""
+    COMPRESSED = 3
+    """Blob is compressed in memory."""
 
 
 class Blob:
@@ -46,14 +70,44 @@ class Blob:
         self.key = key
         self.size = len(value)
         self._value: bytes | None = value
+        self._compressed: bytes | None = None
         self.filepath = filepath
+        # Codec and size of the blob when compressed in memory or on disk.
+        self.codec: Codec | None = None
+        self.stored_size = self.size
+
+    @classmethod
+    def from_file(
+        cls,
+        key: str,
+        filepath: str,
+        size: int,
+        codec: Codec | None = None,
+        stored_size: int | None = None,
+    ) -> Blob:
+        """Create a blob which is stored on disk.
+
+        Args:
+            key: Key associated with the blob.
+            filepath: Path to the file containing the blob.
+            size: Size of the blob in bytes.
+            codec: Codec the file is compressed with, if any.
+            stored_size: Size of the file in bytes. Defaults to `size`.
+        """
+        blob = cls(key, b'', filepath)
+        blob.size = size
+        blob.set_dumped(codec, size if stored_size is None else stored_size)
+        return blob
 
     @property
     def location(self) -> BlobLocation:
         """Location of the blob."""
-        return (
-            BlobLocation.FILE if self._value is None else BlobLocation.MEMORY
-        )
+        if self._value is not None:
+            return BlobLocation.MEMORY
+        elif self._compressed is not None:
+            return BlobLocation.COMPRESSED
+        else:
+            return BlobLocation.FILE
 
     @property
     def value(self) -> bytes:
@@ -68,46 +122,253 @@ class Blob:
         if self.filepath is not None and os.path.isfile(self.filepath):
             os.remove(self.filepath)
 
-    def dump(self) -> None:
-        """Dump the blob to disk."""
+    def encode(
+        self,
+        codec: Codec | None = None,
+        threshold: float = 1.0,
+    ) -> tuple[bytes, Codec | None]:
+        """Get the data to store when the blob is demoted.
+
+        This method is safe to call from a thread other than the one
+        which owns the blob.
+
+        Args:
+            codec: Optional codec to compress the blob with.
+            threshold: Compress the blob only if the compression ratio is
+                below this value.
+
+        Returns:
+            Tuple of the data and the codec used to compress the data or \
+            `None` if the data is not compressed.
+        """
+        compressed = self._compressed
+        if compressed is not None:
+            return compressed, self.codec
+        value = self._value
+        assert value is not None
+        if codec is None:
+            return value, None
+        return maybe_compress(value, codec, threshold)
+
+    def decode(self, data: bytes) -> bytes:
+        """Decompress data returned by [`encode()`][proxystore.endpoint.storage.Blob.encode].
+
+        This method is safe to call from a thread other than the one
+        which owns the blob.
+        """  # noqa: E501
+        return data if self.codec is None else self.codec.decompress(data)
+
+    def write_file(self, data: bytes | None = None) -> None:
+        """Write the blob to disk without releasing it from memory.
+
+        This method is safe to call from a thread other than the one
+        which owns the blob.
+
+        Args:
+            data: Data to write. Defaults to the result of
+                [`encode()`][proxystore.endpoint.storage.Blob.encode].
+        """
         if self.filepath is None:
             raise FileDumpNotAvailableError(
                 'The blob was not initialized with a filepath '
                 'to dump data to.',
             )
-        assert self._value is not None
+        if data is None:
+            data, _ = self.encode()
         with open(self.filepath, 'wb') as f:
-            f.write(self._value)
+            f.write(data)
+
+    def read_file(self) -> bytes:
+        """Read and decode the blob from disk without loading it into memory.
+
+        This method is safe to call from a thread other than the one
+        which owns the blob.
+        """
+        assert self.filepath is not None
+        with open(self.filepath, 'rb') as f:
+            return self.decode(f.read())
+
+    def set_value(self, value: bytes) -> None:
+        """Set the uncompressed blob bytes in memory."""
+        self._value = value
+        self._compressed = None
+        self.codec = None
+        self.stored_size = self.size
+
+    def set_compressed(self, data: bytes, codec: Codec) -> None:
+        """Replace the blob bytes in memory with compressed data."""
+        self._value = None
+        self._compressed = data
+        self.codec = codec
+        self.stored_size = len(data)
+
+    def set_dumped(self, codec: Codec | None, stored_size: int) -> None:
+        """Release the blob from memory once written to disk."""
         self._value = None
+        self._compressed = None
+        self.codec = codec
+        self.stored_size = stored_size
+
+    def compress(self, codec: Codec, threshold: float = 1.0) -> bool:
+        """Compress the blob in memory.
+
+        Args:
+            codec: Codec to compress the blob with.
+            threshold: Compress the blob only if the compression ratio is
+                below this value.
+
+        Returns:
+            If the blob was compressed.
+        """
+        data, used = self.encode(codec, threshold)
+        if used is None:
+            return False
+        self.set_compressed(data, used)
+        return True
+
+    def dump(
+        self,
+        codec: Codec | None = None,
+        threshold: float = 1.0,
+    ) -> None:
+        """Dump the blob to disk.
+
+        Args:
+            codec: Optional codec to compress the blob with. Ignored if
+                the blob is already compressed.
+            threshold: Compress the blob only if the compression ratio is
+                below this value.
+        """
+        data, used = self.encode(codec, threshold)
+        self.write_file(data)
+        self.set_dumped(used, len(data))
 
     def load(self) -> None:
-        """Load the blob from disk."""
+        """Load the blob from memory or disk."""
         if self._value is not None:
             return
+        elif self._compressed is not None:
+            self.set_value(self.decode(self._compressed))
+        else:
+            self.set_value(self.read_file())
+            self.delete_file()
 
-        assert self.filepath is not None
-        with open(self.filepath, 'rb') as f:
-            self._value = f.read()
-        self.delete_file()
+
+@dataclasses.dataclass
+class StorageStats:
+    """Snapshot of endpoint storage statistics."""
+
+    blobs: int
+    """Number of blobs in the storage."""
+    memory_blobs: int
+    """Number of uncompressed blobs in memory."""
+    memory_bytes: int
+    """Total size in bytes of uncompressed blobs in memory."""
+    compressed_blobs: int
+    """Number of compressed blobs in memory."""
+    compressed_bytes: int
+    """Total compressed size in bytes of compressed blobs in memory."""
+    pending_spills: int
+    """Number of blobs currently being spilled to disk."""
+    pending_reloads: int
+    """Number of blobs currently being reloaded from disk."""
+    spills: TimeStats
+    """Latency of spilling blobs to disk."""
+    reloads: TimeStats
+    """Latency of reloading blobs from disk."""
+    spilled_bytes: int
+    """Total size in bytes of blobs spilled to disk."""
+    reloaded_bytes: int
+    """Total size in bytes of blobs reloaded from disk."""
+    streamed_blobs: int
+    """Number of blobs streamed from disk without being reloaded."""
+    direct_writes: int
+    """Number of blobs written directly to disk when set."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the dataclass to a [`dict`][dict]."""
+        return dataclasses.asdict(self)
 
 
 class EndpointStorage(MutableMapping[str, bytes]):
     """Endpoint in-memory blob storage with filesystem fallback.
 
     Provides a dict-like storage of key-bytes pairs. Optionally, a maximum
-    in-memory size for the data structure can be specified and least-recently
-    used key-bytes pairs will be dumped to a file in a specified directory.
+    in-memory size for the data structure can be specified and key-bytes
+    pairs selected by the demotion policy (least-recently used by default)
+    will be dumped to a file in a specified directory.
+
+    If a `compression` codec is set, demoted blobs are compressed when a
+    probe of the blob estimates the compression ratio to be below
+    `compression_threshold` and are otherwise stored uncompressed. If
+    `max_compressed_size` is also set, compressed blobs are first kept in
+    a compressed in-memory tier of that size. Blobs demoted from the
+    compressed tier, selected by a separate instance of the demotion
+    policy, are written to disk without being recompressed.
+
+    The dict-like interface performs file I/O synchronously. The async
+    methods, [`aget()`][proxystore.endpoint.storage.EndpointStorage.aget]
+    and [`aset()`][proxystore.endpoint.storage.EndpointStorage.aset],
+    perform compression and file I/O in the event loop's default executor
+    so demoting or reloading a large blob does not block the event loop.
+    With the async methods, blobs are spilled in the background once the
+    in-memory size exceeds `spill_watermark` of `max_size` so space is
+    available ahead of new blobs, concurrent reloads of the same blob
+    share a single read, and a blob which is read while being spilled is
+    served from memory. The compressed tier may temporarily exceed
+    `max_compressed_size` while its blobs are being spilled. The sync and
+    async interfaces should not be used concurrently.
+
+    If `persist` is set, blobs written to `dump_dir` are recorded in a
+    [`SpillManifest`][proxystore.endpoint.manifest.SpillManifest]. When a
+    storage is created with an existing manifest, the blobs it records are
+    restored on disk and lazily reloaded into memory when accessed, and
+    other files in `dump_dir` are removed.
+    [`snapshot()`][proxystore.endpoint.storage.EndpointStorage.snapshot]
+    writes the blobs in memory to disk so they can also be restored and
+    [`close()`][proxystore.endpoint.storage.EndpointStorage.close] keeps
+    `dump_dir` rather than removing it.
+
+    If `large_object_threshold` is set, blobs of at least that size on
+    disk are streamed from their file by
+    [`astream()`][proxystore.endpoint.storage.EndpointStorage.astream]
+    without being reloaded into memory, and blobs set by
+    [`aset_stream()`][proxystore.endpoint.storage.EndpointStorage.aset_stream]
+    are written directly to disk once they reach that size.
 
     Args:
         max_size: Optional maximum size in bytes for in-memory
-            storage of blobs. If the memory limit is exceeded, least
-            recently used blobs will be dumped to disk (if configured).
+            storage of blobs. If the memory limit is exceeded, blobs
+            selected by the demotion policy will be dumped to disk (if
+            configured).
         max_object_size: Optional maximum size in bytes for any single blob.
         dump_dir: Optional directory to dump blobs to when `max_object_size`
             is reached.
+        demotion_policy: Policy, or name of a policy in
+            [`DEMOTION_POLICIES`][proxystore.endpoint.policies.DEMOTION_POLICIES],
+            used to select blobs to dump to disk.
+        spill_watermark: Fraction of `max_size` above which blobs are
+            spilled in the background by the async methods.
+        compression: Optional codec, or name of a codec in
+            [`CODECS`][proxystore.endpoint.compression.CODECS], used to
+            compress demoted blobs.
+        compression_threshold: Demoted blobs are compressed only if the
+            compression ratio is below this value.
+        max_compressed_size: Optional maximum size in bytes of the
+            compressed in-memory tier. Requires `compression`.
+        persist: Record blobs written to `dump_dir` so they can be restored
+            by a new storage. Requires `dump_dir`.
+        large_object_threshold: Optional size in bytes at which blobs are
+            streamed to and from disk rather than held in memory. Requires
+            `dump_dir`.
 
     Raises:
-        ValueError: If only one of `max_size` or `dump_dir` is set.
+        ValueError: If only one of `max_size` or `dump_dir` is set, if
+            `demotion_policy` is not a known policy name, if
+            `spill_watermark` is not in the range (0, 1], if `compression`
+            is not a known codec name, if `max_compressed_size` is set
+            without `compression`, or if `persist` or
+            `large_object_threshold` is set without `dump_dir`.
     """
 
     def __init__(
@@ -115,6 +376,13 @@ class EndpointStorage(MutableMapping[str, bytes]):
         max_size: int | None = None,
         max_object_size: int | None = None,
         dump_dir: str | None = None,
+        demotion_policy: DemotionPolicy | str = 'lru',
+        spill_watermark: float = 0.9,
+        compression: Codec | str | None = None,
+        compression_threshold: float = 0.8,
+        max_compressed_size: int | None = None,
+        persist: bool = False,
+        large_object_threshold: int | None = None,
     ) -> None:
         if (max_size is not None or dump_dir is not None) and (
             max_size is None or dump_dir is None
@@ -123,20 +391,74 @@ class EndpointStorage(MutableMapping[str, bytes]):
                 'Either both of max_size and dump_dir should be specified '
                 'or neither.',
             )
+        if not 0 < spill_watermark <= 1:
+            raise ValueError(
+                'Spill watermark must be in the range (0, 1]. '
+                f'Got {spill_watermark}.',
+            )
+        if max_compressed_size is not None and compression is None:
+            raise ValueError(
+                'A compression codec must be specified if '
+                'max_compressed_size is specified.',
+            )
+        if persist and dump_dir is None:
+            raise ValueError('A dump_dir must be specified if persist is set.')
+        if large_object_threshold is not None and dump_dir is None:
+            raise ValueError(
+                'A dump_dir must be specified if large_object_threshold is '
+                'set.',
+            )
         self.max_size = max_size
         self.max_object_size = max_object_size
         self.dump_dir = dump_dir
+        self.spill_watermark = spill_watermark
+        self.compression = (
+            get_codec(compression)
+            if isinstance(compression, str)
+            else compression
+        )
+        self.compression_threshold = compression_threshold
+        self.max_compressed_size = max_compressed_size
+        self.large_object_threshold = large_object_threshold
 
         if self.dump_dir is not None:
             os.makedirs(self.dump_dir, exist_ok=True)
 
         self._in_memory_size = 0
+        self._compressed_size = 0
         self._blobs: dict[str, Blob] = {}
 
-        # Only in-memory objects should be in this.
-        # Recently used keys are appended to right side, LRU keys are
-        # popped from left side.
-        self._lru_queue: Deque[str] = collections.deque()
+        # Only in-memory objects which are not being spilled are tracked
+        # by the policies. Uncompressed and compressed objects are tracked
+        # by separate instances of the policy.
+        self._policy = (
+            get_demotion_policy(demotion_policy)
+            if isinstance(demotion_policy, str)
+            else demotion_policy
+        )
+        self._compressed_policy = type(self._policy)()
+
+        # In-flight async spills and reloads. Blobs being spilled are
+        # still in memory until the spill completes.
+        self._spills: dict[Blob, asyncio.Future[bool]] = {}
+        self._spilling_size = 0
+        self._compressed_spilling_size = 0
+        self._reloads: dict[Blob, asyncio.Future[bytes | None]] = {}
+
+        self._spill_times = TimeStats()
+        self._reload_times = TimeStats()
+        self._spilled_bytes = 0
+        self._reloaded_bytes = 0
+        self._streamed_blobs = 0
+        self._direct_writes = 0
+
+        self._manifest: SpillManifest | None = None
+        if persist:
+            assert self.dump_dir is not None
+            self._manifest = SpillManifest(
+                os.path.join(self.dump_dir, MANIFEST_FILENAME),
+            )
+            self._restore()
 
     def __getitem__(self, key: str) -> bytes:
         """Get bytes associated with key."""
@@ -146,17 +468,26 @@ class EndpointStorage(MutableMapping[str, bytes]):
         blob = self._blobs[key]
 
         if blob.location == BlobLocation.MEMORY:
-            # Move to right side because recently used
-            self._lru_queue.remove(key)
-            self._lru_queue.append(key)
+            if key in self._policy:
+                self._policy.access(key)
             return blob.value
 
+        location = blob.location
+        if location == BlobLocation.COMPRESSED:
+            self._compressed_size -= blob.stored_size
+            if key in self._compressed_policy:
+                self._compressed_policy.remove(key)
+
         self._make_space(blob.size)
         self._in_memory_size += blob.size
+        start = time.perf_counter()
         blob.load()
+        if location == BlobLocation.FILE:
+            self._record_reload(blob, start)
+            self._unrecord(key)
 
-        # Add to queue because it is back in memory
-        self._lru_queue.append(key)
+        # Track because it is back in memory
+        self._policy.add(key, blob.size)
 
         return blob.value
 
@@ -166,29 +497,12 @@ class EndpointStorage(MutableMapping[str, bytes]):
         Raises:
             ValueError: If `value` is larger than `max_size`.
         """
-        if (
-            self.max_object_size is not None
-            and len(value) > self.max_object_size
-        ):
-            raise ObjectSizeExceededError(
-                f'Bytes value has size {bytes_to_readable(len(value))} which '
-                f'exceeds the {bytes_to_readable(self.max_object_size)} '
-                'object limit.',
-            )
-        if self.max_size is not None and len(value) > self.max_size:
-            raise ObjectSizeExceededError(
-                f'Bytes value has size {bytes_to_readable(len(value))} which '
-                f'exceeds the {bytes_to_readable(self.max_size)} '
-                'memory limit.',
-            )
-        filepath = (
-            None if self.dump_dir is None else os.path.join(self.dump_dir, key)
-        )
-        blob = Blob(key, value, filepath)
+        self._check_size(len(value))
+        if key in self._blobs:
+            del self[key]
+        blob = Blob(key, value, self._filepath(key))
         self._make_space(blob.size)
-        self._blobs[key] = blob
-        self._in_memory_size += blob.size
-        self._lru_queue.append(key)
+        self._insert(blob)
 
     def __delitem__(self, key: str) -> None:
         """Remove a key from the storage."""
@@ -199,8 +513,16 @@ class EndpointStorage(MutableMapping[str, bytes]):
         assert blob is not None
         if blob.location == BlobLocation.MEMORY:
             self._in_memory_size -= blob.size
-            self._lru_queue.remove(key)
+            if key in self._policy:
+                self._policy.remove(key)
+        elif blob.location == BlobLocation.COMPRESSED:
+            self._compressed_size -= blob.stored_size
+            if key in self._compressed_policy:
+                self._compressed_policy.remove(key)
+        # If the blob is being spilled, the file is removed once the spill
+        # completes.
         blob.delete_file()
+        self._unrecord(key)
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over keys in the storage."""
@@ -218,15 +540,395 @@ class EndpointStorage(MutableMapping[str, bytes]):
         """Clear all keys in the storage."""
         keys = list(self._blobs.keys())
         for key in keys:
-            del self._blobs[key]
-        self._lru_queue.clear()
+            del self[key]
 
     def cleanup(self) -> None:
         """Clear all keys in the storage and remove the data dump."""
-        if self.dump_dir is not None:
+        if self._manifest is not None:
+            self._manifest.close()
+        if self.dump_dir is not None and os.path.isdir(self.dump_dir):
             shutil.rmtree(self.dump_dir)
         self._blobs.clear()
 
+    def close(self) -> None:
+        """Close the storage.
+
+        If the storage is persistent, blobs on disk and the manifest are
+        kept so they can be restored by a new storage. Otherwise, this is
+        equivalent to
+        [`cleanup()`][proxystore.endpoint.storage.EndpointStorage.cleanup].
+        """
+        if self._manifest is None:
+            self.cleanup()
+            return
+        self._manifest.close()
+        self._blobs.clear()
+        self._policy = type(self._policy)()
+        self._compressed_policy = type(self._policy)()
+        self._in_memory_size = 0
+        self._compressed_size = 0
+
+    def snapshot(self) -> None:
+        """Write all blobs in memory to disk.
+
+        The blobs are released from memory and will be reloaded from disk
+        when accessed.
+
+        Raises:
+            RuntimeError: If the storage is not persistent.
+        """
+        if self._manifest is None:
+            raise RuntimeError('Only persistent storage can be snapshotted.')
+        for blob in list(self._blobs.values()):
+            if blob.location == BlobLocation.FILE:
+                continue
+            self._untrack(blob)
+            data, codec = blob.encode(
+                self.compression,
+                self.compression_threshold,
+            )
+            self._dump(blob, data, codec)
+
+    def stats(self) -> StorageStats:
+        """Get a snapshot of the storage statistics."""
+        locations = collections.Counter(
+            blob.location for blob in self._blobs.values()
+        )
+        return StorageStats(
+            blobs=len(self._blobs),
+            memory_blobs=locations[BlobLocation.MEMORY],
+            memory_bytes=self._in_memory_size,
+            compressed_blobs=locations[BlobLocation.COMPRESSED],
+            compressed_bytes=self._compressed_size,
+            pending_spills=len(self._spills),
+            pending_reloads=len(self._reloads),
+            spills=dataclasses.replace(self._spill_times),
+            reloads=dataclasses.replace(self._reload_times),
+            spilled_bytes=self._spilled_bytes,
+            reloaded_bytes=self._reloaded_bytes,
+            streamed_blobs=self._streamed_blobs,
+            direct_writes=self._direct_writes,
+        )
+
+    async def aget(self, key: str) -> bytes | None:
+        """Get bytes associated with key.
+
+        Blobs which are compressed or on disk are reloaded in the default
+        executor. Concurrent calls for a blob being reloaded wait on the
+        same reload.
+
+        Returns:
+            Bytes associated with key or `None` if the key does not exist.
+        """
+        blob = self._blobs.get(key)
+        if blob is None:
+            return None
+
+        if blob.location == BlobLocation.MEMORY:
+            if key in self._policy:
+                self._policy.access(key)
+            return blob.value
+
+        reload = self._reloads.get(blob)
+        if reload is None:
+            reload = asyncio.ensure_future(self._reload(blob))
+            self._reloads[blob] = reload
+            reload.add_done_callback(lambda _: self._reloads.pop(blob, None))
+        return await asyncio.shield(reload)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        """Set key to value.
+
+        If there is not enough space in memory, waits for blobs to be
+        spilled to disk in the default executor.
+
+        Raises:
+            ValueError: If `value` is larger than `max_size`.
+        """
+        self._check_size(len(value))
+        if key in self._blobs:
+            del self[key]
+        await self._amake_space(len(value))
+        # Another task may have set the key while waiting for space.
+        if key in self._blobs:
+            del self[key]
+        self._insert(Blob(key, value, self._filepath(key)))
+        self._spill_to_watermark()
+
+    async def astream(
+        self,
+        key: str,
+        chunk_size: int = MAX_CHUNK_LENGTH,
+    ) -> AsyncIterator[BytesLike] | None:
+        """Get the bytes associated with key as a stream of chunks.
+
+        Large blobs on disk are read from their file in chunks in the
+        default executor without being reloaded into memory. Other blobs
+        are retrieved with
+        [`aget()`][proxystore.endpoint.storage.EndpointStorage.aget].
+
+        Args:
+            key: Key to get.
+            chunk_size: Maximum size in bytes of chunks read from disk.
+
+        Returns:
+            Async iterator of chunks of the bytes associated with key or \
+            `None` if the key does not exist.
+        """
+        blob = self._blobs.get(key)
+        if blob is None:
+            return None
+
+        if (
+            blob.location == BlobLocation.FILE
+            and self._is_large(blob.size)
+            and blob not in self._reloads
+        ):
+            assert blob.filepath is not None
+            codec = blob.codec
+            loop = asyncio.get_running_loop()
+            try:
+                # Once open, the file can be read even if it is deleted by
+                # a reload. A blob spilled again after a reload is written
+                # with the same contents so the codec is still correct.
+                f = await loop.run_in_executor(None, open, blob.filepath, 'rb')
+            except FileNotFoundError:
+                pass
+            else:
+                self._streamed_blobs += 1
+                return _stream_file(f, codec, chunk_size)
+
+        value = await self.aget(key)
+        if value is None:
+            return None
+        return achunk_bytes(value, chunk_size)
+
+    async def aset_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[BytesLike],
+    ) -> int:
+        """Set key to the concatenation of a stream of chunks.
+
+        Chunks are buffered in memory until the total size reaches
+        `large_object_threshold`. After that, the buffered and remaining
+        chunks are written directly to disk in the default executor and
+        the blob is stored on disk.
+
+        Args:
+            key: Key to set.
+            chunks: Async iterable of chunks of bytes.
+
+        Returns:
+            Total size of the chunks. If zero, the key is not set.
+
+        Raises:
+            ObjectSizeExceededError: If the total size exceeds
+                `max_object_size` or `max_size`.
+        """
+        loop = asyncio.get_running_loop()
+        buffer = bytearray()
+        size = 0
+        filepath: str | None = None
+        f: BinaryIO | None = None
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                self._check_size(size)
+                if f is not None:
+                    await loop.run_in_executor(None, f.write, chunk)
+                    continue
+                buffer += chunk
+                if self._is_large(len(buffer)):
+                    filepath = self._filepath(key)
+                    assert filepath is not None
+                    f = await loop.run_in_executor(None, open, filepath, 'wb')
+                    await loop.run_in_executor(None, f.write, buffer)
+                    buffer = bytearray()
+            if f is not None:
+                await loop.run_in_executor(None, f.close)
+        except BaseException:
+            if f is not None:
+                f.close()
+                os.remove(f.name)
+            raise
+
+        if filepath is None:
+            if size > 0:
+                await self.aset(key, bytes(buffer))
+            return size
+
+        if key in self._blobs:
+            del self[key]
+        blob = Blob.from_file(key, filepath, size)
+        self._blobs[key] = blob
+        self._record(blob)
+        self._direct_writes += 1
+        return size
+
+    async def wait_pending(self) -> None:
+        """Wait for in-flight spills and reloads to complete."""
+        while len(self._spills) > 0 or len(self._reloads) > 0:
+            # Spills to the compressed tier can start spills to disk so
+            # wait until no new work is started.
+            pending: list[asyncio.Future[Any]] = [
+                *self._spills.values(),
+                *self._reloads.values(),
+            ]
+            await asyncio.wait(pending)
+
+    async def asnapshot(self) -> None:
+        """Write all blobs in memory to disk in the default executor.
+
+        Waits for in-flight spills and reloads to complete first.
+
+        Raises:
+            RuntimeError: If the storage is not persistent.
+        """
+        if self._manifest is None:
+            raise RuntimeError('Only persistent storage can be snapshotted.')
+        await self.wait_pending()
+        loop = asyncio.get_running_loop()
+        for blob in list(self._blobs.values()):
+            if (
+                blob.location == BlobLocation.FILE
+                or self._blobs.get(blob.key) is not blob
+            ):
+                continue
+            self._untrack(blob)
+            start = time.perf_counter()
+            data, codec = await loop.run_in_executor(
+                None,
+                blob.encode,
+                self.compression,
+                self.compression_threshold,
+            )
+            await loop.run_in_executor(None, blob.write_file, data)
+            if self._blobs.get(blob.key) is blob:
+                self._dumped(blob, codec, len(data))
+                self._record_spill(blob, start)
+            else:
+                blob.delete_file()
+
+    def _check_size(self, size: int) -> None:
+        if self.max_object_size is not None and size > self.max_object_size:
+            raise ObjectSizeExceededError(
+                f'Bytes value has size {bytes_to_readable(size)} which '
+                f'exceeds the {bytes_to_readable(self.max_object_size)} '
+                'object limit.',
+            )
+        if self.max_size is not None and size > self.max_size:
+            raise ObjectSizeExceededError(
+                f'Bytes value has size {bytes_to_readable(size)} which '
+                f'exceeds the {bytes_to_readable(self.max_size)} '
+                'memory limit.',
+            )
+
+    def _is_large(self, size: int) -> bool:
+        return (
+            self.large_object_threshold is not None
+            and size >= self.large_object_threshold
+        )
+
+    def _filepath(self, key: str) -> str | None:
+        # Each blob gets a unique file so an in-flight spill of a deleted
+        # or overwritten blob cannot clobber the file of a newer blob.
+        if self.dump_dir is None:
+            return None
+        return os.path.join(self.dump_dir, f'{key}.{uuid.uuid4().hex[:8]}')
+
+    def _insert(self, blob: Blob) -> None:
+        self._blobs[blob.key] = blob
+        self._in_memory_size += blob.size
+        self._policy.add(blob.key, blob.size)
+
+    def _untrack(self, blob: Blob) -> None:
+        """Remove a blob from the demotion policy of its tier."""
+        if blob.key in self._policy:
+            self._policy.remove(blob.key)
+        if blob.key in self._compressed_policy:
+            self._compressed_policy.remove(blob.key)
+
+    def _dumped(self, blob: Blob, codec: Codec | None, nbytes: int) -> None:
+        """Release a blob from memory once it has been written to disk."""
+        if blob.location == BlobLocation.MEMORY:
+            self._in_memory_size -= blob.size
+        elif blob.location == BlobLocation.COMPRESSED:
+            self._compressed_size -= blob.stored_size
+        blob.set_dumped(codec, nbytes)
+        self._record(blob)
+
+    def _record(self, blob: Blob) -> None:
+        """Add a blob which was written to disk to the manifest."""
+        if self._manifest is not None:
+            assert blob.filepath is not None
+            self._manifest.add(
+                ManifestEntry(
+                    key=blob.key,
+                    filename=os.path.basename(blob.filepath),
+                    size=blob.size,
+                    stored_size=blob.stored_size,
+                    codec=None if blob.codec is None else blob.codec.name,
+                ),
+            )
+
+    def _dump(self, blob: Blob, data: bytes, codec: Codec | None) -> None:
+        """Write the encoded blob to disk and release it from memory."""
+        start = time.perf_counter()
+        blob.write_file(data)
+        self._dumped(blob, codec, len(data))
+        self._record_spill(blob, start)
+
+    def _unrecord(self, key: str) -> None:
+        """Remove a key whose file was deleted from the manifest."""
+        if self._manifest is not None:
+            self._manifest.remove(key)
+
+    def _restore(self) -> None:
+        """Restore the blobs recorded in the manifest."""
+        assert self._manifest is not None
+        assert self.dump_dir is not None
+        filenames = {MANIFEST_FILENAME}
+        for entry in list(self._manifest.entries.values()):
+            filepath = os.path.join(self.dump_dir, entry.filename)
+            try:
+                codec = None if entry.codec is None else get_codec(entry.codec)
+                valid = os.path.getsize(filepath) == entry.stored_size
+            except (OSError, ValueError) as e:
+                logger.warning(f'Cannot restore blob {entry.key}: {e}')
+                valid = False
+            if not valid:
+                self._manifest.remove(entry.key)
+                continue
+            self._blobs[entry.key] = Blob.from_file(
+                entry.key,
+                filepath,
+                entry.size,
+                codec,
+                entry.stored_size,
+            )
+            filenames.add(entry.filename)
+
+        # Remove files of blobs which were not recorded, such as spills
+        # in progress when the previous storage was stopped.
+        for filename in os.listdir(self.dump_dir):
+            filepath = os.path.join(self.dump_dir, filename)
+            if filename not in filenames and os.path.isfile(filepath):
+                os.remove(filepath)
+
+        self._manifest.compact()
+        logger.info(
+            f'Restored {len(self._blobs)} blob(s) from {self.dump_dir}',
+        )
+
+    def _record_spill(self, blob: Blob, start: float) -> None:
+        self._spill_times.add_time((time.perf_counter() - start) * 1000)
+        self._spilled_bytes += blob.size
+
+    def _record_reload(self, blob: Blob, start: float) -> None:
+        self._reload_times.add_time((time.perf_counter() - start) * 1000)
+        self._reloaded_bytes += blob.size
+
     def _fits(self, size: int) -> bool:
         """Check if there is `size` bytes available in the storage."""
         if self.max_size is None:
@@ -235,10 +937,237 @@ class EndpointStorage(MutableMapping[str, bytes]):
         assert size <= self.max_size
         return self._in_memory_size + size <= self.max_size
 
+    def _fits_compressed(self, size: int) -> bool:
+        """Check if a compressed blob can enter the compressed tier."""
+        return (
+            self.max_compressed_size is not None
+            and size <= self.max_compressed_size
+        )
+
+    def _demote(self, blob: Blob) -> None:
+        """Move an uncompressed blob to the compressed tier or disk."""
+        data, codec = blob.encode(
+            self.compression,
+            self.compression_threshold,
+        )
+        if codec is not None and self._fits_compressed(len(data)):
+            self._in_memory_size -= blob.size
+            blob.set_compressed(data, codec)
+            self._compressed_size += blob.stored_size
+            self._compressed_policy.add(blob.key, blob.stored_size)
+            self._make_compressed_space()
+        else:
+            self._dump(blob, data, codec)
+
     def _make_space(self, size: int) -> None:
-        """Demote LRU keys to the file dump until `size` bytes is clear."""
-        while not self._fits(size) and len(self._lru_queue) > 0:
-            lru_key = self._lru_queue.popleft()
-            blob = self._blobs[lru_key]
-            blob.dump()
+        """Demote keys to the file dump until `size` bytes is clear."""
+        while not self._fits(size) and len(self._policy) > 0:
+            self._demote(self._blobs[self._policy.pop()])
+
+    def _make_compressed_space(self) -> None:
+        """Demote keys in the compressed tier until it is within its limit."""
+        assert self.max_compressed_size is not None
+        while (
+            self._compressed_size > self.max_compressed_size
+            and len(self._compressed_policy) > 0
+        ):
+            blob = self._blobs[self._compressed_policy.pop()]
+            data, codec = blob.encode()
+            self._dump(blob, data, codec)
+
+    async def _amake_space(self, size: int) -> None:
+        """Spill keys in the background until `size` bytes is clear."""
+        if self.max_size is None:
+            return
+        while not self._fits(size):
+            self._start_spills(
+                self._in_memory_size
+                - self._spilling_size
+                + size
+                - self.max_size,
+            )
+            if len(self._spills) == 0:
+                # Nothing left to spill so exceed the limit like
+                # _make_space() does.
+                break
+            done, _ = await asyncio.wait(
+                list(self._spills.values()),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not any(spill.result() for spill in done) and (
+                len(self._spills) == 0
+            ):
+                # Spills are failing so exceed the limit rather than
+                # retrying them indefinitely.
+                break
+
+    def _spill_to_watermark(self) -> None:
+        """Start spilling keys if memory use exceeds the watermark."""
+        if self.max_size is None:
+            return
+        watermark = int(self.spill_watermark * self.max_size)
+        self._start_spills(
+            self._in_memory_size - self._spilling_size - watermark,
+        )
+
+    def _start_spills(self, nbytes: int) -> None:
+        """Start spilling keys until at least `nbytes` will be freed."""
+        scheduled = 0
+        while scheduled < nbytes and len(self._policy) > 0:
+            blob = self._blobs[self._policy.pop()]
+            scheduled += blob.size
+            self._spilling_size += blob.size
+            self._spills[blob] = asyncio.ensure_future(self._spill(blob))
+
+    def _start_compressed_spills(self) -> None:
+        """Start spilling compressed keys exceeding the compressed limit."""
+        assert self.max_compressed_size is not None
+        excess = (
+            self._compressed_size
+            - self._compressed_spilling_size
+            - self.max_compressed_size
+        )
+        scheduled = 0
+        while scheduled < excess and len(self._compressed_policy) > 0:
+            blob = self._blobs[self._compressed_policy.pop()]
+            scheduled += blob.stored_size
+            self._compressed_spilling_size += blob.stored_size
+            self._spills[blob] = asyncio.ensure_future(self._spill(blob))
+
+    async def _spill(self, blob: Blob) -> bool:
+        loop = asyncio.get_running_loop()
+        location = blob.location
+        nbytes = blob.stored_size
+        start = time.perf_counter()
+        try:
+            data, codec = await loop.run_in_executor(
+                None,
+                blob.encode,
+                self.compression,
+                self.compression_threshold,
+            )
+            if (
+                location == BlobLocation.MEMORY
+                and codec is not None
+                and self._fits_compressed(len(data))
+            ):
+                # Keep the blob in the compressed tier rather than
+                # writing it to disk.
+                if self._blobs.get(blob.key) is blob:
+                    self._in_memory_size -= blob.size
+                    blob.set_compressed(data, codec)
+                    self._compressed_size += blob.stored_size
+                    self._compressed_policy.add(blob.key, blob.stored_size)
+                    self._start_compressed_spills()
+                return True
+            await loop.run_in_executor(None, blob.write_file, data)
+        except Exception as e:
+            logger.exception(f'Failed to spill blob {blob.key}: {e}')
+            if self._blobs.get(blob.key) is blob:
+                # Keep the blob in memory.
+                if location == BlobLocation.MEMORY:
+                    self._policy.add(blob.key, blob.size)
+                else:
+                    self._compressed_policy.add(blob.key, blob.stored_size)
+            return False
+        else:
+            self._record_spill(blob, start)
+            if (
+                self._blobs.get(blob.key) is blob
+                and blob.location == location
+            ):
+                self._dumped(blob, codec, len(data))
+            else:
+                # The blob was deleted, overwritten, or reloaded during
+                # the spill.
+                blob.delete_file()
+            return True
+        finally:
+            if location == BlobLocation.MEMORY:
+                self._spilling_size -= nbytes
+            else:
+                self._compressed_spilling_size -= nbytes
+            self._spills.pop(blob, None)
+
+    async def _reload(self, blob: Blob) -> bytes | None:
+        await self._amake_space(blob.size)
+        if self._blobs.get(blob.key) is not blob:
+            return None
+
+        location = blob.location
+        if blob.key in self._compressed_policy:
+            # Prevent the blob from being spilled while decompressing.
+            self._compressed_policy.remove(blob.key)
+
+        # Reserve space for the blob while it is being read.
+        self._in_memory_size += blob.size
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            if location == BlobLocation.COMPRESSED:
+                assert blob._compressed is not None
+                value = await loop.run_in_executor(
+                    None,
+                    blob.decode,
+                    blob._compressed,
+                )
+            else:
+                value = await loop.run_in_executor(None, blob.read_file)
+                # Delete the file before the blob can be spilled again so
+                # the delete cannot race with the next spill.
+                await loop.run_in_executor(None, blob.delete_file)
+        except Exception:
+            self._in_memory_size -= blob.size
+            if self._blobs.get(blob.key) is not blob:
+                # The blob and its file were deleted during the reload.
+                return None
+            if blob.location == BlobLocation.COMPRESSED:
+                self._compressed_policy.add(blob.key, blob.stored_size)
+            raise
+        if location == BlobLocation.FILE:
+            self._record_reload(blob, start)
+
+        if self._blobs.get(blob.key) is not blob:
             self._in_memory_size -= blob.size
+            return value
+
+        if blob.location == BlobLocation.COMPRESSED:
+            self._compressed_size -= blob.stored_size
+        elif location == BlobLocation.COMPRESSED:
+            # The blob was spilled from the compressed tier while being
+            # decompressed.
+            blob.delete_file()
+        self._unrecord(blob.key)
+        blob.set_value(value)
+        self._policy.add(blob.key, blob.size)
+        self._spill_to_watermark()
+        return value
+
+
+async def _stream_file(
+    f: BinaryIO,
+    codec: Codec | None,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """Read and decompress an open file in chunks in the default executor."""
+    loop = asyncio.get_running_loop()
+    decompressor = None if codec is None else codec.decompressor()
+
+    def _read() -> bytes:
+        while True:
+            data = f.read(chunk_size)
+            if decompressor is None or len(data) == 0:
+                return data
+            # Decompressing may consume a chunk without producing output.
+            data = decompressor.decompress(data)
+            if len(data) > 0:
+                return data
+
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, _read)
+            if len(chunk) == 0:
+                break
+            yield chunk
+    finally:
+        f.close()
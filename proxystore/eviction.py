@@ -0,0 +1,164 @@
+"""Eviction bookkeeping shared by caches and endpoint storage.
+
+The policies in this module track a set of keys and select which key to
+evict next. They hold no values so the same implementation is used by the
+in-memory caches of [`proxystore.store.cache`][proxystore.store.cache] and
+as the demotion policies of
+[`proxystore.endpoint.policies`][proxystore.endpoint.policies].
+"""
+from __future__ import annotations
+
+import collections
+from typing import Generic
+from typing import TypeVar
+
+KeyT = TypeVar('KeyT')
+
+
+class LRUPolicy(Generic[KeyT]):
+    """Least-recently used eviction policy.
+
+    All operations are constant time.
+    """
+
+    def __init__(self) -> None:
+        # Keys are ordered from least to most recently used.
+        self._keys: collections.OrderedDict[KeyT, None] = (
+            collections.OrderedDict()
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: KeyT, size: int = 0) -> None:
+        """Start tracking a key as the most recently used.
+
+        Args:
+            key: Key to track.
+            size: Size of the object in bytes. Unused by this policy.
+        """
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+
+    def access(self, key: KeyT) -> None:
+        """Mark a key as the most recently used."""
+        self._keys.move_to_end(key)
+
+    def remove(self, key: KeyT) -> None:
+        """Stop tracking a key.
+
+        Raises:
+            KeyError: If the key is not tracked.
+        """
+        del self._keys[key]
+
+    def peek(self) -> KeyT:
+        """Get the least recently used key without removing it.
+
+        Raises:
+            KeyError: If no keys are tracked.
+        """
+        if len(self._keys) == 0:
+            raise KeyError('peek from an empty policy')
+        return next(iter(self._keys))
+
+    def pop(self) -> KeyT:
+        """Select and stop tracking the least recently used key.
+
+        Raises:
+            KeyError: If no keys are tracked.
+        """
+        if len(self._keys) == 0:
+            raise KeyError('pop from an empty policy')
+        key, _ = self._keys.popitem(last=False)
+        return key
+
+
+class LFUPolicy(Generic[KeyT]):
+    """Least-frequently used eviction policy.
+
+    Ties between keys with the same access count are broken by evicting
+    the least recently used key. Operations take constant time except
+    when the last key with the minimum access count is removed which takes
+    time linear in the number of distinct access counts.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[KeyT, int] = {}
+        # Keys with each access count ordered from least to most recently
+        # used. Empty buckets are removed.
+        self._buckets: dict[int, collections.OrderedDict[KeyT, None]] = {}
+        self._min_count = 0
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _unlink(self, key: KeyT) -> int:
+        count = self._counts.pop(key)
+        bucket = self._buckets[count]
+        del bucket[key]
+        if len(bucket) == 0:
+            del self._buckets[count]
+        return count
+
+    def _link(self, key: KeyT, count: int) -> None:
+        self._counts[key] = count
+        self._buckets.setdefault(count, collections.OrderedDict())[key] = None
+
+    def add(self, key: KeyT, size: int = 0) -> None:
+        """Start tracking a key with one access.
+
+        Args:
+            key: Key to track. The access count is reset if the key is
+                already tracked.
+            size: Size of the object in bytes. Unused by this policy.
+        """
+        if key in self._counts:
+            self._unlink(key)
+        self._link(key, 1)
+        self._min_count = 1
+
+    def access(self, key: KeyT) -> None:
+        """Increment the access count of a key."""
+        count = self._unlink(key)
+        if count == self._min_count and count not in self._buckets:
+            self._min_count = count + 1
+        self._link(key, count + 1)
+
+    def remove(self, key: KeyT) -> None:
+        """Stop tracking a key.
+
+        Raises:
+            KeyError: If the key is not tracked.
+        """
+        count = self._unlink(key)
+        if count == self._min_count and count not in self._buckets:
+            self._min_count = min(self._buckets, default=0)
+
+    def peek(self) -> KeyT:
+        """Get the least frequently used key without removing it.
+
+        Raises:
+            KeyError: If no keys are tracked.
+        """
+        if len(self._counts) == 0:
+            raise KeyError('peek from an empty policy')
+        return next(iter(self._buckets[self._min_count]))
+
+    def pop(self) -> KeyT:
+        """Select and stop tracking the least frequently used key.
+
+        Raises:
+            KeyError: If no keys are tracked.
+        """
+        if len(self._counts) == 0:
+            raise KeyError('pop from an empty policy')
+        key = self.peek()
+        self.remove(key)
+        return key
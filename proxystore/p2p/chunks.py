@@ -1,15 +1,22 @@
 """Message chunking utilities."""
 from __future__ import annotations
 
+import asyncio
 import enum
 import math
 from struct import pack
 from struct import unpack_from
 from typing import Generator
+from typing import Iterable
+from typing import Sequence
+from typing import Union
 
 CHUNK_HEADER_LENGTH = 2 + (4 * 4)
 CHUNK_HEADER_FORMAT = '!HLLLL'
 
+ChunkData = Union[bytes, memoryview, str]
+BufferSequence = Sequence[Union[bytes, memoryview]]
+
 
 class ChunkDType(enum.Enum):
     """Data type contained in a Chunk."""
@@ -18,6 +25,10 @@ class ChunkDType(enum.Enum):
     """Data is bytes."""
     STRING = 2
     """Data is a string."""
+    STREAM_HEADER = 3
+    """Data is bytes of a message followed by a stream."""
+    STREAM = 4
+    """Data is bytes of the stream following a message."""
 
 
 class Chunk:
@@ -39,7 +50,7 @@ class Chunk:
         stream_id: int,
         seq_id: int,
         seq_len: int,
-        data: bytes | str,
+        data: ChunkData,
         dtype: ChunkDType | None = None,
     ) -> None:
         if seq_len <= seq_id:
@@ -52,85 +63,270 @@ class Chunk:
         self.data = data
         if dtype is None:
             self.dtype = (
-                ChunkDType.BYTES
-                if isinstance(data, bytes)
-                else ChunkDType.STRING
+                ChunkDType.STRING
+                if isinstance(data, str)
+                else ChunkDType.BYTES
             )
         else:
             self.dtype = dtype
 
     def __bytes__(self) -> bytes:
-        """Pack the chunk into bytes."""
-        length = CHUNK_HEADER_LENGTH + len(self.data)
+        """Pack the chunk into bytes.
+
+        The header and data are joined into a single new bytes object so
+        the data is copied once even if it is a view of a larger buffer.
+        """
+        return b''.join(self.pack())
+
+    def pack(self) -> tuple[bytes, bytes | memoryview]:
+        """Pack the chunk into a header and data without copying the data.
+
+        Returns:
+            Tuple of the packed header and the data of the chunk. The \
+            data is encoded if it is a string and otherwise is the data \
+            of the chunk itself.
+        """
+        data = (
+            self.data.encode('utf8')
+            if isinstance(self.data, str)
+            else self.data
+        )
         header = pack(
             CHUNK_HEADER_FORMAT,
             self.dtype.value,
-            length,
+            CHUNK_HEADER_LENGTH + len(data),
             self.stream_id,
             self.seq_id,
             self.seq_len,
         )
-        data = (
-            self.data.encode('utf8')
-            if isinstance(self.data, str)
-            else self.data
-        )
-        chunk = header + data
+        return header, data
 
-        data += b'\x00' * (len(chunk) % 4)
-        return chunk
+    @classmethod
+    def from_bytes(cls, chunk: bytes | memoryview) -> Chunk:
+        """Decode bytes into a Chunk.
+
+        The data of a bytes chunk is a memoryview of `chunk` rather than
+        a copy.
+        """
+        length = unpack_from(CHUNK_HEADER_FORMAT, chunk)[1]
+        view = memoryview(chunk)
+        return cls.from_header(
+            view[:CHUNK_HEADER_LENGTH],
+            view[CHUNK_HEADER_LENGTH:length],
+        )
 
     @classmethod
-    def from_bytes(cls, chunk: bytes) -> Chunk:
-        """Decode bytes into a Chunk."""
-        (dtype_value, length, stream_id, seq_id, seq_len) = unpack_from(
+    def from_header(
+        cls,
+        header: bytes | memoryview,
+        data: bytes | memoryview,
+    ) -> Chunk:
+        """Decode a Chunk from a header and data received separately.
+
+        Args:
+            header: Packed header of the chunk.
+            data: Data of the chunk which is used as is, rather than copied,
+                unless the chunk is a string.
+        """
+        (dtype_value, _, stream_id, seq_id, seq_len) = unpack_from(
             CHUNK_HEADER_FORMAT,
-            chunk,
+            header,
         )
         dtype = ChunkDType(dtype_value)
-        chunk_data = chunk[CHUNK_HEADER_LENGTH:length]
-        data: bytes | str
+        chunk_data: ChunkData
         if dtype is ChunkDType.STRING:
-            data = chunk_data.decode('utf8')
+            chunk_data = str(data, 'utf8')
         else:
-            data = chunk_data
+            chunk_data = data
         return cls(
             stream_id=stream_id,
             seq_id=seq_id,
             seq_len=seq_len,
-            data=data,
+            data=chunk_data,
             dtype=dtype,
         )
 
 
+def _split_buffers(
+    buffers: BufferSequence,
+    size: int,
+) -> Generator[bytes | memoryview, None, None]:
+    # Yields views of the buffers except for pieces which span the
+    # boundary between two buffers which are joined.
+    pending: list[memoryview] = []
+    pending_size = 0
+    for buffer in buffers:
+        view = memoryview(buffer).cast('B')
+        offset = 0
+        if pending_size > 0:
+            offset = min(size - pending_size, len(view))
+            pending.append(view[:offset])
+            pending_size += offset
+            if pending_size < size:
+                continue
+            yield b''.join(pending)
+            pending, pending_size = [], 0
+        while len(view) - offset >= size:
+            yield view[offset : offset + size]
+            offset += size
+        if offset < len(view):
+            pending, pending_size = [view[offset:]], len(view) - offset
+    if pending_size > 0:
+        yield pending[0] if len(pending) == 1 else b''.join(pending)
+
+
 def chunkify(
-    data: bytes | str,
+    data: bytes | str | BufferSequence,
     size: int,
     stream_id: int,
+    dtype: ChunkDType | None = None,
 ) -> Generator[Chunk, None, None]:
     """Generate chunks from data.
 
     Args:
-        data: Data to chunk.
+        data: Data to chunk. A sequence of buffers is chunked as if the
+            buffers were joined into a single bytes object.
         size: Size of each chunk.
         stream_id: Unique ID for the stream of chunks.
+        dtype: Optionally specify data type of the chunks otherwise
+            inferred from data.
 
     Yields:
-        Chunks of data.
+        Chunks of data. The data of each bytes chunk is a memoryview of \
+        `data` unless the chunk spans multiple buffers.
     """
-    seq_len = math.ceil(len(data) / size)
+    pieces: Iterable[ChunkData]
+    if isinstance(data, str):
+        length = len(data)
+        pieces = (data[x : x + size] for x in range(0, length, size))
+    else:
+        buffers = (
+            [data]
+            if isinstance(data, (bytes, bytearray, memoryview))
+            else data
+        )
+        length = sum(memoryview(buffer).nbytes for buffer in buffers)
+        pieces = _split_buffers(buffers, size)
+    seq_len = math.ceil(length / size)
 
-    for i, x in enumerate(range(0, len(data), size)):
-        chunk_data = data[x : min(x + size, len(data))]
+    for i, chunk_data in enumerate(pieces):
         yield Chunk(
             stream_id=stream_id,
             seq_id=i,
             seq_len=seq_len,
             data=chunk_data,
+            dtype=dtype,
         )
 
 
-def reconstruct(chunks: list[Chunk]) -> bytes | str:
+class ChunkBuffer:
+    """Reassembles a stream of chunks as they are received.
+
+    Bytes chunks are written in place by sequence ID into a `bytearray`
+    preallocated from the length of the stream and the size of the first
+    chunk received. Chunks may arrive in any order, but the last chunk
+    of a stream may be shorter than the others so it is held until
+    another chunk of the stream is received if it arrives first. String
+    chunks are joined once all chunks are received.
+
+    Args:
+        seq_len: Length of the stream.
+        dtype: Data type of the chunks in the stream.
+    """
+
+    def __init__(self, seq_len: int, dtype: ChunkDType) -> None:
+        self.seq_len = seq_len
+        self.dtype = dtype
+        self._received = bytearray(seq_len)
+        self._count = 0
+        self._buffer: bytearray | None = None
+        self._chunk_size = 0
+        self._length = 0
+        self._last: bytes | memoryview | None = None
+        self._strings: list[str] = []
+        if dtype is ChunkDType.STRING:
+            self._strings = [''] * seq_len
+
+    @property
+    def complete(self) -> bool:
+        """All chunks of the stream have been received."""
+        return self._count == self.seq_len
+
+    def add(self, chunk: Chunk) -> bool:
+        """Add a chunk to the buffer.
+
+        Args:
+            chunk: Chunk of the stream.
+
+        Returns:
+            If all chunks of the stream have been received.
+
+        Raises:
+            ValueError: If the chunk is not part of the stream, has already
+                been received, or is larger than the other chunks.
+        """
+        if chunk.seq_len != self.seq_len or chunk.dtype is not self.dtype:
+            raise ValueError(
+                f'Chunk with seq_len {chunk.seq_len} and dtype '
+                f'{chunk.dtype.name} does not match stream with seq_len '
+                f'{self.seq_len} and dtype {self.dtype.name}.',
+            )
+        if self._received[chunk.seq_id]:
+            raise ValueError(f'Chunk {chunk.seq_id} was already received.')
+
+        if isinstance(chunk.data, str):
+            self._strings[chunk.seq_id] = chunk.data
+        elif self._buffer is not None:
+            self._write(chunk.seq_id, chunk.data)
+        elif chunk.seq_id == self.seq_len - 1 and self.seq_len > 1:
+            self._last = chunk.data
+        else:
+            self._chunk_size = len(chunk.data)
+            self._buffer = bytearray(self.seq_len * self._chunk_size)
+            self._write(chunk.seq_id, chunk.data)
+            if self._last is not None:
+                self._write(self.seq_len - 1, self._last)
+                self._last = None
+
+        self._received[chunk.seq_id] = 1
+        self._count += 1
+        return self.complete
+
+    def _write(self, seq_id: int, data: bytes | memoryview) -> None:
+        assert self._buffer is not None
+        last = seq_id == self.seq_len - 1
+        if len(data) > self._chunk_size or (
+            not last and len(data) != self._chunk_size
+        ):
+            raise ValueError(
+                f'Chunk {seq_id} has size {len(data)} but expected '
+                f'{self._chunk_size}.',
+            )
+        start = seq_id * self._chunk_size
+        self._buffer[start : start + len(data)] = data
+        if last:
+            self._length = start + len(data)
+
+    def result(self) -> bytearray | str:
+        """Get the reassembled data.
+
+        Returns:
+            Reassembled bytes or string.
+
+        Raises:
+            ValueError: If not all chunks of the stream have been received.
+        """
+        if not self.complete:
+            raise ValueError(f'Got {self._count} but expected {self.seq_len}.')
+        if self.dtype is ChunkDType.STRING:
+            return ''.join(self._strings)
+        assert self._buffer is not None
+        # Trim the unused space after the last chunk.
+        del self._buffer[self._length :]
+        return self._buffer
+
+
+def reconstruct(chunks: list[Chunk]) -> bytearray | str:
     """Reconstructs data from list of chunks.
 
     Args:
@@ -144,10 +340,90 @@ def reconstruct(chunks: list[Chunk]) -> bytes | str:
     seq_len = chunks[0].seq_len
     if len(chunks) != seq_len:
         raise ValueError(f'Got {len(chunks)} but expected {seq_len}.')
-    chunks = sorted(chunks, key=lambda c: c.seq_id)
-    if isinstance(chunks[0].data, bytes):
-        return b''.join(c.data for c in chunks)  # type: ignore
-    elif isinstance(chunks[0].data, str):
-        return ''.join(c.data for c in chunks)  # type: ignore
-    else:
-        raise AssertionError('Unreachable.')
+    buffer = ChunkBuffer(seq_len, chunks[0].dtype)
+    for chunk in chunks:
+        buffer.add(chunk)
+    return buffer.result()
+
+
+class ChunkStream:
+    """Async iterator over the data of a stream of chunks in order.
+
+    Chunks may be added in any order. Iterating yields the data of each
+    chunk as soon as all chunks before it have been added so a consumer
+    can process the beginning of a stream before the rest is received.
+    Only chunks which have been added but not yet yielded are buffered.
+
+    Example:
+        ```python
+        stream = ChunkStream()
+        for chunk in chunkify(data, size, stream_id, ChunkDType.STREAM):
+            stream.add(chunk)
+
+        async for piece in stream:
+            ...
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.seq_len: int | None = None
+        self._chunks: dict[int, bytes | memoryview] = {}
+        self._next = 0
+        self._received = 0
+        self._error: Exception | None = None
+        self._event = asyncio.Event()
+
+    @property
+    def complete(self) -> bool:
+        """All chunks of the stream have been added."""
+        return self.seq_len is not None and self._received == self.seq_len
+
+    def add(self, chunk: Chunk) -> None:
+        """Add a chunk to the stream.
+
+        Args:
+            chunk: Chunk of the stream.
+
+        Raises:
+            ValueError: If the chunk is not part of the stream or has
+                already been added.
+        """
+        if isinstance(chunk.data, str) or (
+            self.seq_len is not None and chunk.seq_len != self.seq_len
+        ):
+            raise ValueError(
+                f'Chunk with seq_len {chunk.seq_len} and dtype '
+                f'{chunk.dtype.name} does not match stream.',
+            )
+        if chunk.seq_id < self._next or chunk.seq_id in self._chunks:
+            raise ValueError(f'Chunk {chunk.seq_id} was already received.')
+        self.seq_len = chunk.seq_len
+        self._chunks[chunk.seq_id] = chunk.data
+        self._received += 1
+        self._event.set()
+
+    def close(self, error: Exception) -> None:
+        """Stop the stream before all chunks are added.
+
+        Args:
+            error: Exception raised to the consumer once the chunks added
+                before the stream was closed have been yielded.
+        """
+        self._error = error
+        self._event.set()
+
+    def __aiter__(self) -> ChunkStream:
+        return self
+
+    async def __anext__(self) -> bytes | memoryview:
+        while True:
+            if self._next in self._chunks:
+                data = self._chunks.pop(self._next)
+                self._next += 1
+                return data
+            if self.seq_len is not None and self._next >= self.seq_len:
+                raise StopAsyncIteration
+            if self._error is not None:
+                raise self._error
+            self._event.clear()
+            await self._event.wait()
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import itertools
 import logging
 import re
+import time
 import warnings
-from collections import defaultdict
+from struct import unpack_from
 from typing import Any
 from typing import Awaitable
 from typing import Callable
+from typing import Coroutine
+from typing import Iterable
 from uuid import UUID
 
 try:
@@ -31,12 +36,21 @@ except ImportError as e:  # pragma: no cover
     )
 
 from proxystore.p2p import messages
+from proxystore.p2p.chunks import BufferSequence
 from proxystore.p2p.chunks import Chunk
+from proxystore.p2p.chunks import CHUNK_HEADER_FORMAT
+from proxystore.p2p.chunks import CHUNK_HEADER_LENGTH
+from proxystore.p2p.chunks import ChunkBuffer
+from proxystore.p2p.chunks import ChunkDType
 from proxystore.p2p.chunks import chunkify
-from proxystore.p2p.chunks import reconstruct
+from proxystore.p2p.chunks import ChunkStream
 from proxystore.p2p.counter import AtomicCounter
+from proxystore.p2p.direct import DirectServer
+from proxystore.p2p.direct import new_token
+from proxystore.p2p.direct import open_direct_connection
 from proxystore.p2p.exceptions import PeerConnectionError
 from proxystore.p2p.exceptions import PeerConnectionTimeoutError
+from proxystore.p2p.task import spawn_guarded_background_task
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +58,80 @@ logger = logging.getLogger(__name__)
 # testing/scripts/peer_connection_bandwidth.py
 MAX_CHUNK_SIZE_STRING = 2**15
 MAX_CHUNK_SIZE_BYTES = 2**15
+# Bounds of the adaptive chunk size for bytes messages. The upper bound
+# keeps chunks within the max message size of the SCTP transport.
+MIN_ADAPTIVE_CHUNK_SIZE = 2**12
+MAX_ADAPTIVE_CHUNK_SIZE = 2**16 - CHUNK_HEADER_LENGTH
+# Direct TCP connections are not limited by the SCTP max message size.
+DIRECT_CHUNK_SIZE = 2**20
+
+# Only sends of at least this many bytes are used to tune the chunk size
+# and channel count because smaller sends are dominated by latency.
+_TUNING_MIN_BYTES = 2**20
+# Number of tuned sends to keep a chunk size after a probe was reverted.
+_TUNING_HOLD = 8
+# Minimum relative throughput gain for an added channel to be kept growing.
+_TUNING_CHANNEL_GAIN = 1.05
+# Weight of the newest sample in the smoothed bandwidth.
+_BANDWIDTH_SMOOTHING = 0.25
+_DYNAMIC_LABEL_PREFIX = 'p2p-dynamic-'
+
+
+@dataclasses.dataclass
+class PeerStats:
+    """Snapshot of peer connection statistics.
+
+    Attributes:
+        transport: Transport messages are exchanged over. One of
+            `#!python 'webrtc'` or `#!python 'tcp'`.
+        channels: Number of open datachannels.
+        chunk_size: Current size in bytes of chunks of bytes messages.
+        messages_sent: Number of messages sent to the peer.
+        messages_received: Number of messages received from the peer.
+        bytes_sent: Total bytes, including chunk headers, sent to the peer.
+        bytes_received: Total bytes, including chunk headers, received
+            from the peer.
+        bandwidth: Smoothed send throughput in bytes per second measured
+            over large messages or `None` if no large message has been
+            sent.
+        rtt: Smoothed round-trip time in seconds estimated by the SCTP
+            transport or `None` if no estimate is available.
+        stalls: Number of times sending waited because the buffers of all
+            datachannels were full.
+        saturated: If sending the most recent large message waited on full
+            buffers, i.e., throughput was limited by the link rather than
+            the sender.
+    """
+
+    transport: str
+    channels: int
+    chunk_size: int
+    messages_sent: int
+    messages_received: int
+    bytes_sent: int
+    bytes_received: int
+    bandwidth: float | None
+    rtt: float | None
+    stalls: int
+    saturated: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the dataclass to a [`dict`][dict]."""
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class StreamedMessage:
+    """Message received from a peer with an attached stream.
+
+    Attributes:
+        message: Message sent with the stream.
+        stream: Async iterator over the data of the stream which yields
+            data as it is received from the peer.
+    """
+
+    message: bytearray
+    stream: ChunkStream
 
 
 class PeerConnection:
@@ -92,11 +180,28 @@ class PeerConnection:
         await connection2.close()
         ```
 
+    If `direct` is provided, the peers exchange messages over a direct TCP
+    connection rather than WebRTC when the answering peer accepts direct
+    connections and is reachable by the offering peer (see
+    [`proxystore.p2p.direct`][proxystore.p2p.direct]).
+
+    Chunks of a message are sent over whichever open datachannel has the
+    least buffered data so a congested channel does not stall the others.
+    The chunk size of bytes messages is tuned using the throughput
+    measured when sending large messages, and additional datachannels, up
+    to `max_channels`, are opened while sending is limited by full channel
+    buffers and each added channel improves the throughput.
+
     Args:
         uuid: UUID of this client.
         name: Readable name of this client for logging.
         websocket: Websocket connection to the relay server.
         channels: Number of datachannels to open with peer.
+        max_channels: Maximum number of datachannels to open with the peer
+            as throughput is measured. Defaults to `channels` in which case
+            no datachannels are added.
+        direct: Optional server accepting direct connections from peers.
+            Direct connections are only used if both peers provide one.
     """
 
     def __init__(
@@ -106,30 +211,71 @@ class PeerConnection:
         websocket: WebSocketClientProtocol,
         *,
         channels: int = 1,
+        max_channels: int | None = None,
+        direct: DirectServer | None = None,
     ) -> None:
         self._uuid = uuid
         self._name = name
         self._websocket = websocket
-        self._max_channels = channels
+        self._initial_channels = channels
+        self._max_channels = max(
+            channels,
+            channels if max_channels is None else max_channels,
+        )
 
         self._handshake_success: asyncio.Future[
             bool
         ] = asyncio.get_running_loop().create_future()
         self._pc = RTCPeerConnection()
-
-        self._incoming_queue: asyncio.Queue[bytes | str] = asyncio.Queue()
-        self._incoming_chunks: dict[int, list[Chunk]] = defaultdict(list)
+        self._pc.on('datachannel', self._on_datachannel)
+
+        self._incoming_queue: asyncio.Queue[
+            bytearray | str | StreamedMessage
+        ] = asyncio.Queue()
+        self._incoming_chunks: dict[int, ChunkBuffer] = {}
+        # Incoming streams are removed once all chunks of the stream and
+        # the message the stream is attached to have been received.
+        self._incoming_streams: dict[int, ChunkStream] = {}
+        self._attached_streams: set[int] = set()
         # Max size of unsigned long (4 bytes) is 2^32 - 1
         self._message_counter = AtomicCounter(size=2**32 - 1)
 
-        # Used by offerer to count how many of the channels it opened are ready
+        # Count of the initial channels which are ready. The offerer counts
+        # the channels it opened and the answerer the channels it received.
         self._ready = 0
         self._channels: dict[str, RTCDataChannel] = {}
-        self._channel_buffer_low: dict[str, asyncio.Event] = {}
+        # Set when the buffer of any channel drains below its threshold.
+        self._buffer_low = asyncio.Event()
+
+        self._chunk_size = MAX_CHUNK_SIZE_BYTES
+        self._chunk_direction = 1
+        self._chunk_hold = 0
+        # Chunk size before the last step, i.e., the size to revert to if
+        # the step lowered the throughput.
+        self._chunk_previous: int | None = None
+        self._grow_channels = self._max_channels > channels
+        self._channel_baseline: float | None = None
+        self._last_bandwidth: float | None = None
+        self._bandwidth: float | None = None
+        self._saturated = False
+        self._stalls = 0
+        self._messages_sent = 0
+        self._messages_received = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
 
         self._peer_uuid: UUID | None = None
         self._peer_name: str | None = None
 
+        self._direct = direct
+        self._direct_token: str | None = None
+        self._direct_writer: asyncio.StreamWriter | None = None
+        self._direct_task: asyncio.Task[None] | None = None
+        self._direct_closed = False
+        self._close_callbacks: list[
+            Callable[[], Coroutine[Any, Any, None]]
+        ] = []
+
     @property
     def _log_prefix(self) -> str:
         local = log_name(self._uuid, self._name)
@@ -147,11 +293,27 @@ class PeerConnection:
         Returns:
             One of 'connected', 'connecting', 'closed', 'failed', or 'new'.
         """
+        if self._direct_writer is not None:
+            return 'closed' if self._direct_closed else 'connected'
         return self._pc.connectionState
 
     async def close(self) -> None:
         """Terminate the peer connection."""
         logger.info(f'{self._log_prefix}: closing connection')
+        for stream in self._incoming_streams.values():
+            stream.close(
+                PeerConnectionError(
+                    f'Connection closed in {self._log_prefix} before '
+                    'stream was received.',
+                ),
+            )
+        self._incoming_streams.clear()
+        self._attached_streams.clear()
+        if self._direct is not None and self._direct_token is not None:
+            self._direct.discard(self._direct_token)
+        if self._direct_writer is not None:
+            await self._close_direct()
+            return
         # Flush send buffers before close
         # https://github.com/aiortc/aiortc/issues/547
         for channel in self._channels.values():
@@ -185,45 +347,218 @@ class PeerConnection:
                 await callback(*args, **kwargs)
 
         self._pc.on('connectionstatechange', _on_close)
+        self._close_callbacks.append(_on_close)
+
+    def stats(self) -> PeerStats:
+        """Get a snapshot of the statistics of the connection."""
+        # aiortc does not expose the RTT estimate of the SCTP association
+        # so the smoothed RTT is read from the transport if available.
+        sctp = self._pc.sctp
+        rtt = getattr(sctp, '_srtt', None) if sctp is not None else None
+        return PeerStats(
+            transport='webrtc' if self._direct_writer is None else 'tcp',
+            channels=len(self._open_channels()),
+            chunk_size=self._chunk_size,
+            messages_sent=self._messages_sent,
+            messages_received=self._messages_received,
+            bytes_sent=self._bytes_sent,
+            bytes_received=self._bytes_received,
+            bandwidth=self._bandwidth,
+            rtt=rtt,
+            stalls=self._stalls,
+            saturated=self._saturated,
+        )
 
-    async def send(self, message: bytes | str, timeout: float = 30) -> None:
+    async def send(
+        self,
+        message: bytes | str | BufferSequence,
+        timeout: float = 30,
+        *,
+        stream: bytes | BufferSequence | None = None,
+    ) -> None:
         """Send message to peer.
 
         Args:
-            message: Message to send to peer.
+            message: Message to send to peer. A sequence of buffers is
+                sent as a single bytes message without joining the
+                buffers first.
             timeout: Timeout to wait on peer connection to be ready.
+            stream: Optional data to send as a stream after the message.
+                The peer receives the message and stream as a
+                [`StreamedMessage`][proxystore.p2p.connection.StreamedMessage]
+                once the message is received and can consume the stream
+                as it arrives rather than after it is fully received.
 
         Raises:
             PeerConnectionTimeoutError: If the peer connection is not
                 established within the timeout.
+            PeerConnectionError: If the direct connection to the peer is
+                closed.
+            ValueError: If `stream` is provided and `message` is a string
+                or `stream` is empty.
         """
+        if stream is not None:
+            buffers = (
+                [stream]
+                if isinstance(stream, (bytes, bytearray, memoryview))
+                else stream
+            )
+            if isinstance(message, str):
+                raise ValueError('Messages with a stream must be bytes.')
+            if sum(memoryview(buffer).nbytes for buffer in buffers) == 0:
+                raise ValueError('Stream cannot be empty.')
+
         await self.ready(timeout)
+        if self._direct_closed:
+            raise PeerConnectionError(
+                f'Direct connection in {self._log_prefix} is closed.',
+            )
 
+        direct = self._direct_writer
+        stream_chunk_size = (
+            self._chunk_size if direct is None else DIRECT_CHUNK_SIZE
+        )
         chunk_size = (
             MAX_CHUNK_SIZE_STRING
-            if isinstance(message, str)
-            else MAX_CHUNK_SIZE_BYTES
+            if direct is None and isinstance(message, str)
+            else stream_chunk_size
         )
 
         message_id = self._message_counter.increment()
-        channel_names = list(self._channels.keys())
 
-        for i, chunk in enumerate(chunkify(message, chunk_size, message_id)):
-            channel_name = channel_names[i % len(channel_names)]
-            channel = self._channels[channel_name]
-            buffer_low = self._channel_buffer_low[channel_name]
-            if channel.bufferedAmount > channel.bufferedAmountLowThreshold:
-                await buffer_low.wait()
-                buffer_low.clear()
-            channel.send(bytes(chunk))
+        chunks: Iterable[Chunk] = chunkify(
+            message,
+            chunk_size,
+            message_id,
+            None if stream is None else ChunkDType.STREAM_HEADER,
+        )
+        if stream is not None:
+            chunks = itertools.chain(
+                chunks,
+                chunkify(
+                    stream,
+                    stream_chunk_size,
+                    message_id,
+                    ChunkDType.STREAM,
+                ),
+            )
 
+        start = time.perf_counter()
+        stalls = self._stalls
+        sent = 0
+        for chunk in chunks:
+            if direct is not None:
+                # The data of the chunk is written without first being
+                # joined to the header.
+                header, data = chunk.pack()
+                direct.writelines([header, data])
+                await direct.drain()
+                sent += len(header) + len(data)
+            else:
+                packed = bytes(chunk)
+                channel = await self._next_channel()
+                channel.send(packed)
+                sent += len(packed)
+        elapsed = time.perf_counter() - start
+
+        self._messages_sent += 1
+        self._bytes_sent += sent
+        self._tune(sent, elapsed, self._stalls > stalls)
         logger.debug(f'{self._log_prefix}: sending message to peer')
 
-    async def recv(self) -> bytes | str:
+    def _open_channels(self) -> list[RTCDataChannel]:
+        return [
+            channel
+            for channel in self._channels.values()
+            if channel.readyState == 'open'
+        ]
+
+    async def _next_channel(self) -> RTCDataChannel:
+        # Chunks are sent over the open channel with the least buffered
+        # data, only waiting if the buffers of all channels are full.
+        while True:
+            channels = self._open_channels()
+            if len(channels) == 0:
+                # Sending on a closed channel raises the error of the
+                # underlying transport.
+                return next(iter(self._channels.values()))
+            channel = min(channels, key=lambda c: c.bufferedAmount)
+            if channel.bufferedAmount <= channel.bufferedAmountLowThreshold:
+                return channel
+            self._stalls += 1
+            self._buffer_low.clear()
+            await self._buffer_low.wait()
+
+    def _tune(self, sent: int, elapsed: float, stalled: bool) -> None:
+        if sent < _TUNING_MIN_BYTES or elapsed <= 0:
+            return
+        bandwidth = sent / elapsed
+        self._saturated = stalled
+        self._bandwidth = (
+            bandwidth
+            if self._bandwidth is None
+            else _BANDWIDTH_SMOOTHING * bandwidth
+            + (1 - _BANDWIDTH_SMOOTHING) * self._bandwidth
+        )
+        last, self._last_bandwidth = self._last_bandwidth, bandwidth
+        if self._direct_writer is not None:
+            return
+
+        # Channels are added one at a time while sending is limited by full
+        # channel buffers and stop being added once a channel does not
+        # improve the throughput. The chunk size is not changed while a new
+        # channel is measured.
+        if self._channel_baseline is not None:
+            if bandwidth < self._channel_baseline * _TUNING_CHANNEL_GAIN:
+                self._grow_channels = False
+            self._channel_baseline = None
+            return
+        if (
+            stalled
+            and self._grow_channels
+            and len(self._channels) < self._max_channels
+        ):
+            self._channel_baseline = bandwidth
+            self._add_channel()
+            return
+
+        # Hill climb the chunk size by doubling or halving it. A step which
+        # lowers the throughput is reverted and the chunk size is held for
+        # a number of sends before probing in the other direction.
+        if self._chunk_hold > 0:
+            self._chunk_hold -= 1
+            return
+        if (
+            self._chunk_previous is not None
+            and last is not None
+            and bandwidth < last
+        ):
+            self._chunk_size = self._chunk_previous
+            self._chunk_previous = None
+            self._chunk_direction = -self._chunk_direction
+            self._chunk_hold = _TUNING_HOLD
+            return
+        size = (
+            self._chunk_size * 2
+            if self._chunk_direction > 0
+            else self._chunk_size // 2
+        )
+        size = min(max(size, MIN_ADAPTIVE_CHUNK_SIZE), MAX_ADAPTIVE_CHUNK_SIZE)
+        if size == self._chunk_size:
+            self._chunk_previous = None
+            self._chunk_direction = -self._chunk_direction
+        else:
+            self._chunk_previous = self._chunk_size
+            self._chunk_size = size
+
+    async def recv(self) -> bytearray | str | StreamedMessage:
         """Receive next message from peer.
 
         Returns:
-            Message received from peer.
+            Message received from peer. Bytes messages are reassembled \
+            into a `bytearray`. Messages sent with a stream are returned \
+            as a \
+            [`StreamedMessage`][proxystore.p2p.connection.StreamedMessage].
         """
         return await self._incoming_queue.get()
 
@@ -233,28 +568,13 @@ class PeerConnection:
         Args:
             peer_uuid: UUID of peer client to establish connection with.
         """
-
-        def _on_close(label: str) -> Any:
-            # We use this factory method to avoid Flake8-BugBear B023
-            async def on_close() -> None:
-                if self._channels[label].readyState in ('closed', 'failed'):
-                    await self.close()
-
-            return on_close
-
-        for i in range(self._max_channels):
-            label = f'p2p-{i}-{self._max_channels}'
+        if self._direct is not None:
+            self._direct_token = new_token()
+        for i in range(self._initial_channels):
+            label = f'p2p-{i}-{self._initial_channels}'
             channel = self._pc.createDataChannel(label, ordered=False)
-            buffer_low = asyncio.Event()
             channel.on('open', self._on_datachannel_open)
-            channel.on('bufferedamountlow', buffer_low.set)
-            channel.on('message', self._on_message)
-
-            self._channels[label] = channel
-            self._channel_buffer_low[label] = buffer_low
-
-            # We use the underlying RTCDtlsTransport as the channel status.
-            channel.transport.transport.on('statechange', _on_close(label))
+            self._register_channel(channel)
 
         await self._pc.setLocalDescription(await self._pc.createOffer())
         message = messages.PeerConnection(
@@ -263,6 +583,7 @@ class PeerConnection:
             peer_uuid=peer_uuid,
             description_type='offer',
             description=object_to_string(self._pc.localDescription),
+            direct_token=self._direct_token,
         )
         message_str = messages.encode(message)
         logger.info(f'{self._log_prefix}: sending offer to {peer_uuid}')
@@ -274,36 +595,6 @@ class PeerConnection:
         Args:
             peer_uuid: UUID of peer client that sent the initial offer.
         """
-
-        @self._pc.on('datachannel')
-        def on_datachannel(channel: RTCDataChannel) -> None:
-            logger.info(f'{self._log_prefix}: peer channel established')
-            # TODO: note this is first channel opened
-            match = re.search(r'(\d+)-(\d+)$', channel.label)
-            if match is None:
-                raise AssertionError(
-                    f'Got mislabled datachannel {channel.label}',
-                )
-            total = int(match.group(2))
-
-            buffer_low = asyncio.Event()
-            self._channels[channel.label] = channel
-            self._channel_buffer_low[channel.label] = buffer_low
-            channel.on('bufferedamountlow', buffer_low.set)
-            channel.on('message', self._on_message)
-
-            async def _on_close() -> None:
-                if channel.readyState in ('closed', 'failed'):
-                    await self.close()
-                else:
-                    pass  # pragma: no cover
-
-            # We use the underlying RTCDtlsTransport as the channel status
-            channel.transport.transport.on('statechange', _on_close)
-
-            if len(self._channels) >= total:
-                self._handshake_success.set_result(True)
-
         await self._pc.setLocalDescription(await self._pc.createAnswer())
         message = messages.PeerConnection(
             source_uuid=self._uuid,
@@ -311,26 +602,182 @@ class PeerConnection:
             peer_uuid=peer_uuid,
             description_type='answer',
             description=object_to_string(self._pc.localDescription),
+            direct_address=(
+                None
+                if self._direct is None or self._direct_token is None
+                else self._direct.address
+            ),
         )
         message_str = messages.encode(message)
         logger.info(f'{self._log_prefix}: sending answer to {peer_uuid}')
         await self._websocket.send(message_str)
 
+    def _register_channel(self, channel: RTCDataChannel) -> None:
+        self._channels[channel.label] = channel
+        channel.on('bufferedamountlow', self._buffer_low.set)
+        channel.on('message', self._on_message)
+
+        async def _on_close() -> None:
+            # The WebRTC connection is closed once a direct connection is
+            # used so channel state changes are ignored.
+            if self._direct_writer is None and channel.readyState in (
+                'closed',
+                'failed',
+            ):
+                await self.close()
+            else:
+                pass  # pragma: no cover
+
+        # We use the underlying RTCDtlsTransport as the channel status
+        channel.transport.transport.on('statechange', _on_close)
+
+    def _add_channel(self) -> None:
+        # Either peer may add channels so labels include the UUID of the
+        # peer which opened the channel to be unique.
+        label = f'{_DYNAMIC_LABEL_PREFIX}{self._uuid}-{len(self._channels)}'
+        channel = self._pc.createDataChannel(label, ordered=False)
+        self._register_channel(channel)
+        logger.info(
+            f'{self._log_prefix}: opening datachannel {len(self._channels)} '
+            f'of at most {self._max_channels}',
+        )
+
+    def _on_datachannel(self, channel: RTCDataChannel) -> None:
+        logger.info(f'{self._log_prefix}: peer channel established')
+        if channel.label.startswith(_DYNAMIC_LABEL_PREFIX):
+            self._register_channel(channel)
+            return
+
+        match = re.search(r'(\d+)-(\d+)$', channel.label)
+        if match is None:
+            raise AssertionError(
+                f'Got mislabled datachannel {channel.label}',
+            )
+        total = int(match.group(2))
+
+        self._register_channel(channel)
+        self._ready += 1
+        if self._ready >= total and not self._handshake_success.done():
+            self._handshake_success.set_result(True)
+
     async def _on_message(self, data: bytes) -> None:
-        chunk = Chunk.from_bytes(data)
-        self._incoming_chunks[chunk.stream_id].append(chunk)
+        await self._on_chunk(Chunk.from_bytes(data), len(data))
+
+    async def _on_chunk(self, chunk: Chunk, size: int) -> None:
+        self._bytes_received += size
+        if chunk.dtype is ChunkDType.STREAM:
+            stream = self._incoming_stream(chunk.stream_id)
+            stream.add(chunk)
+            if stream.complete and chunk.stream_id in self._attached_streams:
+                self._attached_streams.remove(chunk.stream_id)
+                del self._incoming_streams[chunk.stream_id]
+            return
 
-        if len(self._incoming_chunks[chunk.stream_id]) == chunk.seq_len:
-            chunks = self._incoming_chunks.pop(chunk.stream_id)
-            message = reconstruct(chunks)
-            await self._incoming_queue.put(message)
+        buffer = self._incoming_chunks.get(chunk.stream_id)
+        if buffer is None:
+            buffer = ChunkBuffer(chunk.seq_len, chunk.dtype)
+            self._incoming_chunks[chunk.stream_id] = buffer
+
+        if buffer.add(chunk):
+            del self._incoming_chunks[chunk.stream_id]
+            message = buffer.result()
+            if chunk.dtype is ChunkDType.STREAM_HEADER:
+                assert isinstance(message, bytearray)
+                stream = self._incoming_stream(chunk.stream_id)
+                if stream.complete:
+                    del self._incoming_streams[chunk.stream_id]
+                else:
+                    self._attached_streams.add(chunk.stream_id)
+                await self._incoming_queue.put(
+                    StreamedMessage(message, stream),
+                )
+            else:
+                await self._incoming_queue.put(message)
+            self._messages_received += 1
             logger.debug(f'{self._log_prefix}: received message from peer')
 
+    def _incoming_stream(self, stream_id: int) -> ChunkStream:
+        stream = self._incoming_streams.get(stream_id)
+        if stream is None:
+            stream = ChunkStream()
+            self._incoming_streams[stream_id] = stream
+        return stream
+
+    async def _use_direct(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        logger.info(f'{self._log_prefix}: using direct connection to peer')
+        self._direct_writer = writer
+        self._direct_task = spawn_guarded_background_task(
+            self._recv_direct,
+            reader,
+        )
+        # Release the resources of the unused WebRTC connection.
+        await self._pc.close()
+        if not self._handshake_success.done():
+            self._handshake_success.set_result(True)
+
+    async def _open_direct(self, message: messages.PeerConnection) -> bool:
+        if message.direct_address is None or self._direct_token is None:
+            return False
+        try:
+            reader, writer = await open_direct_connection(
+                message.direct_address,
+                self._direct_token,
+            )
+        except OSError as e:
+            logger.info(
+                f'{self._log_prefix}: falling back to WebRTC because a '
+                f'direct connection could not be opened: {e}',
+            )
+            return False
+        await self._use_direct(reader, writer)
+        return True
+
+    async def _recv_direct(self, reader: asyncio.StreamReader) -> None:
+        # Direct connections carry the same chunks as the datachannels and
+        # each chunk header contains the length of the chunk.
+        try:
+            while True:
+                header = await reader.readexactly(CHUNK_HEADER_LENGTH)
+                length = unpack_from(CHUNK_HEADER_FORMAT, header)[1]
+                data = await reader.readexactly(length - CHUNK_HEADER_LENGTH)
+                await self._on_chunk(Chunk.from_header(header, data), length)
+        except (asyncio.IncompleteReadError, OSError):
+            pass
+        await self._close_direct()
+
+    async def _close_direct(self) -> None:
+        if self._direct_closed:
+            return
+        self._direct_closed = True
+        assert self._direct_writer is not None
+        self._direct_writer.close()
+        try:
+            await self._direct_writer.wait_closed()
+        except OSError:  # pragma: no cover
+            pass
+        if (
+            self._direct_task is not None
+            and self._direct_task is not asyncio.current_task()
+        ):
+            self._direct_task.cancel()
+        logger.info(f'{self._log_prefix}: direct connection closed')
+        # Callbacks are run as tasks, like the callbacks of the WebRTC
+        # connection, because they may close this connection.
+        for callback in self._close_callbacks:
+            spawn_guarded_background_task(callback)
+
     def _on_datachannel_open(self) -> None:
         # Note: this callback is only used on the offerer/initiators side
         logger.info(f'{self._log_prefix}: peer channels established')
         self._ready += 1
-        if self._ready >= self._max_channels:
+        if (
+            self._ready >= self._initial_channels
+            and not self._handshake_success.done()
+        ):
             self._handshake_success.set_result(True)
 
     async def handle_server_message(
@@ -370,10 +817,18 @@ class PeerConnection:
             )
 
         if isinstance(obj, RTCSessionDescription):
-            await self._pc.setRemoteDescription(obj)
             self._peer_uuid = message.source_uuid
             self._peer_name = message.source_name
+            if obj.type == 'answer' and await self._open_direct(message):
+                return
+            await self._pc.setRemoteDescription(obj)
             if obj.type == 'offer':
+                if (
+                    self._direct is not None
+                    and message.direct_token is not None
+                ):
+                    self._direct_token = message.direct_token
+                    self._direct.expect(self._direct_token, self._use_direct)
                 await self.send_answer(message.source_uuid)
         elif isinstance(obj, RTCIceCandidate):  # pragma: no cover
             # We should not receive an RTCIceCandidate message via the
@@ -0,0 +1,216 @@
+"""Direct TCP connections between peers.
+
+Peers which can reach each other directly exchange messages over a TCP
+stream rather than WebRTC datachannels. The offering peer of a
+[`PeerConnection`][proxystore.p2p.connection.PeerConnection] sends a
+one-time token through the relay server, and the answering peer replies
+with the address of its
+[`DirectServer`][proxystore.p2p.direct.DirectServer]. The offering peer
+then connects to the server and presents the token, and confirms the
+server's acceptance before either peer uses the connection. If the
+connection cannot be opened, the peers fall back to WebRTC.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+from typing import Awaitable
+from typing import Callable
+
+from proxystore import utils
+
+logger = logging.getLogger(__name__)
+
+DIRECT_CONNECT_TIMEOUT = 2.0
+"""Time in seconds to wait for a direct connection before falling back."""
+DIRECT_BUFFER_SIZE = 2**22
+"""Size in bytes of the read and write buffers of direct connections."""
+
+_HELLO = b'PSDC'
+_TOKEN_BYTES = 16
+_TOKEN_LENGTH = 2 * _TOKEN_BYTES
+_ACCEPT = b'\x01'
+_CONFIRM = b'\x02'
+_WILDCARD_HOSTS = ('', '0.0.0.0', '::')
+
+DirectHandler = Callable[
+    [asyncio.StreamReader, asyncio.StreamWriter],
+    Awaitable[None],
+]
+
+
+def new_token() -> str:
+    """Generate a one-time token for a direct connection."""
+    return secrets.token_hex(_TOKEN_BYTES)
+
+
+class DirectServer:
+    """TCP server accepting direct connections from peers.
+
+    A connection is accepted only if the peer presents a token registered
+    with [`expect()`][proxystore.p2p.direct.DirectServer.expect]. Tokens
+    are removed once used.
+
+    Warning:
+        Data sent over direct connections is not encrypted so direct
+        connections should only be enabled on trusted networks.
+
+    Args:
+        host: Host to listen on. The host is also the address advertised
+            to peers unless it is a wildcard address in which case the
+            hostname is advertised.
+        port: Port to listen on. If `0`, a free port is chosen.
+    """
+
+    def __init__(self, host: str, port: int = 0) -> None:
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._handlers: dict[str, DirectHandler] = {}
+
+    @property
+    def address(self) -> str:
+        """Address formatted as `host:port` that peers connect to."""
+        host = utils.hostname() if self.host in _WILDCARD_HOSTS else self.host
+        return f'{host}:{self.port}'
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        if self._server is None:
+            self._server = await asyncio.start_server(
+                self._handle,
+                self.host,
+                self.port,
+                limit=DIRECT_BUFFER_SIZE,
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            logger.info(f'Direct peer server listening on {self.address}')
+
+    async def close(self) -> None:
+        """Stop listening for connections."""
+        self._handlers.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def expect(self, token: str, handler: DirectHandler) -> None:
+        """Accept a connection presenting a token.
+
+        Args:
+            token: Token from
+                [`new_token()`][proxystore.p2p.direct.new_token].
+            handler: Coroutine function invoked with the reader and writer
+                of the connection once accepted.
+        """
+        self._handlers[token] = handler
+
+    def discard(self, token: str) -> None:
+        """Stop accepting a connection presenting a token."""
+        self._handlers.pop(token, None)
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            hello = await asyncio.wait_for(
+                reader.readexactly(len(_HELLO) + _TOKEN_LENGTH),
+                DIRECT_CONNECT_TIMEOUT,
+            )
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, OSError):
+            writer.close()
+            return
+
+        token = hello[len(_HELLO) :].decode('ascii', errors='replace')
+        handler = (
+            self._handlers.pop(token, None)
+            if hello.startswith(_HELLO)
+            else None
+        )
+        if handler is None:
+            logger.warning(
+                'Rejected direct peer connection from '
+                f'{writer.get_extra_info("peername")} with unknown token',
+            )
+            writer.close()
+            return
+
+        writer.transport.set_write_buffer_limits(high=DIRECT_BUFFER_SIZE)
+        writer.write(_ACCEPT)
+        # The peer confirms it received the acceptance before the connection
+        # is used. Otherwise, the peer may have timed out and fallen back to
+        # WebRTC while this side switches to the direct connection.
+        try:
+            confirm = await asyncio.wait_for(
+                reader.readexactly(len(_CONFIRM)),
+                DIRECT_CONNECT_TIMEOUT,
+            )
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, OSError):
+            confirm = b''
+        if confirm != _CONFIRM:
+            logger.warning(
+                'Direct peer connection from '
+                f'{writer.get_extra_info("peername")} was not confirmed',
+            )
+            writer.close()
+            return
+
+        await handler(reader, writer)
+
+
+async def open_direct_connection(
+    address: str,
+    token: str,
+    timeout: float = DIRECT_CONNECT_TIMEOUT,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a direct connection to the server of a peer.
+
+    Args:
+        address: Address of the server formatted as `host:port`.
+        token: Token the server expects.
+        timeout: Time in seconds to wait for the server to accept the
+            connection.
+
+    Returns:
+        Reader and writer of the connection.
+
+    Raises:
+        OSError: If the connection is refused, rejected, or not accepted
+            within the timeout.
+    """
+    host, _, port_str = address.rpartition(':')
+    try:
+        port = int(port_str)
+    except ValueError:
+        raise ConnectionError(f'Invalid direct address {address}.') from None
+
+    async def _open() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(
+            host,
+            port,
+            limit=DIRECT_BUFFER_SIZE,
+        )
+        try:
+            writer.write(_HELLO + token.encode('ascii'))
+            if await reader.readexactly(len(_ACCEPT)) != _ACCEPT:
+                raise ConnectionError('Direct connection was not accepted.')
+            writer.write(_CONFIRM)
+        except BaseException:
+            writer.close()
+            raise
+        writer.transport.set_write_buffer_limits(high=DIRECT_BUFFER_SIZE)
+        return reader, writer
+
+    try:
+        return await asyncio.wait_for(_open(), timeout)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError(
+            f'Direct connection to {address} was rejected.',
+        ) from e
+    except asyncio.TimeoutError as e:
+        raise ConnectionError(
+            f'Timeout opening direct connection to {address}.',
+        ) from e
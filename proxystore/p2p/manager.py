@@ -24,9 +24,13 @@ except ImportError as e:  # pragma: no cover
 
 from proxystore import utils
 from proxystore.p2p import messages
+from proxystore.p2p.chunks import BufferSequence
 from proxystore.p2p.client import connect
 from proxystore.p2p.connection import log_name
 from proxystore.p2p.connection import PeerConnection
+from proxystore.p2p.connection import PeerStats
+from proxystore.p2p.connection import StreamedMessage
+from proxystore.p2p.direct import DirectServer
 from proxystore.p2p.exceptions import PeerConnectionError
 from proxystore.p2p.exceptions import PeerConnectionTimeoutError  # noqa: F401
 from proxystore.p2p.exceptions import PeerRegistrationError
@@ -93,6 +97,15 @@ class PeerManager:
             connection to be established.
         peer_channels: number of datachannels to split message sending over
             between each peer.
+        max_peer_channels: Maximum number of datachannels to open with each
+            peer as throughput is measured. Defaults to `peer_channels`.
+        direct_host: Optional host to accept direct TCP connections from
+            peers on. If set, messages are exchanged with peers which also
+            accept direct connections over TCP, rather than WebRTC, when
+            the peers can reach each other (see
+            [`proxystore.p2p.direct`][proxystore.p2p.direct]).
+        direct_port: Port to accept direct TCP connections on. If `0`, a
+            free port is chosen.
         verify_certificate: Verify the relay server's SSL certificate,
 
     Raises:
@@ -108,6 +121,9 @@ class PeerManager:
         *,
         timeout: int = 30,
         peer_channels: int = 1,
+        max_peer_channels: int | None = None,
+        direct_host: str | None = None,
+        direct_port: int = 0,
         verify_certificate: bool = True,
     ) -> None:
         if not (
@@ -123,13 +139,19 @@ class PeerManager:
         self._name = name if name is not None else utils.hostname()
         self._timeout = timeout
         self._peer_channels = peer_channels
+        self._max_peer_channels = max_peer_channels
+        self._direct = (
+            None
+            if direct_host is None
+            else DirectServer(direct_host, direct_port)
+        )
         self._verify_certificate = verify_certificate
 
         self._peers_lock = asyncio.Lock()
         self._peers: dict[frozenset[UUID], PeerConnection] = {}
 
         self._message_queue: asyncio.Queue[
-            tuple[UUID, bytes | str]
+            tuple[UUID, bytearray | str | StreamedMessage]
         ] = asyncio.Queue()
         self._server_task: asyncio.Task[None] | None = None
         self._tasks: dict[frozenset[UUID], asyncio.Task[None]] = {}
@@ -188,6 +210,8 @@ class PeerManager:
                 f'{self._log_prefix}: registered as peer with relay '
                 f'server at {self._relay_server}',
             )
+        if self._direct is not None:
+            await self._direct.start()
         if self._server_task is None:
             self._server_task = spawn_guarded_background_task(
                 self._handle_server_messages,
@@ -286,6 +310,8 @@ class PeerManager:
                         name=self._name,
                         websocket=self._websocket,
                         channels=self._peer_channels,
+                        max_channels=self._max_peer_channels,
+                        direct=self._direct,
                     )
                     async with self._peers_lock:
                         self._peers[peers] = connection
@@ -309,6 +335,18 @@ class PeerManager:
                     f'{type(message).__name__} from relay server',
                 )
 
+    def stats(self) -> dict[UUID, PeerStats]:
+        """Get a snapshot of the statistics of each peer connection.
+
+        Returns:
+            Mapping of peer UUIDs to the statistics of the connection with \
+            the peer.
+        """
+        return {
+            next(iter(peers - {self._uuid}), self._uuid): connection.stats()
+            for peers, connection in self._peers.items()
+        }
+
     async def close(self) -> None:
         """Close the connection manager."""
         if self._server_task is not None:
@@ -328,6 +366,8 @@ class PeerManager:
                 await connection.close()
         if self._websocket_or_none is not None:
             await self._websocket_or_none.close()
+        if self._direct is not None:
+            await self._direct.close()
         logger.info(f'{self._log_prefix}: peer manager closed')
 
     async def close_connection(self, peers: Iterable[UUID]) -> None:
@@ -361,7 +401,7 @@ class PeerManager:
             except (asyncio.CancelledError, SafeTaskExitError):
                 pass
 
-    async def recv(self) -> tuple[UUID, bytes | str]:
+    async def recv(self) -> tuple[UUID, bytearray | str | StreamedMessage]:
         """Receive next message from a peer.
 
         Returns:
@@ -373,22 +413,28 @@ class PeerManager:
     async def send(
         self,
         peer_uuid: UUID,
-        message: bytes | str,
+        message: bytes | str | BufferSequence,
         timeout: float = 30,
+        *,
+        stream: bytes | BufferSequence | None = None,
     ) -> None:
         """Send message to peer.
 
         Args:
             peer_uuid: UUID of peer to send message to.
-            message: Message to send to peer.
+            message: Message to send to peer. A sequence of buffers is
+                sent as a single bytes message.
             timeout: Timeout to wait on peer connection to be ready.
+            stream: Optional data to send as a stream after the message
+                (see
+                [`PeerConnection.send()`][proxystore.p2p.connection.PeerConnection.send]).
 
         Raises:
             PeerConnectionTimeoutError: If the peer connection is not
                 established within the timeout.
         """
         connection = await self.get_connection(peer_uuid)
-        await connection.send(message, timeout)
+        await connection.send(message, timeout, stream=stream)
 
     async def get_connection(self, peer_uuid: UUID) -> PeerConnection:
         """Get connection to the peer.
@@ -410,6 +456,8 @@ class PeerManager:
                 self._name,
                 self._websocket,
                 channels=self._peer_channels,
+                max_channels=self._max_peer_channels,
+                direct=self._direct,
             )
             self._peers[peers] = connection
 
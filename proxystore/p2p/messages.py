@@ -74,6 +74,10 @@ class PeerConnection(Message):
             indicating the type of message being sent.
         description: Session description protocol message.
         error: Error string if a problem occurs.
+        direct_token: Token sent in an offer by a peer which can open
+            a direct TCP connection.
+        direct_address: Address sent in an answer to an offer with a
+            `direct_token` by a peer which accepts direct TCP connections.
     """
 
     source_uuid: uuid.UUID
@@ -82,6 +86,8 @@ class PeerConnection(Message):
     description_type: Literal['answer', 'offer']
     description: str
     error: str | None = None
+    direct_token: str | None = None
+    direct_address: str | None = None
     message_type: str = MessageType.peer_connection.name
 
 
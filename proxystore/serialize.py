@@ -2,10 +2,28 @@
 from __future__ import annotations
 
 import pickle
+import struct
+import sys
 from typing import Any
+from typing import List
+from typing import Union
 
 import cloudpickle
 
+BytesLike = Union[bytes, bytearray, memoryview]
+"""Types of binary data supported by [`deserialize()`][proxystore.serialize.deserialize]."""  # noqa: E501
+BufferList = List[BytesLike]
+"""List of buffers produced by [`serialize_buffers()`][proxystore.serialize.serialize_buffers]."""  # noqa: E501
+
+# Pickle protocol 5 and out-of-band buffers were added in Python 3.8.
+_OOB_SUPPORTED = sys.version_info >= (3, 8)
+
+_IDENTIFIER_LENGTH = len(b'00\n')
+# Header of an out-of-band pickle: number of out-of-band buffers followed
+# by the length of the pickle stream and the length of each buffer.
+_OOB_COUNT = struct.Struct('!I')
+_OOB_LENGTH = struct.Struct('!Q')
+
 
 class SerializationError(Exception):
     """Base Serialization Exception."""
@@ -13,16 +31,91 @@ class SerializationError(Exception):
     pass
 
 
+def _pickle(obj: Any) -> tuple[bytes, BufferList]:
+    """Pickle an object and collect its out-of-band buffers.
+
+    Pickle protocol 5 streams are always tagged with the `05` identifier,
+    even if there are no out-of-band buffers, so data tagged `03` remains
+    readable by Python versions without protocol 5.
+
+    Returns:
+        Tuple of the identifier and the list of buffers. For protocol 5, the
+        first buffer is the out-of-band header followed by the pickle stream
+        and the out-of-band buffers. Otherwise, the only buffer is the
+        pickle stream.
+    """
+    try:
+        if _OOB_SUPPORTED:  # pragma: >=3.8 cover
+            raw_buffers: list[pickle.PickleBuffer] = []
+            data = pickle.dumps(
+                obj,
+                protocol=5,
+                buffer_callback=raw_buffers.append,
+            )
+            views = [buffer.raw() for buffer in raw_buffers]
+            header = b''.join(
+                [
+                    _OOB_COUNT.pack(len(views)),
+                    _OOB_LENGTH.pack(len(data)),
+                    *(_OOB_LENGTH.pack(v.nbytes) for v in views),
+                ],
+            )
+            return b'05\n', [header, data, *views]
+        else:  # pragma: <3.8 cover
+            # Pickle protocol 4 is available in Python 3.7 and later but not
+            # the default in Python 3.7 so manually specify it.
+            return b'03\n', [pickle.dumps(obj, protocol=4)]
+    except Exception:
+        # Use cloudpickle if pickle fails
+        return b'04\n', [cloudpickle.dumps(obj)]
+
+
+def serialize_buffers(obj: Any) -> BufferList:
+    """Serialize object into a list of buffers without joining them.
+
+    Large contiguous buffers inside of the object (e.g., the data of a NumPy
+    array) are returned as separate zero-copy
+    [`memoryview`][memoryview] instances using pickle protocol 5 out-of-band
+    buffers rather than being copied into the pickle stream. The buffers can
+    be written with scatter/gather I/O, and the concatenation of the buffers
+    is identical to the output of
+    [`serialize()`][proxystore.serialize.serialize].
+
+    Warning:
+        The returned buffers may reference the memory of `obj` so `obj`
+        should not be modified until the buffers have been consumed.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        List of buffers where the first buffer starts with the identifier.
+    """
+    if isinstance(obj, bytes):
+        return [b'01\n', obj]
+    elif isinstance(obj, str):
+        return [b'02\n', obj.encode()]
+
+    identifier, buffers = _pickle(obj)
+    buffers[0] = identifier + buffers[0]
+    return buffers
+
+
 def serialize(obj: Any) -> bytes:
     """Serialize object.
 
     Objects are serialized using
     [pickle](https://docs.python.org/3/library/pickle.html){target=_blank}
-    (protocol 4) except for [bytes][] or [str][] objects.
+    (protocol 5 in Python 3.8 and later, otherwise protocol 4) except for
+    [bytes][] or [str][] objects.
     If pickle fails,
     [cloudpickle](https://github.com/cloudpipe/cloudpickle){target=_blank}
     is used as a fallback.
 
+    Objects which expose out-of-band buffers with pickle protocol 5 (e.g.,
+    NumPy arrays) are written directly after the pickle stream such that the
+    buffer data is only copied once.
+
     Args:
         obj: Object to serialize.
 
@@ -30,64 +123,104 @@ def serialize(obj: Any) -> bytes:
         Bytes that can be passed to \
         [`deserialize()`][proxystore.serialize.deserialize].
     """
-    if isinstance(obj, bytes):
-        identifier = b'01\n'
-    elif isinstance(obj, str):
-        identifier = b'02\n'
-        obj = obj.encode()
-    else:
-        # Use cloudpickle if pickle fails
-        try:
-            identifier = b'03\n'
-            # Pickle protocol 4 is available in Python 3.7 and later but not
-            # the default in Python 3.7 so manually specify it.
-            obj = pickle.dumps(obj, protocol=4)
-        except Exception:
-            identifier = b'04\n'
-            obj = cloudpickle.dumps(obj)
+    buffers = serialize_buffers(obj)
+    return b''.join(buffers)
 
-    assert isinstance(identifier, bytes)
-    assert isinstance(obj, bytes)
 
-    return identifier + obj
+def _unpickle_oob(data: memoryview, copy: bool) -> Any:
+    """Unpickle data with out-of-band buffers.
 
+    If `copy` is `False`, the out-of-band buffers are views of `data`.
+    Otherwise, each buffer is copied into a new [`bytearray`][bytearray].
+    """
+    try:
+        (count,) = _OOB_COUNT.unpack_from(data, 0)
+        offset = _OOB_COUNT.size
+        lengths = [
+            _OOB_LENGTH.unpack_from(data, offset + i * _OOB_LENGTH.size)[0]
+            for i in range(count + 1)
+        ]
+    except struct.error as e:
+        raise SerializationError(
+            'Data does not have a valid out-of-band buffer header.',
+        ) from e
+
+    offset += (count + 1) * _OOB_LENGTH.size
+    if offset + sum(lengths) != data.nbytes:
+        raise SerializationError(
+            'Data length does not match the out-of-band buffer header.',
+        )
+
+    views: list[BytesLike] = []
+    for length in lengths:
+        view = data[offset : offset + length]
+        views.append(bytearray(view) if copy and len(views) > 0 else view)
+        offset += length
 
-def deserialize(data: bytes) -> Any:
+    return pickle.loads(views[0], buffers=views[1:])
+
+
+def deserialize(data: BytesLike, *, copy: bool = True) -> Any:
     """Deserialize object.
 
+    Data is not copied before being unpickled so a
+    [`bytearray`][bytearray] or [`memoryview`][memoryview] (e.g., over a
+    receive buffer or memory-mapped file) can be passed directly.
+
+    Objects serialized with out-of-band buffers (e.g., NumPy arrays) are
+    reconstructed on writable copies of the buffers by default, the same
+    as [`pickle.loads()`][pickle.loads]. If `copy` is `False`, the buffers
+    are instead reconstructed on top of the memory of `data` which avoids
+    the copy but keeps `data` alive for the lifetime of the object. Note
+    that the reconstructed buffers are read-only if `data` is read-only
+    (e.g., [`bytes`][bytes] or a read-only memory-mapped file).
+
+    Tip:
+        Use `#!python functools.partial(deserialize, copy=False)` as the
+        deserializer of a [`Store`][proxystore.store.base.Store] to
+        opt in to reconstructing objects without copying.
+
     Args:
         data: Bytes produced by
             [`serialize()`][proxystore.serialize.serialize].
+        copy: Copy out-of-band buffers rather than aliasing `data`.
 
     Returns:
         The deserialized object.
 
     Raises:
-        ValueError: If `data` is not of type `bytes`.
+        ValueError: If `data` is not a bytes-like object.
         SerializationError: If the identifier of `data` is missing or
             invalid. The identifier is prepended to the string in
             [`serialize()`][proxystore.serialize.serialize] to indicate which
             serialization method was used (e.g., no serialization, pickle,
             etc.).
     """
-    if not isinstance(data, bytes):
+    if not isinstance(data, (bytes, bytearray, memoryview)):
         raise ValueError(
             f'Expected data to be of type bytes, not {type(data)}.',
         )
-    identifier, separator, data = data.partition(b'\n')
-    if separator == b'' or len(identifier) != len(b'00'):
+    view = memoryview(data).cast('B')
+    identifier = bytes(view[:_IDENTIFIER_LENGTH])
+    if len(identifier) != _IDENTIFIER_LENGTH or not identifier.endswith(
+        b'\n',
+    ):
         raise SerializationError(
             'Data does not have required identifier for deserialization.',
         )
-    if identifier == b'01':
-        return data
-    elif identifier == b'02':
-        return data.decode()
-    elif identifier == b'03':
-        return pickle.loads(data)
-    elif identifier == b'04':
-        return cloudpickle.loads(data)
+    view = view[_IDENTIFIER_LENGTH:]
+
+    if identifier == b'01\n':
+        return bytes(view)
+    elif identifier == b'02\n':
+        return str(view, 'utf-8')
+    elif identifier == b'03\n':
+        return pickle.loads(view)
+    elif identifier == b'04\n':
+        return cloudpickle.loads(view)
+    elif identifier == b'05\n' and _OOB_SUPPORTED:  # pragma: >=3.8 cover
+        return _unpickle_oob(view, copy)
     else:
         raise SerializationError(
-            f'Unknown identifier {identifier!r} for deserialization,',
+            f'Unknown identifier {identifier[:-1]!r} for deserialization,',
         )
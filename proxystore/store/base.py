@@ -1,15 +1,20 @@
 """Store implementation."""
 from __future__ import annotations
 
+import asyncio
+import collections
+import functools
 import logging
 import sys
+import threading
 from concurrent.futures import Future
-from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Generator
 from typing import Generic
+from typing import Iterable
 from typing import Sequence
 from typing import Tuple
 from typing import TypeVar
@@ -21,17 +26,25 @@ else:  # pragma: <3.11 cover
 
 import proxystore
 import proxystore.serialize
+from proxystore.connectors.connector import AsyncConnector
 from proxystore.connectors.connector import Connector
+from proxystore.connectors.connector import PayloadT
+from proxystore.proxy import is_resolved
 from proxystore.proxy import Proxy
 from proxystore.proxy import ProxyLocker
-from proxystore.store.cache import LRUCache
+from proxystore.proxy import resolve
+from proxystore.serialize import BytesLike
+from proxystore.store.cache import Cache
+from proxystore.store.cache import get_cache
 from proxystore.store.exceptions import ProxyResolveMissingKeyError
 from proxystore.store.metrics import StoreMetrics
+from proxystore.store.resolver import ResolverExecutor
 from proxystore.timer import Timer
 from proxystore.utils import get_class_path
 from proxystore.utils import import_class
+from proxystore.utils import nbytes
 
-_default_pool = ThreadPoolExecutor()
+_MISSING = object()
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -39,10 +52,47 @@ ConnectorT = TypeVar('ConnectorT', bound=Connector[Any])
 """Connector type variable."""
 ConnectorKeyT = Tuple[Any, ...]
 """Connector key type alias."""
-SerializerT = Callable[[Any], bytes]
-"""Serializer type alias."""
-DeserializerT = Callable[[bytes], Any]
-"""Deserializer type alias."""
+SerializerT = Callable[[Any], PayloadT]
+"""Serializer type alias.
+
+Serializers can return a single bytes-like object or a sequence of
+bytes-like objects (see [`PayloadT`][proxystore.connectors.connector.PayloadT]).
+"""
+DeserializerT = Callable[[BytesLike], Any]
+"""Deserializer type alias.
+
+Deserializers are passed the bytes-like object returned by
+[`Connector.get()`][proxystore.connectors.connector.Connector.get].
+"""
+
+
+def _check_serialized(obj: Any) -> None:
+    """Check that a serializer produced a valid connector payload.
+
+    Raises:
+        TypeError: If `obj` is not a bytes-like object or a sequence of
+            bytes-like objects.
+    """
+    buffer_types = (bytes, bytearray, memoryview)
+    if isinstance(obj, buffer_types):
+        return
+    if isinstance(obj, (list, tuple)) and all(
+        isinstance(buffer, buffer_types) for buffer in obj
+    ):
+        return
+    raise TypeError(
+        'Serializer must produce bytes, a bytes-like object, or a sequence '
+        f'of bytes-like objects. Got {type(obj).__name__}.',
+    )
+
+
+def _copy_future(source: Future[T], target: Future[T]) -> None:
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
 
 
 class StoreFactory(Generic[ConnectorT, T]):
@@ -114,6 +164,31 @@ class StoreFactory(Generic[ConnectorT, T]):
             'metrics': self.metrics,
         }
 
+    @property
+    def resolving(self) -> bool:
+        """If the object is being or has been retrieved asynchronously.
+
+        The object is returned by the next call to the factory without
+        another request to the store.
+        """
+        return self._obj_future is not None
+
+    def set_result(self, obj: T) -> None:
+        """Set the object the next call to the factory returns.
+
+        Useful when the object has already been retrieved from the store
+        (e.g., as part of a batch). Has no effect if the factory is
+        already [`resolving`][proxystore.store.base.StoreFactory.resolving]
+        the object.
+
+        Args:
+            obj: Object associated with the key of the factory.
+        """
+        if self._obj_future is None:
+            future: Future[T] = Future()
+            future.set_result(obj)
+            self._obj_future = future
+
     def get_store(self) -> Store[ConnectorT]:
         """Get store and reinitialize if necessary.
 
@@ -154,10 +229,20 @@ class StoreFactory(Generic[ConnectorT, T]):
 
         return cast(T, obj)
 
-    def resolve_async(self) -> None:
-        """Asynchronously get object associated with key from store."""
+    def resolve_async(self, priority: int = 0) -> None:
+        """Asynchronously get object associated with key from store.
+
+        The object is resolved by the resolver executor of the store. If
+        another factory is already resolving the same key, the result of
+        that resolve is shared rather than retrieving the object again.
+
+        Args:
+            priority: Priority of the resolve in the resolver queue of the
+                store. Lower values are resolved first.
+        """
         logger.debug(f'Starting asynchronous resolve of {self.key}')
-        self._obj_future = _default_pool.submit(self.resolve)
+        store = self.get_store()
+        self._obj_future = store._submit_resolve(self, priority)
 
 
 class Store(Generic[ConnectorT]):
@@ -184,12 +269,26 @@ class Store(Generic[ConnectorT]):
             byte string. If `None`, the default deserializer
             ([`deserialize()`][proxystore.serialize.deserialize]) will be
             used.
-        cache_size: Size of LRU cache (in # of objects). If 0,
+        cache_size: Size of the cache (in # of objects). If 0,
             the cache is disabled. The cache is local to the Python process.
+        cache_bytes: Optional maximum total size of the cache in bytes.
+            Cached objects are accounted for by their serialized size.
+        cache_policy: Eviction policy of the cache (`'lru'` or `'lfu'`).
+            See [`get_cache()`][proxystore.store.cache.get_cache].
         metrics: Enable recording operation metrics.
+        resolver_workers: Maximum number of threads used to asynchronously
+            resolve proxies created by this store. Defaults to the
+            [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor]
+            default.
+        resolver_max_pending: Optional maximum number of queued or running
+            asynchronous resolves. Starting an asynchronous resolve blocks
+            once the limit is reached.
 
     Raises:
-        ValueError: If `cache_size` is less than zero.
+        ValueError: If `cache_size` or `cache_bytes` is less than zero.
+        ValueError: If `cache_policy` is not a known policy.
+        ValueError: If `resolver_workers` or `resolver_max_pending` is
+            less than one.
     """
 
     def __init__(
@@ -200,21 +299,47 @@ class Store(Generic[ConnectorT]):
         serializer: SerializerT | None = None,
         deserializer: DeserializerT | None = None,
         cache_size: int = 16,
+        cache_bytes: int | None = None,
+        cache_policy: str = 'lru',
         metrics: bool = False,
+        resolver_workers: int | None = None,
+        resolver_max_pending: int | None = None,
     ) -> None:
         if cache_size < 0:
             raise ValueError(
                 f'Cache size cannot be negative. Got {cache_size}.',
             )
+        if cache_bytes is not None and cache_bytes < 0:
+            raise ValueError(
+                f'Cache bytes cannot be negative. Got {cache_bytes}.',
+            )
 
         self.connector = connector
-        self.cache: LRUCache[ConnectorKeyT, Any] = LRUCache(cache_size)
+        self._async_connector = isinstance(connector, AsyncConnector)
+        self.cache: Cache[ConnectorKeyT, Any] = get_cache(
+            cache_policy,
+            cache_size,
+            cache_bytes,
+        )
         self._name = name
-        self._metrics = StoreMetrics() if metrics else None
+        self._metrics = StoreMetrics(cache=self.cache) if metrics else None
         self._cache_size = cache_size
+        self._cache_bytes = cache_bytes
+        self._cache_policy = cache_policy
         self._serializer = serializer
         self._deserializer = deserializer
 
+        self._resolver_workers = resolver_workers
+        self._resolver = ResolverExecutor(
+            resolver_workers,
+            resolver_max_pending,
+        )
+        # Maps keys (and the deserializer) currently being resolved by the
+        # resolver to the future of the result so concurrent resolves of
+        # the same object are deduplicated.
+        self._resolving: dict[tuple[ConnectorKeyT, int], Future[Any]] = {}
+        self._resolving_lock = threading.RLock()
+
         logger.info(f'Initialized {self}')
 
     def __enter__(self) -> Self:
@@ -235,6 +360,8 @@ class Store(Generic[ConnectorT]):
             f'Store("{self.name}", connector={self.connector}, '
             f'serializer={serializer}, deserializer={deserializer}, '
             f'cache_size={self.cache.maxsize}, '
+            f'cache_bytes={self.cache.maxbytes}, '
+            f"cache_policy='{self._cache_policy}', "
             f'metrics={self.metrics is not None})'
         )
 
@@ -273,7 +400,12 @@ class Store(Generic[ConnectorT]):
             This method should only be called at the end of the program
             when the store will no longer be used, for example once all
             proxies have been resolved.
+
+        Note:
+            Queued asynchronous resolves are completed before the connector
+            is closed so proxies being resolved remain resolvable.
         """
+        self._resolver.shutdown(wait=True)
         self.connector.close()
 
     def config(self) -> dict[str, Any]:
@@ -296,7 +428,11 @@ class Store(Generic[ConnectorT]):
             'serializer': self._serializer,
             'deserializer': self._deserializer,
             'cache_size': self._cache_size,
+            'cache_bytes': self._cache_bytes,
+            'cache_policy': self._cache_policy,
             'metrics': self.metrics is not None,
+            'resolver_workers': self._resolver_workers,
+            'resolver_max_pending': self._resolver.max_pending,
         }
 
     @classmethod
@@ -315,6 +451,31 @@ class Store(Generic[ConnectorT]):
         config['connector'] = connector.from_config(connector_config)
         return cls(**config)
 
+    async def _aconnector(
+        self,
+        operation: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Await a connector operation.
+
+        Uses the async method of the connector (e.g., `aget()` for `get()`)
+        if the connector implements
+        [`AsyncConnector`][proxystore.connectors.connector.AsyncConnector].
+        Otherwise, the synchronous method is run in the default executor of
+        the event loop.
+        """
+        if self._async_connector:
+            method = getattr(self.connector, f'a{operation}')
+            return await method(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        function = getattr(self.connector, operation)
+        return await loop.run_in_executor(
+            None,
+            functools.partial(function, *args, **kwargs),
+        )
+
     def evict(self, key: ConnectorKeyT) -> None:
         """Evict the object associated with the key.
 
@@ -325,12 +486,35 @@ class Store(Generic[ConnectorT]):
             with Timer() as connector_timer:
                 self.connector.evict(key)
 
-            if self.metrics is not None:
-                ctime = connector_timer.elapsed_ns
-                self.metrics.add_time('store.evict.connector', key, ctime)
+            self._evict_finish(key, connector_timer)
+
+        self._log_evict(key, timer)
+
+    async def aevict(self, key: ConnectorKeyT) -> None:
+        """Evict the object associated with the key asynchronously.
+
+        See [`evict()`][proxystore.store.base.Store.evict] for details.
+        """
+        with Timer() as timer:
+            with Timer() as connector_timer:
+                await self._aconnector('evict', key)
+
+            self._evict_finish(key, connector_timer)
+
+        self._log_evict(key, timer)
+
+    def _evict_finish(
+        self,
+        key: ConnectorKeyT,
+        connector_timer: Timer,
+    ) -> None:
+        if self.metrics is not None:
+            ctime = connector_timer.elapsed_ns
+            self.metrics.add_time('store.evict.connector', key, ctime)
 
-            self.cache.evict(key)
+        self.cache.evict(key)
 
+    def _log_evict(self, key: ConnectorKeyT, timer: Timer) -> None:
         if self.metrics is not None:
             self.metrics.add_time('store.evict', key, timer.elapsed_ns)
 
@@ -358,6 +542,28 @@ class Store(Generic[ConnectorT]):
                     ctime = connector_timer.elapsed_ns
                     self.metrics.add_time('store.exists.connector', key, ctime)
 
+        self._log_exists(key, timer)
+        return res
+
+    async def aexists(self, key: ConnectorKeyT) -> bool:
+        """Check if an object associated with the key exists asynchronously.
+
+        See [`exists()`][proxystore.store.base.Store.exists] for details.
+        """
+        with Timer() as timer:
+            res = self.cache.exists(key)
+            if not res:
+                with Timer() as connector_timer:
+                    res = await self._aconnector('exists', key)
+
+                if self.metrics is not None:
+                    ctime = connector_timer.elapsed_ns
+                    self.metrics.add_time('store.exists.connector', key, ctime)
+
+        self._log_exists(key, timer)
+        return res
+
+    def _log_exists(self, key: ConnectorKeyT, timer: Timer) -> None:
         if self.metrics is not None:
             self.metrics.add_time('store.exists', key, timer.elapsed_ns)
 
@@ -365,7 +571,6 @@ class Store(Generic[ConnectorT]):
             f'Store(name="{self.name}"): EXISTS {key} in '
             f'{timer.elapsed_ms:.3f} ms',
         )
-        return res
 
     def get(
         self,
@@ -389,9 +594,55 @@ class Store(Generic[ConnectorT]):
         timer = Timer()
         timer.start()
 
-        if self.is_cached(key):
-            value = self.cache.get(key)
+        result = self._get_cached(key, timer)
+        if result is not _MISSING:
+            return result
+
+        with Timer() as connector_timer:
+            value = self.connector.get(key)
+
+        return self._get_finish(
+            key,
+            value,
+            deserializer,
+            default,
+            timer,
+            connector_timer,
+        )
+
+    async def aget(
+        self,
+        key: ConnectorKeyT,
+        *,
+        deserializer: DeserializerT | None = None,
+        default: object | None = None,
+    ) -> Any | None:
+        """Get the object associated with the key asynchronously.
 
+        See [`get()`][proxystore.store.base.Store.get] for details.
+        """
+        timer = Timer()
+        timer.start()
+
+        result = self._get_cached(key, timer)
+        if result is not _MISSING:
+            return result
+
+        with Timer() as connector_timer:
+            value = await self._aconnector('get', key)
+
+        return self._get_finish(
+            key,
+            value,
+            deserializer,
+            default,
+            timer,
+            connector_timer,
+        )
+
+    def _get_cached(self, key: ConnectorKeyT, timer: Timer) -> Any:
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
             timer.stop()
             if self.metrics is not None:
                 self.metrics.add_counter('store.get.cache_hits', key, 1)
@@ -401,11 +652,17 @@ class Store(Generic[ConnectorT]):
                 f'Store(name="{self.name}"): GET {key} in '
                 f'{timer.elapsed_ms:.3f} ms (cached=True)',
             )
-            return value
-
-        with Timer() as connector_timer:
-            value = self.connector.get(key)
+        return value
 
+    def _get_finish(
+        self,
+        key: ConnectorKeyT,
+        value: BytesLike | None,
+        deserializer: DeserializerT | None,
+        default: object | None,
+        timer: Timer,
+        connector_timer: Timer,
+    ) -> Any:
         if self.metrics is not None:
             ctime = connector_timer.elapsed_ns
             self.metrics.add_counter('store.get.cache_misses', key, 1)
@@ -428,7 +685,7 @@ class Store(Generic[ConnectorT]):
                     obj_size,
                 )
 
-            self.cache.set(key, result)
+            self.cache.set(key, result, size=len(value))
         else:
             result = default
 
@@ -442,6 +699,155 @@ class Store(Generic[ConnectorT]):
         )
         return result
 
+    def get_batch(
+        self,
+        keys: Sequence[ConnectorKeyT],
+        *,
+        deserializer: DeserializerT | None = None,
+        default: object | None = None,
+    ) -> list[Any | None]:
+        """Get the objects associated with the keys.
+
+        Cached objects are returned from the cache and the remaining objects
+        are retrieved with a single call to
+        [`Connector.get_batch()`][proxystore.connectors.connector.Connector.get_batch].
+
+        Args:
+            keys: Sequence of keys associated with the objects to retrieve.
+            deserializer: Optionally override the default deserializer for the
+                store instance.
+            default: An optional value to be returned for keys which do
+                not have an associated object.
+
+        Returns:
+            List with the same order as `keys` of the objects or `default` \
+            if the object associated with a key does not exist.
+        """
+        timer = Timer()
+        timer.start()
+
+        results, missing = self._get_batch_cached(keys)
+        missing_keys = list(missing)
+
+        with Timer() as connector_timer:
+            values = (
+                self.connector.get_batch(missing_keys)
+                if len(missing_keys) > 0
+                else []
+            )
+
+        return self._get_batch_finish(
+            keys,
+            results,
+            missing,
+            values,
+            deserializer,
+            default,
+            timer,
+            connector_timer,
+        )
+
+    async def aget_batch(
+        self,
+        keys: Sequence[ConnectorKeyT],
+        *,
+        deserializer: DeserializerT | None = None,
+        default: object | None = None,
+    ) -> list[Any | None]:
+        """Get the objects associated with the keys asynchronously.
+
+        See [`get_batch()`][proxystore.store.base.Store.get_batch] for details.
+        """
+        timer = Timer()
+        timer.start()
+
+        results, missing = self._get_batch_cached(keys)
+        missing_keys = list(missing)
+
+        with Timer() as connector_timer:
+            values = (
+                await self._aconnector('get_batch', missing_keys)
+                if len(missing_keys) > 0
+                else []
+            )
+
+        return self._get_batch_finish(
+            keys,
+            results,
+            missing,
+            values,
+            deserializer,
+            default,
+            timer,
+            connector_timer,
+        )
+
+    def _get_batch_cached(
+        self,
+        keys: Sequence[ConnectorKeyT],
+    ) -> tuple[list[Any], dict[ConnectorKeyT, list[int]]]:
+        results: list[Any] = [self.cache.get(key, _MISSING) for key in keys]
+        # Map each missing key to the indices of keys in the batch so
+        # duplicate keys are only retrieved once.
+        missing: dict[ConnectorKeyT, list[int]] = {}
+        for index, (key, result) in enumerate(zip(keys, results)):
+            if result is _MISSING:
+                missing.setdefault(key, []).append(index)
+        return results, missing
+
+    def _get_batch_finish(
+        self,
+        keys: Sequence[ConnectorKeyT],
+        results: list[Any],
+        missing: dict[ConnectorKeyT, list[int]],
+        values: Sequence[BytesLike | None],
+        deserializer: DeserializerT | None,
+        default: object | None,
+        timer: Timer,
+        connector_timer: Timer,
+    ) -> list[Any]:
+        deserializer = (
+            deserializer if deserializer is not None else self.deserializer
+        )
+
+        sizes = 0
+        with Timer() as deserializer_timer:
+            for key, value in zip(missing, values):
+                if value is not None:
+                    result = deserializer(value)
+                    sizes += len(value)
+                    self.cache.set(key, result, size=len(value))
+                else:
+                    result = default
+                for index in missing[key]:
+                    results[index] = result
+
+        timer.stop()
+        if self.metrics is not None:
+            ctime = connector_timer.elapsed_ns
+            dtime = deserializer_timer.elapsed_ns
+            hits = len(keys) - sum(len(i) for i in missing.values())
+            self.metrics.add_counter('store.get_batch.cache_hits', keys, hits)
+            self.metrics.add_counter(
+                'store.get_batch.cache_misses',
+                keys,
+                len(keys) - hits,
+            )
+            self.metrics.add_attribute(
+                'store.get_batch.object_sizes',
+                keys,
+                sizes,
+            )
+            self.metrics.add_time('store.get_batch.connector', keys, ctime)
+            self.metrics.add_time('store.get_batch.deserialize', keys, dtime)
+            self.metrics.add_time('store.get_batch', keys, timer.elapsed_ns)
+
+        logger.debug(
+            f'Store(name="{self.name}"): GET_BATCH ({len(keys)} items) in '
+            f'{timer.elapsed_ms:.3f} ms ({len(missing)} uncached)',
+        )
+        return results
+
     def is_cached(self, key: ConnectorKeyT) -> bool:
         """Check if an object associated with the key is cached locally.
 
@@ -453,6 +859,98 @@ class Store(Generic[ConnectorT]):
         """
         return self.cache.exists(key)
 
+    def prefetch(
+        self,
+        proxies: Iterable[Proxy[T]],
+        *,
+        max_inflight: int = 8,
+        priority: int = 0,
+    ) -> Generator[Proxy[T], None, None]:
+        """Resolve proxies ahead of use and yield them in order.
+
+        Up to `max_inflight` proxies ahead of the proxy most recently
+        yielded are resolved asynchronously. Proxies are consumed from
+        `proxies` lazily so the number of in flight resolves, and thus the
+        memory used by resolved objects not yet consumed, is bounded.
+
+        ```python
+        for proxy in store.prefetch(proxies, max_inflight=16):
+            process(proxy)  # proxy is already resolved
+        ```
+
+        Note:
+            Proxies created by a different store are resolved by the
+            resolver of that store. Proxies not created by a store are
+            resolved synchronously before being yielded.
+
+        Args:
+            proxies: Iterable of proxies to resolve.
+            max_inflight: Maximum number of proxies being resolved
+                ahead of the consumer.
+            priority: Priority of the resolves in the resolver queue.
+                Lower values are resolved first.
+
+        Yields:
+            Each proxy in `proxies`, in order, once it is resolved.
+
+        Raises:
+            ValueError: If `max_inflight` is less than one.
+        """
+        if max_inflight < 1:
+            raise ValueError(
+                f'Max inflight must be at least one. Got {max_inflight}.',
+            )
+
+        window: collections.deque[Proxy[T]] = collections.deque()
+        for proxy in proxies:
+            factory = proxy.__factory__
+            if not is_resolved(proxy) and isinstance(factory, StoreFactory):
+                factory.resolve_async(priority)
+            window.append(proxy)
+            if len(window) >= max_inflight:
+                proxy = window.popleft()
+                resolve(proxy)
+                yield proxy
+
+        while len(window) > 0:
+            proxy = window.popleft()
+            resolve(proxy)
+            yield proxy
+
+    def _submit_resolve(
+        self,
+        factory: StoreFactory[ConnectorT, T],
+        priority: int,
+    ) -> Future[T]:
+        resolving_key = (factory.key, id(factory.deserializer))
+        with self._resolving_lock:
+            future = self._resolving.get(resolving_key)
+            if future is not None:
+                return future
+            future = Future()
+            self._resolving[resolving_key] = future
+        future.add_done_callback(lambda _: self._resolve_done(resolving_key))
+
+        # Submit outside of the lock because submitting blocks while the
+        # pending resolves of the resolver are at the limit.
+        try:
+            task = self._resolver.submit(factory.resolve, priority=priority)
+        except RuntimeError:
+            # The resolver is shutdown once the store is closed so resolve
+            # in the calling thread instead.
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(factory.resolve())
+            except BaseException as e:
+                future.set_exception(e)
+        else:
+            task.add_done_callback(lambda t: _copy_future(t, future))
+        return future
+
+    def _resolve_done(self, resolving_key: tuple[ConnectorKeyT, int]) -> None:
+        with self._resolving_lock:
+            self._resolving.pop(resolving_key, None)
+
     def proxy(
         self,
         obj: T,
@@ -497,6 +995,41 @@ class Store(Generic[ConnectorT]):
         )
         return proxy
 
+    async def aproxy(
+        self,
+        obj: T,
+        *,
+        evict: bool = False,
+        serializer: SerializerT | None = None,
+        deserializer: DeserializerT | None = None,
+        **kwargs: Any,
+    ) -> Proxy[T]:
+        """Create a proxy that will resolve to an object in the store.
+
+        The object is put in the store asynchronously with
+        [`aset()`][proxystore.store.base.Store.aset].
+        See [`proxy()`][proxystore.store.base.Store.proxy] for details.
+        """
+        with Timer() as timer:
+            key = await self.aset(obj, serializer=serializer, **kwargs)
+            factory: StoreFactory[ConnectorT, T] = StoreFactory(
+                key,
+                store_config=self.config(),
+                deserializer=deserializer,
+                evict=evict,
+                metrics=self.metrics is not None,
+            )
+            proxy = Proxy(factory)
+
+        if self.metrics is not None:
+            self.metrics.add_time('store.proxy', key, timer.elapsed_ns)
+
+        logger.debug(
+            f'Store(name="{self.name}"): PROXY {key} in '
+            f'{timer.elapsed_ms:.3f} ms',
+        )
+        return proxy
+
     def proxy_batch(
         self,
         objs: Sequence[T],
@@ -623,28 +1156,74 @@ class Store(Generic[ConnectorT]):
             A key which can be used to retrieve the object.
 
         Raises:
-            TypeError: If the output of `serializer` is not bytes.
+            TypeError: If the output of `serializer` is not a bytes-like
+                object or a sequence of bytes-like objects.
         """
         timer = Timer()
         timer.start()
 
         with Timer() as serialize_timer:
-            if serializer is not None:
-                obj = serializer(obj)
-            else:
-                obj = self.serializer(obj)
+            payload = self._serialize(obj, serializer)
 
-        if not isinstance(obj, bytes):
-            raise TypeError('Serializer must produce bytes.')
+        with Timer() as connector_timer:
+            key = self.connector.put(payload, **kwargs)
+
+        self._set_finish(key, payload, timer, serialize_timer, connector_timer)
+        return key
+
+    async def aset(
+        self,
+        obj: Any,
+        *,
+        serializer: SerializerT | None = None,
+        **kwargs: Any,
+    ) -> ConnectorKeyT:
+        """Put an object in the store asynchronously.
+
+        See [`set()`][proxystore.store.base.Store.set] for details.
+        """
+        timer = Timer()
+        timer.start()
+
+        with Timer() as serialize_timer:
+            payload = self._serialize(obj, serializer)
 
         with Timer() as connector_timer:
-            key = self.connector.put(obj, **kwargs)
+            key = await self._aconnector('put', payload, **kwargs)
+
+        self._set_finish(key, payload, timer, serialize_timer, connector_timer)
+        return key
+
+    def _serialize(
+        self,
+        obj: Any,
+        serializer: SerializerT | None,
+    ) -> PayloadT:
+        if serializer is not None:
+            payload = serializer(obj)
+        else:
+            payload = self.serializer(obj)
+
+        _check_serialized(payload)
+        return payload
 
+    def _set_finish(
+        self,
+        key: ConnectorKeyT,
+        payload: PayloadT,
+        timer: Timer,
+        serialize_timer: Timer,
+        connector_timer: Timer,
+    ) -> None:
         timer.stop()
         if self.metrics is not None:
             ctime = connector_timer.elapsed_ns
             stime = serialize_timer.elapsed_ns
-            self.metrics.add_attribute('store.set.object_size', key, len(obj))
+            self.metrics.add_attribute(
+                'store.set.object_size',
+                key,
+                nbytes(payload),
+            )
             self.metrics.add_time('store.set.serialize', key, stime)
             self.metrics.add_time('store.set.connector', key, ctime)
             self.metrics.add_time('store.set', key, timer.elapsed_ns)
@@ -653,7 +1232,6 @@ class Store(Generic[ConnectorT]):
             f'Store(name="{self.name}"): SET {key} in '
             f'{timer.elapsed_ms:.3f} ms',
         )
-        return key
 
     def set_batch(
         self,
@@ -675,33 +1253,69 @@ class Store(Generic[ConnectorT]):
             A list of keys which can be used to retrieve the objects.
 
         Raises:
-            TypeError: If the output of `serializer` is not bytes.
+            TypeError: If the output of `serializer` is not a bytes-like
+                object or a sequence of bytes-like objects.
         """
         timer = Timer()
         timer.start()
 
-        def _serialize(obj: Any) -> bytes:
-            if serializer is not None:
-                obj = serializer(obj)
-            else:
-                obj = self.serializer(obj)
+        with Timer() as serialize_timer:
+            payloads = [self._serialize(obj, serializer) for obj in objs]
 
-            if not isinstance(obj, bytes):
-                raise TypeError('Serializer must produce bytes.')
+        with Timer() as connector_timer:
+            keys = self.connector.put_batch(payloads, **kwargs)
+
+        self._set_batch_finish(
+            keys,
+            payloads,
+            timer,
+            serialize_timer,
+            connector_timer,
+        )
+        return keys
 
-            return obj
+    async def aset_batch(
+        self,
+        objs: Sequence[Any],
+        *,
+        serializer: SerializerT | None = None,
+        **kwargs: Any,
+    ) -> list[ConnectorKeyT]:
+        """Put multiple objects in the store asynchronously.
+
+        See [`set_batch()`][proxystore.store.base.Store.set_batch] for details.
+        """
+        timer = Timer()
+        timer.start()
 
         with Timer() as serialize_timer:
-            _objs = list(map(_serialize, objs))
+            payloads = [self._serialize(obj, serializer) for obj in objs]
 
         with Timer() as connector_timer:
-            keys = self.connector.put_batch(_objs, **kwargs)
+            keys = await self._aconnector('put_batch', payloads, **kwargs)
+
+        self._set_batch_finish(
+            keys,
+            payloads,
+            timer,
+            serialize_timer,
+            connector_timer,
+        )
+        return keys
 
+    def _set_batch_finish(
+        self,
+        keys: list[ConnectorKeyT],
+        payloads: list[PayloadT],
+        timer: Timer,
+        serialize_timer: Timer,
+        connector_timer: Timer,
+    ) -> None:
         timer.stop()
         if self.metrics is not None:
             ctime = connector_timer.elapsed_ns
             stime = serialize_timer.elapsed_ns
-            sizes = sum(len(obj) for obj in _objs)
+            sizes = sum(nbytes(payload) for payload in payloads)
             self.metrics.add_attribute(
                 'store.set_batch.object_sizes',
                 keys,
@@ -715,4 +1329,3 @@ class Store(Generic[ConnectorT]):
             f'Store(name="{self.name}"): SET_BATCH ({len(keys)} items) in '
             f'{timer.elapsed_ms:.3f} ms',
         )
-        return keys
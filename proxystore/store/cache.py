@@ -1,39 +1,119 @@
-"""Simple Cache Implementation."""
+"""Cache implementations.
+
+All caches support bounding the number of cached objects (`maxsize`) and,
+optionally, the total size of the cached objects in bytes (`maxbytes`).
+The eviction policy is determined by the cache type and is tracked with the
+policies in [`proxystore.eviction`][proxystore.eviction].
+
+Example:
+    ```python
+    from proxystore.store.cache import get_cache
+
+    cache = get_cache('lfu', maxsize=1000, maxbytes=int(1e9))
+    ```
+"""
 from __future__ import annotations
 
+import abc
+import dataclasses
+import sys
+from typing import Any
 from typing import Generic
 from typing import TypeVar
 
+from proxystore.eviction import LFUPolicy
+from proxystore.eviction import LRUPolicy
+
 KeyT = TypeVar('KeyT')
 ValueT = TypeVar('ValueT')
 
 
-class LRUCache(Generic[KeyT, ValueT]):
-    """Simple LRU Cache.
+@dataclasses.dataclass
+class CacheStats:
+    """Snapshot of cache statistics."""
+
+    hits: int
+    """Number of successful lookups."""
+    misses: int
+    """Number of unsuccessful lookups."""
+    evictions: int
+    """Number of objects evicted to make space for new objects."""
+    size: int
+    """Number of objects in the cache."""
+    nbytes: int
+    """Total size in bytes of objects in the cache."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the dataclass to a [`dict`][dict]."""
+        return dataclasses.asdict(self)
+
+
+class Cache(abc.ABC, Generic[KeyT, ValueT]):
+    """Base cache implementation.
+
+    Subclasses implement the eviction policy by overriding `_on_access()`,
+    `_on_insert()`, `_on_remove()`, and `_victim()`.
 
     Args:
-        maxsize: Maximum number of value to cache.
+        maxsize: Maximum number of objects to cache. If 0, the cache is
+            disabled.
+        maxbytes: Optional maximum total size in bytes of cached objects.
+            Object sizes are provided via the `size` argument of
+            [`set()`][proxystore.store.cache.Cache.set] or estimated with
+            [`sys.getsizeof()`][sys.getsizeof].
 
     Raises:
-        ValueError: If `maxsize <= 0`.
+        ValueError: If `maxsize < 0` or `maxbytes < 0`.
     """
 
-    def __init__(self, maxsize: int = 16) -> None:
+    def __init__(self, maxsize: int = 16, maxbytes: int | None = None) -> None:
         if maxsize < 0:
             raise ValueError('Cache size must by >= 0')
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError('Cache bytes limit must by >= 0')
         self.maxsize = maxsize
+        self.maxbytes = maxbytes
         self.data: dict[KeyT, ValueT] = {}
-        self.lru: list[KeyT] = []
+        self.nbytes = 0
+        self._sizes: dict[KeyT, int] = {}
 
         # Count hits/misses
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @abc.abstractmethod
+    def _on_access(self, key: KeyT) -> None:
+        """Record an access of a cached key."""
+        ...
+
+    @abc.abstractmethod
+    def _on_insert(self, key: KeyT) -> None:
+        """Record the insertion of a new key."""
+        ...
+
+    @abc.abstractmethod
+    def _on_remove(self, key: KeyT) -> None:
+        """Record the removal of a key."""
+        ...
+
+    @abc.abstractmethod
+    def _victim(self) -> KeyT:
+        """Get the next key to evict."""
+        ...
+
+    def _remove(self, key: KeyT) -> None:
+        del self.data[key]
+        self.nbytes -= self._sizes.pop(key)
+        self._on_remove(key)
 
     def evict(self, key: KeyT) -> None:
         """Evict key from cache."""
         if key in self.data:
-            del self.data[key]
-            self.lru.remove(key)
+            self._remove(key)
 
     def exists(self, key: KeyT) -> bool:
         """Check if key is in cache."""
@@ -41,22 +121,149 @@ class LRUCache(Generic[KeyT, ValueT]):
 
     def get(self, key: KeyT, default: ValueT | None = None) -> ValueT | None:
         """Get value for key if it exists else returns default."""
-        if self.exists(key):
-            # Move to front b/c most recently used
+        if key in self.data:
             self.hits += 1
-            self.lru.remove(key)
-            self.lru.insert(0, key)
+            self._on_access(key)
             return self.data[key]
         else:
             self.misses += 1
             return default
 
-    def set(self, key: KeyT, value: ValueT) -> None:
-        """Set key to value."""
+    def set(self, key: KeyT, value: ValueT, size: int | None = None) -> None:
+        """Set key to value.
+
+        Args:
+            key: Key to set.
+            value: Value to cache.
+            size: Size of the value in bytes. Only used if `maxbytes` is set.
+                If `None`, the size is estimated with
+                [`sys.getsizeof()`][sys.getsizeof].
+        """
         if self.maxsize == 0:
             return
-        if len(self.data) >= self.maxsize:
-            lru_key = self.lru.pop()
-            del self.data[lru_key]
-        self.lru.insert(0, key)
+
+        if self.maxbytes is None:
+            size = 0
+        elif size is None:
+            size = sys.getsizeof(value)
+
+        if key in self.data:
+            self._remove(key)
+
+        if self.maxbytes is not None and size > self.maxbytes:
+            # Object could never fit so do not evict everything else.
+            return
+
+        while len(self.data) >= self.maxsize or (
+            self.maxbytes is not None
+            and len(self.data) > 0
+            and self.nbytes + size > self.maxbytes
+        ):
+            self._remove(self._victim())
+            self.evictions += 1
+
         self.data[key] = value
+        self._sizes[key] = size
+        self.nbytes += size
+        self._on_insert(key)
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache statistics."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self.data),
+            nbytes=self.nbytes,
+        )
+
+
+class _PolicyCache(Cache[KeyT, ValueT]):
+    # Cache which delegates eviction bookkeeping to an eviction policy
+    # set by subclasses.
+    _policy: LRUPolicy[KeyT] | LFUPolicy[KeyT]
+
+    def _on_access(self, key: KeyT) -> None:
+        self._policy.access(key)
+
+    def _on_insert(self, key: KeyT) -> None:
+        self._policy.add(key)
+
+    def _on_remove(self, key: KeyT) -> None:
+        self._policy.remove(key)
+
+    def _victim(self) -> KeyT:
+        return self._policy.peek()
+
+
+class LRUCache(_PolicyCache[KeyT, ValueT]):
+    """Least recently used cache.
+
+    Args:
+        maxsize: Maximum number of objects to cache. If 0, the cache is
+            disabled.
+        maxbytes: Optional maximum total size in bytes of cached objects.
+
+    Raises:
+        ValueError: If `maxsize < 0` or `maxbytes < 0`.
+    """
+
+    def __init__(self, maxsize: int = 16, maxbytes: int | None = None) -> None:
+        super().__init__(maxsize, maxbytes)
+        self._policy = LRUPolicy()
+
+
+class LFUCache(_PolicyCache[KeyT, ValueT]):
+    """Least frequently used cache.
+
+    Ties between keys with the same access frequency are broken by recency
+    (i.e., the least recently used key among the least frequently used keys
+    is evicted first).
+
+    Args:
+        maxsize: Maximum number of objects to cache. If 0, the cache is
+            disabled.
+        maxbytes: Optional maximum total size in bytes of cached objects.
+
+    Raises:
+        ValueError: If `maxsize < 0` or `maxbytes < 0`.
+    """
+
+    def __init__(self, maxsize: int = 16, maxbytes: int | None = None) -> None:
+        super().__init__(maxsize, maxbytes)
+        self._policy = LFUPolicy()
+
+
+CACHE_POLICIES: dict[str, type[Cache[Any, Any]]] = {
+    'lru': LRUCache,
+    'lfu': LFUCache,
+}
+"""Mapping of cache policy names to cache types."""
+
+
+def get_cache(
+    policy: str = 'lru',
+    maxsize: int = 16,
+    maxbytes: int | None = None,
+) -> Cache[Any, Any]:
+    """Create a new cache with the specified eviction policy.
+
+    Args:
+        policy: Name of the eviction policy (one of `'lru'` or `'lfu'`).
+        maxsize: Maximum number of objects to cache.
+        maxbytes: Optional maximum total size in bytes of cached objects.
+
+    Returns:
+        Cache instance.
+
+    Raises:
+        ValueError: If `policy` is not a known cache policy.
+    """
+    try:
+        cache_type = CACHE_POLICIES[policy.lower()]
+    except KeyError:
+        raise ValueError(
+            f'Unknown cache policy "{policy}". Expected one of '
+            f'{", ".join(CACHE_POLICIES)}.',
+        ) from None
+    return cache_type(maxsize, maxbytes)
@@ -23,6 +23,8 @@ else:  # pragma: <3.11 cover
     pass
 
 from proxystore.proxy import Proxy
+from proxystore.store.cache import Cache
+from proxystore.store.cache import CacheStats
 from proxystore.store.utils import get_key
 
 ConnectorKeyT = Tuple[Any, ...]
@@ -100,10 +102,17 @@ class Metrics:
 
 
 class StoreMetrics:
-    """Record and query metrics on [`Store`][proxystore.store.base.Store] operations."""  # noqa: E501
+    """Record and query metrics on [`Store`][proxystore.store.base.Store] operations.
 
-    def __init__(self) -> None:
+    Args:
+        cache: Optional cache of the [`Store`][proxystore.store.base.Store]
+            whose statistics are reported by
+            [`cache_stats()`][proxystore.store.metrics.StoreMetrics.cache_stats].
+    """  # noqa: E501
+
+    def __init__(self, cache: Cache[Any, Any] | None = None) -> None:
         self._metrics: dict[int, Metrics] = defaultdict(Metrics)
+        self._cache = cache
 
     def add_attribute(self, name: str, key: KeyT, value: Any) -> None:
         """Add an attribute associated with the key.
@@ -155,6 +164,17 @@ class StoreMetrics:
                 times[key] += value
         return times
 
+    def cache_stats(self) -> CacheStats | None:
+        """Get statistics of the store's cache.
+
+        Returns:
+            Snapshot of the cache hit, miss, and eviction counts and current \
+            cache occupancy or `None` if no cache is being tracked.
+        """
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+
     def get_metrics(self, key_or_proxy: KeyT | ProxyT) -> Metrics | None:
         """Get the metrics associated with a key.
 
@@ -0,0 +1,227 @@
+"""Bounded priority executor for resolving proxies asynchronously.
+
+Each [`Store`][proxystore.store.base.Store] owns a
+[`ResolverExecutor`][proxystore.store.resolver.ResolverExecutor] which
+is used by
+[`StoreFactory.resolve_async()`][proxystore.store.base.StoreFactory.resolve_async]
+and [`Store.prefetch()`][proxystore.store.base.Store.prefetch].
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any
+from typing import Callable
+from typing import Tuple
+from typing import TypeVar
+
+T = TypeVar('T')
+
+# (priority, sequence number, future, function)
+_WorkItem = Tuple[int, int, 'Future[Any]', Callable[[], Any]]
+
+# Set in the worker threads of every resolver executor.
+_worker_local = threading.local()
+
+
+def _run(future: Future[T], function: Callable[[], T]) -> None:
+    try:
+        result = function()
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+class ResolverExecutor:
+    """Bounded priority thread pool executor.
+
+    Unlike a [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor],
+    queued work is ordered by priority (lower values are executed first and
+    ties are executed in submission order) and the number of pending
+    (queued or running) tasks can be bounded. When the bound is reached,
+    [`submit()`][proxystore.store.resolver.ResolverExecutor.submit] blocks
+    until a task completes, providing back-pressure to the caller.
+
+    Worker threads are started lazily as tasks are submitted and exit
+    after being idle for `idle_timeout` seconds so an unused executor does
+    not hold any threads.
+
+    Tasks submitted from within a worker thread of any resolver executor
+    (e.g., resolving a proxy while resolving another proxy) are executed
+    immediately in the calling thread rather than queued. Otherwise, the
+    worker could wait on a task which cannot start because all workers or
+    pending slots are occupied.
+
+    Args:
+        max_workers: Maximum number of worker threads. Defaults to
+            `min(32, os.cpu_count() + 4)`, the same as
+            [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor].
+        max_pending: Maximum number of pending tasks. If `None`, the
+            number of pending tasks is unbounded.
+        idle_timeout: Time in seconds after which an idle worker thread
+            exits.
+
+    Raises:
+        ValueError: If `max_workers` or `max_pending` is less than one.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        idle_timeout: float = 5.0,
+    ) -> None:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers < 1:
+            raise ValueError(
+                f'Max workers must be at least one. Got {max_workers}.',
+            )
+        if max_pending is not None and max_pending < 1:
+            raise ValueError(
+                f'Max pending tasks must be at least one. Got {max_pending}.',
+            )
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.idle_timeout = idle_timeout
+
+        self._queue: list[_WorkItem] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+        self._thread_counter = itertools.count()
+        self._idle = 0
+        self._shutdown = False
+        self._slots = (
+            threading.Semaphore(max_pending)
+            if max_pending is not None
+            else None
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}(max_workers={self.max_workers}, '
+            f'max_pending={self.max_pending})'
+        )
+
+    def submit(
+        self,
+        function: Callable[[], T],
+        *,
+        priority: int = 0,
+    ) -> Future[T]:
+        """Schedule a function to be executed.
+
+        Args:
+            function: Function with no arguments to execute.
+            priority: Priority of the task. Lower values are executed first.
+
+        Returns:
+            Future to the result of `function`.
+
+        Raises:
+            RuntimeError: If the executor has been shutdown.
+        """
+        future: Future[T] = Future()
+        if getattr(_worker_local, 'active', False):
+            future.set_running_or_notify_cancel()
+            _run(future, function)
+            return future
+
+        if self._slots is not None:
+            self._slots.acquire()
+
+        with self._condition:
+            if self._shutdown:
+                if self._slots is not None:
+                    self._slots.release()
+                raise RuntimeError('Cannot submit tasks after shutdown.')
+
+            heapq.heappush(
+                self._queue,
+                (priority, next(self._counter), future, function),
+            )
+            if (
+                len(self._queue) > self._idle
+                and len(self._threads) < self.max_workers
+            ):
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f'resolver-{next(self._thread_counter)}',
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._condition.notify()
+
+        return future
+
+    def _worker(self) -> None:
+        _worker_local.active = True
+        while True:
+            with self._condition:
+                self._idle += 1
+                while len(self._queue) == 0 and not self._shutdown:
+                    if (
+                        not self._condition.wait(self.idle_timeout)
+                        and len(self._queue) == 0
+                        and not self._shutdown
+                    ):
+                        self._idle -= 1
+                        self._threads.remove(threading.current_thread())
+                        return
+                self._idle -= 1
+                if len(self._queue) == 0:
+                    return
+                _, _, future, function = heapq.heappop(self._queue)
+
+            if not future.set_running_or_notify_cancel():
+                self._release()
+                continue
+
+            try:
+                result = function()
+            except BaseException as e:
+                # Release the slot before completing the future because
+                # done callbacks may block on submitting another task.
+                self._release()
+                future.set_exception(e)
+            else:
+                self._release()
+                future.set_result(result)
+
+    def _release(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    def shutdown(
+        self,
+        wait: bool = True,
+        cancel_futures: bool = False,
+    ) -> None:
+        """Shutdown the executor.
+
+        Args:
+            wait: Wait for pending tasks to finish and the worker threads
+                to exit.
+            cancel_futures: Cancel queued tasks that have not started.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                while len(self._queue) > 0:
+                    _, _, future, _ = heapq.heappop(self._queue)
+                    future.cancel()
+                    self._release()
+            self._condition.notify_all()
+            threads = list(self._threads)
+
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
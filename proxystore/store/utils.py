@@ -2,17 +2,22 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Sequence
 from typing import Tuple
 from typing import TypeVar
 
 from proxystore.proxy import is_resolved
 from proxystore.proxy import Proxy
+from proxystore.proxy import resolve
 from proxystore.store import base
+from proxystore.store.exceptions import ProxyResolveMissingKeyError
 from proxystore.store.exceptions import ProxyStoreFactoryError
 
 T = TypeVar('T')
 ConnectorKeyT = Tuple[Any, ...]
 
+_MISSING = object()
+
 
 def get_key(proxy: Proxy[T]) -> ConnectorKeyT:
     """Extract the key from the proxy's factory.
@@ -64,3 +69,75 @@ def resolve_async(proxy: Proxy[T]) -> None:
     """
     if not is_resolved(proxy):
         proxy.__factory__.resolve_async()
+
+
+def resolve_batch(proxies: Sequence[Proxy[Any]]) -> None:
+    """Resolve a batch of proxies.
+
+    Unresolved proxies created by a
+    [`Store`][proxystore.store.base.Store] are grouped by store and the
+    objects of each group are retrieved with a single call to
+    [`Store.get_batch()`][proxystore.store.base.Store.get_batch] rather
+    than one request per proxy. Other proxies are resolved individually.
+
+    ```python
+    from proxystore.store.utils import resolve_batch
+
+    proxies = store.proxy_batch([...])
+    resolve_batch(proxies)
+    ```
+
+    Args:
+        proxies: Sequence of proxies to resolve.
+
+    Raises:
+        ProxyResolveMissingKeyError: If the key associated with a proxy
+            does not exist in its store.
+    """
+    groups: dict[
+        tuple[str, int],
+        tuple[base.Store[Any], list[base.StoreFactory[Any, Any]]],
+    ] = {}
+    for proxy in proxies:
+        if is_resolved(proxy):
+            continue
+        factory = proxy.__factory__
+        # Factories already resolving asynchronously are left to complete
+        # on their own.
+        if isinstance(factory, base.StoreFactory) and not factory.resolving:
+            store = factory.get_store()
+            # Factories can override the deserializer of the store so
+            # group by the deserializer as well.
+            group = (store.name, id(factory.deserializer))
+            groups.setdefault(group, (store, []))[1].append(factory)
+
+    results: list[tuple[base.StoreFactory[Any, Any], Any]] = []
+    for store, factories in groups.values():
+        keys = [factory.key for factory in factories]
+        objs = store.get_batch(
+            keys,
+            deserializer=factories[0].deserializer,
+            default=_MISSING,
+        )
+        results.extend(zip(factories, objs))
+
+    # Check every key exists before evicting objects or completing any
+    # factories so a missing key leaves all proxies unchanged.
+    for factory, obj in results:
+        if obj is _MISSING:
+            store = factory.get_store()
+            raise ProxyResolveMissingKeyError(
+                factory.key,
+                type(store),
+                store.name,
+            )
+
+    for factory, obj in results:
+        if factory.evict:
+            factory.get_store().evict(factory.key)
+        # Resolving the proxy returns the object without another request
+        # to the store.
+        factory.set_result(obj)
+
+    for proxy in proxies:
+        resolve(proxy)
@@ -1,32 +1,157 @@
 """General purpose utility functions."""
 from __future__ import annotations
 
+import asyncio
 import decimal
 import importlib
 import os
 import random
 import re
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
 from typing import Generator
+from typing import Sequence
+from typing import TypeVar
+
+from proxystore.serialize import BytesLike
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def as_buffers(data: BytesLike | Sequence[BytesLike]) -> list[memoryview]:
+    """Get byte views of a single- or multi-part payload without copying.
+
+    Args:
+        data: A bytes-like object or a sequence of bytes-like objects.
+
+    Returns:
+        List of one-dimensional byte [`memoryview`][memoryview] instances.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = [data]
+    return [memoryview(buffer).cast('B') for buffer in data]
+
+
+def nbytes(data: BytesLike | Sequence[BytesLike]) -> int:
+    """Get the total size in bytes of a single- or multi-part payload."""
+    return sum(buffer.nbytes for buffer in as_buffers(data))
+
+
+def join_buffers(data: BytesLike | Sequence[BytesLike]) -> bytes:
+    """Join a single- or multi-part payload into [`bytes`][bytes].
+
+    Note:
+        No copy is made if `data` is already [`bytes`][bytes].
+    """
+    if isinstance(data, bytes):
+        return data
+    return b''.join(as_buffers(data))
 
 
 def chunk_bytes(
-    data: bytes,
+    data: BytesLike | Sequence[BytesLike],
     chunk_size: int,
-) -> Generator[bytes, None, None]:
+) -> Generator[BytesLike, None, None]:
     """Yield chunks of binary data.
 
+    Multi-part data is chunked one part at a time so chunks never span
+    multiple parts and no parts are joined.
+
     Args:
-        data: Data to be chunked.
+        data: Data to be chunked. Can be a bytes-like object or a sequence
+            of bytes-like objects.
         chunk_size: Chunk size in bytes.
 
     Returns:
-        Generator that yields chunks of bytes.
+        Generator that yields chunks of bytes. If `data` is not \
+        [`bytes`][bytes], the chunks are zero-copy \
+        [`memoryview`][memoryview] slices.
+    """
+    buffers: Sequence[BytesLike] = (
+        [data] if isinstance(data, bytes) else as_buffers(data)
+    )
+    for buffer in buffers:
+        length = len(buffer)
+        for index in range(0, length, chunk_size):
+            yield buffer[index : min(index + chunk_size, length)]
+
+
+async def achunk_bytes(
+    data: BytesLike | Sequence[BytesLike],
+    chunk_size: int,
+) -> AsyncGenerator[BytesLike, None]:
+    """Asynchronously yield chunks of binary data.
+
+    Async version of [`chunk_bytes()`][proxystore.utils.chunk_bytes].
+    """
+    for chunk in chunk_bytes(data, chunk_size):
+        yield chunk
+
+
+def map_concurrent(
+    function: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int,
+) -> list[R]:
+    """Apply a blocking function to items concurrently in threads.
+
+    Useful for overlapping the latency of independent I/O bound operations
+    (e.g., in the `get_batch()` or `put_batch()` methods of a connector).
+
+    Args:
+        function: Function to apply to each item.
+        items: Sequence of items.
+        max_workers: Maximum number of concurrent calls to `function`. If
+            `max_workers <= 1` or there is only one item, `function` is
+            applied sequentially in the calling thread.
+
+    Returns:
+        List of results with the same order as `items`.
+
+    Raises:
+        Exception: The first exception raised by `function`.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(min(max_workers, len(items))) as pool:
+        return list(pool.map(function, items))
+
+
+async def gather_concurrent(
+    function: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    max_concurrency: int,
+) -> list[R]:
+    """Await a coroutine function on items with bounded concurrency.
+
+    The async equivalent of
+    [`map_concurrent()`][proxystore.utils.map_concurrent].
+
+    Args:
+        function: Coroutine function to apply to each item.
+        items: Sequence of items.
+        max_concurrency: Maximum number of coroutines awaited concurrently.
+
+    Returns:
+        List of results with the same order as `items`.
+
+    Raises:
+        Exception: The first exception raised by `function`.
     """
-    length = len(data)
-    for index in range(0, length, chunk_size):
-        yield data[index : min(index + chunk_size, length)]
+    # Semaphore is created within the coroutine so it is bound to the
+    # running event loop in Python 3.9 and older.
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _limited(item: T) -> R:
+        async with semaphore:
+            return await function(item)
+
+    return list(await asyncio.gather(*(_limited(item) for item in items)))
 
 
 def create_key(obj: Any) -> str:
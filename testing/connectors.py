@@ -35,6 +35,7 @@ from proxystore.utils import hostname
 from testing.mocked.globus import MockDeleteData
 from testing.mocked.globus import MockTransferClient
 from testing.mocked.globus import MockTransferData
+from testing.mocked.redis import MockAsyncStrictRedis
 from testing.mocked.redis import MockStrictRedis
 from testing.mocking import mock_multiprocessing
 from testing.utils import open_port
@@ -180,7 +181,19 @@ def redis_connector() -> Generator[ConnectorInfo, None, None]:
     def create_mocked_redis(*args: Any, **kwargs: Any) -> MockStrictRedis:
         return MockStrictRedis(MOCK_REDIS_CACHE, *args, **kwargs)
 
-    with mock.patch('redis.StrictRedis', side_effect=create_mocked_redis):
+    def create_mocked_async_redis(
+        *args: Any,
+        **kwargs: Any,
+    ) -> MockAsyncStrictRedis:
+        return MockAsyncStrictRedis(MOCK_REDIS_CACHE, *args, **kwargs)
+
+    with mock.patch(
+        'redis.StrictRedis',
+        side_effect=create_mocked_redis,
+    ), mock.patch(
+        'redis.asyncio.StrictRedis',
+        side_effect=create_mocked_async_redis,
+    ):
         yield ConnectorInfo(
             RedisConnector,
             {'hostname': redis_host, 'port': redis_port},
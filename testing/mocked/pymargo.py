@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Sequence
 
 from proxystore.serialize import serialize
 
@@ -10,7 +11,7 @@ client = 'client'
 server = 'server'
 
 # server dictionary
-data_dict = {}
+data_dict: dict[str, Any] = {}
 
 
 class MargoException(Exception):  # pragma: no cover  # noqa: N818
@@ -90,11 +91,15 @@ class Engine:
 
         if bulk_op == 'pull':
             assert isinstance(local_bulk.data, bytearray)
-            local_bulk.data[:] = bulk_str.data
+            local_bulk.data[lo : lo + bulk_size] = bulk_str.data[
+                oo : oo + bulk_size
+            ]
 
         else:
             assert isinstance(bulk_str.data, bytearray)
-            bulk_str.data[:] = local_bulk.data
+            bulk_str.data[oo : oo + bulk_size] = local_bulk.data[
+                lo : lo + bulk_size
+            ]
 
     def register(self, funcname: str, *args: Any) -> RPC:
         """Mock register.
@@ -120,11 +125,20 @@ class RPC:
         self,
         array_str: Bulk,
         size: int,
-        key: str,
+        key: str | Sequence[tuple[str, int]],
     ) -> Any:
-        """Mockfunc implementation."""
+        """Mockfunc implementation.
+
+        The batch RPCs are passed a sequence of `(key, size)` pairs rather
+        than a single key.
+        """
         from proxystore.connectors.dim.utils import Status
 
+        if self.name in ('set_batch', 'get_batch'):
+            assert not isinstance(key, str)
+            return self._batch(array_str, key)
+
+        assert isinstance(key, str)
         if self.name == 'set':
             data_dict[key] = array_str.data
             return serialize(Status(True, None))
@@ -156,6 +170,24 @@ class RPC:
             array_str.data[:] = serialize(key in data_dict)
             return serialize(Status(True, None))
 
+    def _batch(self, array_str: Bulk, keys: Sequence[tuple[str, int]]) -> Any:
+        from proxystore.connectors.dim.utils import Status
+
+        found = []
+        offset = 0
+        for key, obj_size in keys:
+            region = slice(offset, offset + obj_size)
+            offset += obj_size
+            if self.name == 'set_batch':
+                data_dict[key] = bytes(array_str.data[region])
+            elif key in data_dict:
+                assert isinstance(array_str.data, bytearray)
+                array_str.data[region] = data_dict[key]
+            found.append(key in data_dict)
+        if self.name == 'set_batch':
+            return serialize(Status(True, None))
+        return serialize(found)
+
 
 class MockBulkMod:
     """MockBulkMod implementation."""
@@ -9,6 +9,15 @@ class MockStrictRedis:
 
     def __init__(self, data: dict[str, Any], *args, **kwargs):
         self.data = data
+        self.closed = False
+
+    def append(self, key: str, value: bytes) -> None:
+        """Append value to key."""
+        self.data[key] = self.data.get(key, b'') + bytes(value)
+
+    def close(self) -> None:
+        """Close the client."""
+        self.closed = True
 
     def delete(self, key: str) -> None:
         """Delete key."""
@@ -34,6 +43,62 @@ class MockStrictRedis:
         for key, value in values.items():
             self.set(key, value)
 
+    def execute(self) -> None:
+        """Execute pipelined commands (commands are executed eagerly)."""
+        pass
+
+    def pipeline(self, transaction: bool = True) -> MockStrictRedis:
+        """Get a pipeline (commands are executed eagerly)."""
+        return self
+
     def set(self, key: str, value: bytes) -> None:
         """Set value in MockStrictRedis."""
-        self.data[key] = value
+        self.data[key] = bytes(value)
+
+
+class MockAsyncPipeline(MockStrictRedis):
+    """Mock redis.asyncio Pipeline."""
+
+    async def execute(self) -> None:  # type: ignore[override]
+        """Execute pipelined commands (commands are executed eagerly)."""
+        pass
+
+
+class MockAsyncStrictRedis:
+    """Mock redis.asyncio StrictRedis."""
+
+    def __init__(self, data: dict[str, Any], *args, **kwargs):
+        self._redis = MockStrictRedis(data)
+        self.closed = False
+
+    async def aclose(self) -> None:
+        """Close the client."""
+        self.closed = True
+
+    async def delete(self, key: str) -> None:
+        """Delete key."""
+        self._redis.delete(key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists."""
+        return self._redis.exists(key)
+
+    async def get(self, key: str) -> bytes | None:
+        """Get value with key."""
+        return self._redis.get(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        """Get list of values from keys."""
+        return self._redis.mget(keys)
+
+    async def mset(self, values: dict[str, bytes]) -> None:
+        """Set list of values."""
+        self._redis.mset(values)
+
+    def pipeline(self, transaction: bool = True) -> MockAsyncPipeline:
+        """Get a pipeline (commands are executed eagerly)."""
+        return MockAsyncPipeline(self._redis.data)
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Set value."""
+        self._redis.set(key, value)
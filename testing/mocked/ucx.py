@@ -1,13 +1,21 @@
-"""UCX mocker implementation."""
+"""UCX mocker implementation.
+
+Endpoints are mocked as in-process pairs with a queue of messages per tag
+in each direction. Creating an endpoint to a port without a listener
+starts an in-process `UCXServer` to emulate the server process spawned by
+the `UCXConnector`.
+"""
 from __future__ import annotations
 
+import asyncio
 from typing import Any
+from typing import Callable
+from typing import Coroutine
 
-from proxystore.serialize import deserialize
-from proxystore.serialize import SerializationError
-from proxystore.serialize import serialize
-
-data = {}
+_listeners: dict[int, Callable[[Any], Coroutine[Any, Any, None]]] = {}
+_servers: dict[int, Any] = {}
+_handlers: set[asyncio.Task[None]] = set()
+_CLOSED = object()
 
 
 class Lib:
@@ -28,91 +36,92 @@ class Lib:
 _libs = Lib()
 
 
+class exceptions:  # noqa: N801
+    """Mock ucp exceptions implementation."""
+
+    class UCXError(Exception):
+        """Mock Exception implementation."""
+
+        pass
+
+    class UCXCanceled(UCXError):  # noqa: N818
+        """Mock Exception implementation."""
+
+        pass
+
+
 class MockEndpoint:
     """Mock Endpoint."""
 
-    last_event: str
-    key: str
-    response: str | int
-    req: Any
-    server: Any
+    peer: MockEndpoint | None
     is_closed: bool
 
-    def __init__(self, server=False):
-        self.key = ''
-        self.last_event = ''
-        self.response = ''
-        self.req = None
-        self.server = server
+    def __init__(self) -> None:
+        self.peer = None
         self.is_closed = False
-
-    async def send_obj(self, req: Any) -> None:
-        """Mock the `ucp.send_obj` function.
-
-        Args:
-            req: The object to communicate.
-        """
-        self.req = None
-        if self.server:
-            self.req = req
-            return self.req
-
-        try:
-            event = deserialize(req)
-        except SerializationError:
-            event = {}
-            event['op'] = 'exists'
-            event['key'] = ''
-            self.response = 1
-
-        if event['op'] == 'set':
-            data[event['key']] = event['data']
-
-        self.key = event['key']
-        self.last_event = event['op']
-
-    async def recv_obj(self) -> Any:
-        """Mock the `ucp.recv_obj` function."""
-        from proxystore.connectors.dim.utils import Status
-
-        if self.req is not None:
-            return self.req
-
-        if self.last_event == 'get':
-            try:
-                return data[self.key]
-            except KeyError as e:
-                return serialize(Status(success=False, error=e))
-        elif self.last_event == 'exists':
-            if self.key != '':
-                return serialize(self.key in data)
-            else:
-                return self.response
-        elif self.last_event == 'evict':
-            data.pop(self.key, None)
-            return serialize(Status(success=True, error=None))
-        return serialize(True)
+        self._queues: dict[Any, asyncio.Queue[Any]] = {}
+
+    def _queue(self, tag: Any) -> asyncio.Queue[Any]:
+        if tag not in self._queues:
+            self._queues[tag] = asyncio.Queue()
+        return self._queues[tag]
+
+    async def send(self, buffer: Any, tag: Any = None) -> None:
+        """Mock the `ucp.Endpoint.send` function."""
+        if self.is_closed or self.peer is None or self.peer.is_closed:
+            raise exceptions.UCXCanceled('Endpoint is closed.')
+        self.peer._queue(tag).put_nowait(bytes(buffer))
+
+    async def recv(self, buffer: Any, tag: Any = None) -> None:
+        """Mock the `ucp.Endpoint.recv` function."""
+        message = await self._queue(tag).get()
+        if message is _CLOSED:
+            raise exceptions.UCXCanceled('Endpoint is closed.')
+        view = memoryview(buffer).cast('B')
+        if len(message) != view.nbytes:
+            raise exceptions.UCXError(
+                f'length mismatch: {len(message)} (got) != '
+                f'{view.nbytes} (expected)',
+            )
+        view[:] = message
 
     async def close(self) -> None:
         """Mock close implementation."""
         self.is_closed = True
+        for endpoint in (self, self.peer):
+            if endpoint is not None:
+                for queue in endpoint._queues.values():
+                    queue.put_nowait(_CLOSED)
+                # Wake up receives on the default tag which have not
+                # been posted yet.
+                endpoint._queue(None).put_nowait(_CLOSED)
+        # Let the peer observe the close.
+        await asyncio.sleep(0)
 
     def closed(self) -> bool:
         """Mock closed implementation."""
         return self.is_closed
 
 
+def endpoint_pair() -> tuple[MockEndpoint, MockEndpoint]:
+    """Create a pair of connected mock endpoints."""
+    client, server = MockEndpoint(), MockEndpoint()
+    client.peer, server.peer = server, client
+    return client, server
+
+
 class Listener:
     """Mock listener implementation."""
 
     called: bool
 
-    def __init__(self) -> None:
+    def __init__(self, port: int) -> None:
+        self.port = port
         self.called = False
 
     def close(self) -> None:
         """Close implementation."""
-        pass
+        _listeners.pop(self.port, None)
 
     def closed(self) -> bool:
         """Mock closed."""
@@ -130,7 +139,8 @@ def create_listener(handler: Any, port: int) -> Any:
         port: The communication port.
 
     """
-    return Listener()
+    _listeners[port] = handler
+    return Listener(port)
 
 
 async def create_endpoint(
@@ -138,4 +148,16 @@ async def create_endpoint(
     port: int,
 ) -> MockEndpoint:
     """Create endpoint mock implementation."""
-    return MockEndpoint()
+    if port not in _listeners:
+        from proxystore.connectors.dim.ucx import UCXServer
+
+        server = _servers.setdefault(port, UCXServer(host, port))
+        handler = server.handler
+    else:
+        handler = _listeners[port]
+
+    client, server_endpoint = endpoint_pair()
+    task = asyncio.ensure_future(handler(server_endpoint))
+    _handlers.add(task)
+    task.add_done_callback(_handlers.discard)
+    return client
@@ -17,6 +17,7 @@ else:  # pragma: <3.8 cover
 from proxystore.p2p import messages
 from proxystore.p2p.client import connect
 from proxystore.p2p.connection import PeerConnection
+from proxystore.p2p.connection import StreamedMessage
 from testing.compat import randbytes
 
 
@@ -34,10 +35,10 @@ async def get_connection(
 
     if actor == 'producer':
         await connection.send_offer(remote_uuid)
-        answer = messages.decode(await websocket.recv())  # type: ignore
+        answer = messages.decode(await websocket.recv())
         await connection.handle_server_message(answer)  # type: ignore
     elif actor == 'consumer':
-        offer = messages.decode(await websocket.recv())  # type: ignore
+        offer = messages.decode(await websocket.recv())
         await connection.handle_server_message(offer)  # type: ignore
 
     await connection.ready()
@@ -56,7 +57,7 @@ async def amain(
     """Measure transfer speed between producer and consumer."""
     connection = await get_connection(actor, relay, channels)
 
-    data: str | bytes
+    data: str | bytes | bytearray | StreamedMessage
     if actor == 'producer':
         data = randbytes(size)
         start = time.perf_counter()
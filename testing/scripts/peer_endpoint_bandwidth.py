@@ -22,12 +22,14 @@ from testing.compat import randbytes
 async def get_endpoint(
     actor: Literal['local', 'remote'],
     relay: str,
+    direct_host: str | None = None,
 ) -> tuple[Endpoint, uuid.UUID | None]:
     """Return a ready PeerConnection."""
     endpoint = await Endpoint(
         name=socket.gethostname(),
         uuid=uuid.uuid4(),
         relay_server=relay,
+        peer_direct_host=direct_host,
     )
 
     print(f'Endpoint uuid: {endpoint.uuid}')
@@ -43,9 +45,10 @@ async def amain(
     actor: Literal['local', 'remote'],
     size: int,
     relay: str,
+    direct_host: str | None = None,
 ) -> None:
     """Measure transfer speed between producer and consumer."""
-    endpoint, target_uuid = await get_endpoint(actor, relay)
+    endpoint, target_uuid = await get_endpoint(actor, relay, direct_host)
 
     if actor == 'local':
         print('Testing connection to remote')
@@ -101,6 +104,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         '--relay',
         help='relay server address',
     )
+    parser.add_argument(
+        '--direct-host',
+        help='accept direct TCP connections from the peer on this host',
+    )
     parser.add_argument(
         '--no-uvloop',
         action='store_true',
@@ -129,7 +136,10 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     logging.basicConfig()
 
-    asyncio.run(amain(args.actor, args.size, args.relay), debug=args.debug)
+    asyncio.run(
+        amain(args.actor, args.size, args.relay, args.direct_host),
+        debug=args.debug,
+    )
 
     return 0
 
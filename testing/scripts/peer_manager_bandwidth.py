@@ -14,6 +14,7 @@ if sys.version_info >= (3, 8):  # pragma: >=3.8 cover
 else:  # pragma: <3.8 cover
     from typing_extensions import Literal
 
+from proxystore.p2p.connection import StreamedMessage
 from proxystore.p2p.manager import PeerManager
 from testing.compat import randbytes
 
@@ -50,7 +51,7 @@ async def amain(
     """Measure transfer speed between producer and consumer."""
     manager, remote_uuid = await get_manager(actor, relay)
 
-    data: str | bytes
+    data: str | bytes | bytearray | StreamedMessage
     if actor == 'producer':
         data = randbytes(size)
         start = time.perf_counter()
@@ -40,6 +40,7 @@ from proxystore.store.redis import RedisStore
 from testing.mocked.globus import MockDeleteData
 from testing.mocked.globus import MockTransferClient
 from testing.mocked.globus import MockTransferData
+from testing.mocked.redis import MockAsyncStrictRedis
 from testing.mocked.redis import MockStrictRedis
 
 FIXTURE_LIST = [
@@ -147,7 +148,19 @@ def redis_store() -> Generator[StoreInfo, None, None]:
     def create_mocked_redis(*args: Any, **kwargs: Any) -> MockStrictRedis:
         return MockStrictRedis(MOCK_REDIS_CACHE, *args, **kwargs)
 
-    with mock.patch('redis.StrictRedis', side_effect=create_mocked_redis):
+    def create_mocked_async_redis(
+        *args: Any,
+        **kwargs: Any,
+    ) -> MockAsyncStrictRedis:
+        return MockAsyncStrictRedis(MOCK_REDIS_CACHE, *args, **kwargs)
+
+    with mock.patch(
+        'redis.StrictRedis',
+        side_effect=create_mocked_redis,
+    ), mock.patch(
+        'redis.asyncio.StrictRedis',
+        side_effect=create_mocked_async_redis,
+    ):
         yield StoreInfo(
             RedisStore,
             'redis',
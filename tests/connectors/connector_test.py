@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
+
+from proxystore.connectors.connector import AsyncConnector
 from proxystore.connectors.connector import Connector
 
 
@@ -43,3 +46,42 @@ def test_connector_config(connectors: Connector[Any]) -> None:
 
     assert isinstance(new_connector, Connector)
     assert type(connector) == type(new_connector)
+
+
+def test_connector_buffer_ops(connectors: Connector[Any]) -> None:
+    connector = connectors
+    values = [
+        bytearray(b'value1'),
+        memoryview(b'value2'),
+        [b'val', memoryview(b'ue'), bytearray(b'3')],
+    ]
+
+    key = connector.put(values[-1])
+    assert connector.get(key) == b'value3'
+    connector.evict(key)
+
+    keys = connector.put_batch(values)
+    assert connector.get_batch(keys) == [b'value1', b'value2', b'value3']
+    for key in keys:
+        connector.evict(key)
+
+
+@pytest.mark.asyncio()
+async def test_connector_async_ops(connectors: Connector[Any]) -> None:
+    connector = connectors
+    if not isinstance(connector, AsyncConnector):
+        pytest.skip(f'{type(connector).__name__} is not an AsyncConnector.')
+
+    value = b'test_value'
+    key = await connector.aput(value)
+    assert await connector.aget(key) == value
+    assert await connector.aexists(key)
+    await connector.aevict(key)
+    assert not await connector.aexists(key)
+    assert await connector.aget(key) is None
+
+    values = [b'value1', [b'val', memoryview(b'ue2')]]
+    keys = await connector.aput_batch(values)
+    assert await connector.aget_batch(keys) == [b'value1', b'value2']
+    for key in keys:
+        await connector.aevict(key)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import pytest
 
+from proxystore.connectors.dim.margo import BufferPool
 from proxystore.connectors.dim.margo import MargoConnector
 from proxystore.connectors.dim.margo import MargoServer
 from proxystore.connectors.dim.margo import when_finalize
@@ -82,5 +83,50 @@ def test_margo_server(margo_server) -> None:
     assert deserialize(h.response).success
 
 
+def test_margo_server_batch(margo_server) -> None:
+    objs = [b'abc', b'', b'defgh']
+    keys = [(f'key{i}', len(obj)) for i, obj in enumerate(objs)]
+    h = Handle()
+
+    margo_server.set_batch(h, Bulk(bytearray(b''.join(objs))), 8, keys)
+    assert deserialize(h.response).success
+    assert [margo_server.data[key] for key, _ in keys] == objs
+
+    buff = bytearray(10)
+    request = [keys[2], ('missing', 2), keys[0]]
+    margo_server.get_batch(h, Bulk(buff), len(buff), request)
+    assert deserialize(h.response) == [True, False, True]
+    assert buff[:5] == b'defgh'
+    assert buff[7:] == b'abc'
+
+    # Evicting and overwriting objects returns buffers to the pool.
+    idle = margo_server.pool.idle_bytes
+    margo_server.evict(h, '', 0, 'key0')
+    margo_server.set(h, Bulk(bytearray(b'xyz')), 3, 'key2')
+    assert margo_server.data['key2'] == b'xyz'
+    assert margo_server.pool.idle_bytes == idle + 64
+
+
+def test_buffer_pool() -> None:
+    pool = BufferPool(Engine('tcp://127.0.0.1:0'), max_idle_bytes=256)
+
+    buffer, handle = pool.acquire(100)
+    assert len(buffer) == 112
+    assert len(pool.acquire(0)[0]) == 64
+    with pytest.raises(ValueError, match='non-negative'):
+        pool.acquire(-1)
+
+    pool.release(buffer, handle)
+    assert pool.idle_bytes == 112
+    assert pool.acquire(97) == (buffer, handle)
+    assert pool.idle_bytes == 0
+
+    # Buffers beyond the idle limit are not kept.
+    first, second = pool.acquire(200), pool.acquire(200)
+    pool.release(*first)
+    pool.release(*second)
+    assert pool.idle_bytes == 224
+
+
 def test_finalize() -> None:
     when_finalize()
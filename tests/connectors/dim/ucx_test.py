@@ -13,13 +13,15 @@ else:  # pragma: <3.8 cover
     from asynctest import CoroutineMock as AsyncMock
 
 import pytest
+import ucp
 
+from proxystore.connectors.dim.ucx import _Op
+from proxystore.connectors.dim.ucx import _PeerEndpoint
+from proxystore.connectors.dim.ucx import _Status
 from proxystore.connectors.dim.ucx import launch_server
 from proxystore.connectors.dim.ucx import UCXConnector
 from proxystore.connectors.dim.ucx import UCXServer
-from proxystore.serialize import deserialize
-from proxystore.serialize import serialize
-from testing.mocked.ucx import MockEndpoint
+from testing.mocked.ucx import endpoint_pair
 from testing.utils import open_port
 
 ENCODING = 'UTF-8'
@@ -35,14 +37,6 @@ def ucx_server(ucx_connector):
     server.close()
 
 
-async def execute_handler(obj: Any, server: UCXServer) -> Any:
-    ep = MockEndpoint(server=True)
-    await ep.send_obj(obj)
-    await server.handler(ep)
-    ret = await ep.recv_obj()
-    return ret
-
-
 def test_ucx_connector(ucx_connector) -> None:
     ucx_connector.kwargs['port'] = open_port()
     with ucx_connector.ctx():
@@ -95,41 +89,79 @@ def test_ucx_server(ucx_server) -> None:
     key = 'hello'
     val = bytes('world', encoding=ENCODING)
 
-    # server_started call
-    ret = asyncio.run(execute_handler(bytes(1), ucx_server))
-    assert ret == bytes(1)
-
-    obj = serialize({'key': key, 'data': val, 'op': 'set'})
-    ret = deserialize(asyncio.run(execute_handler(obj, ucx_server)))
-    assert ret.success
-    assert ucx_server.data[key] == val
-
-    data = ucx_server.get(key)
-    assert data == val
-
-    obj = serialize({'key': key, 'data': '', 'op': 'get'})
-    ret = asyncio.run(execute_handler(obj, ucx_server))
-    assert ret == val
-
-    data = ucx_server.get('test')
-    assert not data.success
-
-    ret = ucx_server.exists(key)
-    assert ret
-
-    obj = serialize({'key': 'test', 'data': '', 'op': 'exists'})
-    ret = deserialize(asyncio.run(execute_handler(obj, ucx_server)))
-    assert not ret
-    ret = ucx_server.exists('test')
-    assert not ret
-
-    obj = serialize({'key': key, 'data': '', 'op': 'evict'})
-    ret = deserialize(asyncio.run(execute_handler(obj, ucx_server)))
-    assert ret.success
+    assert ucx_server.set(key, val).success
+    assert ucx_server.get(key) == val
+    assert not ucx_server.get('test').success
+    assert ucx_server.exists(key)
+    assert not ucx_server.exists('test')
+
+    assert ucx_server.process(_Op.PING, '', b'') == (_Status.OK, b'')
+    assert ucx_server.process(_Op.SET, 'k', b'v') == (_Status.OK, b'')
+    assert ucx_server.process(_Op.GET, 'k', b'') == (_Status.OK, b'v')
+    assert ucx_server.process(_Op.EXISTS, 'k', b'') == (_Status.OK, b'')
+    assert ucx_server.process(_Op.EVICT, 'k', b'') == (_Status.OK, b'')
+    assert ucx_server.process(_Op.GET, 'k', b'') == (_Status.MISSING, b'')
+    assert ucx_server.process(_Op.EXISTS, 'k', b'') == (_Status.MISSING, b'')
+    assert ucx_server.evict('test').success
+
+    status, message = ucx_server.process(255, key, b'')
+    assert status == _Status.ERROR
+    assert b'Unknown operation' in message
+
+
+def test_ucx_server_handler(ucx_server) -> None:
+    async def _main() -> None:
+        client, server = endpoint_pair()
+        handler = asyncio.ensure_future(ucx_server.handler(server))
+        peer = _PeerEndpoint(client)
+
+        # Requests are pipelined and responses are matched by tag.
+        results = await asyncio.gather(
+            peer.request(1, _Op.SET, b'key', b'value'),
+            peer.request(2, _Op.GET, b'key', size_hint=5),
+            peer.request(3, _Op.GET, b'missing'),
+            peer.request(4, _Op.EXISTS, b'key'),
+        )
+        assert results == [
+            (_Status.OK, bytearray()),
+            (_Status.OK, bytearray(b'value')),
+            (_Status.MISSING, bytearray()),
+            (_Status.OK, bytearray()),
+        ]
+
+        # Size hints which do not match the object are ignored.
+        assert await peer.request(5, _Op.GET, b'key', size_hint=100) == (
+            _Status.OK,
+            bytearray(b'value'),
+        )
+
+        await peer.close()
+        await handler
+
+    asyncio.run(_main())
+
+
+def test_ucx_connector_reuses_endpoints(ucx_connector) -> None:
+    ucx_connector.kwargs['port'] = open_port()
+    with ucx_connector.ctx():
+        connector = UCXConnector(**ucx_connector.kwargs)
 
-    ret = ucx_server.evict('test')
-    assert ret.success
+        with mock.patch(
+            'ucp.create_endpoint',
+            wraps=ucp.create_endpoint,
+        ) as mock_create:
+            keys = connector.put_batch([b'a', b'bc', b'def'])
+            assert connector.get_batch(keys) == [b'a', b'bc', b'def']
+            assert connector.exists(keys[0])
+            connector.evict(keys[0])
+            assert connector.get(keys[0]) is None
+            assert mock_create.call_count == 1
+
+        with mock.patch.object(
+            UCXServer,
+            'process',
+            return_value=(_Status.ERROR, b'oops'),
+        ), pytest.raises(RuntimeError, match='oops'):
+            connector.exists(keys[0])
 
-    obj = serialize({'key': key, 'data': '', 'op': 'sum'})
-    with pytest.raises(AssertionError):
-        ret = asyncio.run(execute_handler(obj, ucx_server))
+        connector.close()
@@ -0,0 +1,36 @@
+"""DIM utilities unit tests."""
+from __future__ import annotations
+
+import pytest
+
+from proxystore.connectors.dim.utils import BufferPool
+from proxystore.connectors.dim.utils import size_class
+
+
+def test_size_class() -> None:
+    assert size_class(0) == 64
+    assert size_class(64) == 64
+    assert size_class(65) == 80
+    assert size_class(1024) == 1024
+    assert size_class(1025) == 1280
+    for size in (100, 1000, 12345, 10**6):
+        assert size <= size_class(size) < size * 1.25
+
+    with pytest.raises(ValueError, match='non-negative'):
+        size_class(-1)
+
+
+def test_buffer_pool() -> None:
+    pool = BufferPool(max_idle_bytes=1024)
+    buffer = pool.acquire(100)
+    assert len(buffer) == size_class(100)
+
+    pool.release(buffer)
+    assert pool.idle_bytes == len(buffer)
+    # Buffers of the same size class are reused
+    assert pool.acquire(99) is buffer
+    assert pool.idle_bytes == 0
+
+    # Buffers beyond the idle limit are not kept
+    pool.release(pool.acquire(2000))
+    assert pool.idle_bytes == 0
@@ -2,12 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+import struct
+from unittest import mock
 
 import pytest
+import zmq
+import zmq.asyncio
 
+from proxystore.connectors.dim.zmq import _HEADER
+from proxystore.connectors.dim.zmq import _Op
+from proxystore.connectors.dim.zmq import _Status
 from proxystore.connectors.dim.zmq import MAX_CHUNK_LENGTH
 from proxystore.connectors.dim.zmq import wait_for_server
 from proxystore.connectors.dim.zmq import ZeroMQConnector
+from proxystore.connectors.dim.zmq import ZeroMQServer
 from testing.compat import randbytes
 from testing.utils import open_port
 
@@ -28,3 +36,170 @@ def test_large_message_sizes(zmq_connector) -> None:
     connector.evict(key)
     # Note: Don't close connector because it will close server used by other
     # tests using the same fixture.
+
+
+def test_server_process() -> None:
+    server = ZeroMQServer('localhost', open_port())
+
+    def _request(op: _Op, *frames: bytes) -> tuple[int, list[bytes]]:
+        header, *response = server.process([_HEADER.pack(42, op), *frames])
+        request_id, status = _HEADER.unpack(header)
+        assert request_id == 42
+        return status, [bytes(frame) for frame in response]
+
+    assert server.process([b'ping']) == [b'pong']
+
+    assert _request(_Op.SET, b'key', b'val', b'ue') == (_Status.OK, [])
+    assert _request(_Op.EXISTS, b'key') == (_Status.OK, [])
+    assert _request(_Op.GET, b'key') == (_Status.OK, [b'val', b'ue'])
+
+    status, frames = _request(_Op.GET_BATCH, b'key', b'missing')
+    assert status == _Status.OK
+    assert struct.unpack('!2q', frames[0]) == (2, -1)
+    assert frames[1:] == [b'val', b'ue']
+
+    counts = struct.pack('!2q', 1, 0)
+    assert _request(_Op.SET_BATCH, counts, b'k1', b'k2', b'v1') == (
+        _Status.OK,
+        [],
+    )
+    assert server.data['k1'] == [b'v1']
+    assert server.data['k2'] == []
+
+    assert _request(_Op.EVICT, b'key') == (_Status.OK, [])
+    assert _request(_Op.EXISTS, b'key') == (_Status.MISSING, [])
+    assert _request(_Op.GET, b'key') == (_Status.MISSING, [])
+
+    status, frames = _request(_Op.SET_BATCH, counts, b'k1')
+    assert status == _Status.ERROR
+    assert b'counts' in frames[0]
+
+    status, frames = _request(255)  # type: ignore[arg-type]
+    assert status == _Status.ERROR
+    assert b'Unknown operation' in frames[0]
+
+    server.close()
+
+
+def test_pipelined_requests(zmq_connector) -> None:
+    connector = ZeroMQConnector(**zmq_connector.kwargs)
+    objs = [randbytes(1000) for _ in range(16)]
+
+    async def _main() -> None:
+        # Many requests are in flight on the same socket at once.
+        keys = await asyncio.gather(*(connector.aput(obj) for obj in objs))
+        results = await asyncio.gather(*(connector.aget(k) for k in keys))
+        assert results == objs
+        assert len(connector._peers) == 1
+
+        # Keys on the same peer are fetched with a single request.
+        with mock.patch.object(
+            connector,
+            '_rpc',
+            wraps=connector._rpc,
+        ) as mock_rpc:
+            assert await connector.aget_batch(keys[:2]) == objs[:2]
+            assert mock_rpc.call_count == 1
+
+        # Cancelled requests do not affect subsequent requests.
+        task = asyncio.ensure_future(connector.aget(keys[0]))
+        await asyncio.sleep(0)
+        task.cancel()
+        assert await connector.aget(keys[1]) == objs[1]
+
+    asyncio.run(_main())
+    # Note: Don't close connector because it will close server used by other
+    # tests using the same fixture.
+
+
+def test_reader_task_exits_when_idle(zmq_connector) -> None:
+    connector = ZeroMQConnector(**zmq_connector.kwargs)
+
+    async def _main() -> None:
+        key = await connector.aput(b'value')
+        (peer,) = connector._peers.values()
+        reader = peer._reader
+        assert reader is not None
+        # The reader exits once the response to the last request is read
+        await asyncio.wait_for(reader, timeout=5)
+        assert len(peer._pending) == 0
+
+        # The next request starts a new reader
+        assert await connector.aget(key) == b'value'
+        assert peer._reader is not reader
+        await asyncio.wait_for(peer._reader, timeout=5)
+
+    asyncio.run(_main())
+    # Note: Don't close connector because it will close server used by other
+    # tests using the same fixture.
+
+
+def test_server_stored_bytes() -> None:
+    server = ZeroMQServer('localhost', open_port())
+
+    server.set('a', [b'abc', b'de'])
+    server.set('b', [b'xyz'])
+    assert server.nbytes == 8
+    server.set('a', [b'a'])
+    assert server.nbytes == 4
+    server.evict('a')
+    server.evict('missing')
+    assert server.nbytes == 3
+
+    server.close()
+
+
+def test_server_admission() -> None:
+    with pytest.raises(ValueError, match='Max inflight'):
+        ZeroMQServer('localhost', open_port(), max_inflight=0)
+
+    server = ZeroMQServer(
+        'localhost',
+        open_port(),
+        max_inflight=2,
+        max_inflight_bytes=100,
+    )
+    # A large request is admitted when nothing else is in flight.
+    assert server._can_admit(1000)
+    server.inflight_requests, server.inflight_bytes = 1, 60
+    assert server._can_admit(40)
+    assert not server._can_admit(41)
+    server.inflight_requests, server.inflight_bytes = 2, 0
+    assert not server._can_admit(0)
+
+    server.close()
+
+
+def test_server_concurrent_clients() -> None:
+    port = open_port()
+    server = ZeroMQServer('localhost', port, max_inflight=1)
+    context = zmq.asyncio.Context()
+
+    async def _client(i: int) -> None:
+        socket = context.socket(zmq.DEALER)
+        socket.connect(f'tcp://localhost:{port}')
+        key, value = f'key{i}'.encode(), randbytes(100)
+        await socket.send_multipart(
+            [b'', _HEADER.pack(i, _Op.SET), key, value],
+        )
+        _, header = await socket.recv_multipart()
+        assert _HEADER.unpack(header) == (i, _Status.OK)
+        await socket.send_multipart([b'', _HEADER.pack(i, _Op.GET), key])
+        _, header, data = await socket.recv_multipart()
+        assert _HEADER.unpack(header) == (i, _Status.OK)
+        assert data == value
+        socket.close()
+
+    async def _main() -> None:
+        handler = asyncio.ensure_future(server.handler())
+        await asyncio.gather(*(_client(i) for i in range(8)))
+        handler.cancel()
+        await asyncio.gather(handler, return_exceptions=True)
+
+    asyncio.run(_main())
+    assert server.inflight_requests == 0
+    assert server.inflight_bytes == 0
+    assert server.nbytes == 800
+
+    server.close()
+    context.term()
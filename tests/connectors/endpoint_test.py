@@ -30,7 +30,7 @@ def test_no_endpoints_accessible(endpoint_connector) -> None:
     response = requests.Response()
     response.status_code = 400
 
-    with mock.patch('requests.get', return_value=response):
+    with mock.patch.object(requests.Session, 'get', return_value=response):
         with pytest.raises(EndpointConnectorError, match='Failed to find'):
             EndpointConnector(**endpoint_connector.kwargs)
 
@@ -40,7 +40,7 @@ def test_endpoint_uuid_mismatch(endpoint_connector) -> None:
     response.status_code = 200
     response.json = lambda: {'uuid': str(uuid.uuid4())}  # type: ignore
 
-    with mock.patch('requests.get', return_value=response):
+    with mock.patch.object(requests.Session, 'get', return_value=response):
         with pytest.raises(EndpointConnectorError, match='Failed to find'):
             EndpointConnector(**endpoint_connector.kwargs)
 
@@ -52,20 +52,20 @@ def test_bad_responses(endpoint_connector) -> None:
     response = requests.Response()
     response.status_code = 400
 
-    with mock.patch('requests.get', return_value=response):
+    with mock.patch.object(requests.Session, 'get', return_value=response):
         key = connector.put(b'value')
         assert connector.get(key) is None
 
     response.status_code = 401
 
-    with mock.patch('requests.get', return_value=response):
+    with mock.patch.object(requests.Session, 'get', return_value=response):
         with pytest.raises(EndpointConnectorError, match='401'):
             connector.exists(key)
 
         with pytest.raises(EndpointConnectorError, match='401'):
             connector.get(key)
 
-    with mock.patch('requests.post', return_value=response):
+    with mock.patch.object(requests.Session, 'post', return_value=response):
         with pytest.raises(EndpointConnectorError, match='401'):
             connector.evict(key)
 
@@ -75,6 +75,73 @@ def test_bad_responses(endpoint_connector) -> None:
     connector.close()
 
 
+def test_batch_requests(endpoint_connector) -> None:
+    connector = EndpointConnector(**endpoint_connector.kwargs)
+
+    keys = connector.put_batch([b'value1', [b'val', b'ue2']])
+    stats = connector.pool_stats()
+    # The batch is put with a single request.
+    assert connector.get_batch(keys) == [b'value1', b'value2']
+    assert connector.pool_stats().requests == stats.requests + 1
+
+    # Keys located on different endpoints are retrieved in separate batches.
+    other = keys[0]._replace(endpoint_id=None)
+    assert connector.get_batch([keys[1], other]) == [b'value2', b'value1']
+
+    assert connector.put_batch([]) == []
+    assert connector.get_batch([]) == []
+
+    response = requests.Response()
+    response.status_code = 401
+    with mock.patch.object(requests.Session, 'post', return_value=response):
+        with pytest.raises(EndpointConnectorError, match='401'):
+            connector.get_batch(keys)
+
+        with pytest.raises(EndpointConnectorError, match='401'):
+            connector.put_batch([b'value'])
+
+    connector.close()
+
+
+def test_batch_request_errors(endpoint_connector) -> None:
+    connector = EndpointConnector(**endpoint_connector.kwargs)
+    keys = connector.put_batch([b'value1', b'value2'])
+
+    # Connection errors do not have a response with an error code.
+    error = requests.exceptions.ConnectionError('refused')
+    with mock.patch.object(requests.Session, 'post', side_effect=error):
+        with pytest.raises(EndpointConnectorError, match='refused'):
+            connector.get_batch(keys)
+
+        with pytest.raises(EndpointConnectorError, match='refused'):
+            connector.put_batch([b'value'])
+
+    # The response does not contain an object for each key.
+    with mock.patch(
+        'proxystore.endpoint.client.decode_frames',
+        return_value=[b'value1'],
+    ):
+        with pytest.raises(EndpointConnectorError, match='invalid response'):
+            connector.get_batch(keys)
+
+    connector.close()
+
+
+@pytest.mark.asyncio()
+async def test_async_batch_request_errors(endpoint_connector) -> None:
+    connector = EndpointConnector(**endpoint_connector.kwargs)
+    keys = connector.put_batch([b'value1', b'value2'])
+
+    with mock.patch(
+        'proxystore.endpoint.client.decode_frames',
+        return_value=[b'value1'],
+    ):
+        with pytest.raises(EndpointConnectorError, match='invalid response'):
+            await connector.aget_batch(keys)
+
+    connector.close()
+
+
 def test_chunked_requests(endpoint_connector) -> None:
     connector = EndpointConnector(**endpoint_connector.kwargs)
 
@@ -86,3 +153,25 @@ def test_chunked_requests(endpoint_connector) -> None:
     assert connector.get(key) == data
 
     connector.close()
+
+
+def test_connection_pooling(endpoint_connector) -> None:
+    connector = EndpointConnector(**endpoint_connector.kwargs, pool_size=2)
+    assert connector.config()['pool_size'] == 2
+
+    keys = connector.put_batch([b'value'] * 8)
+    assert connector.get_batch(keys) == [b'value'] * 8
+    for key in keys:
+        assert connector.exists(key)
+        connector.evict(key)
+
+    stats = connector.pool_stats()
+    assert stats.pool_size == 2
+    # One request to find the endpoint, one batch put, one batch get, and
+    # 8 exists and 8 evicts. Connections are reused after being returned to
+    # the pool.
+    assert stats.requests == 19
+    assert 0 < stats.connections < stats.requests
+    assert 0 < stats.idle_connections <= 2
+
+    connector.close()
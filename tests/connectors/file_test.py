@@ -3,9 +3,17 @@ from __future__ import annotations
 
 import os
 import pathlib
+import pickle
+import sys
 import tempfile
+from unittest import mock
+
+import pytest
 
 from proxystore.connectors.file import FileConnector
+from proxystore.serialize import deserialize
+from proxystore.serialize import serialize_buffers
+from proxystore.store.base import Store
 
 
 def test_file_conenctor_close(tmp_path: pathlib.Path) -> None:
@@ -38,3 +46,68 @@ def test_cwd_change(tmp_path: pathlib.Path) -> None:
         connector.close()
 
     os.chdir(current)
+
+
+def test_file_connector_partial_writes(tmp_path: pathlib.Path) -> None:
+    # Simulate writev only writing part of the buffers on each call
+    writev = os.writev
+
+    def _partial_writev(fd: int, buffers: list[memoryview]) -> int:
+        return writev(fd, [buffers[0][:3]])
+
+    with FileConnector(str(tmp_path)) as connector:
+        with mock.patch('os.writev', side_effect=_partial_writev):
+            key = connector.put([b'abcde', b'', memoryview(b'fghij')])
+        assert connector.get(key) == b'abcdefghij'
+
+
+def test_file_connector_mmap(tmp_path: pathlib.Path) -> None:
+    with FileConnector(str(tmp_path), mmap=True) as connector:
+        assert connector.config()['mmap']
+
+        key = connector.put(b'data')
+        data = connector.get(key)
+        assert isinstance(data, memoryview)
+        assert data.readonly
+        assert data == b'data'
+
+        # Mapping remains valid after the file is removed
+        connector.evict(key)
+        assert data == b'data'
+
+        empty = connector.put(b'')
+        assert connector.get(empty) == b''
+
+        assert connector.get(key) is None
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason='Out-of-band buffers require Python 3.8 or later',
+)
+def test_file_connector_mmap_zero_copy(tmp_path: pathlib.Path) -> None:
+    obj = pickle.PickleBuffer(bytearray(b'x' * 1000))
+
+    with FileConnector(str(tmp_path), mmap=True) as connector:
+        key = connector.put(serialize_buffers(obj))
+        data = connector.get(key)
+        assert isinstance(data, memoryview)
+
+        result = deserialize(data, copy=False)
+        # Buffer is reconstructed on top of the read-only mapping
+        assert isinstance(result, memoryview)
+        assert result.readonly
+        assert result == b'x' * 1000
+
+        # By default the buffer is copied and writable
+        result = deserialize(data)
+        assert isinstance(result, bytearray)
+        assert result == b'x' * 1000
+
+
+def test_file_connector_mmap_store(tmp_path: pathlib.Path) -> None:
+    connector = FileConnector(str(tmp_path), mmap=True)
+    with Store('test-file-mmap', connector, cache_size=0) as store:
+        key = store.set([1, 2, 3])
+        assert store.get(key) == [1, 2, 3]
+        assert store.get(key) == [1, 2, 3]
@@ -110,6 +110,19 @@ def test_multi_connector_policy_size() -> None:
         assert connector2.exists(key.connector_key)
 
 
+def test_multi_connector_batch_grouping() -> None:
+    with multi_connector_from_policies(
+        Policy(max_size=1),
+        Policy(min_size=2),
+    ) as (multi_connector, connector1, connector2):
+        values = [b'a', b'value', b'b', b'value']
+        keys = multi_connector.put_batch(values)
+        assert [key.connector_name for key in keys] == ['c1', 'c2', 'c1', 'c2']
+        assert connector1.exists(keys[0].connector_key)
+        assert connector2.exists(keys[1].connector_key)
+        assert multi_connector.get_batch(keys) == values
+
+
 def test_multi_connector_policy_tags() -> None:
     with multi_connector_from_policies(
         Policy(priority=1, subset_tags=['a', 'b']),
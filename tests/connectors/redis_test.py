@@ -1,6 +1,12 @@
 """RedisConnector Unit Tests."""
 from __future__ import annotations
 
+import asyncio
+import threading
+
+from proxystore.connectors.redis import RedisConnector
+from testing.connectors import ConnectorInfo
+
 
 def test_nothing() -> None:
     """Test RedisConnector.
@@ -9,3 +15,64 @@ def test_nothing() -> None:
     tests/connectors/connectors_test.py.
     """
     pass
+
+
+def test_close_clients(redis_connector: ConnectorInfo) -> None:
+    connector = RedisConnector(**redis_connector.kwargs)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(connector.aput(b'value'))
+    client = connector._async_redis_client
+    assert client is not None
+
+    connector.close()
+    assert connector._redis_client.closed  # type: ignore[attr-defined]
+    assert client.closed  # type: ignore[attr-defined]
+    assert connector._async_redis_client is None
+    loop.close()
+
+
+def test_close_clients_from_event_loop(
+    redis_connector: ConnectorInfo,
+) -> None:
+    connector = RedisConnector(**redis_connector.kwargs)
+
+    async def _main() -> None:
+        await connector.aput(b'value')
+        client = connector._async_redis_client
+        connector.close()
+        assert connector._close_task is not None
+        await connector._close_task
+        assert client.closed  # type: ignore[union-attr]
+
+    asyncio.run(_main())
+
+
+def test_close_clients_other_thread(redis_connector: ConnectorInfo) -> None:
+    connector = RedisConnector(**redis_connector.kwargs)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(connector.aput(b'value'), loop).result()
+    client = connector._async_redis_client
+
+    connector.close()
+    assert client.closed  # type: ignore[union-attr]
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_aclose(redis_connector: ConnectorInfo) -> None:
+    connector = RedisConnector(**redis_connector.kwargs)
+
+    async def _main() -> None:
+        await connector.aput(b'value')
+        client = connector._async_redis_client
+        await connector.aclose()
+        assert client.closed  # type: ignore[union-attr]
+        assert connector._async_redis_client is None
+
+    asyncio.run(_main())
+    # Closing again is a no-op for the async client
+    connector.close()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import AsyncIterator
+from unittest import mock
+
+import pytest
+
+from proxystore.endpoint.cache import PeerCache
+from proxystore.serialize import BytesLike
+from proxystore.utils import achunk_bytes
+
+PEER = uuid.uuid4()
+
+
+def test_cache_validation() -> None:
+    with pytest.raises(ValueError, match='Max size'):
+        PeerCache(0)
+    with pytest.raises(ValueError, match='TTL'):
+        PeerCache(100, ttl=0)
+
+
+def test_cache_insert_lookup() -> None:
+    cache = PeerCache(100)
+    assert cache.lookup(PEER, 'key') is None
+
+    cache.insert(PEER, 'key', b'value')
+    assert cache.lookup(PEER, 'key') == b'value'
+    assert cache.lookup(uuid.uuid4(), 'key') is None
+    assert cache.size == 5
+
+    cache.insert(PEER, 'key', b'new-value')
+    assert cache.lookup(PEER, 'key') == b'new-value'
+    assert cache.size == 9
+
+    cache.invalidate(PEER, 'key')
+    assert cache.lookup(PEER, 'key') is None
+    assert cache.size == 0
+
+
+def test_cache_evicts_to_budget() -> None:
+    cache = PeerCache(100)
+    cache.insert(PEER, 'a', b'x' * 40)
+    cache.insert(PEER, 'b', b'x' * 40)
+    # Access a so b is the least recently used.
+    assert cache.lookup(PEER, 'a') is not None
+    cache.insert(PEER, 'c', b'x' * 40)
+
+    assert cache.lookup(PEER, 'a') is not None
+    assert cache.lookup(PEER, 'b') is None
+    assert cache.lookup(PEER, 'c') is not None
+    assert cache.size == 80
+
+    # Objects larger than the cache are not cached.
+    cache.insert(PEER, 'd', b'x' * 101)
+    assert cache.lookup(PEER, 'd') is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_cache_ttl() -> None:
+    cache = PeerCache(100, ttl=10)
+    with mock.patch('time.monotonic', return_value=0):
+        cache.insert(PEER, 'key', b'value')
+    with mock.patch('time.monotonic', return_value=9):
+        assert cache.lookup(PEER, 'key') == b'value'
+    with mock.patch('time.monotonic', return_value=10):
+        assert cache.lookup(PEER, 'key') is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio()
+async def test_cache_get_coalesces_requests() -> None:
+    cache = PeerCache(100)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def _fetch() -> bytes:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        return b'value'
+
+    first = asyncio.ensure_future(cache.get(PEER, 'key', _fetch))
+    await started.wait()
+    others = [
+        asyncio.ensure_future(cache.get(PEER, 'key', _fetch))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == b'value'
+    assert await asyncio.gather(*others) == [b'value'] * 5
+    assert calls == 1
+    assert cache.misses == 1
+    assert cache.hits == 5
+
+    assert await cache.get(PEER, 'key', _fetch) == b'value'
+    assert calls == 1
+
+
+@pytest.mark.asyncio()
+async def test_cache_get_missing_not_cached() -> None:
+    cache = PeerCache(100)
+
+    async def _fetch() -> None:
+        return None
+
+    assert await cache.get(PEER, 'key', _fetch) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio()
+async def test_cache_get_failure_retried_by_waiters() -> None:
+    cache = PeerCache(100)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _fail() -> bytes:
+        started.set()
+        await release.wait()
+        raise RuntimeError('peer failed')
+
+    async def _fetch() -> bytes:
+        return b'value'
+
+    first = asyncio.ensure_future(cache.get(PEER, 'key', _fail))
+    await started.wait()
+    waiter = asyncio.ensure_future(cache.get(PEER, 'key', _fetch))
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(RuntimeError, match='peer failed'):
+        await first
+    assert await waiter == b'value'
+
+
+@pytest.mark.asyncio()
+async def test_cache_invalidate_in_flight() -> None:
+    cache = PeerCache(100)
+    release = asyncio.Event()
+
+    async def _fetch() -> bytes:
+        await release.wait()
+        return b'stale'
+
+    task = asyncio.ensure_future(cache.get(PEER, 'key', _fetch))
+    await asyncio.sleep(0)
+    cache.invalidate(PEER, 'key')
+    release.set()
+
+    assert await task == b'stale'
+    assert cache.lookup(PEER, 'key') is None
+
+
+@pytest.mark.asyncio()
+async def test_cache_stream() -> None:
+    cache = PeerCache(100)
+    data = b'x' * 50
+    calls = 0
+
+    async def _fetch() -> AsyncIterator[BytesLike]:
+        nonlocal calls
+        calls += 1
+        return achunk_bytes(data, 16)
+
+    stream = await cache.stream(PEER, 'key', _fetch)
+    assert stream is not None
+    # The object is cached once the stream has been consumed.
+    assert cache.lookup(PEER, 'key') is None
+    assert b''.join([bytes(c) async for c in stream]) == data
+    assert cache.lookup(PEER, 'key') == data
+
+    stream = await cache.stream(PEER, 'key', _fetch)
+    assert stream is not None
+    assert b''.join([bytes(c) async for c in stream]) == data
+    assert calls == 1
+
+    async def _missing() -> None:
+        return None
+
+    assert await cache.stream(PEER, 'missing', _missing) is None
+
+
+@pytest.mark.asyncio()
+async def test_cache_stream_too_large() -> None:
+    cache = PeerCache(20)
+    data = b'x' * 50
+
+    async def _fetch() -> AsyncIterator[BytesLike]:
+        return achunk_bytes(data, 16)
+
+    stream = await cache.stream(PEER, 'key', _fetch)
+    assert stream is not None
+    chunks = [bytes(await stream.__anext__()), bytes(await stream.__anext__())]
+    # Buffering stops and the in-flight request is abandoned once the
+    # stream exceeds the cache size, before the stream is consumed.
+    assert cache._inflight.get(f'{PEER}/key') is None
+    chunks.extend([bytes(c) async for c in stream])
+    assert b''.join(chunks) == data
+    assert cache.lookup(PEER, 'key') is None
+    assert cache.size == 0
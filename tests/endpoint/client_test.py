@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from unittest import mock
 
+import aiohttp
 import pytest
 import requests
 
@@ -24,6 +25,76 @@ def test_basic_client_interaction(endpoint: EndpointConfig) -> None:
     assert client.get(address, key) is None
 
 
+def test_batch_client_interaction(endpoint: EndpointConfig) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    data = [b'value1', [b'val', b'ue2'], bytearray(b'value3')]
+
+    client.put_batch(address, keys, data)
+    missing = str(uuid.uuid4())
+    assert client.exists_batch(address, [keys[0], missing]) == [True, False]
+    assert client.get_batch(address, [*keys, missing]) == [
+        b'value1',
+        b'value2',
+        b'value3',
+        None,
+    ]
+
+    with pytest.raises(ValueError, match='keys'):
+        client.put_batch(address, keys, data[:1])
+
+
+@pytest.mark.asyncio()
+async def test_async_batch_client_interaction(
+    endpoint: EndpointConfig,
+) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    keys = [str(uuid.uuid4()) for _ in range(2)]
+    data = [b'value1', [b'val', b'ue2']]
+
+    async with aiohttp.ClientSession() as session:
+        await client.aput_batch(session, address, keys, data)
+        assert await client.aexists_batch(session, address, keys) == [
+            True,
+            True,
+        ]
+        assert await client.aget_batch(session, address, keys) == [
+            b'value1',
+            b'value2',
+        ]
+
+
+def test_client_session(endpoint: EndpointConfig) -> None:
+    address = f'http://{endpoint.host}:{endpoint.port}'
+    key = str(uuid.uuid4())
+
+    with client.create_session(pool_size=1) as session:
+        client.put(address, key, b'test', session=session)
+        assert client.exists(address, key, session=session)
+        assert client.get(address, key, session=session) == b'test'
+        client.evict(address, key, session=session)
+        assert client.get(address, key, session=session) is None
+
+        stats = client.pool_stats(session)
+        assert stats.as_dict() == {
+            'pool_size': 1,
+            'connections': 1,
+            'requests': 5,
+            'idle_connections': 1,
+        }
+
+
+def test_create_session_bad_pool_size() -> None:
+    with pytest.raises(ValueError, match='Pool size'):
+        client.create_session(pool_size=0)
+
+
+def test_pool_stats_unknown_session() -> None:
+    with requests.Session() as session:
+        with pytest.raises(ValueError, match='create_session'):
+            client.pool_stats(session)
+
+
 def test_errors_raised() -> None:
     address = 'http://localhost:8539'
     key = 'abcd'
@@ -44,3 +115,13 @@ def test_errors_raised() -> None:
 
         with pytest.raises(requests.exceptions.RequestException):
             client.get(address, key)
+
+    with mock.patch('requests.post', return_value=response):
+        with pytest.raises(requests.exceptions.RequestException):
+            client.exists_batch(address, [key])
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_batch(address, [key])
+
+        with pytest.raises(requests.exceptions.RequestException):
+            client.put_batch(address, [key], [b'data'])
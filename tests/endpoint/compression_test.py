@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from proxystore.endpoint.compression import CODECS
+from proxystore.endpoint.compression import get_codec
+from proxystore.endpoint.compression import maybe_compress
+from proxystore.endpoint.compression import MIN_COMPRESS_SIZE
+from proxystore.endpoint.compression import probe
+from testing.compat import randbytes
+
+
+@pytest.mark.parametrize('name', list(CODECS))
+def test_codec_roundtrip(name: str) -> None:
+    codec = get_codec(name)
+    assert codec.name == name
+    data = b'abc' * 1000
+    compressed = codec.compress(data)
+    assert len(compressed) < len(data)
+    assert codec.decompress(compressed) == data
+
+    decompressor = codec.decompressor()
+    chunks = [compressed[i : i + 100] for i in range(0, len(compressed), 100)]
+    assert b''.join(decompressor.decompress(c) for c in chunks) == data
+
+
+def test_get_unknown_codec() -> None:
+    with pytest.raises(ValueError, match='Unknown compression codec'):
+        get_codec('unknown')
+
+
+def test_probe() -> None:
+    assert probe(b'') == 1.0
+    assert probe(bytes(1_000_000)) < 0.1
+    assert probe(randbytes(1_000_000)) > 0.9
+    # The sample is taken from the middle of the data.
+    data = randbytes(10_000) + bytes(10_000) + randbytes(10_000)
+    assert probe(data, sample_size=5_000) < 0.1
+
+
+def test_maybe_compress() -> None:
+    codec = get_codec('zlib')
+
+    data = bytes(10 * MIN_COMPRESS_SIZE)
+    compressed, used = maybe_compress(data, codec, threshold=0.8)
+    assert used is codec
+    assert codec.decompress(compressed) == data
+
+    # Small data is not compressed.
+    data = bytes(MIN_COMPRESS_SIZE - 1)
+    assert maybe_compress(data, codec, threshold=0.8) == (data, None)
+
+    # Incompressible data is not compressed.
+    data = randbytes(10 * MIN_COMPRESS_SIZE)
+    assert maybe_compress(data, codec, threshold=0.8) == (data, None)
@@ -120,6 +120,27 @@ def test_validate_name(name: str, valid: bool) -> None:
         ({'max_memory': -1}, False),
         ({'peer_channels': 1}, True),
         ({'peer_channels': 0}, False),
+        ({'peer_channels': 2, 'max_peer_channels': 4}, True),
+        ({'peer_channels': 2, 'max_peer_channels': 1}, False),
+        ({'peer_direct_host': 'localhost', 'peer_direct_port': 0}, True),
+        ({'peer_direct_port': -1}, False),
+        ({'peer_direct_port': 65536}, False),
+        ({'demotion_policy': 'greedy-dual'}, True),
+        ({'demotion_policy': 'fifo'}, False),
+        ({'compression': 'zlib', 'max_compressed_memory': 100}, True),
+        ({'compression': 'gzip'}, False),
+        ({'max_compressed_memory': 100}, False),
+        ({'compression': 'lzma', 'max_compressed_memory': 0}, False),
+        ({'dump_dir': '/tmp', 'persist': True}, True),
+        ({'persist': True}, False),
+        ({'dump_dir': '/tmp', 'snapshot_on_shutdown': True}, False),
+        ({'dump_dir': '/tmp', 'large_object_threshold': 100}, True),
+        ({'dump_dir': '/tmp', 'large_object_threshold': 0}, False),
+        ({'large_object_threshold': 100}, False),
+        ({'peer_cache_size': 100, 'peer_cache_ttl': 1.5}, True),
+        ({'peer_cache_size': 0}, False),
+        ({'peer_cache_size': 100, 'peer_cache_ttl': 0}, False),
+        ({'peer_cache_ttl': 1}, False),
         ({'max_object_size': 0}, False),
         ({'max_object_size': 1}, True),
         ({'max_object_size': -1}, False),
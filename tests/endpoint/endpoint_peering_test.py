@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from typing import AsyncGenerator
@@ -10,8 +11,10 @@ import pytest_asyncio
 from proxystore.endpoint.endpoint import Endpoint
 from proxystore.endpoint.exceptions import PeeringNotAvailableError
 from proxystore.endpoint.exceptions import PeerRequestError
+from proxystore.endpoint.messages import encode
 from proxystore.endpoint.messages import EndpointRequest
-from proxystore.serialize import serialize
+from proxystore.p2p.chunks import ChunkStream
+from proxystore.p2p.connection import MAX_CHUNK_SIZE_BYTES
 from testing.compat import randbytes
 
 
@@ -70,6 +73,113 @@ async def test_get(endpoints: tuple[Endpoint, Endpoint]) -> None:
     assert (await endpoint2.get('missingkey', endpoint=endpoint1.uuid)) is None
 
 
+@pytest.mark.asyncio()
+async def test_get_stream(endpoints: tuple[Endpoint, Endpoint]) -> None:
+    endpoint1, endpoint2 = endpoints
+    key = str(uuid.uuid4())
+    data = randbytes(10 * MAX_CHUNK_SIZE_BYTES)
+    await endpoint2.set(key, data)
+
+    stream = await endpoint1.get_stream(key, endpoint=endpoint2.uuid)
+    assert isinstance(stream, ChunkStream)
+    assert b''.join([bytes(chunk) async for chunk in stream]) == data
+    assert len(endpoint1._response_streams) == 0
+
+    await endpoint2.set(key, b'')
+    stream = await endpoint1.get_stream(key, endpoint=endpoint2.uuid)
+    assert stream is not None
+    assert b''.join([bytes(chunk) async for chunk in stream]) == b''
+
+    missing = str(uuid.uuid4())
+    assert await endpoint1.get_stream(missing, endpoint=endpoint2.uuid) is None
+
+
+async def _wait_uncached(
+    endpoint: Endpoint,
+    peer: uuid.UUID,
+    key: str,
+) -> None:
+    assert endpoint._peer_cache is not None
+    for _ in range(100):
+        if endpoint._peer_cache.lookup(peer, key) is None:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('Key was not invalidated.')
+
+
+@pytest.mark.asyncio()
+async def test_direct_peering(relay_server) -> None:
+    async with Endpoint(
+        name='test-direct-endpoint-1',
+        uuid=uuid.uuid4(),
+        relay_server=relay_server.address,
+        peer_direct_host='localhost',
+    ) as endpoint1, Endpoint(
+        name='test-direct-endpoint-2',
+        uuid=uuid.uuid4(),
+        relay_server=relay_server.address,
+        peer_direct_host='localhost',
+    ) as endpoint2:
+        key = str(uuid.uuid4())
+        data = randbytes(10 * MAX_CHUNK_SIZE_BYTES)
+        await endpoint1.set(key, data, endpoint=endpoint2.uuid)
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == data
+
+        stream = await endpoint1.get_stream(key, endpoint=endpoint2.uuid)
+        assert stream is not None
+        assert b''.join([bytes(chunk) async for chunk in stream]) == data
+
+        assert endpoint1.peer_stats()[endpoint2.uuid].transport == 'tcp'
+        assert endpoint2.peer_stats()[endpoint1.uuid].transport == 'tcp'
+
+
+@pytest.mark.asyncio()
+async def test_peer_cache(relay_server) -> None:
+    async with Endpoint(
+        name='test-cache-endpoint-1',
+        uuid=uuid.uuid4(),
+        relay_server=relay_server.address,
+        peer_cache_size=1000,
+    ) as endpoint1, Endpoint(
+        name='test-cache-endpoint-2',
+        uuid=uuid.uuid4(),
+        relay_server=relay_server.address,
+    ) as endpoint2:
+        cache = endpoint1._peer_cache
+        assert cache is not None
+        key = str(uuid.uuid4())
+        await endpoint2.set(key, b'value')
+
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'value'
+        assert cache.lookup(endpoint2.uuid, key) == b'value'
+        assert endpoint2._peer_readers[key] == {endpoint1.uuid}
+        stream = await endpoint1.get_stream(key, endpoint=endpoint2.uuid)
+        assert stream is not None
+        assert b''.join([bytes(c) async for c in stream]) == b'value'
+        assert cache.misses == 1
+
+        # Owner overwriting the key invalidates the cached copy.
+        await endpoint2.set(key, b'new-value')
+        await _wait_uncached(endpoint1, endpoint2.uuid, key)
+        stream = await endpoint1.get_stream(key, endpoint=endpoint2.uuid)
+        assert stream is not None
+        assert b''.join([bytes(c) async for c in stream]) == b'new-value'
+        assert cache.lookup(endpoint2.uuid, key) == b'new-value'
+
+        # Owner evicting the key invalidates the cached copy.
+        await endpoint2.evict(key)
+        await _wait_uncached(endpoint1, endpoint2.uuid, key)
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) is None
+        assert key not in endpoint2._peer_readers
+
+        # Setting the key on the peer invalidates the local copy.
+        await endpoint2.set(key, b'value')
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'value'
+        await endpoint1.set(key, b'other', endpoint=endpoint2.uuid)
+        assert cache.lookup(endpoint2.uuid, key) is None
+        assert await endpoint1.get(key, endpoint=endpoint2.uuid) == b'other'
+
+
 @pytest.mark.asyncio()
 async def test_evict(endpoints: tuple[Endpoint, Endpoint]) -> None:
     endpoint1, endpoint2 = endpoints
@@ -94,6 +204,27 @@ async def test_exists(endpoints: tuple[Endpoint, Endpoint]) -> None:
     assert await endpoint2.exists(key)
 
 
+@pytest.mark.asyncio()
+async def test_batch_operations(endpoints: tuple[Endpoint, Endpoint]) -> None:
+    endpoint1, endpoint2 = endpoints
+    keys = [str(uuid.uuid4()) for _ in range(3)]
+    data = [randbytes(100) for _ in keys]
+
+    await endpoint1.set_batch(keys, data, endpoint=endpoint2.uuid)
+    assert await endpoint2.get_batch(keys) == data
+    assert not any(await endpoint1.exists_batch(keys))
+
+    missing = str(uuid.uuid4())
+    assert await endpoint1.get_batch(
+        [*keys, missing],
+        endpoint=endpoint2.uuid,
+    ) == [*data, None]
+    assert await endpoint1.exists_batch(
+        [keys[0], missing],
+        endpoint=endpoint2.uuid,
+    ) == [True, False]
+
+
 @pytest.mark.asyncio()
 async def test_remote_error_propogation(
     endpoints: tuple[Endpoint, Endpoint],
@@ -162,12 +293,14 @@ async def test_unexpected_response(
     endpoint1, endpoint2 = endpoints
 
     # Add bad message to queue
-    message = serialize(
-        EndpointRequest(
-            kind='request',
-            op='evict',
-            uuid='1234',
-            key='key',
+    message = b''.join(
+        encode(
+            EndpointRequest(
+                kind='request',
+                op='evict',
+                uuid='1234',
+                key='key',
+            ),
         ),
     )
     assert endpoint2._peer_manager is not None
@@ -76,3 +76,39 @@ async def test_exists() -> None:
         assert not (await endpoint.exists('key'))
         await endpoint.set('key', data)
         assert await endpoint.exists('key')
+
+
+@pytest.mark.asyncio()
+async def test_batch_operations() -> None:
+    async with Endpoint(name=_NAME, uuid=_UUID) as endpoint:
+        keys = ['key1', 'key2']
+        data = [randbytes(100), randbytes(100)]
+        await endpoint.set_batch(keys, data)
+
+        assert await endpoint.get_batch([*keys, 'missing']) == [*data, None]
+        assert await endpoint.exists_batch(['key1', 'missing']) == [
+            True,
+            False,
+        ]
+
+        with pytest.raises(ValueError, match='keys'):
+            await endpoint.set_batch(keys, data[:1])
+
+
+@pytest.mark.asyncio()
+async def test_restart_with_snapshot(tmp_path) -> None:
+    kwargs = {
+        'name': _NAME,
+        'uuid': _UUID,
+        'max_memory': 1000,
+        'dump_dir': str(tmp_path),
+        'persist': True,
+        'snapshot_on_shutdown': True,
+    }
+    data = randbytes(100)
+    async with Endpoint(**kwargs) as endpoint:
+        await endpoint.set('key', data)
+
+    async with Endpoint(**kwargs) as endpoint:
+        assert await endpoint.exists('key')
+        assert (await endpoint.get('key')) == data
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from proxystore.endpoint.framing import decode_frames
+from proxystore.endpoint.framing import encode_frames
+from proxystore.endpoint.framing import FrameDecoder
+from proxystore.endpoint.framing import FramingError
+from testing.compat import randbytes
+
+
+def test_encode_decode_frames() -> None:
+    large = bytearray(randbytes(200 * 1024))
+    frames = [b'small', None, b'', [b'multi', memoryview(b'-part')], large]
+
+    chunks = list(encode_frames(frames, chunk_size=64 * 1024))
+    # The large frame is yielded in zero-copy chunks.
+    assert any(isinstance(chunk, memoryview) for chunk in chunks)
+
+    decoded = decode_frames(b''.join(chunks))
+    assert decoded == [b'small', None, b'', b'multi-part', large]
+
+
+def test_encode_frames_empty() -> None:
+    assert list(encode_frames([])) == []
+    assert decode_frames(b'') == []
+
+
+def test_decode_frames_malformed() -> None:
+    data = b''.join(encode_frames([b'data']))
+
+    with pytest.raises(FramingError, match='partial header'):
+        decode_frames(data[:4])
+
+    with pytest.raises(FramingError, match='exceeds'):
+        decode_frames(data[:-1])
+
+
+@pytest.mark.parametrize('chunk_size', (1, 5, 8, 13, 1024))
+def test_frame_decoder(chunk_size: int) -> None:
+    frames = [b'small', None, b'', randbytes(100), b'last']
+    data = b''.join(encode_frames(frames))
+
+    decoder = FrameDecoder()
+    for i in range(0, len(data), chunk_size):
+        decoder.feed(data[i : i + chunk_size])
+    assert decoder.finish() == frames
+
+
+def test_frame_decoder_malformed() -> None:
+    data = b''.join(encode_frames([b'data']))
+
+    decoder = FrameDecoder()
+    decoder.feed(data[:4])
+    with pytest.raises(FramingError, match='partial header'):
+        decoder.finish()
+
+    decoder = FrameDecoder()
+    decoder.feed(data[:-1])
+    with pytest.raises(FramingError, match='1 bytes before'):
+        decoder.finish()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import pathlib
+
+from proxystore.endpoint.manifest import ManifestEntry
+from proxystore.endpoint.manifest import SpillManifest
+
+
+def _entry(key: str, size: int = 100) -> ManifestEntry:
+    return ManifestEntry(
+        key=key,
+        filename=f'{key}.file',
+        size=size,
+        stored_size=size // 2,
+        codec='zlib',
+    )
+
+
+def test_manifest_replay(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'manifest.jsonl')
+    manifest = SpillManifest(path)
+    manifest.add(_entry('a'))
+    manifest.add(_entry('b'))
+    manifest.add(_entry('a', size=200))
+    manifest.remove('b')
+    # Removing an unknown key is ignored.
+    manifest.remove('c')
+    manifest.close()
+
+    manifest = SpillManifest(path)
+    assert len(manifest) == 1
+    assert 'a' in manifest
+    assert 'b' not in manifest
+    assert manifest.entries['a'] == _entry('a', size=200)
+    manifest.close()
+
+
+def test_manifest_ignores_invalid_records(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'manifest.jsonl')
+    manifest = SpillManifest(path)
+    manifest.add(_entry('a'))
+    manifest.close()
+
+    with open(path, 'a') as f:
+        f.write('{"op": "unknown", "key": "b"}\n')
+        f.write('{"op": "add", "key": "c"}\n')
+        # Partially written record.
+        f.write('{"op": "add", "key": "d", "file')
+
+    manifest = SpillManifest(path)
+    assert list(manifest.entries) == ['a']
+    manifest.close()
+
+
+def test_manifest_compaction(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / 'manifest.jsonl')
+    manifest = SpillManifest(path)
+    for _ in range(1000):
+        manifest.add(_entry('a'))
+        manifest.add(_entry('b'))
+        manifest.remove('b')
+    manifest.close()
+
+    with open(path) as f:
+        assert len(f.readlines()) < 1100
+
+    manifest = SpillManifest(path)
+    assert list(manifest.entries) == ['a']
+    manifest.compact()
+    manifest.close()
+
+    with open(path) as f:
+        assert len(f.readlines()) == 1
+    assert not os.path.exists(f'{path}.tmp')
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from proxystore.endpoint.messages import decode
+from proxystore.endpoint.messages import encode
+from proxystore.endpoint.messages import EndpointBatchRequest
+from proxystore.endpoint.messages import EndpointMessage
+from proxystore.endpoint.messages import EndpointRequest
+
+
+@pytest.mark.parametrize(
+    'message',
+    (
+        EndpointRequest(kind='request', op='evict', uuid='1', key='key'),
+        EndpointRequest(
+            kind='response',
+            op='exists',
+            uuid='2',
+            key='kéy',
+            exists=False,
+        ),
+        EndpointRequest(
+            kind='request',
+            op='set',
+            uuid='3',
+            key='key',
+            data=b'value',
+        ),
+        EndpointRequest(kind='response', op='get', uuid='4', key='key'),
+        EndpointRequest(
+            kind='request',
+            op='get',
+            uuid='4',
+            key='key',
+            stream=True,
+            cache=True,
+        ),
+        EndpointRequest(kind='request', op='invalidate', uuid='8', key='k'),
+        EndpointRequest(
+            kind='response',
+            op='get',
+            uuid='5',
+            key='key',
+            error=ValueError('error'),
+        ),
+        EndpointBatchRequest(
+            kind='response',
+            op='get',
+            uuid='6',
+            keys=['a', 'b', 'c'],
+            data=[b'a', None, b''],
+        ),
+        EndpointBatchRequest(
+            kind='response',
+            op='exists',
+            uuid='7',
+            keys=['a', 'b'],
+            exists=[True, False],
+        ),
+    ),
+)
+def test_encode_decode(message: EndpointMessage) -> None:
+    buffers = encode(message)
+    decoded = decode(b''.join(buffers))
+
+    assert type(decoded) is type(message)
+    assert repr(decoded.error) == repr(message.error)
+    decoded.error = message.error
+    assert decoded == message
+
+
+def test_encode_payload_not_copied() -> None:
+    data = b'x' * 1000
+    message = EndpointRequest(
+        kind='request',
+        op='set',
+        uuid='1',
+        key='key',
+        data=data,
+    )
+    buffers = encode(message)
+    assert len(buffers) == 2
+    assert buffers[1] is data
+
+
+def test_decode_invalid() -> None:
+    message = b''.join(
+        encode(EndpointRequest(kind='request', op='get', uuid='1', key='k')),
+    )
+
+    with pytest.raises(ValueError, match='truncated'):
+        decode(b'PE')
+    with pytest.raises(ValueError, match='not an endpoint message'):
+        decode(b'nonsense_message')
+    with pytest.raises(ValueError, match='truncated'):
+        decode(message[:-1])
+    with pytest.raises(ValueError, match='trailing'):
+        decode(message + b'\x00')
+    with pytest.raises(ValueError, match='Unknown'):
+        decode(message[:3] + struct.pack('!B', 9) + message[4:])
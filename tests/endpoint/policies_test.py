@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from proxystore.endpoint.policies import DEMOTION_POLICIES
+from proxystore.endpoint.policies import DemotionPolicy
+from proxystore.endpoint.policies import get_demotion_policy
+from proxystore.endpoint.policies import GreedyDualPolicy
+
+
+@pytest.mark.parametrize('name', list(DEMOTION_POLICIES))
+def test_policy_tracks_keys(name: str) -> None:
+    policy = get_demotion_policy(name)
+    assert isinstance(policy, DemotionPolicy)
+
+    for i in range(5):
+        policy.add(str(i), 10)
+    assert len(policy) == 5
+    assert '0' in policy
+
+    policy.access('0')
+    policy.remove('1')
+    assert '1' not in policy
+    with pytest.raises(KeyError):
+        policy.remove('1')
+
+    popped = {policy.pop() for _ in range(4)}
+    assert popped == {'0', '2', '3', '4'}
+    assert len(policy) == 0
+    with pytest.raises(KeyError, match='empty'):
+        policy.pop()
+
+
+def test_get_demotion_policy_unknown() -> None:
+    with pytest.raises(ValueError, match='Unknown demotion policy'):
+        get_demotion_policy('fifo')
+
+
+def test_greedy_dual_policy() -> None:
+    policy = GreedyDualPolicy()
+    policy.add('large', 1000)
+    policy.add('small', 10)
+    policy.add('medium', 100)
+    # Larger blobs are demoted first.
+    assert policy.pop() == 'large'
+
+    # Inflation ages blobs which are not accessed so a recently added
+    # blob outranks an old blob of the same size.
+    policy.add('new-medium', 100)
+    assert policy.pop() == 'medium'
+
+    # Accessing resets a blob's priority with the current inflation.
+    policy.add('old-small', 10)
+    policy.access('small')
+    assert policy.pop() == 'new-medium'
+    assert policy.pop() == 'old-small'
+    assert policy.pop() == 'small'
+
+
+def test_greedy_dual_policy_compacts_heap() -> None:
+    policy = GreedyDualPolicy()
+    policy.add('key', 1)
+    for _ in range(1000):
+        policy.access('key')
+    assert len(policy._heap) < 100
+    assert policy.pop() == 'key'
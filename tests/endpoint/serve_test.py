@@ -17,6 +17,8 @@ import requests
 
 from proxystore.endpoint.config import EndpointConfig
 from proxystore.endpoint.endpoint import Endpoint
+from proxystore.endpoint.framing import decode_frames
+from proxystore.endpoint.framing import encode_frames
 from proxystore.endpoint.serve import create_app
 from proxystore.endpoint.serve import MAX_CHUNK_LENGTH
 from proxystore.endpoint.serve import serve
@@ -53,6 +55,25 @@ async def test_running(quart_app) -> None:
     assert len((await response.get_json())['uuid']) > 0
 
 
+@pytest.mark.asyncio()
+async def test_stats_request(quart_app) -> None:
+    client = quart_app.test_client()
+    await client.post(
+        '/set',
+        headers={'Content-Type': 'application/octet-stream'},
+        query_string={'key': 'my-key'},
+        data=b'value',
+    )
+
+    response = await client.get('/stats')
+    assert response.status_code == 200
+    stats = await response.get_json()
+    assert stats['blobs'] == 1
+    assert stats['memory_bytes'] == len(b'value')
+    assert stats['spills']['count'] == 0
+    assert stats['peers'] == {}
+
+
 @pytest.mark.asyncio()
 async def test_set_request(quart_app) -> None:
     client = quart_app.test_client()
@@ -200,6 +221,40 @@ async def test_evict_request(quart_app) -> None:
     assert not (await exists_response.get_json())['exists']
 
 
+@pytest.mark.asyncio()
+async def test_large_object_streaming(tmp_path: pathlib.Path) -> None:
+    async with Endpoint(
+        name='my-endpoint',
+        uuid=uuid.uuid4(),
+        max_memory=1000,
+        dump_dir=str(tmp_path),
+        large_object_threshold=100,
+    ) as endpoint:
+        app = create_app(endpoint)
+        async with app.test_app() as quart_app:
+            client = quart_app.test_client()
+            data = randbytes(500)
+            set_response = await client.post(
+                '/set',
+                headers={'Content-Type': 'application/octet-stream'},
+                query_string={'key': 'my-key'},
+                data=data,
+            )
+            assert set_response.status_code == 200
+
+            get_response = await client.get(
+                '/get',
+                query_string={'key': 'my-key'},
+            )
+            assert get_response.status_code == 200
+            assert await get_response.get_data() == data
+
+            stats = endpoint.stats()
+            assert stats.direct_writes == 1
+            assert stats.streamed_blobs == 1
+            assert stats.memory_bytes == 0
+
+
 @pytest.mark.asyncio()
 async def test_payload_too_big() -> None:
     async with Endpoint(
@@ -317,6 +372,105 @@ async def test_missing_key(quart_app) -> None:
     assert set_response.status_code == 400
 
 
+@pytest.mark.asyncio()
+async def test_batch_requests(quart_app) -> None:
+    client = quart_app.test_client()
+    data = [randbytes(100), randbytes(100)]
+
+    set_response = await client.post(
+        '/set_batch',
+        headers={'Content-Type': 'application/octet-stream'},
+        data=b''.join(
+            encode_frames([b'key1', data[0], b'key2', data[1]]),
+        ),
+    )
+    assert set_response.status_code == 200
+
+    get_response = await client.post(
+        '/get_batch',
+        json={'keys': ['key1', 'missing', 'key2']},
+    )
+    assert get_response.status_code == 200
+    frames = decode_frames(await get_response.get_data())
+    assert frames == [data[0], None, data[1]]
+
+    exists_response = await client.post(
+        '/exists_batch',
+        json={'keys': ['key1', 'missing']},
+    )
+    assert exists_response.status_code == 200
+    assert (await exists_response.get_json())['exists'] == [True, False]
+
+
+@pytest.mark.asyncio()
+async def test_bad_batch_requests(quart_app) -> None:
+    client = quart_app.test_client()
+
+    for route in ('/get_batch', '/exists_batch'):
+        response = await client.post(route, json={'keys': 'not-a-list'})
+        assert response.status_code == 400
+        response = await client.post(route, data=b'not json')
+        assert response.status_code == 400
+        response = await client.post(
+            route,
+            json={'keys': []},
+            query_string={'endpoint': 'not a uuid'},
+        )
+        assert response.status_code == 400
+
+    bad_bodies = [
+        # Partial header
+        b'abc',
+        # Key without data
+        b''.join(encode_frames([b'key'])),
+        # Empty data
+        b''.join(encode_frames([b'key', b''])),
+        # Missing data
+        b''.join(encode_frames([b'key', None])),
+    ]
+    for body in bad_bodies:
+        response = await client.post('/set_batch', data=body)
+        assert response.status_code == 400
+
+    response = await client.post(
+        '/set_batch',
+        data=b''.join(encode_frames([b'key', b'value'])),
+        query_string={'endpoint': 'not a uuid'},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio()
+async def test_batch_requests_unknown_endpoint_uuid(quart_app) -> None:
+    client = quart_app.test_client()
+    unknown_uuid = uuid.uuid4()
+
+    with mock.patch(
+        'proxystore.endpoint.endpoint.Endpoint._is_peer_request',
+        return_value=True,
+    ):
+        quart_app.endpoint._peer_manager = AsyncMock()
+        quart_app.endpoint._peer_manager.send = AsyncMock(
+            side_effect=Exception(),
+        )
+        quart_app.endpoint._peer_manager.close = AsyncMock()
+
+        for route in ('/get_batch', '/exists_batch'):
+            response = await client.post(
+                route,
+                json={'keys': ['key']},
+                query_string={'endpoint': unknown_uuid},
+            )
+            assert response.status_code == 400
+
+        response = await client.post(
+            '/set_batch',
+            data=b''.join(encode_frames([b'key', b'value'])),
+            query_string={'endpoint': unknown_uuid},
+        )
+        assert response.status_code == 400
+
+
 @pytest.mark.timeout(5)
 def test_serve(use_uvloop: bool) -> None:
     config = EndpointConfig(
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import pathlib
+from unittest import mock
 
 import pytest
 
+from proxystore.endpoint.compression import get_codec
 from proxystore.endpoint.exceptions import ObjectSizeExceededError
 from proxystore.endpoint.storage import Blob
 from proxystore.endpoint.storage import BlobLocation
@@ -146,3 +149,541 @@ def test_object_exceeds_object_size(tmp_path: pathlib.Path) -> None:
     storage = EndpointStorage(max_object_size=100)
     with pytest.raises(ObjectSizeExceededError, match='object limit'):
         storage['key'] = randbytes(200)
+
+
+@pytest.mark.parametrize('policy', ('lru', 'lfu', 'greedy-dual'))
+def test_endpoint_storage_demotion_policy(
+    policy: str,
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=str(tmp_path),
+        demotion_policy=policy,
+    )
+
+    for i in range(20):
+        storage[str(i)] = randbytes(10)
+        # Keep key 0 in memory by accessing it.
+        assert len(storage['0']) == 10
+
+    assert storage._blobs['0'].location == BlobLocation.MEMORY
+    assert storage._in_memory_size == 100
+    assert len(os.listdir(tmp_path)) == 10
+
+    # Overwriting a key does not double count its size.
+    storage['0'] = randbytes(10)
+    assert storage._in_memory_size == 100
+
+    storage.clear()
+    assert len(storage) == 0
+    assert storage._in_memory_size == 0
+    assert len(os.listdir(tmp_path)) == 0
+
+
+def test_endpoint_storage_unknown_policy() -> None:
+    with pytest.raises(ValueError, match='Unknown demotion policy'):
+        EndpointStorage(demotion_policy='fifo')
+
+
+def test_endpoint_storage_bad_spill_watermark() -> None:
+    with pytest.raises(ValueError, match='Spill watermark'):
+        EndpointStorage(spill_watermark=0)
+
+    with pytest.raises(ValueError, match='Spill watermark'):
+        EndpointStorage(spill_watermark=1.5)
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_spilling(tmp_path: pathlib.Path) -> None:
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=str(tmp_path),
+        spill_watermark=0.5,
+    )
+    values = {f'key{i}': randbytes(10) for i in range(10)}
+    for key, value in values.items():
+        await storage.aset(key, value)
+    await storage.wait_pending()
+
+    # Blobs are spilled in the background down to the watermark.
+    stats = storage.stats()
+    assert stats.blobs == 10
+    assert stats.memory_bytes <= 50
+    assert stats.memory_blobs == stats.memory_bytes // 10
+    assert stats.pending_spills == 0
+    assert stats.spills.count == 10 - stats.memory_blobs
+    assert stats.spilled_bytes == 10 * stats.spills.count
+    assert len(os.listdir(tmp_path)) == stats.spills.count
+
+    for key, value in values.items():
+        assert await storage.aget(key) == value
+    await storage.wait_pending()
+
+    stats = storage.stats()
+    assert stats.reloads.count > 0
+    assert stats.memory_bytes <= 100
+    assert await storage.aget('missing') is None
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_shared_reload(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(max_size=100, dump_dir=str(tmp_path))
+    value = randbytes(60)
+    await storage.aset('key', value)
+    await storage.aset('other', randbytes(60))
+    await storage.wait_pending()
+    assert storage._blobs['key'].location == BlobLocation.FILE
+
+    with mock.patch.object(
+        Blob,
+        'read_file',
+        autospec=True,
+        side_effect=Blob.read_file,
+    ) as mock_read:
+        results = await asyncio.gather(
+            *(storage.aget('key') for _ in range(5)),
+        )
+    assert all(result == value for result in results)
+    mock_read.assert_called_once()
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_delete_while_spilling(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=str(tmp_path),
+        spill_watermark=0.5,
+    )
+    value = randbytes(40)
+    await storage.aset('key', value)
+    await storage.aset('other', randbytes(40))
+
+    # The spill has started but not completed so the blob is still
+    # served from memory.
+    assert storage.stats().pending_spills == 1
+    assert await storage.aget('key') == value
+
+    del storage['key']
+    await storage.wait_pending()
+    assert 'key' not in storage
+    assert len(os.listdir(tmp_path)) == 0
+    assert storage.stats().memory_bytes == 40
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_spill_failure(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(max_size=100, dump_dir=str(tmp_path))
+    value = randbytes(60)
+    await storage.aset('key', value)
+
+    with mock.patch.object(
+        Blob,
+        'write_file',
+        side_effect=OSError('disk full'),
+    ):
+        await storage.aset('other', randbytes(60))
+        await storage.wait_pending()
+
+    # Failed spills keep the blob in memory.
+    assert storage._blobs['key'].location == BlobLocation.MEMORY
+    assert await storage.aget('key') == value
+    assert storage.stats().memory_bytes == 120
+
+    storage.cleanup()
+
+
+def test_blob_compression(tmp_path: pathlib.Path) -> None:
+    codec = get_codec('zlib')
+    value = bytes(10_000)
+    blob = Blob('key', value, os.path.join(tmp_path, 'key'))
+
+    assert blob.compress(codec)
+    assert blob.location == BlobLocation.COMPRESSED
+    assert blob.codec is codec
+    assert blob.stored_size < blob.size
+
+    blob.dump()
+    assert blob.location == BlobLocation.FILE
+    assert os.path.getsize(blob.filepath) == blob.stored_size
+
+    assert blob.value == value
+    assert blob.codec is None
+    assert not os.path.exists(blob.filepath)
+
+    # Incompressible blobs are dumped uncompressed.
+    value = randbytes(10_000)
+    blob = Blob('key', value, os.path.join(tmp_path, 'key'))
+    assert not blob.compress(codec, threshold=0.8)
+    blob.dump(codec, threshold=0.8)
+    assert blob.codec is None
+    assert os.path.getsize(blob.filepath) == len(value)
+    assert blob.value == value
+
+
+def test_endpoint_storage_compression_init_error() -> None:
+    with pytest.raises(ValueError, match='compression codec'):
+        EndpointStorage(max_compressed_size=100)
+
+    with pytest.raises(ValueError, match='Unknown compression codec'):
+        EndpointStorage(compression='unknown')
+
+
+def test_endpoint_storage_compressed_tier(tmp_path: pathlib.Path) -> None:
+    storage = EndpointStorage(
+        max_size=10_000,
+        dump_dir=str(tmp_path),
+        compression='zlib',
+        max_compressed_size=200,
+    )
+    random = randbytes(5_000)
+    storage['random'] = random
+    compressible = {f'key{i}': bytes([i]) * 5_000 for i in range(10)}
+    for key, value in compressible.items():
+        storage[key] = value
+
+    stats = storage.stats()
+    assert stats.memory_bytes <= 10_000
+    assert stats.compressed_blobs > 0
+    assert stats.compressed_bytes <= 200
+    assert stats.memory_blobs + stats.compressed_blobs < stats.blobs
+
+    # The incompressible blob is written to disk uncompressed and blobs
+    # demoted from the compressed tier are written compressed.
+    random_blob = storage._blobs['random']
+    assert random_blob.location == BlobLocation.FILE
+    assert random_blob.filepath is not None
+    random_file = os.path.basename(random_blob.filepath)
+    files = [f for f in os.listdir(tmp_path) if f != random_file]
+    assert len(files) > 0
+    assert all(os.path.getsize(tmp_path / f) < 5_000 for f in files)
+    assert os.path.getsize(random_blob.filepath) == 5_000
+
+    for key, value in compressible.items():
+        assert storage[key] == value
+    assert storage['random'] == random
+
+    storage.clear()
+    stats = storage.stats()
+    assert stats.memory_bytes == 0
+    assert stats.compressed_bytes == 0
+    assert len(os.listdir(tmp_path)) == 0
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_compressed_tier(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=10_000,
+        dump_dir=str(tmp_path),
+        compression='zlib',
+        max_compressed_size=200,
+    )
+    values = {f'key{i}': bytes([i]) * 5_000 for i in range(10)}
+    for key, value in values.items():
+        await storage.aset(key, value)
+    await storage.wait_pending()
+
+    stats = storage.stats()
+    assert stats.memory_bytes <= 9_000
+    assert stats.compressed_blobs > 0
+    assert stats.compressed_bytes <= 200
+    assert stats.spills.count > 0
+    assert all(
+        os.path.getsize(tmp_path / f) < 5_000 for f in os.listdir(tmp_path)
+    )
+
+    results = await asyncio.gather(
+        *(storage.aget(key) for key in values),
+    )
+    assert results == list(values.values())
+    await storage.wait_pending()
+
+    storage.clear()
+    stats = storage.stats()
+    assert stats.memory_bytes == 0
+    assert stats.compressed_bytes == 0
+    assert len(os.listdir(tmp_path)) == 0
+
+    storage.cleanup()
+
+
+def test_endpoint_storage_persist_init_error() -> None:
+    with pytest.raises(ValueError, match='persist'):
+        EndpointStorage(persist=True)
+
+
+def test_endpoint_storage_not_persistent_snapshot() -> None:
+    storage = EndpointStorage()
+    with pytest.raises(RuntimeError, match='persistent'):
+        storage.snapshot()
+
+
+def test_endpoint_storage_restore(tmp_path: pathlib.Path) -> None:
+    dump_dir = str(tmp_path / 'dump')
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=dump_dir,
+        compression='zlib',
+        persist=True,
+    )
+    values = {f'key{i}': bytes([i]) * 40 for i in range(3)}
+    values['random'] = randbytes(40)
+    # Overwritten blobs are restored with the latest value.
+    storage['key1'] = randbytes(90)
+    storage['key2'] = randbytes(90)
+    for key, value in values.items():
+        storage[key] = value
+    del storage['key0']
+    values.pop('key0')
+    storage['key1']
+    # Files not in the manifest are removed on restore.
+    with open(os.path.join(dump_dir, 'orphan'), 'wb') as f:
+        f.write(b'data')
+    on_disk = {
+        key
+        for key, blob in storage._blobs.items()
+        if blob.location == BlobLocation.FILE
+    }
+    assert len(on_disk) > 0
+    storage.close()
+    assert os.path.isdir(dump_dir)
+
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=dump_dir,
+        compression='zlib',
+        persist=True,
+    )
+    # Only blobs on disk are restored and they are loaded lazily.
+    assert set(storage) == on_disk
+    assert storage.stats().memory_bytes == 0
+    assert not os.path.exists(os.path.join(dump_dir, 'orphan'))
+    for key in on_disk:
+        assert storage[key] == values[key]
+    storage.cleanup()
+    assert not os.path.exists(dump_dir)
+
+
+def test_endpoint_storage_restore_invalid_files(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=str(tmp_path),
+        persist=True,
+    )
+    for key in ('a', 'b', 'c', 'd'):
+        storage[key] = randbytes(100)
+    filepaths: dict[str, str] = {}
+    for key, blob in storage._blobs.items():
+        assert blob.filepath is not None
+        filepaths[key] = blob.filepath
+    storage.close()
+
+    # Missing and truncated files are not restored.
+    os.remove(filepaths['a'])
+    with open(filepaths['b'], 'wb') as f:
+        f.write(b'truncated')
+
+    storage = EndpointStorage(
+        max_size=100,
+        dump_dir=str(tmp_path),
+        persist=True,
+    )
+    assert set(storage) == {'c'}
+    assert not os.path.exists(filepaths['b'])
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_async_snapshot(tmp_path: pathlib.Path) -> None:
+    dump_dir = str(tmp_path / 'dump')
+    storage = EndpointStorage(
+        max_size=1000,
+        dump_dir=dump_dir,
+        compression='zlib',
+        max_compressed_size=1000,
+        persist=True,
+    )
+    values = {f'key{i}': bytes([i]) * 600 for i in range(3)}
+    for key, value in values.items():
+        await storage.aset(key, value)
+    await storage.wait_pending()
+    assert storage.stats().compressed_blobs > 0
+
+    await storage.asnapshot()
+    stats = storage.stats()
+    assert stats.memory_blobs == stats.compressed_blobs == 0
+    assert stats.memory_bytes == stats.compressed_bytes == 0
+    storage.close()
+
+    storage = EndpointStorage(max_size=1000, dump_dir=dump_dir, persist=True)
+    assert set(storage) == set(values)
+    for key, value in values.items():
+        assert await storage.aget(key) == value
+    storage.cleanup()
+
+
+def test_endpoint_storage_snapshot(tmp_path: pathlib.Path) -> None:
+    dump_dir = str(tmp_path / 'dump')
+    storage = EndpointStorage(max_size=100, dump_dir=dump_dir, persist=True)
+    storage['key'] = b'value'
+    storage.snapshot()
+    assert storage._blobs['key'].location == BlobLocation.FILE
+    assert storage['key'] == b'value'
+    storage.snapshot()
+    storage.close()
+
+    storage = EndpointStorage(max_size=100, dump_dir=dump_dir, persist=True)
+    assert storage['key'] == b'value'
+    storage.cleanup()
+
+
+def test_endpoint_storage_large_object_init_error() -> None:
+    with pytest.raises(ValueError, match='large_object_threshold'):
+        EndpointStorage(large_object_threshold=100)
+
+
+async def _join_stream(storage: EndpointStorage, key: str) -> bytes | None:
+    chunks = await storage.astream(key, chunk_size=100)
+    if chunks is None:
+        return None
+    return b''.join([bytes(chunk) async for chunk in chunks])
+
+
+async def _chunks(data: bytes, chunk_size: int = 100):
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+@pytest.mark.parametrize('compression', (None, 'zlib', 'lzma'))
+@pytest.mark.asyncio()
+async def test_endpoint_storage_stream_from_disk(
+    compression: str | None,
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=2000,
+        dump_dir=str(tmp_path),
+        compression=compression,
+        large_object_threshold=1000,
+    )
+    large = randbytes(500) + bytes(1000)
+    small = bytes(500)
+    await storage.aset('large', large)
+    await storage.aset('small', small)
+    await storage.aset('other', randbytes(1500))
+    await storage.wait_pending()
+    assert storage._blobs['large'].location == BlobLocation.FILE
+    assert storage._blobs['small'].location == BlobLocation.FILE
+
+    # Large blobs are streamed without being reloaded into memory.
+    assert await _join_stream(storage, 'large') == large
+    assert storage._blobs['large'].location == BlobLocation.FILE
+    assert storage.stats().streamed_blobs == 1
+    assert storage.stats().reloads.count == 0
+
+    # Small blobs are reloaded.
+    assert await _join_stream(storage, 'small') == small
+    assert storage._blobs['small'].location == BlobLocation.MEMORY
+
+    assert await _join_stream(storage, 'missing') is None
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_stream_deleted_file(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=2000,
+        dump_dir=str(tmp_path),
+        large_object_threshold=1000,
+    )
+    value = randbytes(1500)
+    storage['key'] = value
+    storage['other'] = randbytes(1500)
+    assert storage._blobs['key'].location == BlobLocation.FILE
+
+    # The stream can be read after the file is deleted once opened.
+    chunks = await storage.astream('key', chunk_size=100)
+    assert chunks is not None
+    del storage['key']
+    assert b''.join([bytes(chunk) async for chunk in chunks]) == value
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_set_stream(tmp_path: pathlib.Path) -> None:
+    storage = EndpointStorage(
+        max_size=2000,
+        dump_dir=str(tmp_path),
+        large_object_threshold=1000,
+        persist=True,
+    )
+    small = randbytes(500)
+    assert await storage.aset_stream('small', _chunks(small)) == len(small)
+    assert storage._blobs['small'].location == BlobLocation.MEMORY
+
+    large = randbytes(1500)
+    assert await storage.aset_stream('large', _chunks(large)) == len(large)
+    assert storage._blobs['large'].location == BlobLocation.FILE
+    assert storage.stats().memory_bytes == len(small)
+    assert storage.stats().direct_writes == 1
+    assert await storage.aget('large') == large
+
+    # Overwriting a blob with a large blob writes it directly to disk.
+    assert await storage.aset_stream('small', _chunks(large)) == len(large)
+    assert storage._blobs['small'].location == BlobLocation.FILE
+    assert storage.stats().memory_bytes == len(large)
+
+    # Empty streams do not set the key.
+    assert await storage.aset_stream('empty', _chunks(b'')) == 0
+    assert 'empty' not in storage
+
+    # Directly written blobs are restored.
+    storage.close()
+    storage = EndpointStorage(
+        max_size=2000,
+        dump_dir=str(tmp_path),
+        persist=True,
+    )
+    assert storage['small'] == large
+
+    storage.cleanup()
+
+
+@pytest.mark.asyncio()
+async def test_endpoint_storage_set_stream_too_large(
+    tmp_path: pathlib.Path,
+) -> None:
+    storage = EndpointStorage(
+        max_size=2000,
+        dump_dir=str(tmp_path),
+        large_object_threshold=1000,
+    )
+    with pytest.raises(ObjectSizeExceededError):
+        await storage.aset_stream('key', _chunks(randbytes(3000)))
+    assert 'key' not in storage
+    # The partially written file is removed.
+    assert len(os.listdir(tmp_path)) == 0
+
+    storage.cleanup()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from proxystore.eviction import LFUPolicy
+from proxystore.eviction import LRUPolicy
+
+
+def test_lru_policy() -> None:
+    policy = LRUPolicy()
+    for key in 'abc':
+        policy.add(key, 1)
+    policy.access('a')
+    assert [policy.pop() for _ in range(3)] == ['b', 'c', 'a']
+
+
+def test_lfu_policy() -> None:
+    policy = LFUPolicy()
+    for key in 'abcd':
+        policy.add(key, 1)
+    policy.access('a')
+    policy.access('a')
+    policy.access('b')
+    policy.access('d')
+    # c has one access. b and d have two accesses and b was accessed least
+    # recently. a has three accesses.
+    assert policy.pop() == 'c'
+    policy.remove('d')
+    assert policy.pop() == 'b'
+    # Re-adding a key resets its count.
+    policy.add('a', 1)
+    policy.add('e', 1)
+    policy.access('e')
+    assert policy.pop() == 'a'
+    assert policy.pop() == 'e'
+
+
+@pytest.mark.parametrize('policy_type', (LRUPolicy, LFUPolicy))
+def test_policy_peek(
+    policy_type: type[LRUPolicy[int] | LFUPolicy[int]],
+) -> None:
+    policy = policy_type()
+    with pytest.raises(KeyError, match='empty'):
+        policy.peek()
+
+    policy.add(1)
+    policy.add(2)
+    policy.access(1)
+    # Peeking does not remove or access the key.
+    assert policy.peek() == 2
+    assert policy.peek() == 2
+    assert len(policy) == 2
+    assert policy.pop() == 2
+    assert policy.peek() == 1
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from proxystore.p2p.chunks import Chunk
+from proxystore.p2p.chunks import ChunkBuffer
 from proxystore.p2p.chunks import ChunkDType
 from proxystore.p2p.chunks import chunkify
+from proxystore.p2p.chunks import ChunkStream
 from proxystore.p2p.chunks import reconstruct
 from testing.compat import randbytes
 
@@ -33,6 +37,38 @@ def test_chunk_to_bytes(dtype: bytes | str) -> None:
     assert chunk.dtype == new_chunk.dtype
 
 
+def test_chunk_to_bytes_multibyte_string() -> None:
+    chunk = Chunk(1, 0, 1, 'αβγ')
+    assert Chunk.from_bytes(bytes(chunk)).data == 'αβγ'
+
+
+def test_chunk_pack_zero_copy() -> None:
+    data = memoryview(randbytes(100))
+    chunk = Chunk(1, 2, 3, data)
+
+    header, packed = chunk.pack()
+    assert packed is data
+    assert bytes(chunk) == header + data
+
+    new_chunk = Chunk.from_header(header, packed)
+    assert new_chunk.data is data
+    assert new_chunk.stream_id == 1
+    assert new_chunk.seq_id == 2
+    assert new_chunk.seq_len == 3
+
+    header, packed = Chunk(1, 0, 1, 'αβγ').pack()
+    assert Chunk.from_header(header, packed).data == 'αβγ'
+
+
+def test_chunkify_bytes_views() -> None:
+    data = randbytes(1000)
+    chunks = list(chunkify(data, 300, 1))
+    assert len(chunks) == 4
+    assert all(isinstance(c.data, memoryview) for c in chunks)
+    assert all(c.dtype is ChunkDType.BYTES for c in chunks)
+    assert bytes(chunks[-1].data) == data[900:]
+
+
 def test_chunk_validation() -> None:
     with pytest.raises(ValueError):
         Chunk(0, 2, 1, '')
@@ -48,9 +84,88 @@ def test_chunk_and_reconstruct(dtype: bytes | str) -> None:
     assert data == new_data
 
 
+@pytest.mark.parametrize('dtype', (bytes, str))
+def test_chunk_buffer_out_of_order(dtype: bytes | str) -> None:
+    data: bytes | str = randbytes(1050) if dtype is bytes else 'x' * 1050
+    chunks = [
+        Chunk.from_bytes(bytes(chunk)) for chunk in chunkify(data, 100, 1)
+    ]
+    # Receive the short last chunk first.
+    chunks.reverse()
+    buffer = ChunkBuffer(chunks[0].seq_len, chunks[0].dtype)
+    for chunk in chunks[:-1]:
+        assert not buffer.add(chunk)
+    assert buffer.add(chunks[-1])
+    assert buffer.result() == data
+
+
+def test_chunk_buffer_validation() -> None:
+    buffer = ChunkBuffer(3, ChunkDType.BYTES)
+
+    with pytest.raises(ValueError, match='does not match'):
+        buffer.add(Chunk(0, 0, 2, b'abc'))
+    with pytest.raises(ValueError, match='does not match'):
+        buffer.add(Chunk(0, 0, 3, 'abc'))
+
+    assert not buffer.add(Chunk(0, 0, 3, b'abc'))
+    with pytest.raises(ValueError, match='already received'):
+        buffer.add(Chunk(0, 0, 3, b'abc'))
+    with pytest.raises(ValueError, match='expected 3'):
+        buffer.add(Chunk(0, 1, 3, b'ab'))
+    with pytest.raises(ValueError, match='expected 3'):
+        buffer.add(Chunk(0, 2, 3, b'abcd'))
+    with pytest.raises(ValueError, match='expected 3'):
+        buffer.result()
+
+
 def test_reconstruct_validation() -> None:
     with pytest.raises(ValueError, match='empty'):
         reconstruct([])
 
     with pytest.raises(ValueError, match='expected'):
         reconstruct([Chunk(0, 0, 1, ''), Chunk(0, 0, 1, '')])
+
+
+def test_chunkify_buffer_sequence() -> None:
+    buffers = [randbytes(150), b'', randbytes(30), randbytes(220)]
+    data = b''.join(buffers)
+
+    chunks = list(chunkify(buffers, 100, 1))
+    assert len(chunks) == 4
+    assert all(c.seq_len == 4 for c in chunks)
+    assert reconstruct(chunks) == data
+
+
+@pytest.mark.asyncio()
+async def test_chunk_stream_in_order() -> None:
+    data = randbytes(1050)
+    chunks = list(chunkify(data, 100, 1, ChunkDType.STREAM))
+    stream = ChunkStream()
+
+    # Chunks are not yielded until the chunks before them are added.
+    for chunk in chunks[1:]:
+        stream.add(chunk)
+    task = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    stream.add(chunks[0])
+    assert stream.complete
+    assert await task == data[:100]
+    assert b''.join([bytes(c) async for c in stream]) == data[100:]
+
+
+@pytest.mark.asyncio()
+async def test_chunk_stream_close() -> None:
+    stream = ChunkStream()
+    stream.add(Chunk(0, 0, 2, b'abc'))
+
+    with pytest.raises(ValueError, match='already received'):
+        stream.add(Chunk(0, 0, 2, b'abc'))
+    with pytest.raises(ValueError, match='does not match'):
+        stream.add(Chunk(0, 1, 3, b'abc'))
+
+    stream.close(RuntimeError('closed'))
+    assert await stream.__anext__() == b'abc'
+    with pytest.raises(RuntimeError, match='closed'):
+        await stream.__anext__()
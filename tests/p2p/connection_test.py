@@ -9,9 +9,14 @@ import pytest
 
 from proxystore.p2p import messages
 from proxystore.p2p.client import connect
+from proxystore.p2p.connection import _TUNING_HOLD
+from proxystore.p2p.connection import _TUNING_MIN_BYTES
+from proxystore.p2p.connection import MAX_ADAPTIVE_CHUNK_SIZE
 from proxystore.p2p.connection import MAX_CHUNK_SIZE_BYTES
 from proxystore.p2p.connection import MAX_CHUNK_SIZE_STRING
 from proxystore.p2p.connection import PeerConnection
+from proxystore.p2p.connection import StreamedMessage
+from proxystore.p2p.direct import DirectServer
 from proxystore.p2p.exceptions import PeerConnectionError
 from proxystore.p2p.exceptions import PeerConnectionTimeoutError
 
@@ -88,6 +93,232 @@ async def test_p2p_connection_multichannel(relay_server) -> None:
     await connection2.close()
 
 
+@pytest.mark.asyncio()
+async def test_p2p_connection_stream(relay_server) -> None:
+    uuid1, name1, websocket1 = await connect(relay_server.address)
+    connection1 = PeerConnection(uuid1, name1, websocket1, channels=2)
+
+    uuid2, name2, websocket2 = await connect(relay_server.address)
+    connection2 = PeerConnection(uuid2, name2, websocket2)
+
+    await connection1.send_offer(uuid2)
+    offer = messages.decode(cast(str, await websocket2.recv()))
+    assert isinstance(offer, messages.PeerConnection)
+    await connection2.handle_server_message(offer)
+    answer = messages.decode(cast(str, await websocket1.recv()))
+    assert isinstance(answer, messages.PeerConnection)
+    await connection1.handle_server_message(answer)
+
+    with pytest.raises(ValueError, match='bytes'):
+        await connection1.send('header', stream=b'data')
+    with pytest.raises(ValueError, match='empty'):
+        await connection1.send(b'header', stream=[b'', b''])
+
+    data = b'\x01' * (MAX_CHUNK_SIZE_BYTES * 5 + 1)
+    await connection1.send(b'header', stream=data)
+    await connection1.send(b'message')
+
+    received = await connection2.recv()
+    assert isinstance(received, StreamedMessage)
+    assert received.message == b'header'
+    assert b''.join([bytes(c) async for c in received.stream]) == data
+    assert await connection2.recv() == b'message'
+    assert len(connection2._incoming_streams) == 0
+
+    await websocket1.close()
+    await websocket2.close()
+    await connection1.close()
+    await connection2.close()
+
+
+@pytest.mark.asyncio()
+async def test_p2p_connection_stats_and_channels(relay_server) -> None:
+    uuid1, name1, websocket1 = await connect(relay_server.address)
+    connection1 = PeerConnection(uuid1, name1, websocket1, max_channels=2)
+
+    uuid2, name2, websocket2 = await connect(relay_server.address)
+    connection2 = PeerConnection(uuid2, name2, websocket2)
+
+    await connection1.send_offer(uuid2)
+    offer = messages.decode(cast(str, await websocket2.recv()))
+    assert isinstance(offer, messages.PeerConnection)
+    await connection2.handle_server_message(offer)
+    answer = messages.decode(cast(str, await websocket1.recv()))
+    assert isinstance(answer, messages.PeerConnection)
+    await connection1.handle_server_message(answer)
+
+    await connection1.ready()
+    await connection2.ready()
+
+    stats = connection1.stats()
+    assert stats.channels == 1
+    assert stats.messages_sent == 0
+    assert stats.bandwidth is None
+
+    message = b'\x00' * MAX_CHUNK_SIZE_BYTES * 3
+    await connection1.send(message)
+    assert await connection2.recv() == message
+
+    sent = connection1.stats()
+    received = connection2.stats()
+    assert sent.messages_sent == received.messages_received == 1
+    assert sent.bytes_sent == received.bytes_received > len(message)
+
+    # Sending was limited by full channel buffers so a channel is added
+    connection1._tune(_TUNING_MIN_BYTES, 1.0, stalled=True)
+    while connection1.stats().channels < 2 or len(connection2._channels) < 2:
+        await asyncio.sleep(0.01)
+    # Limit is reached and the added channel did not improve throughput
+    connection1._tune(_TUNING_MIN_BYTES, 1.0, stalled=True)
+    assert len(connection1._channels) == 2
+    assert not connection1._grow_channels
+    assert connection1.stats().saturated
+
+    await connection1.send(message)
+    await connection2.send(message)
+    assert await connection2.recv() == message
+    assert await connection1.recv() == message
+
+    await websocket1.close()
+    await websocket2.close()
+    await connection1.close()
+    await connection2.close()
+
+
+@pytest.mark.asyncio()
+async def test_p2p_connection_chunk_size_tuning(relay_server) -> None:
+    uuid, name, websocket = await connect(relay_server.address)
+    connection = PeerConnection(uuid, name, websocket)
+    size = connection.stats().chunk_size
+
+    # Small sends are not used for tuning
+    connection._tune(1, 1.0, stalled=False)
+    assert connection.stats().bandwidth is None
+
+    connection._tune(_TUNING_MIN_BYTES, 1.0, stalled=False)
+    assert connection.stats().chunk_size == MAX_ADAPTIVE_CHUNK_SIZE
+    # Max chunk size is reached so the next probe lowers the chunk size
+    connection._tune(_TUNING_MIN_BYTES, 0.5, stalled=False)
+    assert connection.stats().chunk_size == MAX_ADAPTIVE_CHUNK_SIZE
+    connection._tune(_TUNING_MIN_BYTES, 0.5, stalled=False)
+    assert connection.stats().chunk_size == MAX_ADAPTIVE_CHUNK_SIZE // 2
+    # Throughput is lower so the step is reverted and held
+    connection._tune(_TUNING_MIN_BYTES, 1.0, stalled=False)
+    assert connection.stats().chunk_size == MAX_ADAPTIVE_CHUNK_SIZE
+    for _ in range(_TUNING_HOLD):
+        connection._tune(_TUNING_MIN_BYTES, 0.5, stalled=False)
+        assert connection.stats().chunk_size == MAX_ADAPTIVE_CHUNK_SIZE
+    assert connection.stats().chunk_size > size
+
+    bandwidth = connection.stats().bandwidth
+    assert bandwidth is not None
+    assert _TUNING_MIN_BYTES <= bandwidth <= 2 * _TUNING_MIN_BYTES
+
+    await websocket.close()
+    await connection.close()
+
+
+@pytest.mark.asyncio()
+async def test_p2p_connection_direct(relay_server) -> None:
+    server1 = DirectServer('localhost')
+    server2 = DirectServer('localhost')
+    await server1.start()
+    await server2.start()
+
+    closed = asyncio.Event()
+
+    async def closed_callback() -> None:
+        closed.set()
+
+    uuid1, name1, websocket1 = await connect(relay_server.address)
+    connection1 = PeerConnection(uuid1, name1, websocket1, direct=server1)
+
+    uuid2, name2, websocket2 = await connect(relay_server.address)
+    connection2 = PeerConnection(uuid2, name2, websocket2, direct=server2)
+    connection2.on_close_callback(closed_callback)
+
+    await connection1.send_offer(uuid2)
+    offer = messages.decode(cast(str, await websocket2.recv()))
+    assert isinstance(offer, messages.PeerConnection)
+    assert offer.direct_token is not None
+    await connection2.handle_server_message(offer)
+    answer = messages.decode(cast(str, await websocket1.recv()))
+    assert isinstance(answer, messages.PeerConnection)
+    assert answer.direct_address == server2.address
+    await connection1.handle_server_message(answer)
+
+    await connection1.ready()
+    await connection2.ready()
+
+    assert connection1.state == connection2.state == 'connected'
+    assert connection1.stats().transport == 'tcp'
+    assert connection2.stats().transport == 'tcp'
+
+    message_str = 'x' * MAX_CHUNK_SIZE_STRING * 3
+    await connection1.send(message_str)
+    assert await connection2.recv() == message_str
+
+    data = b'\x01' * (MAX_CHUNK_SIZE_BYTES * 5 + 1)
+    await connection2.send(data)
+    await connection2.send(b'header', stream=data)
+    assert await connection1.recv() == data
+    received = await connection1.recv()
+    assert isinstance(received, StreamedMessage)
+    assert received.message == b'header'
+    assert b''.join([bytes(c) async for c in received.stream]) == data
+
+    await connection1.close()
+    assert connection1.state == 'closed'
+    with pytest.raises(PeerConnectionError, match='closed'):
+        await connection1.send(b'message')
+    await asyncio.wait_for(closed.wait(), timeout=1)
+    assert connection2.state == 'closed'
+
+    await connection2.close()
+    await websocket1.close()
+    await websocket2.close()
+    await server1.close()
+    await server2.close()
+
+
+@pytest.mark.asyncio()
+async def test_p2p_connection_direct_fallback(relay_server) -> None:
+    server1 = DirectServer('localhost')
+    server2 = DirectServer('localhost')
+    await server1.start()
+    await server2.start()
+
+    uuid1, name1, websocket1 = await connect(relay_server.address)
+    connection1 = PeerConnection(uuid1, name1, websocket1, direct=server1)
+
+    uuid2, name2, websocket2 = await connect(relay_server.address)
+    connection2 = PeerConnection(uuid2, name2, websocket2, direct=server2)
+
+    await connection1.send_offer(uuid2)
+    offer = messages.decode(cast(str, await websocket2.recv()))
+    assert isinstance(offer, messages.PeerConnection)
+    await connection2.handle_server_message(offer)
+    answer = messages.decode(cast(str, await websocket1.recv()))
+    assert isinstance(answer, messages.PeerConnection)
+    # Peer is not reachable so the connection falls back to WebRTC
+    await server2.close()
+    await connection1.handle_server_message(answer)
+
+    await connection1.ready()
+    await connection2.ready()
+
+    assert connection1.stats().transport == 'webrtc'
+    assert connection2.stats().transport == 'webrtc'
+    await connection1.send(b'hello')
+    assert await connection2.recv() == b'hello'
+
+    await websocket1.close()
+    await websocket2.close()
+    await connection1.close()
+    await connection2.close()
+    await server1.close()
+
+
 @pytest.mark.asyncio()
 async def test_p2p_connection_timeout(relay_server) -> None:
     uuid1, name1, websocket1 = await connect(relay_server.address)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from proxystore.p2p.direct import DirectServer
+from proxystore.p2p.direct import new_token
+from proxystore.p2p.direct import open_direct_connection
+
+
+@pytest.mark.asyncio()
+async def test_direct_connection() -> None:
+    server = DirectServer('localhost')
+    await server.start()
+    assert server.port != 0
+    assert server.address == f'localhost:{server.port}'
+
+    accepted: asyncio.Queue[bytes] = asyncio.Queue()
+
+    async def handler(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        await accepted.put(await reader.readexactly(5))
+        writer.close()
+
+    token = new_token()
+    server.expect(token, handler)
+    reader, writer = await open_direct_connection(server.address, token)
+    writer.write(b'hello')
+    assert await accepted.get() == b'hello'
+    writer.close()
+
+    # Tokens can only be used once
+    with pytest.raises(ConnectionError, match='rejected'):
+        await open_direct_connection(server.address, token)
+
+    token = new_token()
+    server.expect(token, handler)
+    server.discard(token)
+    with pytest.raises(ConnectionError, match='rejected'):
+        await open_direct_connection(server.address, token)
+
+    await server.close()
+
+    with pytest.raises(OSError):
+        await open_direct_connection(server.address, token)
+
+
+@pytest.mark.asyncio()
+async def test_direct_connection_not_confirmed() -> None:
+    server = DirectServer('localhost')
+    await server.start()
+
+    handled = asyncio.Event()
+
+    async def handler(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        handled.set()
+        writer.close()
+
+    token = new_token()
+    server.expect(token, handler)
+
+    # Peer that gives up after the server accepts the connection and
+    # before confirming the acceptance.
+    reader, writer = await asyncio.open_connection('localhost', server.port)
+    writer.write(b'PSDC' + token.encode())
+    assert await reader.readexactly(1) == b'\x01'
+    writer.close()
+    await writer.wait_closed()
+
+    await asyncio.sleep(0.05)
+    assert not handled.is_set()
+
+    await server.close()
+
+
+@pytest.mark.asyncio()
+async def test_direct_connection_timeout() -> None:
+    async def handler(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(handler, 'localhost', 0)
+    port = server.sockets[0].getsockname()[1]
+    with pytest.raises(ConnectionError, match='Timeout'):
+        await open_direct_connection(f'localhost:{port}', new_token(), 0.05)
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio()
+async def test_direct_connection_bad_address() -> None:
+    with pytest.raises(ConnectionError, match='Invalid'):
+        await open_direct_connection('localhost', new_token())
+
+
+def test_direct_server_wildcard_address() -> None:
+    server = DirectServer('0.0.0.0', 1234)
+    with mock.patch('proxystore.utils.hostname', return_value='myhost'):
+        assert server.address == 'myhost:1234'
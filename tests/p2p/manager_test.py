@@ -163,6 +163,29 @@ async def test_p2p_messaging(relay_server) -> None:
         assert source_uuid == manager1.uuid
         assert message == 'hello hello'
 
+        assert manager1.stats()[manager2.uuid].messages_sent == 1
+        assert manager2.stats()[manager1.uuid].messages_received == 1
+
+
+@pytest.mark.asyncio()
+async def test_p2p_messaging_direct(relay_server) -> None:
+    async with PeerManager(
+        uuid.uuid4(),
+        relay_server.address,
+        direct_host='localhost',
+    ) as manager1, PeerManager(
+        uuid.uuid4(),
+        relay_server.address,
+        direct_host='localhost',
+    ) as manager2:
+        await manager1.send(manager2.uuid, b'hello hello')
+        source_uuid, message = await manager2.recv()
+        assert source_uuid == manager1.uuid
+        assert message == b'hello hello'
+
+        assert manager1.stats()[manager2.uuid].transport == 'tcp'
+        assert manager2.stats()[manager1.uuid].transport == 'tcp'
+
 
 @pytest.mark.asyncio()
 async def test_expected_server_disconnect(relay_server) -> None:
@@ -1,11 +1,18 @@
 """Serialization Unit Tests."""
 from __future__ import annotations
 
+import pickle
+import sys
+from typing import Any
+
 import pytest
 
+from proxystore.connectors.local import LocalConnector
 from proxystore.serialize import deserialize
 from proxystore.serialize import SerializationError
 from proxystore.serialize import serialize
+from proxystore.serialize import serialize_buffers
+from proxystore.store.base import Store
 
 
 def test_serialization() -> None:
@@ -37,3 +44,97 @@ def test_serialization() -> None:
     with pytest.raises(SerializationError):
         # Fake identifier 'xxx'
         deserialize(b'99\nxxx')
+
+
+def test_deserialize_bytes_like() -> None:
+    b = serialize([1, 2, 3])
+    assert deserialize(bytearray(b)) == [1, 2, 3]
+    assert deserialize(memoryview(b)) == [1, 2, 3]
+    assert deserialize(memoryview(serialize(b'abc'))) == b'abc'
+    assert deserialize(bytearray(serialize('abc'))) == 'abc'
+
+
+def test_serialize_buffers() -> None:
+    assert b''.join(serialize_buffers(b'abc')) == serialize(b'abc')
+    assert b''.join(serialize_buffers('abc')) == serialize('abc')
+    assert b''.join(serialize_buffers([1, 2])) == serialize([1, 2])
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason='Out-of-band buffers require pickle protocol 5.',
+)
+def test_serialize_protocol_identifiers() -> None:
+    # Protocol 5 pickles are tagged 05 even without out-of-band buffers
+    b = serialize([1, 2])
+    assert b.startswith(b'05\n')
+    assert deserialize(b) == [1, 2]
+
+    # Data tagged 03 is always a protocol 4 (or lower) pickle
+    b = b'03\n' + pickle.dumps([1, 2], protocol=4)
+    assert deserialize(b) == [1, 2]
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason='Out-of-band buffers require pickle protocol 5.',
+)
+def test_serialize_out_of_band_buffers() -> None:
+    data = bytearray(b'x' * 1000)
+    obj = {'data': pickle.PickleBuffer(data), 'meta': 'value'}
+
+    buffers = serialize_buffers(obj)
+    assert len(buffers) == 3
+    # The out-of-band buffer is a view of the original data (no copy)
+    assert isinstance(buffers[2], memoryview)
+    assert buffers[2].obj is data
+
+    # Reconstructing over a writable buffer yields writable objects
+    serialized = bytearray(b''.join(buffers))
+    result = deserialize(serialized, copy=False)
+    assert result['meta'] == 'value'
+    assert result['data'] == data
+    assert isinstance(result['data'], memoryview)
+    assert not result['data'].readonly
+    assert result['data'].obj is serialized
+
+    # By default buffers are copied, even if the data is read-only
+    result = deserialize(serialize(obj))
+    assert result['data'] == data
+    assert isinstance(result['data'], bytearray)
+
+
+class _BufferObject:
+    def __init__(self, data: bytearray) -> None:
+        self.data = data
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (_BufferObject, (pickle.PickleBuffer(self.data),))
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason='Out-of-band buffers require pickle protocol 5.',
+)
+def test_store_get_out_of_band_buffers_writable() -> None:
+    with Store('test-writable', LocalConnector(), cache_size=0) as store:
+        key = store.set(_BufferObject(bytearray(b'x' * 100)))
+        result = store.get(key)
+        assert isinstance(result, _BufferObject)
+        # Same result as pickle.loads: a writable bytearray
+        assert isinstance(result.data, bytearray)
+        result.data[0] = ord('y')
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 8),
+    reason='Out-of-band buffers require pickle protocol 5.',
+)
+def test_deserialize_bad_out_of_band_header() -> None:
+    b = serialize({'data': pickle.PickleBuffer(b'x' * 100)})
+
+    with pytest.raises(SerializationError, match='header'):
+        deserialize(b[:5])
+
+    with pytest.raises(SerializationError, match='length'):
+        deserialize(b[:-1])
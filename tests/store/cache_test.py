@@ -3,9 +3,17 @@ from __future__ import annotations
 
 import pytest
 
+from proxystore.store.cache import Cache
+from proxystore.store.cache import get_cache
+from proxystore.store.cache import LFUCache
 from proxystore.store.cache import LRUCache
 
 
+def test_cache_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        Cache()  # type: ignore[abstract]
+
+
 def test_lru_raises() -> None:
     """Test LRU Error Handling."""
     with pytest.raises(ValueError):
@@ -35,3 +43,119 @@ def test_lru_cache() -> None:
     c.evict('1')
     assert not c.exists('1')
     c.evict('1')
+
+
+def test_lru_cache_overwrite_key() -> None:
+    c: LRUCache[str, int] = LRUCache(2)
+    c.set('1', 1)
+    c.set('2', 2)
+    c.set('1', 3)
+    assert len(c) == 2
+    assert c.get('1') == 3
+    assert c.get('2') == 2
+    assert c.evictions == 0
+
+
+def test_lru_cache_maxbytes() -> None:
+    c: LRUCache[str, int] = LRUCache(10, maxbytes=100)
+    c.set('1', 1, size=40)
+    c.set('2', 2, size=40)
+    assert c.nbytes == 80
+    # Make 1 most recently used so 2 is evicted
+    c.get('1')
+    c.set('3', 3, size=40)
+    assert c.exists('1')
+    assert not c.exists('2')
+    assert c.exists('3')
+    assert c.nbytes == 80
+
+    # Objects larger than the budget are not cached and do not evict others
+    c.set('4', 4, size=101)
+    assert not c.exists('4')
+    assert len(c) == 2
+
+    c.evict('1')
+    assert c.nbytes == 40
+
+
+def test_lru_cache_maxbytes_estimated() -> None:
+    c: LRUCache[str, bytes] = LRUCache(10, maxbytes=1000)
+    c.set('1', b'x' * 100)
+    assert 100 < c.nbytes < 1000
+
+
+def test_lfu_cache() -> None:
+    c: LFUCache[str, int] = LFUCache(3)
+    for i in range(1, 4):
+        c.set(str(i), i)
+    # Access 1 twice, 2 once, 3 never
+    c.get('1')
+    c.get('1')
+    c.get('2')
+    c.set('4', 4)
+    assert not c.exists('3')
+    # 4 now has the lowest frequency
+    c.set('5', 5)
+    assert not c.exists('4')
+    assert c.exists('1')
+    assert c.exists('2')
+    assert c.exists('5')
+
+    # Evicting the only key with the minimum frequency
+    c.evict('5')
+    c.get('2')
+    c.get('2')
+    c.set('6', 6)
+    c.set('7', 7)
+    assert not c.exists('6')
+
+
+def test_lfu_cache_tie_breaks_by_recency() -> None:
+    c: LFUCache[str, int] = LFUCache(2)
+    c.set('1', 1)
+    c.set('2', 2)
+    c.set('3', 3)
+    assert not c.exists('1')
+    assert c.exists('2')
+    assert c.exists('3')
+
+
+def test_cache_stats() -> None:
+    c: LRUCache[str, int] = LRUCache(1)
+    c.set('1', 1)
+    c.get('1')
+    c.get('2')
+    c.set('2', 2)
+
+    stats = c.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.size == 1
+    assert stats.as_dict()['nbytes'] == c.nbytes
+
+
+def test_get_cache() -> None:
+    assert isinstance(get_cache('lru'), LRUCache)
+    assert isinstance(get_cache('LFU', maxsize=4), LFUCache)
+
+    c = get_cache('lru', maxsize=2, maxbytes=10)
+    assert c.maxsize == 2
+    assert c.maxbytes == 10
+
+    with pytest.raises(ValueError, match='policy'):
+        get_cache('fifo')
+    with pytest.raises(ValueError):
+        get_cache('lru', maxbytes=-1)
+
+
+def test_lfu_cache_maxbytes_after_evict() -> None:
+    c: LFUCache[str, int] = LFUCache(10, maxbytes=10)
+    c.set('1', 1, size=5)
+    c.set('2', 2, size=5)
+    c.get('2')
+    # Removes the only key with the minimum frequency
+    c.evict('1')
+    c.set('3', 3, size=10)
+    assert not c.exists('2')
+    assert c.exists('3')
@@ -4,6 +4,7 @@ from typing import Any
 
 from proxystore.proxy import Proxy
 from proxystore.store.base import StoreFactory
+from proxystore.store.cache import LRUCache
 from proxystore.store.metrics import Metrics
 from proxystore.store.metrics import StoreMetrics
 from proxystore.store.metrics import TimeStats
@@ -120,3 +121,19 @@ def test_store_metrics_aggregate_times() -> None:
     assert times['time2'].avg_time_ms == 20
     assert times['time2'].min_time_ms == 10
     assert times['time2'].max_time_ms == 30
+
+
+def test_cache_stats() -> None:
+    assert StoreMetrics().cache_stats() is None
+
+    cache: LRUCache[str, int] = LRUCache(4)
+    metrics = StoreMetrics(cache=cache)
+    cache.set('key', 1)
+    cache.get('key')
+    cache.get('missing')
+
+    stats = metrics.cache_stats()
+    assert stats is not None
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
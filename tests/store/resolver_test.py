@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from proxystore.store.resolver import ResolverExecutor
+
+
+def test_resolver_executor_submit() -> None:
+    executor = ResolverExecutor(max_workers=2)
+    futures = [executor.submit(lambda i=i: i * 2) for i in range(10)]
+    assert [f.result() for f in futures] == [i * 2 for i in range(10)]
+    assert len(executor._threads) <= 2
+    executor.shutdown()
+
+
+def test_resolver_executor_bad_args() -> None:
+    with pytest.raises(ValueError, match='workers'):
+        ResolverExecutor(max_workers=0)
+    with pytest.raises(ValueError, match='pending'):
+        ResolverExecutor(max_pending=0)
+
+
+def test_resolver_executor_exception() -> None:
+    def _fail() -> None:
+        raise RuntimeError('oops')
+
+    executor = ResolverExecutor(max_workers=1, max_pending=1)
+    with pytest.raises(RuntimeError, match='oops'):
+        executor.submit(_fail).result()
+    # The pending slot should be released after the exception
+    assert executor.submit(lambda: 1).result() == 1
+    executor.shutdown()
+
+
+def test_resolver_executor_priority() -> None:
+    executor = ResolverExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order: list[int] = []
+
+    def _block() -> None:
+        started.set()
+        release.wait()
+
+    executor.submit(_block)
+    started.wait()
+    # Worker is busy so these are queued and run in priority order
+    futures = [
+        executor.submit(lambda p=p: order.append(p), priority=p)
+        for p in (3, 1, 2, 1)
+    ]
+    release.set()
+    for future in futures:
+        future.result()
+    assert order == [1, 1, 2, 3]
+    executor.shutdown()
+
+
+def test_resolver_executor_max_pending() -> None:
+    executor = ResolverExecutor(max_workers=1, max_pending=1)
+    release = threading.Event()
+    executor.submit(release.wait)
+
+    submitted = threading.Event()
+
+    def _submit() -> None:
+        executor.submit(lambda: None)
+        submitted.set()
+
+    thread = threading.Thread(target=_submit)
+    thread.start()
+    # Second submit blocks until the first task completes
+    time.sleep(0.05)
+    assert not submitted.is_set()
+    release.set()
+    thread.join(timeout=5)
+    assert submitted.is_set()
+    executor.shutdown()
+
+
+def test_resolver_executor_shutdown() -> None:
+    executor = ResolverExecutor(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block() -> None:
+        started.set()
+        release.wait()
+
+    running = executor.submit(_block)
+    started.wait()
+    queued = executor.submit(lambda: None)
+
+    release.set()
+    executor.shutdown(cancel_futures=True)
+    assert running.done()
+    assert queued.cancelled()
+
+    with pytest.raises(RuntimeError, match='shutdown'):
+        executor.submit(lambda: None)
+
+
+def test_resolver_executor_idle_workers_exit() -> None:
+    executor = ResolverExecutor(max_workers=2, idle_timeout=0.01)
+    assert executor.submit(lambda: 1).result() == 1
+    for _ in range(500):
+        if len(executor._threads) == 0:
+            break
+        time.sleep(0.01)
+    assert len(executor._threads) == 0
+
+    # New workers are started for new tasks
+    assert executor.submit(lambda: 2).result() == 2
+    executor.shutdown()
+
+
+def test_resolver_executor_nested_submit() -> None:
+    executor = ResolverExecutor(max_workers=1, max_pending=1)
+
+    def _outer() -> int:
+        # Would deadlock if queued because the only worker and pending
+        # slot are held by this task.
+        return executor.submit(lambda: 1).result() + 1
+
+    assert executor.submit(_outer).result(timeout=5) == 2
+    executor.shutdown()
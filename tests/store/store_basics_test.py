@@ -6,7 +6,12 @@ from unittest import mock
 
 import pytest
 
+from proxystore.connectors.local import LocalConnector
+from proxystore.proxy import Proxy
+from proxystore.serialize import serialize_buffers
+from proxystore.store.base import Store
 from proxystore.store.cache import LRUCache
+from proxystore.store.utils import get_key
 from testing.stores import missing_key
 from testing.stores import StoreFixtureType
 
@@ -126,6 +131,33 @@ def test_store_batch_ops(store_implementation: StoreFixtureType) -> None:
         assert store.exists(key)
 
 
+def test_store_get_batch(store_implementation: StoreFixtureType) -> None:
+    store, _ = store_implementation
+
+    values = ['value1', 'value2', 'value3']
+    keys = store.set_batch(values)
+    missing = missing_key(store)
+
+    # Cache one of the objects so the batch has hits and misses
+    # (if caching is enabled for the store)
+    assert store.get(keys[0]) == values[0]
+    expected = [key for key in keys if not store.is_cached(key)]
+    expected.insert(-1, missing)
+
+    batch = [keys[0], keys[1], missing, keys[2], keys[1]]
+    with mock.patch.object(
+        store.connector,
+        'get_batch',
+        wraps=store.connector.get_batch,
+    ) as mock_get_batch:
+        results = store.get_batch(batch, default='default')
+    assert results == ['value1', 'value2', 'default', 'value3', 'value2']
+    # Only uncached and unique keys are retrieved from the connector
+    mock_get_batch.assert_called_once_with(expected)
+
+    assert store.get_batch([]) == []
+
+
 def test_store_batch_ops_remote(
     store_implementation: StoreFixtureType,
 ) -> None:
@@ -137,3 +169,62 @@ def test_store_batch_ops_remote(
     new_keys = store.set_batch(values, serializer=lambda s: str.encode(s))
     for key in new_keys:
         assert store.exists(key)
+
+
+def test_store_buffer_serialization(
+    store_implementation: StoreFixtureType,
+) -> None:
+    store, _ = store_implementation
+
+    key = store.set('value', serializer=serialize_buffers)
+    assert store.get(key) == 'value'
+
+    key = store.set(b'ABC', serializer=lambda s: memoryview(s))
+    assert store.get(key, deserializer=lambda s: s) == b'ABC'
+
+    keys = store.set_batch(
+        [b'AB', b'CD'],
+        serializer=lambda s: [s[:1], bytearray(s[1:])],
+    )
+    assert [store.get(key, deserializer=bytes) for key in keys] == [
+        b'AB',
+        b'CD',
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_store_async_ops(store_implementation: StoreFixtureType) -> None:
+    store, _ = store_implementation
+
+    key_fake = missing_key(store)
+    value = 'test_value'
+
+    key = await store.aset(value)
+    assert await store.aget(key) == value
+    assert await store.aget(key_fake, default='alt_value') == 'alt_value'
+    assert await store.aexists(key)
+    assert not await store.aexists(key_fake)
+    await store.aevict(key)
+    assert not await store.aexists(key)
+    assert not store.is_cached(key)
+
+    values = ['value1', [1, 2, 3]]
+    keys = await store.aset_batch(values)
+    assert await store.aget_batch([*keys, key_fake]) == [*values, None]
+
+    proxy = await store.aproxy(value)
+    assert isinstance(proxy, Proxy)
+    assert await store.aget(get_key(proxy)) == value
+
+
+@pytest.mark.asyncio()
+async def test_store_async_ops_sync_connector() -> None:
+    # LocalConnector does not implement AsyncConnector so operations
+    # fall back to running the synchronous methods in an executor.
+    with Store('test-async-fallback', LocalConnector()) as store:
+        key = await store.aset('value')
+        assert await store.aexists(key)
+        assert await store.aget(key) == 'value'
+        assert await store.aget_batch([key]) == ['value']
+        await store.aevict(key)
+        assert not await store.aexists(key)
@@ -103,3 +103,60 @@ def test_store_multi_key_operations(store: Store[FileConnector]) -> None:
         assert proxy_metrics.times['store.get'].count == 1
         assert proxy_metrics.times['factory.call'].count == 1
         assert proxy_metrics.times['factory.resolve'].count == 1
+
+
+def test_store_get_batch_metrics(store: Store[FileConnector]) -> None:
+    values = ['value1', 'value2', 'value3']
+    keys = store.set_batch(values)
+    store.get(keys[0])
+
+    assert store.get_batch(keys) == values
+
+    assert store.metrics is not None
+    key_metrics = store.metrics.get_metrics(keys)
+    assert key_metrics is not None
+
+    sizes = sum(len(serialize(value)) for value in values[1:])
+    assert key_metrics.attributes['store.get_batch.object_sizes'] == sizes
+    assert key_metrics.counters['store.get_batch.cache_hits'] == 1
+    assert key_metrics.counters['store.get_batch.cache_misses'] == 2
+    assert key_metrics.times['store.get_batch.connector'].count == 1
+    assert key_metrics.times['store.get_batch.deserialize'].count == 1
+    assert key_metrics.times['store.get_batch'].count == 1
+
+
+def test_store_cache_stats(tmp_path: pathlib.Path) -> None:
+    with Store(
+        'test-cache-store',
+        connector=FileConnector(str(tmp_path)),
+        cache_size=2,
+        cache_bytes=int(1e6),
+        cache_policy='lfu',
+        metrics=True,
+    ) as store:
+        keys = store.set_batch(['value1', 'value2', 'value3'])
+        for key in keys:
+            store.get(key)
+        store.get(keys[-1])
+
+        assert store.metrics is not None
+        stats = store.metrics.cache_stats()
+        assert stats is not None
+        assert stats.hits == 1
+        assert stats.misses == 3
+        assert stats.evictions == 1
+        assert stats.size == 2
+        sizes = [len(serialize(v)) for v in ('value2', 'value3')]
+        assert stats.nbytes == sum(sizes)
+
+        config = store.config()
+        assert config['cache_bytes'] == int(1e6)
+        assert config['cache_policy'] == 'lfu'
+
+
+def test_store_cache_bad_args(tmp_path: pathlib.Path) -> None:
+    connector = FileConnector(str(tmp_path))
+    with pytest.raises(ValueError, match='bytes'):
+        Store('test', connector=connector, cache_bytes=-1)
+    with pytest.raises(ValueError, match='policy'):
+        Store('test', connector=connector, cache_policy='fifo')
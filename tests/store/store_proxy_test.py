@@ -1,10 +1,13 @@
 """Store Factory and Proxy Tests for Store Subclasses."""
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import pytest
 
+from proxystore.connectors.local import LocalConnector
+from proxystore.proxy import is_resolved
 from proxystore.proxy import Proxy
 from proxystore.proxy import ProxyLocker
 from proxystore.serialize import deserialize
@@ -12,6 +15,7 @@ from proxystore.serialize import serialize
 from proxystore.store import get_store
 from proxystore.store import register_store
 from proxystore.store import unregister_store
+from proxystore.store.base import Store
 from proxystore.store.base import StoreFactory
 from proxystore.store.exceptions import ProxyResolveMissingKeyError
 from proxystore.store.utils import get_key
@@ -176,3 +180,121 @@ def test_raises_missing_key(store_implementation: StoreFixtureType) -> None:
         proxy()
 
     unregister_store(store_info.name)
+
+
+def test_store_prefetch(store_implementation: StoreFixtureType) -> None:
+    store, store_info = store_implementation
+    register_store(store)
+
+    values = [[i] for i in range(10)]
+    proxies = store.proxy_batch(values)
+
+    count = 0
+    for proxy, value in zip(store.prefetch(proxies, max_inflight=3), values):
+        assert is_resolved(proxy)
+        assert proxy == value
+        count += 1
+    assert count == len(values)
+
+    with pytest.raises(ValueError, match='inflight'):
+        next(store.prefetch(proxies, max_inflight=0))
+
+    unregister_store(store_info.name)
+
+
+def test_store_resolve_async_dedup() -> None:
+    store = Store('test-dedup', LocalConnector(), resolver_workers=1)
+    register_store(store)
+
+    key = store.set([1, 2, 3])
+    proxies: list[Proxy[list[int]]] = [
+        store.proxy_from_key(key) for _ in range(3)
+    ]
+
+    release = threading.Event()
+    # Occupy the resolver so the resolves below stay queued
+    blocker = store._resolver.submit(release.wait)
+    for proxy in proxies:
+        proxy.__factory__.resolve_async()
+    futures = {id(p.__factory__._obj_future) for p in proxies}
+    assert len(futures) == 1
+    release.set()
+    blocker.result()
+
+    assert proxies == [[1, 2, 3]] * 3
+
+    unregister_store(store.name)
+    store.close()
+
+
+def test_store_resolve_async_dedup_does_not_block() -> None:
+    store = Store(
+        'test-dedup-block',
+        LocalConnector(),
+        resolver_workers=1,
+        resolver_max_pending=2,
+    )
+    register_store(store)
+
+    key = store.set([1, 2, 3])
+    first: Proxy[list[int]] = store.proxy_from_key(key)
+    dedup: Proxy[list[int]] = store.proxy_from_key(key)
+    other: Proxy[list[int]] = store.proxy_from_key(store.set([4]))
+
+    release = threading.Event()
+    # Occupy the only worker and fill the pending slots of the resolver
+    blocker = store._resolver.submit(release.wait)
+    first.__factory__.resolve_async()
+
+    thread = threading.Thread(target=other.__factory__.resolve_async)
+    thread.start()
+    # The submit of the other proxy blocks waiting on a pending slot
+    thread.join(timeout=0.05)
+    assert thread.is_alive()
+
+    # A duplicate resolve still returns immediately
+    dedup.__factory__.resolve_async()
+    assert first.__factory__._obj_future is dedup.__factory__._obj_future
+
+    release.set()
+    blocker.result()
+    thread.join(timeout=5)
+    assert first == [1, 2, 3]
+    assert dedup == [1, 2, 3]
+    assert other == [4]
+
+    unregister_store(store.name)
+    store.close()
+
+
+def test_store_resolve_async_after_close() -> None:
+    store = Store('test-resolve-closed', LocalConnector())
+    register_store(store)
+    proxy: Proxy[str] = store.proxy('value')
+    store.close()
+
+    proxy.__factory__.resolve_async()
+    assert proxy == 'value'
+
+    unregister_store(store.name)
+
+
+def test_store_close_completes_queued_resolves() -> None:
+    store = Store('test-close-queued', LocalConnector(), resolver_workers=1)
+    register_store(store)
+    proxy: Proxy[str] = store.proxy('value')
+
+    release = threading.Event()
+    # Occupy the resolver so the resolve below stays queued
+    blocker = store._resolver.submit(release.wait)
+    proxy.__factory__.resolve_async()
+
+    thread = threading.Thread(target=store.close)
+    thread.start()
+    release.set()
+    thread.join(timeout=5)
+    blocker.result()
+
+    assert proxy == 'value'
+
+    unregister_store(store.name)
@@ -1,15 +1,22 @@
 """Unit tests for proxystore.store.utils."""
 from __future__ import annotations
 
+from typing import Any
+from unittest import mock
+
 import pytest
 
 from proxystore.factory import SimpleFactory
 from proxystore.proxy import is_resolved
 from proxystore.proxy import Proxy
+from proxystore.store import register_store
+from proxystore.store import unregister_store
+from proxystore.store.exceptions import ProxyResolveMissingKeyError
 from proxystore.store.exceptions import ProxyStoreFactoryError
 from proxystore.store.local import LocalStore
 from proxystore.store.utils import get_key
 from proxystore.store.utils import resolve_async
+from proxystore.store.utils import resolve_batch
 
 
 def test_get_key_from_proxy() -> None:
@@ -42,3 +49,98 @@ def test_async_resolve() -> None:
         # Now async resolve should be a no-op
         resolve_async(p)
         assert p == value
+
+
+def test_resolve_batch() -> None:
+    with LocalStore('test-resolve-batch', cache_size=0) as store:
+        register_store(store)
+        values = ['value1', 'value2', 'value3']
+        proxies: list[Proxy[Any]] = store.proxy_batch(values)
+        proxies.append(Proxy(SimpleFactory('value4')))
+        proxies.append(store.proxy('value5', evict=True))
+        key5 = get_key(proxies[-1])
+
+        with mock.patch.object(
+            store,
+            'get_batch',
+            wraps=store.get_batch,
+        ) as mock_get_batch:
+            resolve_batch(proxies)
+        mock_get_batch.assert_called_once()
+
+        assert all(is_resolved(p) for p in proxies)
+        assert proxies == [*values, 'value4', 'value5']
+        assert not store.exists(key5)
+
+        # Already resolved proxies are skipped
+        resolve_batch(proxies)
+
+        unregister_store(store.name)
+
+
+def test_resolve_batch_deserializers() -> None:
+    with LocalStore('test-resolve-batch', cache_size=0) as store:
+        register_store(store)
+        key = store.set(b'value', serializer=lambda s: s)
+        proxies: list[Proxy[Any]] = [
+            store.proxy_from_key(key, deserializer=lambda s: s),
+            store.proxy_from_key(key, deserializer=lambda s: bytes(s).decode()),
+        ]
+        resolve_batch(proxies)
+        assert proxies == [b'value', 'value']
+
+        unregister_store(store.name)
+
+
+def test_resolve_batch_missing_key() -> None:
+    with LocalStore('store') as store:
+        proxy: Proxy[str] = store.proxy('value')
+        store.evict(get_key(proxy))
+
+        with pytest.raises(ProxyResolveMissingKeyError):
+            resolve_batch([proxy])
+
+
+def test_resolve_batch_missing_key_does_not_mutate() -> None:
+    with LocalStore('test-resolve-batch', cache_size=0) as store:
+        register_store(store)
+        proxy: Proxy[str] = store.proxy('value', evict=True)
+        missing: Proxy[str] = store.proxy('missing')
+        store.evict(get_key(missing))
+
+        with pytest.raises(ProxyResolveMissingKeyError):
+            resolve_batch([proxy, missing])
+
+        # The other object was not evicted or set on the factory
+        assert store.exists(get_key(proxy))
+        assert not proxy.__factory__.resolving
+        assert proxy == 'value'
+
+        unregister_store(store.name)
+
+
+def test_resolve_batch_keeps_async_resolve() -> None:
+    with LocalStore('test-resolve-batch', cache_size=0) as store:
+        register_store(store)
+        proxy: Proxy[str] = store.proxy('value')
+        resolve_async(proxy)
+        assert proxy.__factory__.resolving
+
+        with mock.patch.object(store, 'get_batch') as mock_get_batch:
+            resolve_batch([proxy])
+        mock_get_batch.assert_not_called()
+        assert proxy == 'value'
+
+        unregister_store(store.name)
+
+
+def test_factory_set_result() -> None:
+    with LocalStore('store') as store:
+        proxy: Proxy[str] = store.proxy('value')
+        factory = proxy.__factory__
+        assert not factory.resolving
+        factory.set_result('other')
+        assert factory.resolving
+        # Setting the result again has no effect
+        factory.set_result('another')
+        assert proxy == 'other'
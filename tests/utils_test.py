@@ -1,7 +1,9 @@
 """Utils Unit Tests."""
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 from typing import Any
 from unittest import mock
 
@@ -31,6 +33,41 @@ def test_chunk_bytes(data_size: int, chunk_size: int) -> None:
     assert data == result
 
 
+def test_chunk_bytes_multipart() -> None:
+    data = [b'abc', memoryview(b'defgh'), bytearray(b'')]
+    chunks = list(chunk_bytes(data, 2))
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert [bytes(chunk) for chunk in chunks] == [
+        b'ab',
+        b'c',
+        b'de',
+        b'fg',
+        b'h',
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_achunk_bytes() -> None:
+    chunks = [bytes(chunk) async for chunk in utils.achunk_bytes(b'abc', 2)]
+    assert chunks == [b'ab', b'c']
+
+
+def test_buffer_utils() -> None:
+    data = [b'abc', memoryview(b'de'), bytearray(b'f')]
+    assert all(isinstance(b, memoryview) for b in utils.as_buffers(data))
+    assert utils.nbytes(data) == 6
+    assert utils.join_buffers(data) == b'abcdef'
+
+    single = b'abc'
+    assert len(utils.as_buffers(single)) == 1
+    assert utils.nbytes(single) == 3
+    assert utils.join_buffers(single) is single
+
+    # Multi-dimensional views are cast to bytes
+    view = memoryview(bytearray(8)).cast('B', shape=[2, 4])
+    assert utils.nbytes(view) == 8
+
+
 def test_create_key() -> None:
     """Test create_key()."""
     assert isinstance(utils.create_key(42), str)
@@ -168,3 +205,45 @@ def test_readable_to_bytes_value_cast_failure() -> None:
     with pytest.raises(ValueError, match='float'):
         # Note that is letter o rather than zero
         readable_to_bytes('O B')
+
+
+@pytest.mark.parametrize('max_workers', (0, 1, 4))
+def test_map_concurrent(max_workers: int) -> None:
+    items = list(range(10))
+    assert utils.map_concurrent(lambda x: x * 2, items, max_workers) == [
+        x * 2 for x in items
+    ]
+
+
+def test_map_concurrent_overlaps() -> None:
+    # Each call waits on the barrier so this only completes if all calls
+    # run concurrently.
+    barrier = threading.Barrier(4, timeout=5)
+    assert utils.map_concurrent(lambda x: barrier.wait() >= 0, range(4), 4)
+
+
+def test_map_concurrent_raises() -> None:
+    def _fail(x: int) -> int:
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        utils.map_concurrent(_fail, [1, 2], 2)
+
+
+@pytest.mark.asyncio()
+async def test_gather_concurrent() -> None:
+    active = 0
+    max_active = 0
+
+    async def _double(x: int) -> int:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(active, max_active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return x * 2
+
+    items = list(range(10))
+    results = await utils.gather_concurrent(_double, items, 3)
+    assert results == [x * 2 for x in items]
+    assert max_active == 3